@@ -0,0 +1,49 @@
+"""Create checkpoint_blobs table for delta-encoded checkpoints.
+
+Checkpoint rows now reference per-channel blobs keyed by channel version
+instead of storing the full channel values inline on every step.
+
+Revision ID: 039_checkpoint_blobs
+Revises: 038_fix_proposalstatus_enum_case
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "039_checkpoint_blobs"
+down_revision: str | None = "038_fix_proposalstatus_enum_case"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "checkpoint_blobs",
+        sa.Column("id", postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column("thread_id", sa.String(255), nullable=False),
+        sa.Column("checkpoint_ns", sa.String(255), nullable=False, server_default=""),
+        sa.Column("channel", sa.String(255), nullable=False),
+        sa.Column("version", sa.String(255), nullable=False),
+        sa.Column("value_type", sa.String(255), nullable=False),
+        sa.Column("value_data", sa.Text(), nullable=False),
+    )
+    op.create_index(
+        "ix_checkpoint_blobs_thread_channel_version",
+        "checkpoint_blobs",
+        ["thread_id", "checkpoint_ns", "channel", "version"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_checkpoint_blobs_thread_channel_version", table_name="checkpoint_blobs")
+    op.drop_table("checkpoint_blobs")
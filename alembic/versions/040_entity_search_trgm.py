@@ -0,0 +1,47 @@
+"""Add pg_trgm GIN indexes for ranked entity search.
+
+Entity search ranks by trigram word similarity over name and entity_id;
+GIN trigram indexes let both the similarity operator and ``ILIKE
+'%q%'`` use an index instead of scanning every row.
+
+Revision ID: 040_entity_search_trgm
+Revises: 039_checkpoint_blobs
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "040_entity_search_trgm"
+down_revision: str | None = "039_checkpoint_blobs"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_ha_entities_name_trgm",
+        "ha_entities",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_ha_entities_entity_id_trgm",
+        "ha_entities",
+        ["entity_id"],
+        postgresql_using="gin",
+        postgresql_ops={"entity_id": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ha_entities_entity_id_trgm", table_name="ha_entities")
+    op.drop_index("ix_ha_entities_name_trgm", table_name="ha_entities")
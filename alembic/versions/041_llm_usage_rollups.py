@@ -0,0 +1,61 @@
+"""Create llm_usage_rollups table for pre-aggregated usage reporting.
+
+Usage endpoints read hourly rollups plus the not-yet-rolled tail of
+llm_usage instead of aggregating the raw table on every request.
+
+Revision ID: 041_llm_usage_rollups
+Revises: 040_entity_search_trgm
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "041_llm_usage_rollups"
+down_revision: str | None = "040_entity_search_trgm"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_usage_rollups",
+        sa.Column("id", postgresql.UUID(as_uuid=False), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("provider", sa.String(50), nullable=False),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("agent_role", sa.String(50), nullable=False, server_default=""),
+        sa.Column("conversation_id", sa.String(36), nullable=False, server_default=""),
+        sa.Column("calls", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("input_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("output_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("total_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("cost_usd", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("latency_ms_sum", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("latency_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_llm_usage_rollups_bucket_group",
+        "llm_usage_rollups",
+        ["bucket_start", "provider", "model", "agent_role", "conversation_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_llm_usage_rollups_conversation_id",
+        "llm_usage_rollups",
+        ["conversation_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_usage_rollups_conversation_id", table_name="llm_usage_rollups")
+    op.drop_index("ix_llm_usage_rollups_bucket_group", table_name="llm_usage_rollups")
+    op.drop_table("llm_usage_rollups")
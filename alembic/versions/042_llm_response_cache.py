@@ -0,0 +1,48 @@
+"""Create llm_response_cache table for persisted LLM response cache entries.
+
+Deterministic LLM responses are cached in memory and written behind to
+this table, which is loaded back at startup.
+
+Revision ID: 042_llm_response_cache
+Revises: 041_llm_usage_rollups
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "042_llm_response_cache"
+down_revision: str | None = "041_llm_usage_rollups"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_response_cache",
+        sa.Column("key", sa.String(64), primary_key=True),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("context_key", sa.String(64), nullable=True),
+        sa.Column("query_text", sa.Text(), nullable=True),
+        sa.Column("response", postgresql.JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_llm_response_cache_expires_at",
+        "llm_response_cache",
+        ["expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_response_cache_expires_at", table_name="llm_response_cache")
+    op.drop_table("llm_response_cache")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Benchmark per-step checkpoint latency for the conversation and analysis graphs.
+
+Replays a growing graph state through ``PostgresCheckpointer.aput`` and
+``aput_writes`` and compares it with the previous write path (full
+channel values stored twice per step, stdlib ``json``, one INSERT per
+pending write).
+
+Statements are compiled for the PostgreSQL dialect and each ``execute``
+sleeps for a simulated round trip, so the numbers capture serialization,
+statement building and round-trip count without needing a database.
+
+Usage:
+    python scripts/bench_checkpoints.py
+    python scripts/bench_checkpoints.py --steps 60 --rtt-ms 1.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+# Ensure project root is in path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
+
+from src.graph.state import ScriptExecution
+from src.storage.checkpoints import CheckpointRecord, PendingWrite, PostgresCheckpointer
+
+_DIALECT = postgresql.dialect()
+
+
+class SimulatedSession:
+    """AsyncSession stand-in that compiles statements and sleeps per round trip."""
+
+    def __init__(self, rtt_seconds: float) -> None:
+        self.rtt_seconds = rtt_seconds
+        self.round_trips = 0
+        self.bytes_sent = 0
+
+    async def execute(self, stmt: Any) -> None:
+        compiled = stmt.compile(dialect=_DIALECT)
+        self.bytes_sent += sum(len(str(v)) for v in compiled.params.values())
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt_seconds)
+
+
+async def _legacy_step(
+    session: SimulatedSession,
+    config: dict[str, Any],
+    checkpoint: Any,
+    metadata: Any,
+    writes: list[tuple[str, Any]],
+) -> None:
+    """The write path before delta checkpoints and batched writes."""
+    configurable = config["configurable"]
+
+    def encode(value: Any) -> Any:
+        return json.loads(json.dumps(value, default=str))
+
+    values = encode(checkpoint.channel_values)
+    await session.execute(
+        insert(CheckpointRecord).values(
+            thread_id=configurable["thread_id"],
+            checkpoint_ns="",
+            checkpoint_id=checkpoint.id,
+            checkpoint_data=values,
+            metadata_data={},
+            channel_versions=dict(checkpoint.channel_versions),
+            channel_values=values,
+            step=metadata.step,
+            checkpoint_at=datetime.fromisoformat(checkpoint.ts),
+        )
+    )
+    # Retention: SELECT plus two DELETEs on every put
+    thread_id = configurable["thread_id"]
+    await session.execute(
+        select(CheckpointRecord.checkpoint_id)
+        .where(CheckpointRecord.thread_id == thread_id)
+        .order_by(CheckpointRecord.step.desc())
+        .limit(100)
+    )
+    keep_ids = [f"cp-{i}" for i in range(max(1, metadata.step - 99), metadata.step + 1)]
+    await session.execute(
+        delete(CheckpointRecord).where(
+            CheckpointRecord.thread_id == thread_id,
+            CheckpointRecord.checkpoint_id.notin_(keep_ids),
+        )
+    )
+    await session.execute(
+        delete(PendingWrite).where(
+            PendingWrite.thread_id == thread_id,
+            PendingWrite.checkpoint_id.notin_(keep_ids),
+        )
+    )
+    for idx, (channel, value) in enumerate(writes):
+        await session.execute(
+            insert(PendingWrite).values(
+                thread_id=configurable["thread_id"],
+                checkpoint_ns="",
+                checkpoint_id=checkpoint.id,
+                task_id="task",
+                idx=idx,
+                channel=channel,
+                value_type="json",
+                value_data=json.dumps(value, default=str),
+            )
+        )
+
+
+def _conversation_step(step: int, state: dict[str, Any]) -> dict[str, Any]:
+    """Advance a conversation-graph state by one step; return changed channels."""
+    new_messages = [
+        HumanMessage(content=f"Turn {step}: turn off the lights in the kitchen " * 4),
+        AIMessage(content=f"Reply {step}: " + "I checked the entities and automations. " * 12),
+    ]
+    state["messages"] = [*state.get("messages", []), *new_messages]
+    changed = {"messages": state["messages"], "active_agent": "architect"}
+    if step % 5 == 0:
+        state["architect_design"] = {"entities": [f"light.kitchen_{i}" for i in range(20)]}
+        changed["architect_design"] = state["architect_design"]
+    state.update(changed)
+    return changed
+
+
+def _analysis_step(step: int, state: dict[str, Any]) -> dict[str, Any]:
+    """Advance an analysis-graph state by one step; return changed channels."""
+    tool_result = ToolMessage(
+        content=json.dumps({"rows": list(range(300))}), tool_call_id=f"c{step}"
+    )
+    state["messages"] = [*state.get("messages", []), tool_result]
+    changed: dict[str, Any] = {"messages": state["messages"]}
+    if "insights" not in state:
+        changed["insights"] = [
+            {"title": f"Insight {i}", "evidence": list(range(200))} for i in range(25)
+        ]
+    if step % 3 == 0:
+        execution = ScriptExecution(
+            script_content=f"import pandas as pd  # step {step}\n" * 40,
+            stdout="x" * 2000,
+            exit_code=0,
+        )
+        state["script_executions"] = [*state.get("script_executions", []), execution]
+        changed["script_executions"] = state["script_executions"]
+    state.update(changed)
+    return changed
+
+
+async def _run(graph: str, steps: int, rtt_seconds: float, legacy: bool) -> dict[str, float]:
+    session = SimulatedSession(rtt_seconds)
+    checkpointer = PostgresCheckpointer(session)  # type: ignore[arg-type]
+    advance = _conversation_step if graph == "conversation" else _analysis_step
+    state: dict[str, Any] = {}
+    versions: dict[str, int] = {}
+    config = {"configurable": {"thread_id": f"bench-{graph}", "checkpoint_ns": ""}}
+    latencies = []
+
+    for step in range(1, steps + 1):
+        changed = advance(step, state)
+        for channel in changed:
+            versions[channel] = versions.get(channel, 0) + 1
+        checkpoint = SimpleNamespace(
+            id=f"cp-{step}",
+            ts=datetime.now(UTC).isoformat(),
+            channel_values=dict(state),
+            channel_versions=dict(versions),
+            versions_seen={},
+            pending_sends=[],
+        )
+        metadata = SimpleNamespace(source="loop", step=step, writes=None, parents={})
+        writes = list(changed.items())
+
+        start = time.perf_counter()
+        if legacy:
+            await _legacy_step(session, config, checkpoint, metadata, writes)
+        else:
+            new_versions = {channel: versions[channel] for channel in changed}
+            next_config = await checkpointer.aput(config, checkpoint, metadata, new_versions)
+            await checkpointer.aput_writes(next_config, writes, "task")
+            config = next_config
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1] * 1000,
+        "round_trips_per_step": session.round_trips / steps,
+        "kb_per_step": session.bytes_sent / steps / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--steps", type=int, default=40, help="Graph steps per run")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="Simulated DB round trip")
+    args = parser.parse_args()
+
+    header = f"{'graph':<14}{'path':<8}{'p50 ms':>9}{'p95 ms':>9}{'trips/step':>12}{'KB/step':>10}"
+    print(header)
+    print("-" * len(header))
+    for graph in ("conversation", "analysis"):
+        for label, legacy in (("before", True), ("after", False)):
+            result = asyncio.run(_run(graph, args.steps, args.rtt_ms / 1000, legacy))
+            print(
+                f"{graph:<14}{label:<8}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+                f"{result['round_trips_per_step']:>12.1f}{result['kb_per_step']:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Benchmark event-loop stall caused by MLflow metric logging on HA requests.
+
+Runs concurrent simulated HA requests that each log a duration metric,
+as ``BaseHAClient._request`` does, and compares the previous path
+(``mlflow.log_metric`` called on the event loop) with the queued
+exporter (``TelemetryExporter`` + ``log_batch`` from its thread).
+
+The tracking server is simulated: every ``log_metric`` / ``log_batch``
+call blocks for a round trip. Stall is the time the loop thread spends
+inside the logging call; lag is how late a 1ms heartbeat task wakes up.
+
+Usage:
+    python scripts/bench_telemetry.py
+    python scripts/bench_telemetry.py --requests 2000 --rtt-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Ensure project root is in path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.tracing import mlflow_logging
+from src.tracing.mlflow_export import TelemetryExporter
+
+
+class SimulatedTrackingServer:
+    """Stand-in for ``mlflow`` / ``MlflowClient`` that blocks per round trip."""
+
+    def __init__(self, rtt_seconds: float) -> None:
+        self.rtt_seconds = rtt_seconds
+        self.round_trips = 0
+        self.records = 0
+        self._run = SimpleNamespace(info=SimpleNamespace(run_id="bench"))
+
+    def active_run(self) -> SimpleNamespace:
+        return self._run
+
+    def log_metric(self, key: str, value: float, step: int | None = None) -> None:
+        self.round_trips += 1
+        self.records += 1
+        time.sleep(self.rtt_seconds)
+
+    def log_batch(self, run_id: str, metrics: list, params: list) -> None:
+        self.round_trips += 1
+        self.records += len(metrics) + len(params)
+        time.sleep(self.rtt_seconds)
+
+
+def _legacy_log_metric(server: SimulatedTrackingServer, key: str, value: float) -> None:
+    """The logging path before the exporter: synchronous on the caller."""
+    if server.active_run():
+        server.log_metric(key, value, step=None)
+
+
+async def _heartbeat(lags: list[float], stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + 0.001
+        await asyncio.sleep(0.001)
+        lags.append(max(loop.time() - expected, 0.0) * 1000)
+
+
+async def _run(log: object, requests: int, concurrency: int) -> dict[str, float]:
+    log("bench.warmup", 0.0)  # type: ignore[operator]  # first-call imports
+    stalls: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(lags, stop))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(i: int) -> None:
+        async with semaphore:
+            await asyncio.sleep(0.002)  # the HA round trip itself
+            started = time.perf_counter()
+            log("ha.request.get.duration_ms", float(i % 50))  # type: ignore[operator]
+            stalls.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await heartbeat
+    return {
+        "wall_s": elapsed,
+        "stall_mean_ms": statistics.fmean(stalls),
+        "stall_p99_ms": sorted(stalls)[int(len(stalls) * 0.99) - 1],
+        "lag_p99_ms": sorted(lags)[int(len(lags) * 0.99) - 1] if lags else 0.0,
+    }
+
+
+def _print(label: str, result: dict[str, float], server: SimulatedTrackingServer) -> None:
+    print(
+        f"{label:<10} wall {result['wall_s']:6.2f}s  "
+        f"stall/request mean {result['stall_mean_ms']:7.3f}ms p99 {result['stall_p99_ms']:7.3f}ms  "
+        f"loop lag p99 {result['lag_p99_ms']:7.2f}ms  "
+        f"round trips {server.round_trips:5d} ({server.records} records)"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rtt-ms", type=float, default=3.0)
+    args = parser.parse_args()
+    rtt = args.rtt_ms / 1000
+
+    legacy_server = SimulatedTrackingServer(rtt)
+    legacy = await _run(
+        lambda key, value: _legacy_log_metric(legacy_server, key, value),
+        args.requests,
+        args.concurrency,
+    )
+
+    queued_server = SimulatedTrackingServer(rtt)
+    exporter = TelemetryExporter(flush_interval=0.5)
+    exporter._client = queued_server
+    with (
+        patch.object(mlflow_logging, "_safe_import_mlflow", return_value=queued_server),
+        patch.object(mlflow_logging, "get_telemetry_exporter", return_value=exporter),
+    ):
+        queued = await _run(mlflow_logging.log_metric, args.requests, args.concurrency)
+    exporter.close()
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, RTT {args.rtt_ms}ms")
+    _print("sync", legacy, legacy_server)
+    _print("queued", queued, queued_server)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
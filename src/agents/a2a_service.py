@@ -466,6 +466,9 @@ def create_a2a_service(
     # Prometheus metrics endpoint at /metrics
     from prometheus_fastapi_instrumentator import Instrumentator
 
+    from src.api.metrics import register_prometheus_collector
+
     Instrumentator().instrument(app).expose(app, include_in_schema=False)
+    register_prometheus_collector()
 
     return app
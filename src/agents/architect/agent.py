@@ -41,6 +41,7 @@ from src.agents.architect.review import (
 from src.agents.architect.tools import get_ha_tools, is_mutating_tool
 from src.agents.base import BaseAgent
 from src.agents.prompts import load_prompt
+from src.agents.streaming.dispatcher import invoke_timed
 from src.graph.state import AgentRole, ConversationState, ConversationStatus, HITLApproval
 from src.llm import get_llm
 
@@ -294,7 +295,9 @@ class ArchitectAgent(BaseAgent):
             tool = tool_lookup.get(tool_name)
             if not tool:
                 return None
-            result = await tool.ainvoke(cast("dict[str, Any]", call.get("args", {})))
+            result = await invoke_timed(
+                tool, tool_name, cast("dict[str, Any]", call.get("args", {}))
+            )
             return ToolMessage(
                 content=str(result),
                 tool_call_id=str(call.get("id", "")),
@@ -5,6 +5,7 @@ consistent tracing, error handling, and state management.
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
 
 try:
@@ -28,7 +29,7 @@ from pydantic import BaseModel
 from src.agents.execution_context import emit_progress
 from src.graph.state import AgentRole, BaseState
 from src.settings import get_settings
-from src.tracing import add_span_event, get_active_span, log_dict, log_param
+from src.tracing import add_span_event, get_active_span, log_dict, log_metric, log_param
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +177,7 @@ class BaseAgent(ABC):
                 span = None
                 ctx = None
 
+        started = time.perf_counter()
         try:
             # Auto-emit agent_start to execution context progress queue
             emit_progress("agent_start", self.role.value, f"{self.name} started")
@@ -211,6 +213,11 @@ class BaseAgent(ABC):
             raise
 
         finally:
+            from src.api.metrics import get_metrics_collector
+
+            get_metrics_collector().record_latency(
+                "agent", self.role.value, (time.perf_counter() - started) * 1000
+            )
             # Clean up span context if we created one
             if mlflow_available and ctx is not None:
                 try:
@@ -323,8 +330,6 @@ class BaseAgent(ABC):
             response: Optional new response to append
             tool_calls: Optional list of tool calls made
         """
-        import time
-
         # Serialize messages
         serialized = []
         for msg in messages:
@@ -408,13 +413,7 @@ class BaseAgent(ABC):
             value: Metric value
             step: Optional step number
         """
-        try:
-            import mlflow
-
-            if mlflow.active_run():
-                mlflow.log_metric(f"{self.name}.{key}", value, step=step)
-        except _MLFLOW_EXCEPTIONS:
-            logger.debug("Failed to log metric %s to MLflow", key, exc_info=True)
+        log_metric(f"{self.name}.{key}", value, step=step)
 
     def log_param(self, key: str, value: Any) -> None:
         """Log a parameter to MLflow.
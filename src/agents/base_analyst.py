@@ -16,8 +16,9 @@ Subclasses must implement:
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import shutil
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
@@ -40,12 +41,16 @@ from src.graph.state import (
 )
 from src.ha import HAClient, get_ha_client, get_ha_client_async
 from src.llm import get_llm
+from src.sandbox.aether_data import write_bundle
 from src.sandbox.policies import get_policy_for_depth
-from src.sandbox.runner import SandboxResult, SandboxRunner
+from src.sandbox.runner import SandboxResult, create_data_dir, get_sandbox_runner
 from src.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Loads the mounted data bundle as ``data`` ahead of the analysis script
+_DATA_PREAMBLE = "import aether_data\ndata = aether_data.load()\n\n"
+
 
 class BaseAnalyst(
     AnalystConfigMixin,
@@ -77,7 +82,7 @@ class BaseAnalyst(
         )
         self._ha_client = ha_client
         self._llm: BaseChatModel | None = None
-        self._sandbox = SandboxRunner()
+        self._sandbox = get_sandbox_runner()
 
     # ------------------------------------------------------------------
     # Shared helpers
@@ -198,7 +203,10 @@ class BaseAnalyst(
     ) -> SandboxResult:
         """Execute an analysis script in the gVisor sandbox.
 
-        Injects data as a JSON preamble so the script can access it.
+        Writes data once as a columnar bundle (see ``aether_data``) that is
+        mounted read-only; a one-line preamble loads it, memory-mapped, as
+        the ``data`` variable. Record rows are only built when a script
+        uses them as a list.
         Uses ``get_policy_for_depth()`` to build a depth-appropriate policy.
         Logs ``status`` communications at start and completion.
 
@@ -222,10 +230,17 @@ class BaseAnalyst(
         settings = get_settings()
         policy = get_policy_for_depth(depth, settings)
 
-        # Inject data as a JSON variable at the top of the script
-        data_json = json.dumps(data, default=str)
-        injected_script = f"import json\ndata = json.loads('''{data_json}''')\n\n{script}"
-        result = await self._sandbox.run(injected_script, policy=policy)
+        # Hand data over as a mounted bundle instead of inlining it
+        data_dir = create_data_dir()
+        try:
+            await asyncio.to_thread(write_bundle, data, data_dir)
+            result = await self._sandbox.run(
+                f"{_DATA_PREAMBLE}{script}",
+                policy=policy,
+                data_path=data_dir,
+            )
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
 
         status = "completed" if result.exit_code == 0 else "failed"
         emit_communication(
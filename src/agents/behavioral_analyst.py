@@ -135,6 +135,8 @@ class BehavioralAnalyst(BaseAnalyst):
                         "co_occurrences": c.co_occurrence_count,
                         "avg_delta_seconds": c.avg_time_delta_seconds,
                         "confidence": c.confidence,
+                        "lift": c.lift,
+                        "pmi": c.pmi,
                     }
                     for c in correlations
                 ]
@@ -6,8 +6,12 @@ Provides a lightweight async cache for active agent configurations
 so that DB-backed per-agent settings can be resolved without
 querying the database on every LLM call.
 
-Cache is invalidated on config/prompt promotion or rollback
-via invalidate_agent_config().
+Also caches the routing metadata of routable agents for the
+Orchestrator (get_routing_agents), so classifying a message does not
+open a DB session.
+
+Cache is invalidated on config/prompt promotion or rollback, status
+changes and seeding via invalidate_agent_config().
 """
 
 from __future__ import annotations
@@ -16,6 +20,7 @@ import logging
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
+from typing import Any
 
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -26,6 +31,9 @@ _CACHE_MAX_SIZE = 100
 
 _cache: OrderedDict[str, _CacheEntry] = OrderedDict()
 
+_routing_agents: list[dict[str, Any]] | None = None
+_routing_agents_fetched_at = 0.0
+
 
 @dataclass(slots=True)
 class AgentRuntimeConfig:
@@ -116,15 +124,57 @@ async def get_agent_runtime_config(agent_name: str) -> AgentRuntimeConfig | None
         return None
 
 
+async def get_routing_agents() -> list[dict[str, Any]]:
+    """Get routing metadata of routable agents (cached).
+
+    Returns:
+        Dicts with name, domain, description, intent_patterns and
+        capabilities; empty if the DB is unavailable and nothing is cached
+    """
+    global _routing_agents, _routing_agents_fetched_at
+    if (
+        _routing_agents is not None
+        and (time.monotonic() - _routing_agents_fetched_at) <= _CACHE_TTL
+    ):
+        return _routing_agents
+
+    try:
+        from src.dal.agents import AgentRepository
+        from src.storage import get_session
+
+        async with get_session() as session:
+            agents = await AgentRepository(session).list_all()
+            _routing_agents = [
+                {
+                    "name": a.name,
+                    "domain": a.domain,
+                    "description": a.description,
+                    "intent_patterns": a.intent_patterns or [],
+                    "capabilities": a.capabilities or [],
+                }
+                for a in agents
+                if a.is_routable
+            ]
+            _routing_agents_fetched_at = time.monotonic()
+            return _routing_agents
+
+    except SQLAlchemyError:
+        logger.warning("Failed to fetch routable agents", exc_info=True)
+        return _routing_agents or []
+
+
 def invalidate_agent_config(agent_name: str | None = None) -> None:
     """Invalidate cached agent configuration.
 
     Called after config/prompt promotion or rollback to ensure
-    agents pick up the new settings.
+    agents pick up the new settings. Routing metadata is always
+    refreshed, since any agent change can affect routing.
 
     Args:
         agent_name: Specific agent to invalidate, or None for all
     """
+    global _routing_agents
+    _routing_agents = None
     if agent_name:
         _cache.pop(agent_name, None)
         logger.debug("Invalidated config cache for agent: %s", agent_name)
@@ -153,4 +203,6 @@ async def is_agent_enabled(agent_name: str) -> bool:
 
 def clear_config_cache() -> None:
     """Clear the entire config cache. Used in tests."""
+    global _routing_agents
     _cache.clear()
+    _routing_agents = None
@@ -204,6 +204,8 @@ async def collect_behavioral_data(
                     "co_occurrences": c.co_occurrence_count,
                     "avg_delta_seconds": c.avg_time_delta_seconds,
                     "confidence": c.confidence,
+                    "lift": c.lift,
+                    "pmi": c.pmi,
                 }
                 for c in correlations
             ]
@@ -0,0 +1,255 @@
+"""Local fast-path intent routing for the Orchestrator.
+
+Runs before the LLM classifier and answers on-CPU when it is confident:
+
+1. Pattern match: each agent's ``intent_patterns`` (``"order_food"``,
+   ``"lights"``) are compiled to word-boundary regexes that also accept
+   plurals and spaces for underscores. A message matching exactly one
+   agent's patterns routes there.
+2. TF-IDF classifier: a nearest-centroid model over each agent's
+   name, domain, description, intent patterns and capabilities, plus
+   messages the LLM classifier has routed confidently. Confidence is
+   the best agent's share of the top two similarities.
+
+Anything below ``INTENT_ROUTER_CONFIDENCE_THRESHOLD`` goes to the LLM.
+A sample of fast-path answers (``INTENT_ROUTER_SHADOW_RATE``) is also
+checked against the LLM to measure fast-path accuracy.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+# Confidence reported for a message matching exactly one agent's patterns
+PATTERN_CONFIDENCE = 0.9
+# Classifier matches weaker than this cosine similarity are ignored
+_MIN_SIMILARITY = 0.15
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    [
+        "a",
+        "an",
+        "and",
+        "are",
+        "be",
+        "can",
+        "could",
+        "do",
+        "for",
+        "i",
+        "in",
+        "is",
+        "it",
+        "me",
+        "my",
+        "of",
+        "or",
+        "please",
+        "the",
+        "to",
+        "would",
+        "you",
+    ]
+)
+
+
+def _stem(word: str) -> str:
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _tokens(text: str) -> list[str]:
+    return [_stem(w) for w in _TOKEN_RE.findall(text.lower()) if w not in _STOP_WORDS]
+
+
+def _compile_pattern(pattern: str) -> re.Pattern[str] | None:
+    words = _TOKEN_RE.findall(pattern.lower())
+    if not words:
+        return None
+    parts = [re.escape(w) if w.endswith("s") else f"{re.escape(w)}s?" for w in words]
+    return re.compile(r"\b" + r"[\s_-]+".join(parts) + r"\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class RouteMatch:
+    """A confident local routing decision."""
+
+    agent: str
+    confidence: float
+    method: Literal["pattern", "classifier"]
+    reasoning: str
+
+
+class IntentRouter:
+    """Pattern matcher plus TF-IDF nearest-centroid classifier over agents."""
+
+    def __init__(
+        self,
+        agents: list[dict[str, Any]],
+        history: list[tuple[str, str]] | None = None,
+        threshold: float = 0.8,
+    ) -> None:
+        """Build the router.
+
+        Args:
+            agents: Routable agent metadata (name, domain, description,
+                intent_patterns, capabilities)
+            history: (message, agent) routing decisions to learn from
+            threshold: Minimum confidence to route without the LLM
+        """
+        self.threshold = threshold
+        self._patterns: dict[str, list[tuple[str, re.Pattern[str]]]] = {}
+        documents: list[tuple[str, list[str]]] = []
+        names = set()
+        for agent in agents:
+            name = agent["name"]
+            names.add(name)
+            compiled = [
+                (p, regex)
+                for p in agent.get("intent_patterns") or []
+                if (regex := _compile_pattern(p))
+            ]
+            if compiled:
+                self._patterns[name] = compiled
+            profile = " ".join(
+                [
+                    name,
+                    agent.get("domain") or "",
+                    agent.get("description") or "",
+                    *(agent.get("intent_patterns") or []),
+                    *(agent.get("capabilities") or []),
+                ]
+            )
+            documents.append((name, _tokens(profile)))
+        documents.extend(
+            (agent, _tokens(message)) for message, agent in history or [] if agent in names
+        )
+        self._centroids = self._train(documents)
+
+    def _train(self, documents: list[tuple[str, list[str]]]) -> dict[str, dict[str, float]]:
+        doc_freq: Counter[str] = Counter()
+        for _, tokens in documents:
+            doc_freq.update(set(tokens))
+        total = len(documents)
+        self._idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in doc_freq.items()}
+        # Words never seen in training still dilute a message's similarity
+        self._unseen_idf = math.log(1 + total) + 1
+        sums: dict[str, Counter[str]] = {}
+        for agent, tokens in documents:
+            vector = self._vector(tokens)
+            sums.setdefault(agent, Counter()).update(vector)
+        return {agent: _normalize(dict(vector)) for agent, vector in sums.items()}
+
+    def _vector(self, tokens: list[str]) -> dict[str, float]:
+        counts = Counter(tokens)
+        return _normalize({t: c * self._idf.get(t, self._unseen_idf) for t, c in counts.items()})
+
+    def route(self, message: str) -> RouteMatch | None:
+        """Route ``message`` locally, or return None to defer to the LLM."""
+        match = self._match_patterns(message)
+        if match is not None and match.confidence >= self.threshold:
+            return match
+        scores = self.scores(message)
+        if not scores:
+            return None
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        best_agent, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best < _MIN_SIMILARITY:
+            return None
+        confidence = best / (best + runner_up)
+        if confidence < self.threshold:
+            return None
+        return RouteMatch(
+            agent=best_agent,
+            confidence=round(confidence, 3),
+            method="classifier",
+            reasoning=f"Local classifier match (similarity {best:.2f})",
+        )
+
+    def _match_patterns(self, message: str) -> RouteMatch | None:
+        matched: dict[str, str] = {}
+        for agent, patterns in self._patterns.items():
+            for pattern, regex in patterns:
+                if regex.search(message):
+                    matched[agent] = pattern
+                    break
+        if len(matched) != 1:
+            return None
+        ((agent, pattern),) = matched.items()
+        return RouteMatch(
+            agent=agent,
+            confidence=PATTERN_CONFIDENCE,
+            method="pattern",
+            reasoning=f"Matched intent pattern '{pattern}'",
+        )
+
+    def scores(self, message: str) -> dict[str, float]:
+        """Cosine similarity of ``message`` to each agent's centroid."""
+        vector = self._vector(_tokens(message))
+        if not vector:
+            return {}
+        return {
+            agent: sum(weight * centroid.get(term, 0.0) for term, weight in vector.items())
+            for agent, centroid in self._centroids.items()
+        }
+
+
+def _normalize(vector: dict[str, float]) -> dict[str, float]:
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return {t: v / norm for t, v in vector.items()} if norm else {}
+
+
+# Confident LLM routing decisions, used as classifier training examples
+_routing_history: deque[tuple[str, str]] = deque(maxlen=500)
+_router: IntentRouter | None = None
+_router_key: str | None = None
+
+
+def get_intent_router(agents: list[dict[str, Any]]) -> IntentRouter | None:
+    """Get the router for the current agent list (None when disabled).
+
+    The router is rebuilt when the agents' routing metadata or the
+    routing history changes.
+    """
+    global _router, _router_key
+    from src.settings import get_settings
+
+    settings = get_settings()
+    if not settings.intent_router_enabled or not agents:
+        return None
+    key = json.dumps(agents, sort_keys=True, default=str)
+    if _router is None or _router_key != key:
+        _router = IntentRouter(
+            agents,
+            history=list(_routing_history),
+            threshold=settings.intent_router_confidence_threshold,
+        )
+        _router_key = key
+    return _router
+
+
+def record_routing_decision(message: str, agent: str) -> None:
+    """Remember a confident LLM routing decision as a training example."""
+    global _router
+    if not message.strip():
+        return
+    _routing_history.append((message[:500], agent))
+    _router = None  # retrain on next use
+
+
+def reset_intent_router() -> None:
+    """Drop the router and routing history. Used in tests."""
+    global _router, _router_key
+    _routing_history.clear()
+    _router = None
+    _router_key = None
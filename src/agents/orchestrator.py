@@ -4,7 +4,9 @@ Feature 30: Domain-Agnostic Orchestration.
 
 The Orchestrator is the default entry point for all user messages when
 agent selection is set to "auto".  It:
-1. Classifies the user's intent via a lightweight LLM call.
+1. Classifies the user's intent, locally when the fast-path router
+   (``src.agents.intent_router``) is confident, otherwise via a
+   lightweight LLM call.
 2. Plans the response strategy (direct, clarify, or multi-step).
 3. Routes to the appropriate domain agent with the right config.
 
@@ -17,12 +19,12 @@ from __future__ import annotations
 
 import json
 import logging
+import random
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
 from langchain_core.messages import HumanMessage, SystemMessage
-from sqlalchemy.exc import SQLAlchemyError
 
 from src.agents.base import BaseAgent
 from src.graph.state import AgentRole, ConversationState
@@ -35,6 +37,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+
+def _record_routing(event: str) -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_intent_router(event)
+
+
 CONFIDENCE_THRESHOLD = 0.6
 FALLBACK_AGENT = "knowledge"
 
@@ -74,9 +83,12 @@ class OrchestratorAgent(BaseAgent):
         self._llm: BaseChatModel | None = None
 
     def _get_classification_llm(self) -> Any:
-        """Get or create the LLM used for intent classification."""
+        """Get or create the LLM used for intent classification.
+
+        Its responses are cached and reused for exact repeats of a request.
+        """
         if self._llm is None:
-            self._llm = get_llm(model=self.model_name, temperature=0.0)
+            self._llm = get_llm(model=self.model_name, temperature=0.0, response_cache="exact")
         return self._llm
 
     async def classify_intent(
@@ -160,37 +172,59 @@ class OrchestratorAgent(BaseAgent):
             "needs_clarification": needs_clarification,
         }
 
+    async def route(
+        self,
+        user_message: str,
+        available_agents: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Select a target agent, locally when confident, else via the LLM.
+
+        A sample of local answers (``INTENT_ROUTER_SHADOW_RATE``) is also
+        classified by the LLM, whose answer is used, to measure fast-path
+        accuracy. Confident LLM classifications train the local router.
+
+        Args:
+            user_message: The user's latest message.
+            available_agents: Agent metadata dicts, as for classify_intent.
+
+        Returns:
+            Dict with keys: agent, confidence, reasoning, needs_clarification.
+        """
+        from src.agents.intent_router import get_intent_router, record_routing_decision
+        from src.settings import get_settings
+
+        router = get_intent_router(available_agents)
+        match = router.route(user_message) if router is not None else None
+        if match is not None:
+            if random.random() >= get_settings().intent_router_shadow_rate:
+                _record_routing("fast_path")
+                return {
+                    "agent": match.agent,
+                    "confidence": match.confidence,
+                    "reasoning": match.reasoning,
+                    "needs_clarification": False,
+                }
+            _record_routing("shadowed")
+        elif router is not None:
+            _record_routing("llm")
+
+        classification = await self.classify_intent(user_message, available_agents)
+        if not classification["needs_clarification"]:
+            record_routing_decision(user_message, classification["agent"])
+            if match is not None:
+                agreed = classification["agent"] == match.agent
+                _record_routing("shadow_agree" if agreed else "shadow_disagree")
+        return classification
+
     async def _get_available_agents(self) -> list[dict[str, Any]]:
-        """Fetch routable agents from the database.
+        """Routable agent metadata for classification context.
 
-        Returns agent metadata dicts for classification context.
-        Falls back to an empty list if the DB is unavailable.
+        Cached in ``src.agents.config_cache`` and refreshed when agents
+        change. Empty if the DB is unavailable.
         """
-        try:
-            from src.dal.agents import AgentRepository
-            from src.storage import get_session_factory
-
-            factory = get_session_factory()
-            session = factory()
-            try:
-                repo = AgentRepository(session)
-                agents = await repo.list_all()
-                return [
-                    {
-                        "name": a.name,
-                        "domain": a.domain,
-                        "description": a.description,
-                        "intent_patterns": a.intent_patterns or [],
-                        "capabilities": a.capabilities or [],
-                    }
-                    for a in agents
-                    if a.is_routable
-                ]
-            finally:
-                await session.close()
-        except SQLAlchemyError:
-            logger.warning("Failed to fetch available agents", exc_info=True)
-            return []
+        from src.agents.config_cache import get_routing_agents
+
+        return await get_routing_agents()
 
     async def invoke(
         self,
@@ -215,7 +249,7 @@ class OrchestratorAgent(BaseAgent):
 
         async with self.trace_span("invoke", state) as span:
             available_agents = await self._get_available_agents()
-            classification = await self.classify_intent(user_message, available_agents)
+            classification = await self.route(user_message, available_agents)
             plan = await self.plan_response(user_message, classification)
 
             span["outputs"] = {
@@ -2,7 +2,8 @@
 
 Encapsulates the ~90-line nested async flow from stream_conversation that
 manages per-tool execution_context, progress_queue, deadline tracking, and
-SSE event forwarding.
+SSE event forwarding. Multiple read-only calls in one LLM turn run
+concurrently, with their progress queues merged by ProgressMuxer.
 """
 
 from __future__ import annotations
@@ -18,6 +19,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from src.agents.execution_context import ProgressEvent, execution_context
 from src.agents.streaming.events import StreamEvent
+from src.agents.streaming.muxer import ProgressMuxer
 from src.settings import ANALYSIS_TOOLS, get_settings
 
 if TYPE_CHECKING:
@@ -27,6 +29,7 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.agents.streaming.parser import ParsedToolCall
+    from src.settings import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,7 @@ async def dispatch_tool_calls(
     tool_lookup: dict[str, Any],
     conversation_id: str,
     session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]] | None = None,
+    max_concurrency: int | None = None,
 ) -> AsyncGenerator[StreamEvent, None]:
     """Execute parsed tool calls, yielding streaming events.
 
@@ -46,6 +50,12 @@ async def dispatch_tool_calls(
       execution context's queue while the tool runs, then yield ``tool_end``.
     - Timeout and exception handling produce error ``tool_end`` events.
 
+    When more than one read-only call is present and ``max_concurrency`` is
+    above 1, the read-only calls run concurrently (bounded by a semaphore).
+    ``tool_start``/``approval_required`` events are still yielded in call
+    order up front, progress from all running tools is multiplexed with
+    :class:`ProgressMuxer`, and ``tool_end`` events follow call order.
+
     After all tools are dispatched, yields a final ``_dispatch_result`` event
     containing ``tool_results`` (id -> result string), ``full_tool_calls``
     (dicts for AIMessage), and ``proposal_summaries``.
@@ -57,35 +67,70 @@ async def dispatch_tool_calls(
         session_factory: Optional callable returning an async session context
             manager.  Threaded into :class:`ExecutionContext` so tools like
             ``consult_data_science_team`` can persist reports/insights.
+        max_concurrency: Maximum concurrently running read-only tools
+            (defaults to ``settings.tool_max_concurrency``; 1 = sequential).
 
     Yields:
         StreamEvent dicts during execution and one ``_dispatch_result`` at end.
     """
     tool_results: dict[str, str] = {}
-    full_tool_calls: list[dict[str, Any]] = []
+    full_tool_calls = [{"name": tc.name, "args": tc.args, "id": tc.id} for tc in tool_calls]
     proposal_summaries: list[str] = []
 
-    for tc in tool_calls:
-        full_tool_calls.append({"name": tc.name, "args": tc.args, "id": tc.id})
+    runnable = sum(1 for tc in tool_calls if not tc.is_mutating and tc.name in tool_lookup)
+    if runnable > 1 and max_concurrency is None:
+        max_concurrency = get_settings().tool_max_concurrency
+    dispatch = (
+        _dispatch_concurrent
+        if runnable > 1 and max_concurrency is not None and max_concurrency > 1
+        else _dispatch_sequential
+    )
+
+    async for event in dispatch(
+        tool_calls=tool_calls,
+        tool_lookup=tool_lookup,
+        conversation_id=conversation_id,
+        session_factory=session_factory,
+        max_concurrency=max_concurrency or 1,
+    ):
+        if event["type"] == "_tool_result":
+            # Internal event — collect result
+            tool_results[event["tool_call_id"]] = event["result_str"]
+            if event.get("is_proposal"):
+                proposal_summaries.append(event["result_str"])
+        else:
+            yield event
 
-        # Mutating tools require human approval — skip execution
+    # Yield final dispatch result for the orchestrator
+    yield StreamEvent(
+        type="_dispatch_result",
+        tool_results=tool_results,
+        full_tool_calls=full_tool_calls,
+        proposal_summaries=proposal_summaries,
+    )
+
+
+async def _dispatch_sequential(
+    *,
+    tool_calls: list[ParsedToolCall],
+    tool_lookup: dict[str, Any],
+    conversation_id: str,
+    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]] | None,
+    max_concurrency: int,
+) -> AsyncGenerator[StreamEvent, None]:
+    """Run tool calls one after another."""
+    for tc in tool_calls:
         if tc.is_mutating:
-            yield StreamEvent(
-                type="approval_required",
-                tool=tc.name,
-                content=f"Approval needed: {tc.name}({tc.args})",
-            )
-            tool_results[tc.id] = "Requires user approval"
+            for event in _approval_events(tc):
+                yield event
             continue
 
-        # Include truncated args so the activity panel can show what's being called
-        args_summary = str(tc.args)[:200] if tc.args else ""
-        yield StreamEvent(type="tool_start", tool=tc.name, agent="architect", args=args_summary)
+        yield _tool_start_event(tc)
 
         tool = tool_lookup.get(tc.name)
         if not tool:
-            tool_results[tc.id] = f"Tool {tc.name} not found"
-            yield StreamEvent(type="tool_end", tool=tc.name, result=f"Tool {tc.name} not found")
+            for event in _not_found_events(tc):
+                yield event
             continue
 
         # Execute tool with progress draining
@@ -97,20 +142,190 @@ async def dispatch_tool_calls(
             conversation_id=conversation_id,
             session_factory=session_factory,
         ):
-            if event["type"] == "_tool_result":
-                # Internal event — collect result
-                tool_results[tc.id] = event["result_str"]
-                if event.get("is_proposal"):
-                    proposal_summaries.append(event["result_str"])
-            else:
-                yield event
+            yield event
 
-    # Yield final dispatch result for the orchestrator
-    yield StreamEvent(
-        type="_dispatch_result",
-        tool_results=tool_results,
-        full_tool_calls=full_tool_calls,
-        proposal_summaries=proposal_summaries,
+
+async def _dispatch_concurrent(
+    *,
+    tool_calls: list[ParsedToolCall],
+    tool_lookup: dict[str, Any],
+    conversation_id: str,
+    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]] | None,
+    max_concurrency: int,
+) -> AsyncGenerator[StreamEvent, None]:
+    """Run read-only tool calls concurrently with in-order start/end events."""
+    settings = get_settings()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    running: list[tuple[ParsedToolCall, asyncio.Task[tuple[str, str]]]] = []
+    queues: list[asyncio.Queue[ProgressEvent]] = []
+
+    try:
+        for tc in tool_calls:
+            if tc.is_mutating:
+                for event in _approval_events(tc):
+                    yield event
+                continue
+
+            yield _tool_start_event(tc)
+
+            tool = tool_lookup.get(tc.name)
+            if not tool:
+                for event in _not_found_events(tc):
+                    yield event
+                continue
+
+            progress_queue: asyncio.Queue[ProgressEvent] = asyncio.Queue()
+            queues.append(progress_queue)
+            running.append(
+                (
+                    tc,
+                    asyncio.create_task(
+                        _run_tool(
+                            tool=tool,
+                            tool_name=tc.name,
+                            args=tc.args,
+                            progress_queue=progress_queue,
+                            semaphore=semaphore,
+                            conversation_id=conversation_id,
+                            session_factory=session_factory,
+                            settings=settings,
+                        )
+                    ),
+                )
+            )
+
+        muxer = ProgressMuxer(queues)
+        for tc, task in running:
+            # Forward progress from every running tool until this one finishes
+            async for progress in muxer.drain_until_done(done_check=task.done):
+                yield _progress_to_stream_event(progress)
+
+            result_str, display = task.result()
+            yield StreamEvent(type="tool_end", tool=tc.name, result=display)
+            yield _result_event(tc.name, tc.id, result_str)
+    finally:
+        for _, task in running:
+            if not task.done():
+                task.cancel()
+
+
+async def _run_tool(
+    *,
+    tool: Any,
+    tool_name: str,
+    args: dict[str, Any],
+    progress_queue: asyncio.Queue[ProgressEvent],
+    semaphore: asyncio.Semaphore,
+    conversation_id: str,
+    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]] | None,
+    settings: Settings,
+) -> tuple[str, str]:
+    """Invoke one tool under the semaphore with its own execution context.
+
+    Returns:
+        ``(result_str, tool_end_display)`` — errors and timeouts are
+        reported as ``Error: ...`` strings rather than raised.
+    """
+    timeout = _timeout_for(tool_name, settings)
+    async with (
+        semaphore,
+        execution_context(
+            progress_queue=progress_queue,
+            session_factory=session_factory,
+            conversation_id=conversation_id,
+            tool_timeout=float(settings.tool_timeout_seconds),
+            analysis_timeout=float(settings.analysis_tool_timeout_seconds),
+        ),
+    ):
+        tool_task = asyncio.create_task(invoke_timed(tool, tool_name, args))
+        try:
+            done, _ = await asyncio.wait({tool_task}, timeout=float(timeout))
+            if not done:
+                tool_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await tool_task
+                result_str = f"Error: Tool {tool_name} timed out after {timeout}s"
+                return result_str, result_str
+            result_str = str(tool_task.result())
+            return result_str, result_str[:500]
+        except (
+            httpx.HTTPError,
+            TimeoutError,
+            ConnectionError,
+            SQLAlchemyError,
+            ValueError,
+            OSError,
+        ) as e:
+            result_str = f"Error: {e}"
+            return result_str, result_str
+        finally:
+            if not tool_task.done():
+                tool_task.cancel()
+
+
+async def invoke_timed(tool: Any, tool_name: str, args: dict[str, Any]) -> Any:
+    """``tool.ainvoke(args)``, recording its latency (including timeouts) per tool."""
+    started = time.perf_counter()
+    try:
+        return await tool.ainvoke(args)
+    finally:
+        from src.api.metrics import get_metrics_collector
+
+        get_metrics_collector().record_latency(
+            "tool", tool_name, (time.perf_counter() - started) * 1000
+        )
+
+
+def _timeout_for(tool_name: str, settings: Settings) -> int:
+    """Per-tool timeout: analysis tools get the longer budget."""
+    return (
+        settings.analysis_tool_timeout_seconds
+        if tool_name in ANALYSIS_TOOLS
+        else settings.tool_timeout_seconds
+    )
+
+
+def _tool_start_event(tc: ParsedToolCall) -> StreamEvent:
+    # Include truncated args so the activity panel can show what's being called
+    args_summary = str(tc.args)[:200] if tc.args else ""
+    return StreamEvent(type="tool_start", tool=tc.name, agent="architect", args=args_summary)
+
+
+def _approval_events(tc: ParsedToolCall) -> list[StreamEvent]:
+    """Mutating tools require human approval — skip execution."""
+    return [
+        StreamEvent(
+            type="approval_required",
+            tool=tc.name,
+            content=f"Approval needed: {tc.name}({tc.args})",
+        ),
+        StreamEvent(type="_tool_result", tool_call_id=tc.id, result_str="Requires user approval"),
+    ]
+
+
+def _not_found_events(tc: ParsedToolCall) -> list[StreamEvent]:
+    result_str = f"Tool {tc.name} not found"
+    return [
+        StreamEvent(type="tool_end", tool=tc.name, result=result_str),
+        StreamEvent(type="_tool_result", tool_call_id=tc.id, result_str=result_str),
+    ]
+
+
+def _result_event(tool_name: str, tool_call_id: str, result_str: str) -> StreamEvent:
+    """Internal ``_tool_result`` event collected by the dispatcher."""
+    # Track proposal creations — authoritative check is tool name,
+    # string match on result is a secondary signal for the frontend.
+    is_proposal = tool_name == "seek_approval"
+    if is_proposal:
+        logger.info(
+            "seek_approval invoked — result (first 200 chars): %s",
+            result_str[:200],
+        )
+    return StreamEvent(
+        type="_tool_result",
+        tool_call_id=tool_call_id,
+        result_str=result_str,
+        is_proposal=is_proposal,
     )
 
 
@@ -157,11 +372,7 @@ async def _execute_single_tool(
         StreamEvent dicts.
     """
     settings = get_settings()
-    timeout = (
-        settings.analysis_tool_timeout_seconds
-        if tool_name in ANALYSIS_TOOLS
-        else settings.tool_timeout_seconds
-    )
+    timeout = _timeout_for(tool_name, settings)
 
     progress_queue: asyncio.Queue[ProgressEvent] = asyncio.Queue()
     async with execution_context(
@@ -171,7 +382,7 @@ async def _execute_single_tool(
         tool_timeout=float(settings.tool_timeout_seconds),
         analysis_timeout=float(settings.analysis_tool_timeout_seconds),
     ):
-        tool_task = asyncio.create_task(tool.ainvoke(args))
+        tool_task = asyncio.create_task(invoke_timed(tool, tool_name, args))
         deadline = time.monotonic() + float(timeout)
         timed_out = False
 
@@ -199,7 +410,7 @@ async def _execute_single_tool(
                     await tool_task
                 result_str = f"Error: Tool {tool_name} timed out after {timeout}s"
                 yield StreamEvent(type="tool_end", tool=tool_name, result=result_str)
-                yield StreamEvent(type="_tool_result", result_str=result_str)
+                yield _result_event(tool_name, tool_call_id, result_str)
             else:
                 # Drain remaining progress events after tool completes
                 while not progress_queue.empty():
@@ -209,20 +420,7 @@ async def _execute_single_tool(
                 result = tool_task.result()
                 result_str = str(result)
                 yield StreamEvent(type="tool_end", tool=tool_name, result=result_str[:500])
-
-                # Track proposal creations — authoritative check is tool name,
-                # string match on result is a secondary signal for the frontend.
-                is_proposal = tool_name == "seek_approval"
-                if is_proposal:
-                    logger.info(
-                        "seek_approval invoked — result (first 200 chars): %s",
-                        result_str[:200],
-                    )
-                yield StreamEvent(
-                    type="_tool_result",
-                    result_str=result_str,
-                    is_proposal=is_proposal,
-                )
+                yield _result_event(tool_name, tool_call_id, result_str)
 
         except (
             httpx.HTTPError,
@@ -236,4 +434,4 @@ async def _execute_single_tool(
                 tool_task.cancel()
             result_str = f"Error: {e}"
             yield StreamEvent(type="tool_end", tool=tool_name, result=result_str)
-            yield StreamEvent(type="_tool_result", result_str=result_str)
+            yield _result_event(tool_name, tool_call_id, result_str)
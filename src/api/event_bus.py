@@ -0,0 +1,360 @@
+"""Event bus behind the global activity SSE stream.
+
+Publishers (``publish_activity`` and the job event helpers) hand the bus
+a topic and a JSON string; every subscriber of that topic gets it with
+an event id it can resume from. Each topic keeps a ring buffer of
+recent events, so a client reconnecting with ``Last-Event-ID`` is sent
+what it missed. Event ids start with their publish time, so an id that
+is no longer buffered (eviction, restart) still bounds the replay.
+
+Each subscriber's backlog is bounded; when a slow client falls behind,
+its oldest events are dropped (and counted) rather than the client
+being disconnected.
+
+Backends (``EVENT_BUS_BACKEND``):
+    memory    Fan-out within this process. Enough for a single worker.
+    postgres  Events are published with ``NOTIFY`` and received with
+              ``LISTEN`` on a dedicated asyncpg connection, so every API
+              worker and A2A service sharing the database sees every
+              event. While that connection is down, events are delivered
+              locally only.
+
+Usage::
+
+    bus = get_event_bus()
+    bus.publish("activity", json.dumps(event))
+
+    subscription = bus.subscribe("activity", last_event_id=header)
+    while (item := await subscription.get()) is not None:
+        event_id, data = item
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import os
+import time
+from collections import defaultdict, deque
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+_MAX_NOTIFY_BYTES = 7900
+_NOTIFY_BATCH = 100
+_BACKOFF_BASE = 1.0
+_BACKOFF_MAX = 30.0
+
+# Distinguishes ids minted by different processes publishing at the same ms
+_PROCESS_TAG = os.urandom(3).hex()
+
+
+def _id_timestamp(event_id: str) -> int | None:
+    """Publish time (epoch ms) embedded in an event id, if it has one."""
+    try:
+        return int(event_id.split("-", 1)[0], 16)
+    except ValueError:
+        return None
+
+
+def _record_metric(event: str, count: int = 1) -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_event_bus(event, count)
+
+
+class Subscription:
+    """One subscriber's bounded backlog of ``(event_id, data)`` pairs."""
+
+    def __init__(self, topic: str, backlog: int) -> None:
+        self.topic = topic
+        self.dropped = 0
+        self._queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue(maxsize=backlog)
+
+    def put(self, item: tuple[str, str] | None) -> bool:
+        """Queue an event, dropping the oldest one if the backlog is full.
+
+        Returns:
+            False when an older event had to be dropped
+        """
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            with contextlib.suppress(asyncio.QueueEmpty):
+                self._queue.get_nowait()
+            self.dropped += 1
+            self._queue.put_nowait(item)
+            return False
+
+    def close(self) -> None:
+        """Wake the subscriber with an end-of-stream sentinel."""
+        self.put(None)
+
+    async def get(self) -> tuple[str, str] | None:
+        """Next ``(event_id, data)`` pair, or None once closed."""
+        return await self._queue.get()
+
+
+class EventBus:
+    """In-process event bus with per-topic replay buffers."""
+
+    def __init__(self, replay_size: int = 500, subscriber_backlog: int = 200) -> None:
+        """Initialize the bus.
+
+        Args:
+            replay_size: Events kept per topic for ``Last-Event-ID`` replay
+            subscriber_backlog: Undelivered events kept per subscriber
+        """
+        self.replay_size = replay_size
+        self.subscriber_backlog = subscriber_backlog
+        self._history: dict[str, deque[tuple[str, str]]] = defaultdict(
+            lambda: deque(maxlen=replay_size)
+        )
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+        self._seq = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+
+    def _next_id(self) -> str:
+        return f"{int(time.time() * 1000):x}-{_PROCESS_TAG}-{next(self._seq)}"
+
+    def publish(self, topic: str, data: str) -> str:
+        """Publish a JSON-encoded event to a topic (never blocks).
+
+        Returns:
+            The event id
+        """
+        event_id = self._next_id()
+        self.published += 1
+        _record_metric("published")
+        self._deliver(topic, event_id, data)
+        return event_id
+
+    def _deliver(self, topic: str, event_id: str, data: str) -> None:
+        """Buffer an event for replay and hand it to local subscribers."""
+        item = (event_id, data)
+        self._history[topic].append(item)
+        dropped = sum(not sub.put(item) for sub in self._subscribers.get(topic, ()))
+        if dropped:
+            self.dropped += dropped
+            _record_metric("dropped", dropped)
+
+    def subscribe(self, topic: str, last_event_id: str | None = None) -> Subscription:
+        """Subscribe to a topic, first replaying events after ``last_event_id``."""
+        subscription = Subscription(topic, self.subscriber_backlog)
+        if last_event_id:
+            missed = self.replay(topic, last_event_id)
+            for item in missed:
+                subscription.put(item)
+            if missed:
+                _record_metric("replayed", len(missed))
+        self._subscribers[topic].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering to a subscription."""
+        self._subscribers.get(subscription.topic, set()).discard(subscription)
+
+    def replay(self, topic: str, last_event_id: str) -> list[tuple[str, str]]:
+        """Buffered events published after ``last_event_id``.
+
+        An id that is no longer buffered (evicted, or minted before a
+        restart) replays only events published after its timestamp; an
+        id that cannot be parsed replays nothing.
+        """
+        history = list(self._history.get(topic, ()))
+        for i, (event_id, _) in enumerate(history):
+            if event_id == last_event_id:
+                return history[i + 1 :]
+        since = _id_timestamp(last_event_id)
+        if since is None:
+            return []
+        return [item for item in history if (_id_timestamp(item[0]) or 0) > since]
+
+    def stats(self) -> dict[str, int]:
+        """Bus counters for diagnostics."""
+        return {
+            "published": self.published,
+            "dropped": self.dropped,
+            "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+        }
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+
+class PostgresEventBus(EventBus):
+    """Event bus that fans out across processes via Postgres LISTEN/NOTIFY.
+
+    ``publish`` only queues the event; a task on the running event loop
+    sends queued events with ``pg_notify`` and delivers notifications
+    (including this process's own) to local subscribers, so every
+    process buffers the same events under the same ids.
+    """
+
+    def __init__(self, dsn: str, channel: str = "aether_events", **kwargs: Any) -> None:
+        """Initialize the bus.
+
+        Args:
+            dsn: libpq-style Postgres URL (no SQLAlchemy driver suffix)
+            channel: NOTIFY channel shared by all processes
+            **kwargs: ``EventBus`` options
+        """
+        super().__init__(**kwargs)
+        self._dsn = dsn
+        self._channel = channel
+        self._outbox: deque[tuple[str, str, str]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._connected = False
+        self.notify_failed = 0
+
+    def publish(self, topic: str, data: str) -> str:
+        event_id = self._next_id()
+        self.published += 1
+        _record_metric("published")
+        payload = json.dumps({"t": topic, "i": event_id, "d": data})
+        if not self._ensure_running() or len(payload.encode()) > _MAX_NOTIFY_BYTES:
+            self._deliver(topic, event_id, data)
+            return event_id
+        self._outbox.append((topic, event_id, data))
+        assert self._wakeup is not None
+        self._wakeup.set()
+        return event_id
+
+    def subscribe(self, topic: str, last_event_id: str | None = None) -> Subscription:
+        self._ensure_running()
+        return super().subscribe(topic, last_event_id)
+
+    def _ensure_running(self) -> bool:
+        """Start the LISTEN loop on the current event loop; True once connected."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._connected = False
+            self._task = loop.create_task(self._run())
+        return self._connected
+
+    async def _run(self) -> None:
+        import asyncpg
+
+        wakeup = self._wakeup
+        assert wakeup is not None
+        backoff = _BACKOFF_BASE
+        while True:
+            try:
+                conn = await asyncpg.connect(self._dsn)
+                try:
+                    conn.add_termination_listener(lambda _conn: wakeup.set())
+                    await conn.add_listener(self._channel, self._on_notify)
+                    self._connected = True
+                    backoff = _BACKOFF_BASE
+                    logger.info("Event bus listening on Postgres channel %s", self._channel)
+                    await self._send_loop(conn)
+                finally:
+                    self._connected = False
+                    with contextlib.suppress(Exception):
+                        await conn.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Event bus connection lost (%s), retrying in %.0fs", e, backoff)
+            self._deliver_outbox_locally()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, _BACKOFF_MAX)
+
+    async def _send_loop(self, conn: Any) -> None:
+        assert self._wakeup is not None
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if conn.is_closed():
+                raise ConnectionError("Postgres connection closed")
+            while self._outbox:
+                batch = [
+                    self._outbox.popleft() for _ in range(min(_NOTIFY_BATCH, len(self._outbox)))
+                ]
+                try:
+                    await conn.executemany(
+                        "SELECT pg_notify($1, $2)",
+                        [
+                            (self._channel, json.dumps({"t": topic, "i": event_id, "d": data}))
+                            for topic, event_id, data in batch
+                        ],
+                    )
+                except Exception:
+                    self.notify_failed += len(batch)
+                    _record_metric("notify_failed", len(batch))
+                    for item in batch:
+                        self._deliver(*item)
+                    raise
+
+    def _on_notify(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            self._deliver(message["t"], message["i"], message["d"])
+        except (ValueError, KeyError, TypeError):
+            logger.debug("Ignoring malformed event bus payload: %.200s", payload)
+
+    def _deliver_outbox_locally(self) -> None:
+        while self._outbox:
+            self._deliver(*self._outbox.popleft())
+
+    def stats(self) -> dict[str, int]:
+        return {**super().stats(), "notify_failed": self.notify_failed}
+
+    async def close(self) -> None:
+        """Stop listening; undelivered events go to local subscribers."""
+        if self._task is not None and self._loop is asyncio.get_running_loop():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        self._deliver_outbox_locally()
+
+
+_event_bus: EventBus | None = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus."""
+    global _event_bus
+    if _event_bus is None:
+        from src.settings import get_settings
+
+        settings = get_settings()
+        replay_size = settings.event_bus_replay_size
+        backlog = settings.event_bus_subscriber_backlog
+        if settings.event_bus_backend == "postgres":
+            dsn = str(settings.database_url).replace("+asyncpg", "", 1)
+            _event_bus = PostgresEventBus(dsn, replay_size=replay_size, subscriber_backlog=backlog)
+        else:
+            _event_bus = EventBus(replay_size=replay_size, subscriber_backlog=backlog)
+    return _event_bus
+
+
+async def close_event_bus() -> None:
+    """Stop the event bus (application shutdown)."""
+    global _event_bus
+    if _event_bus is not None:
+        await _event_bus.close()
+        _event_bus = None
+
+
+__all__ = [
+    "EventBus",
+    "PostgresEventBus",
+    "Subscription",
+    "close_event_bus",
+    "get_event_bus",
+]
@@ -4,6 +4,7 @@ Main entry point for the HTTP API with CORS, middleware,
 rate limiting, and lifecycle management.
 """
 
+import asyncio
 import uuid
 from collections.abc import AsyncGenerator, Callable
 from contextlib import asynccontextmanager
@@ -80,6 +81,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
             _log.getLogger(__name__).debug("Optimization job reconciliation skipped: %s", exc)
 
+    # Load persisted LLM responses so cached answers survive restarts
+    if settings.environment != "testing" and settings.llm_response_cache_persist:
+        try:
+            from src.llm.response_cache import get_response_cache
+
+            await get_response_cache().load()
+        except Exception as exc:
+            import logging as _log
+
+            _log.getLogger(__name__).debug("LLM response cache not loaded: %s", exc)
+
+    # Pre-compile workflow graphs so the first chat request doesn't pay for it
+    if settings.environment != "testing":
+        from src.graph.workflows.cache import warm_up_compiled_graphs
+
+        warm_up_compiled_graphs()
+
     # Start scheduler (Feature 10: Scheduled & Event-Driven Insights)
     # Respects AETHER_ROLE to prevent duplicate jobs in multi-replica deployments
     scheduler = None
@@ -98,15 +116,46 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if settings.environment != "testing":
         try:
             from src.ha import get_ha_client_async
+            from src.ha.event_filter import EventFilter
             from src.ha.event_handler import EventHandler
             from src.ha.event_stream import HAEventStream
 
             ha_client = await get_ha_client_async()
             ws_url = ha_client._get_ws_url()
             token = ha_client.config.ha_token
-            event_handler = EventHandler()
+            history_store = ha_client.history_store
+            state_mirror = ha_client.state_mirror
+            live_caches = [c for c in (history_store, state_mirror) if c is not None]
+
+            def _mark_live() -> None:
+                for cache in live_caches:
+                    cache.mark_live()
+
+            def _mark_stale() -> None:
+                for cache in live_caches:
+                    cache.mark_stale()
+
+            event_filter = EventFilter.from_settings(settings)
+            event_handler = EventHandler(
+                history_store=history_store,
+                state_mirror=state_mirror,
+                event_filter=event_filter,
+            )
             await event_handler.start()
-            event_stream = HAEventStream(ws_url, token, handler=event_handler.handle_event)
+            event_stream = HAEventStream(
+                ws_url,
+                token,
+                handler=event_handler.handle_event,
+                on_connected=_mark_live,
+                on_disconnected=_mark_stale,
+                session=ha_client._get_ws_session(),
+                event_types=("state_changed", "entity_registry_updated")
+                if state_mirror
+                else ("state_changed",),
+                compressed=settings.ha_event_stream_compressed,
+                # Narrow server-side only when no local cache needs every entity
+                entity_ids=None if live_caches else event_filter.literal_entity_ids(),
+            )
             event_stream.start_task()
             app.state.event_stream = event_stream
             app.state.event_handler = event_handler
@@ -134,6 +183,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await close_all_ha_clients()
 
+    # Stop warm sandbox workers
+    from src.sandbox.pool import close_sandbox_pool
+
+    await close_sandbox_pool()
+
+    # Stop listening for cross-process activity events
+    from src.api.event_bus import close_event_bus
+
+    await close_event_bus()
+
+    # Write buffered LLM usage records while the DB is still available
+    from src.llm.usage import close_usage_writer
+
+    await close_usage_writer()
+
+    # Write queued LLM response cache entries
+    from src.llm.response_cache import close_response_cache
+
+    await close_response_cache()
+
+    # Export buffered MLflow metrics and params
+    from src.tracing.mlflow_export import close_telemetry_exporter
+
+    await asyncio.to_thread(close_telemetry_exporter)
+
     if scheduler:
         await scheduler.stop()
     await close_db()
@@ -225,7 +299,10 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # Prometheus metrics endpoint at /metrics
     from prometheus_fastapi_instrumentator import Instrumentator
 
+    from src.api.metrics import register_prometheus_collector
+
     Instrumentator().instrument(app).expose(app, include_in_schema=False)
+    register_prometheus_collector()
 
     return app
 
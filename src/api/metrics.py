@@ -2,16 +2,139 @@
 
 Provides in-memory metrics collection for request rates, latency,
 error rates, and agent invocations. Metrics are ephemeral (reset on restart).
+
+Latencies are kept in log-bucketed histograms (16 buckets per doubling,
+so percentiles are within ~2.2% of the true value) keyed by route
+template, agent role, tool name and LLM model. Histograms are mergeable
+and each has its own lock, so recording never contends on the
+collector-wide lock. They are exported to Prometheus alongside the
+instrumentator's metrics via ``register_prometheus_collector()``.
 """
 
+import math
 import time
-from collections import Counter, deque
+from collections import Counter
+from collections.abc import Iterator
 from threading import Lock
 from typing import Any
 
 # Track application start time for uptime calculation
 _start_time: float = time.time()
 
+# Histogram resolution: bucket i >= 1 covers [_MIN_MS * 2^((i-1)/16), _MIN_MS * 2^(i/16))
+_SUB_BUCKETS = 16
+_MIN_MS = 0.001
+_LOG_SCALE = _SUB_BUCKETS / math.log(2)
+
+# Distinct keys tracked per latency kind; the rest are folded into "other"
+_MAX_KEYS_PER_KIND = 200
+
+# Bucket boundaries (seconds) for the Prometheus export
+_PROMETHEUS_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+LATENCY_KINDS = ("route", "agent", "tool", "llm")
+
+
+def _bucket_index(value_ms: float) -> int:
+    if value_ms < _MIN_MS:
+        return 0
+    return int(math.log(value_ms / _MIN_MS) * _LOG_SCALE) + 1
+
+
+def _bucket_upper_ms(index: int) -> float:
+    return _MIN_MS * 2 ** (index / _SUB_BUCKETS)
+
+
+def _bucket_mid_ms(index: int) -> float:
+    return 0.0 if index == 0 else _MIN_MS * 2 ** ((index - 0.5) / _SUB_BUCKETS)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (milliseconds)."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._buckets: Counter[int] = Counter()
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Add one sample."""
+        index = _bucket_index(value_ms)
+        with self._lock:
+            self._buckets[index] += 1
+            self.count += 1
+            self.sum_ms += value_ms
+            self.min_ms = min(self.min_ms, value_ms)
+            self.max_ms = max(self.max_ms, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples to this one."""
+        with other._lock:
+            buckets = Counter(other._buckets)
+            count, sum_ms, min_ms, max_ms = other.count, other.sum_ms, other.min_ms, other.max_ms
+        with self._lock:
+            self._buckets.update(buckets)
+            self.count += count
+            self.sum_ms += sum_ms
+            self.min_ms = min(self.min_ms, min_ms)
+            self.max_ms = max(self.max_ms, max_ms)
+
+    def _sorted_buckets(self) -> list[tuple[int, int]]:
+        with self._lock:
+            return sorted(self._buckets.items())
+
+    def percentile(self, q: float) -> float:
+        """Approximate value at quantile ``q`` (0-1), clamped to the observed range."""
+        if self.count == 0:
+            return 0.0
+        rank = min(max(math.floor(q * self.count) + 1, 1), self.count)
+        seen = 0
+        for index, n in self._sorted_buckets():
+            seen += n
+            if seen >= rank:
+                return min(max(_bucket_mid_ms(index), self.min_ms), self.max_ms)
+        return self.max_ms
+
+    def cumulative_counts(self, bounds_ms: tuple[float, ...]) -> list[int]:
+        """Samples at or below each bound (bucket-resolution), for Prometheus."""
+        counts = [0] * len(bounds_ms)
+        for index, n in self._sorted_buckets():
+            upper = _bucket_upper_ms(index)
+            for i, bound in enumerate(bounds_ms):
+                if upper <= bound * (1 + 1e-9):
+                    counts[i] += n
+        return counts
+
+    def summary(self) -> dict[str, float]:
+        """Count and percentiles for the JSON metrics endpoint."""
+        return {
+            "count": self.count,
+            "p50_ms": round(self.percentile(0.50), 2),
+            "p95_ms": round(self.percentile(0.95), 2),
+            "p99_ms": round(self.percentile(0.99), 2),
+            "min_ms": round(self.min_ms, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "avg_ms": round(self.sum_ms / self.count, 2) if self.count else 0.0,
+        }
+
 
 class MetricsCollector:
     """Thread-safe in-memory metrics collector.
@@ -22,18 +145,17 @@ class MetricsCollector:
     - Error counts (by error type)
     - Active requests (gauge)
     - Agent invocation count (by agent role)
-
-    Uses a sliding window (last 1000 requests) for percentile calculation.
+    - Sandbox pool events (hit, miss, start, recycle)
+    - LLM usage writer events (queued, written, dropped, failed_batches)
+    - Activity event bus events (published, dropped, replayed, notify_failed)
+    - Latency histograms by route template, agent role, tool and LLM model
+    - LLM resilience events (hedges fired/won/lost, circuit probes, Retry-After)
+    - LLM concurrency limit, in-flight calls and queue depth (by provider/model)
     """
 
-    def __init__(self, window_size: int = 1000):
-        """Initialize metrics collector.
-
-        Args:
-            window_size: Number of recent requests to keep for percentile calculation
-        """
+    def __init__(self) -> None:
+        """Initialize metrics collector."""
         self._lock = Lock()
-        self._window_size = window_size
 
         # Request tracking
         self._request_count = 0
@@ -41,8 +163,11 @@ class MetricsCollector:
         self._requests_by_path: Counter[str] = Counter()
         self._requests_by_method_path: Counter[str] = Counter()
 
-        # Latency tracking (sliding window)
-        self._latency_window: deque[float] = deque(maxlen=window_size)
+        # Latency tracking (all requests, then per kind and key)
+        self._latency = LatencyHistogram()
+        self._latency_by: dict[str, dict[str, LatencyHistogram]] = {
+            kind: {} for kind in LATENCY_KINDS
+        }
 
         # Error tracking
         self._error_count = 0
@@ -54,12 +179,40 @@ class MetricsCollector:
         # Agent invocation tracking
         self._agent_invocations: Counter[str] = Counter()
 
+        # Sandbox worker pool tracking
+        self._sandbox_pool: Counter[str] = Counter()
+
+        # Buffered LLM usage writer tracking
+        self._usage_writer: Counter[str] = Counter()
+
+        # HA GET coalescing and micro-cache tracking
+        self._ha_request_cache: Counter[str] = Counter()
+
+        # Activity event bus tracking
+        self._event_bus: Counter[str] = Counter()
+
+        # MLflow telemetry export tracking
+        self._telemetry: Counter[str] = Counter()
+
+        # LLM hedging, backoff and circuit breaker tracking
+        self._llm_resilience: Counter[str] = Counter()
+
+        # Adaptive LLM concurrency limiter state (gauges)
+        self._llm_concurrency: dict[str, dict[str, float]] = {}
+
+        # Deterministic LLM response cache tracking
+        self._llm_response_cache: Counter[str] = Counter()
+
+        # Orchestrator fast-path intent routing tracking
+        self._intent_router: Counter[str] = Counter()
+
     def record_request(
         self,
         method: str,
         path: str,
         status_code: int,
         duration_ms: float,
+        route: str | None = None,
     ) -> None:
         """Record a completed request.
 
@@ -68,6 +221,8 @@ class MetricsCollector:
             path: Request path
             status_code: HTTP status code
             duration_ms: Request duration in milliseconds
+            route: Matched route template (e.g. ``/api/v1/entities/{entity_id}``);
+                requests that matched no route are not tracked per route
         """
         with self._lock:
             self._request_count += 1
@@ -75,13 +230,36 @@ class MetricsCollector:
             self._requests_by_path[path] += 1
             self._requests_by_method_path[f"{method} {path}"] += 1
 
-            # Add to latency window
-            self._latency_window.append(duration_ms)
-
             # Track errors (4xx and 5xx)
             if status_code >= 400:
                 self._error_count += 1
 
+        self._latency.record(duration_ms)
+        if route is not None:
+            self.record_latency("route", f"{method} {route}", duration_ms)
+
+    def record_latency(self, kind: str, key: str, duration_ms: float) -> None:
+        """Record a latency sample for one agent, tool, model or route.
+
+        Args:
+            kind: One of ``LATENCY_KINDS`` ("route", "agent", "tool", "llm")
+            key: Route template, agent role, tool name or model name
+            duration_ms: Duration in milliseconds
+        """
+        histograms = self._latency_by[kind]
+        histogram = histograms.get(key)
+        if histogram is None:
+            if len(histograms) >= _MAX_KEYS_PER_KIND:
+                key = "other"
+            histogram = histograms.setdefault(key, LatencyHistogram())
+        histogram.record(duration_ms)
+
+    def latency_histograms(self) -> Iterator[tuple[str, str, LatencyHistogram]]:
+        """Yield ``(kind, key, histogram)`` for every tracked key."""
+        for kind, histograms in self._latency_by.items():
+            for key, histogram in list(histograms.items()):
+                yield kind, key, histogram
+
     def record_error(self, error_type: str) -> None:
         """Record an error occurrence.
 
@@ -111,37 +289,128 @@ class MetricsCollector:
         with self._lock:
             self._agent_invocations[agent_role] += 1
 
+    def record_sandbox_pool(self, event: str) -> None:
+        """Record a sandbox worker pool event.
+
+        Args:
+            event: Pool event ("hit", "miss", "start", "recycle")
+        """
+        with self._lock:
+            self._sandbox_pool[event] += 1
+
+    def record_usage_writer(self, event: str, count: int = 1) -> None:
+        """Record LLM usage writer activity.
+
+        Args:
+            event: Writer event ("queued", "written", "dropped", "failed_batches")
+            count: Number of records (or batches) affected
+        """
+        with self._lock:
+            self._usage_writer[event] += count
+
+    def record_ha_request_cache(self, event: str) -> None:
+        """Record an HA GET coalescing or micro-cache event.
+
+        Args:
+            event: Cache event ("hit", "miss", "coalesced", "evict")
+        """
+        with self._lock:
+            self._ha_request_cache[event] += 1
+
+    def record_event_bus(self, event: str, count: int = 1) -> None:
+        """Record activity event bus activity.
+
+        Args:
+            event: Bus event ("published", "dropped", "replayed", "notify_failed")
+            count: Number of events affected
+        """
+        with self._lock:
+            self._event_bus[event] += count
+
+    def record_telemetry(self, event: str, count: int = 1) -> None:
+        """Record MLflow telemetry export activity.
+
+        Args:
+            event: Export event ("queued", "exported", "dropped", "failed",
+                "spans_sampled_out", "spans_tail_kept")
+            count: Number of metrics/params (or spans) affected
+        """
+        with self._lock:
+            self._telemetry[event] += count
+
+    def record_llm_resilience(self, event: str) -> None:
+        """Record an LLM hedging, backoff or circuit breaker event.
+
+        Args:
+            event: Resilience event ("hedge_fired", "hedge_won", "hedge_lost",
+                "retry_after", "circuit_opened", "circuit_probe")
+        """
+        with self._lock:
+            self._llm_resilience[event] += 1
+
+    def record_llm_concurrency(
+        self, key: str, *, limit: float, in_flight: int, queued: int
+    ) -> None:
+        """Record the current state of an LLM concurrency limiter.
+
+        Args:
+            key: Provider/model the limiter applies to
+            limit: Current (adaptive) concurrency limit
+            in_flight: Calls currently holding a slot
+            queued: Calls waiting for a slot
+        """
+        with self._lock:
+            self._llm_concurrency[key] = {
+                "limit": round(limit, 2),
+                "in_flight": in_flight,
+                "queued": queued,
+            }
+
+    def record_llm_response_cache(self, event: str) -> None:
+        """Record an LLM response cache event.
+
+        Args:
+            event: Cache event ("hit", "semantic_hit", "miss", "store",
+                "evict", "persisted", "persist_failed")
+        """
+        with self._lock:
+            self._llm_response_cache[event] += 1
+
+    def record_intent_router(self, event: str) -> None:
+        """Record an Orchestrator intent routing outcome.
+
+        Args:
+            event: Routing event ("fast_path", "shadowed", "llm",
+                "shadow_agree", "shadow_disagree")
+        """
+        with self._lock:
+            self._intent_router[event] += 1
+
+    def llm_concurrency(self) -> dict[str, dict[str, float]]:
+        """Snapshot of LLM concurrency limiter state by provider/model."""
+        with self._lock:
+            return {key: dict(state) for key, state in self._llm_concurrency.items()}
+
     def get_metrics(self) -> dict[str, Any]:
         """Get current metrics as a dictionary.
 
         Returns:
             Dictionary with all current metrics
         """
+        latency_metrics = self._latency.summary()
+        del latency_metrics["count"]
+        latency_by = {
+            kind: {key: histogram.summary() for key, histogram in list(histograms.items())}
+            for kind, histograms in self._latency_by.items()
+        }
         with self._lock:
-            # Calculate latency percentiles
-            latencies = sorted(self._latency_window)
-            latency_metrics = {}
-
-            if latencies:
-                n = len(latencies)
-                latency_metrics = {
-                    "p50_ms": round(latencies[n // 2], 2),
-                    "p95_ms": round(latencies[int(n * 0.95)], 2) if n > 0 else 0.0,
-                    "p99_ms": round(latencies[int(n * 0.99)], 2) if n > 0 else 0.0,
-                    "min_ms": round(latencies[0], 2) if latencies else 0.0,
-                    "max_ms": round(latencies[-1], 2) if latencies else 0.0,
-                    "avg_ms": round(sum(latencies) / n, 2) if n > 0 else 0.0,
-                }
-            else:
-                latency_metrics = {
-                    "p50_ms": 0.0,
-                    "p95_ms": 0.0,
-                    "p99_ms": 0.0,
-                    "min_ms": 0.0,
-                    "max_ms": 0.0,
-                    "avg_ms": 0.0,
-                }
-
+            cache_hits = self._llm_response_cache["hit"] + self._llm_response_cache["semantic_hit"]
+            cache_lookups = cache_hits + self._llm_response_cache["miss"]
+            routed_locally = self._intent_router["fast_path"] + self._intent_router["shadowed"]
+            routed = routed_locally + self._intent_router["llm"]
+            shadow_checked = (
+                self._intent_router["shadow_agree"] + self._intent_router["shadow_disagree"]
+            )
             return {
                 "requests": {
                     "total": self._request_count,
@@ -152,6 +421,7 @@ class MetricsCollector:
                     ),  # Top 20 method+path
                 },
                 "latency": latency_metrics,
+                "latency_by": latency_by,
                 "errors": {
                     "total": self._error_count,
                     "by_type": dict(self._errors_by_type),
@@ -160,6 +430,26 @@ class MetricsCollector:
                 "agents": {
                     "invocations": dict(self._agent_invocations),
                 },
+                "sandbox_pool": dict(self._sandbox_pool),
+                "usage_writer": dict(self._usage_writer),
+                "ha_request_cache": dict(self._ha_request_cache),
+                "event_bus": dict(self._event_bus),
+                "telemetry": dict(self._telemetry),
+                "llm_resilience": dict(self._llm_resilience),
+                "llm_concurrency": {k: dict(v) for k, v in self._llm_concurrency.items()},
+                "llm_response_cache": {
+                    **dict(self._llm_response_cache),
+                    "hit_rate": round(cache_hits / cache_lookups, 4) if cache_lookups else 0.0,
+                },
+                "intent_router": {
+                    **dict(self._intent_router),
+                    "hit_rate": round(routed_locally / routed, 4) if routed else 0.0,
+                    "accuracy": (
+                        round(self._intent_router["shadow_agree"] / shadow_checked, 4)
+                        if shadow_checked
+                        else None
+                    ),
+                },
                 "uptime_seconds": round(time.time() - _start_time, 2),
             }
 
@@ -170,11 +460,22 @@ class MetricsCollector:
             self._requests_by_status.clear()
             self._requests_by_path.clear()
             self._requests_by_method_path.clear()
-            self._latency_window.clear()
+            self._latency = LatencyHistogram()
+            for histograms in self._latency_by.values():
+                histograms.clear()
             self._error_count = 0
             self._errors_by_type.clear()
             self._active_requests = 0
             self._agent_invocations.clear()
+            self._sandbox_pool.clear()
+            self._usage_writer.clear()
+            self._ha_request_cache.clear()
+            self._event_bus.clear()
+            self._telemetry.clear()
+            self._llm_resilience.clear()
+            self._llm_concurrency.clear()
+            self._llm_response_cache.clear()
+            self._intent_router.clear()
 
 
 # Singleton instance
@@ -191,3 +492,66 @@ def get_metrics_collector() -> MetricsCollector:
     if _metrics_collector is None:
         _metrics_collector = MetricsCollector()
     return _metrics_collector
+
+
+class _PrometheusLatencyCollector:
+    """Exposes the collector's latency histograms on the Prometheus registry."""
+
+    _NAMES = {
+        "route": ("aether_route_latency_seconds", "route"),
+        "agent": ("aether_agent_latency_seconds", "agent"),
+        "tool": ("aether_tool_latency_seconds", "tool"),
+        "llm": ("aether_llm_latency_seconds", "model"),
+    }
+
+    def collect(self) -> Iterator[Any]:
+        from prometheus_client.core import HistogramMetricFamily
+
+        bounds_ms = tuple(b * 1000 for b in _PROMETHEUS_BUCKETS)
+        families = {
+            kind: HistogramMetricFamily(name, f"Aether {kind} latency", labels=[label])
+            for kind, (name, label) in self._NAMES.items()
+        }
+        for kind, key, histogram in get_metrics_collector().latency_histograms():
+            cumulative = histogram.cumulative_counts(bounds_ms)
+            buckets = [(str(b), n) for b, n in zip(_PROMETHEUS_BUCKETS, cumulative, strict=True)]
+            buckets.append(("+Inf", histogram.count))
+            families[kind].add_metric([key], buckets, histogram.sum_ms / 1000)
+        yield from families.values()
+
+
+class _PrometheusLLMConcurrencyCollector:
+    """Exposes LLM concurrency limiter gauges on the Prometheus registry."""
+
+    _GAUGES = {
+        "limit": ("aether_llm_concurrency_limit", "Adaptive LLM concurrency limit"),
+        "in_flight": ("aether_llm_in_flight", "LLM calls holding a concurrency slot"),
+        "queued": ("aether_llm_queue_depth", "LLM calls waiting for a concurrency slot"),
+    }
+
+    def collect(self) -> Iterator[Any]:
+        from prometheus_client.core import GaugeMetricFamily
+
+        families = {
+            field: GaugeMetricFamily(name, doc, labels=["model"])
+            for field, (name, doc) in self._GAUGES.items()
+        }
+        for key, state in get_metrics_collector().llm_concurrency().items():
+            for field, family in families.items():
+                family.add_metric([key], state[field])
+        yield from families.values()
+
+
+_prometheus_registered = False
+
+
+def register_prometheus_collector() -> None:
+    """Export latency histograms and LLM concurrency gauges to Prometheus (idempotent)."""
+    global _prometheus_registered
+    if _prometheus_registered:
+        return
+    from prometheus_client import REGISTRY
+
+    REGISTRY.register(_PrometheusLatencyCollector())
+    REGISTRY.register(_PrometheusLLMConcurrencyCollector())
+    _prometheus_registered = True
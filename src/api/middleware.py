@@ -61,6 +61,7 @@ class RequestTracingMiddleware(BaseHTTPMiddleware):
                 path=request.url.path,
                 status_code=response.status_code,
                 duration_ms=duration_ms,
+                route=getattr(request.scope.get("route"), "path", None),
             )
 
             # Log structured request information
@@ -6,8 +6,14 @@ clients. This allows the activity panel to react to ANY LLM call in the
 system, not just chat streaming.
 
 Architecture:
-    src/llm.py  -->  publish_activity()  -->  asyncio.Queue per client
-                                          -->  SSE endpoint reads queue
+    src/llm.py  -->  publish_activity()  -->  event bus ("activity" topic)
+                                          -->  Subscription per client
+                                          -->  SSE endpoint reads subscription
+
+Events carry an SSE ``id``; a reconnecting client sends it back as
+``Last-Event-ID`` and is replayed what it missed from the bus's ring
+buffer. With ``EVENT_BUS_BACKEND=postgres`` events reach clients on
+every API worker (see :mod:`src.api.event_bus`).
 
 Shutdown:
     Call signal_shutdown() during app shutdown to close all SSE connections
@@ -20,18 +26,21 @@ import json
 import logging
 import time
 from collections.abc import AsyncGenerator
-from contextlib import suppress
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Query
 from fastapi.responses import StreamingResponse
 
+from src.api.event_bus import Subscription, get_event_bus
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/activity", tags=["activity"])
 
-# ─── In-process broadcast ─────────────────────────────────────────────────────
+# ─── Broadcast via the event bus ──────────────────────────────────────────────
+
+ACTIVITY_TOPIC = "activity"
 
-_subscribers: set[asyncio.Queue[str | None]] = set()
+_subscribers: set[Subscription] = set()
 _shutting_down = False
 
 
@@ -48,9 +57,8 @@ def signal_shutdown() -> None:
     global _shutting_down
     _shutting_down = True
     # Wake all subscribers so they see the flag
-    for q in _subscribers:
-        with suppress(asyncio.QueueFull):
-            q.put_nowait(None)  # sentinel
+    for subscription in _subscribers:
+        subscription.close()  # sentinel
 
 
 def publish_activity(event: dict) -> None:
@@ -59,49 +67,56 @@ def publish_activity(event: dict) -> None:
     Safe to call from any async or sync context (fire-and-forget).
     """
     event.setdefault("ts", time.time())
-    data = json.dumps(event)
-    dead: list[asyncio.Queue[str | None]] = []
-    for q in _subscribers:
-        try:
-            q.put_nowait(data)
-        except asyncio.QueueFull:
-            dead.append(q)
-    for q in dead:
-        _subscribers.discard(q)
-
-
-async def _subscribe() -> AsyncGenerator[str, None]:
+    get_event_bus().publish(ACTIVITY_TOPIC, json.dumps(event))
+
+
+async def _subscribe(last_event_id: str | None = None) -> AsyncGenerator[str, None]:
     """Subscribe to activity events as an SSE stream.
 
-    Exits cleanly when signal_shutdown() is called, which sets
-    _shutting_down=True and pushes a None sentinel into every queue.
-    This allows uvicorn to proceed with graceful shutdown / reload.
+    Events published after ``last_event_id`` that are still buffered
+    are sent first. Exits cleanly when signal_shutdown() is called,
+    which sets _shutting_down=True and pushes a None sentinel into every
+    subscription. This allows uvicorn to proceed with graceful shutdown /
+    reload.
     """
-    q: asyncio.Queue[str | None] = asyncio.Queue(maxsize=200)
-    _subscribers.add(q)
+    if _shutting_down:
+        return
+    bus = get_event_bus()
+    subscription = bus.subscribe(ACTIVITY_TOPIC, last_event_id)
+    _subscribers.add(subscription)
     try:
         while not _shutting_down:
-            data = await q.get()
-            if data is None:
+            item = await subscription.get()
+            if item is None:
                 # Sentinel: shutdown signal
                 break
-            yield f"data: {data}\n\n"
+            event_id, data = item
+            yield f"id: {event_id}\ndata: {data}\n\n"
     except asyncio.CancelledError:
         pass
     finally:
-        _subscribers.discard(q)
+        _subscribers.discard(subscription)
+        bus.unsubscribe(subscription)
 
 
 @router.get("/stream")
-async def activity_stream() -> StreamingResponse:
+async def activity_stream(
+    last_event_id: str | None = Query(default=None),
+    last_event_id_header: str | None = Header(default=None, alias="Last-Event-ID"),
+) -> StreamingResponse:
     """SSE endpoint for global system activity events.
 
     Events include:
     - LLM call start/end with agent_role and model
     - Agent lifecycle events
+    - Job events (see src/jobs/events.py)
+
+    Reconnecting clients send ``Last-Event-ID`` (``EventSource`` does
+    this automatically) or ``?last_event_id=`` to receive the events
+    they missed.
     """
     return StreamingResponse(
-        _subscribe(),
+        _subscribe(last_event_id_header or last_event_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -102,6 +102,8 @@ async def update_agent_status(
     body: AgentStatusUpdate,
 ) -> AgentResponse:
     """Update agent lifecycle status."""
+    from src.agents.config_cache import invalidate_agent_config
+
     async with get_session() as session:
         repo = AgentRepository(session)
 
@@ -122,6 +124,7 @@ async def update_agent_status(
             raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
 
         await session.commit()
+        invalidate_agent_config(agent_name)
 
         # Refresh to pick up eager-loaded relationships after commit
         await session.refresh(agent)
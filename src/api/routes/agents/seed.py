@@ -154,6 +154,7 @@ async def seed_agents(request: Request) -> dict[str, Any]:
     and populates initial config and prompt versions from env vars
     and file-based prompts.
     """
+    from src.agents.config_cache import invalidate_agent_config
     from src.agents.prompts import load_prompt
     from src.settings import get_settings
 
@@ -218,6 +219,9 @@ async def seed_agents(request: Request) -> dict[str, Any]:
 
         await session.commit()
 
+    # Seeding rewrites routing metadata (intent patterns, capabilities)
+    invalidate_agent_config()
+
     logger.info(
         "Seeded %d agents (routing metadata included), %d configs, %d prompts",
         created_agents,
@@ -79,13 +79,14 @@ async def query_entities(
     """
     repo = EntityRepository(session)
 
-    # Simple search for now - would use LLM for NL parsing
-    entities = await repo.search(data.query, limit=data.limit)
+    # Ranked fuzzy search for now - would use LLM for NL parsing
+    hits = await repo.search_scored(data.query, limit=data.limit)
 
     return EntityQueryResult(
-        entities=[EntityResponse.model_validate(e) for e in entities],
+        entities=[EntityResponse.model_validate(e) for e, _ in hits],
         query=data.query,
         interpreted_as=f"Search for '{data.query}'",
+        scores={e.entity_id: score for e, score in hits},
     )
 
 
@@ -32,6 +32,7 @@ from src.api.routes.openai_compat.utils import (
     _strip_thinking_tags,
 )
 from src.graph.state import ConversationState
+from src.llm.concurrency import Priority, llm_priority, set_llm_priority
 from src.storage import get_session
 from src.tracing import log_param, start_experiment_run
 from src.tracing.context import session_context
@@ -130,9 +131,12 @@ async def _create_chat_completion(
                 )
 
                 # Propagate user's model selection to all delegated agents
-                with model_context(
-                    model_name=request.model,
-                    temperature=request.temperature,
+                with (
+                    model_context(
+                        model_name=request.model,
+                        temperature=request.temperature,
+                    ),
+                    llm_priority(Priority.INTERACTIVE),
                 ):
                     # Process with Architect (using requested LLM model)
                     workflow = ArchitectWorkflow(
@@ -225,6 +229,8 @@ async def _stream_chat_completion(
             from src.tracing.context import set_session_id
 
             set_session_id(conversation_id)
+            # Chat is served ahead of background LLM work
+            set_llm_priority(Priority.INTERACTIVE)
 
             # Convert messages and extract user message
             lc_messages = _convert_to_langchain_messages(request.messages)
@@ -384,7 +390,7 @@ async def _stream_chat_completion(
                 from src.agents.orchestrator import OrchestratorAgent
 
                 orchestrator = OrchestratorAgent(model_name=request.model)
-                classification = await orchestrator.classify_intent(
+                classification = await orchestrator.route(
                     user_message,
                     await orchestrator._get_available_agents(),
                 )
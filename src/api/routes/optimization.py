@@ -288,7 +288,7 @@ async def _run_optimization_background(
 ) -> None:
     """Run optimization analysis in the background with granular events."""
     from src.graph.state import AgentRole, AnalysisState, AnalysisType
-    from src.graph.workflows.optimization import build_optimization_graph
+    from src.graph.workflows.cache import bind_graph, get_compiled_graph
     from src.jobs import (
         emit_job_agent,
         emit_job_complete,
@@ -328,8 +328,7 @@ async def _run_optimization_background(
                 emit_job_status(job_id, f"Running {analysis_type.value}...")
 
                 analysis_enum = type_map.get(analysis_type.value, AnalysisType.BEHAVIOR_ANALYSIS)
-                graph = build_optimization_graph(session=session)
-                compiled = graph.compile()
+                compiled = bind_graph(get_compiled_graph("optimization"), session=session)
 
                 initial_state = AnalysisState(
                     current_agent=AgentRole.DATA_SCIENTIST,
@@ -111,9 +111,14 @@ async def get_metrics(request: Request) -> dict:
     Returns metrics including:
     - Request counts (by method, path, status)
     - Latency percentiles (p50, p95, p99)
+    - Per-route, per-agent, per-tool and per-model latency (``latency_by``)
     - Error counts (by error type)
     - Active requests
     - Agent invocations (by role)
+    - LLM hedging/circuit events (``llm_resilience``) and per-provider
+      concurrency limit, in-flight and queue depth (``llm_concurrency``)
+    - LLM response cache hits, misses and hit rate (``llm_response_cache``)
+    - Orchestrator fast-path routing hit rate and accuracy (``intent_router``)
     - Uptime
 
     Returns:
@@ -52,6 +52,10 @@ class EntityQueryResult(BaseModel):
     entities: list[EntityResponse]
     query: str
     interpreted_as: str | None = None
+    scores: dict[str, float] = Field(
+        default_factory=dict,
+        description="Search relevance (0-1) per entity_id, entities ordered best first",
+    )
 
 
 class EntitySyncRequest(BaseModel):
@@ -156,7 +156,11 @@ class BaseRepository(Generic[T]):
             entity = await self.create(data)
             return entity, True
 
-    async def upsert_many(self, data_list: list[dict[str, Any]]) -> tuple[list[T], dict[str, int]]:
+    async def upsert_many(
+        self,
+        data_list: list[dict[str, Any]],
+        skip_unchanged: bool = False,
+    ) -> tuple[list[T], dict[str, int]]:
         """Batch create-or-update for multiple items in a single DB round-trip.
 
         Loads all existing rows by HA ID in one SELECT, then creates new
@@ -165,12 +169,19 @@ class BaseRepository(Generic[T]):
 
         Args:
             data_list: List of entity data dicts (each must include ha_id_field)
+            skip_unchanged: Leave existing rows whose fields already match
+                their data dict untouched (no UPDATE, no last_synced_at bump)
+                and count them as "unchanged"
 
         Returns:
-            Tuple of (list of upserted entities, stats dict with created/updated counts)
+            Tuple of (list of upserted entities, stats dict with created/updated
+            counts, plus unchanged when ``skip_unchanged`` is set)
         """
         if not data_list:
-            return [], {"created": 0, "updated": 0}
+            empty = {"created": 0, "updated": 0}
+            if skip_unchanged:
+                empty["unchanged"] = 0
+            return [], empty
 
         ha_id_attr = getattr(self.model, self.ha_id_field)
         ha_ids = [d[self.ha_id_field] for d in data_list]
@@ -186,12 +197,16 @@ class BaseRepository(Generic[T]):
         all_entities: list[T] = []
         created = 0
         updated = 0
+        unchanged = 0
 
         for data in data_list:
             ha_id_value = data[self.ha_id_field]
             existing = existing_map.get(ha_id_value)
 
-            if existing:
+            if existing and skip_unchanged and self._matches(existing, data):
+                all_entities.append(existing)
+                unchanged += 1
+            elif existing:
                 # Update in-place
                 for key, value in data.items():
                     if hasattr(existing, key) and key != "id":
@@ -214,7 +229,19 @@ class BaseRepository(Generic[T]):
             self.session.add_all(new_entities)
 
         await self.session.flush()
-        return all_entities, {"created": created, "updated": updated}
+        stats = {"created": created, "updated": updated}
+        if skip_unchanged:
+            stats["unchanged"] = unchanged
+        return all_entities, stats
+
+    @staticmethod
+    def _matches(row: Any, data: dict[str, Any]) -> bool:
+        """Whether every field in ``data`` already holds that value on ``row``."""
+        return all(
+            getattr(row, key) == value
+            for key, value in data.items()
+            if key != "id" and hasattr(row, key)
+        )
 
     async def delete_by_ha_ids(self, ha_ids: set[str]) -> int:
         """Batch delete rows by HA IDs in a single query.
@@ -3,10 +3,12 @@
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
 from sqlalchemy.orm import selectinload
 
 from src.dal.base import BaseRepository
+from src.dal.entity_search import get_search_index
+from src.settings import get_settings
 from src.storage.entities import HAEntity
 
 
@@ -250,28 +252,81 @@ class EntityRepository(BaseRepository[HAEntity]):
         """
         return await self.get_all_ha_ids()
 
+    async def get_sync_timestamps(self) -> dict[str, datetime | None]:
+        """Get ``last_synced_at`` for every entity in a single query.
+
+        Returns:
+            Dictionary of HA entity_id -> last sync time
+        """
+        result = await self.session.execute(select(HAEntity.entity_id, HAEntity.last_synced_at))
+        return {row[0]: row[1] for row in result.fetchall()}
+
     async def search(
         self,
         query: str,
         limit: int = 20,
     ) -> list[HAEntity]:
-        """Search entities by name or entity_id.
+        """Search entities by name, entity_id, area or device, best match first.
+
+        Args:
+            query: Search term (typos tolerated)
+            limit: Max results
+
+        Returns:
+            Matching entities ordered by relevance
+        """
+        return [entity for entity, _ in await self.search_scored(query, limit=limit)]
+
+    async def search_scored(
+        self,
+        query: str,
+        limit: int = 20,
+    ) -> list[tuple[HAEntity, float]]:
+        """Search entities and return each match with its relevance score.
+
+        Served from the in-process ``EntitySearchIndex`` when enabled,
+        otherwise ranked in Postgres by ``pg_trgm`` word similarity
+        (backed by the trigram GIN indexes from migration 040).
 
         Args:
-            query: Search term
+            query: Search term (typos tolerated)
             limit: Max results
 
         Returns:
-            Matching entities
+            ``(entity, score)`` pairs, best first, scores in 0-1
         """
+        settings = get_settings()
+        if not settings.entity_search_index_enabled:
+            return await self._search_trigram(query, limit)
+
+        index = await get_search_index(self.session, settings.entity_search_index_ttl_seconds)
+        hits = index.search(query, limit=limit)
+        if not hits:
+            return []
+        by_id = {e.entity_id: e for e in await self.get_by_entity_ids([eid for eid, _ in hits])}
+        return [(by_id[eid], score) for eid, score in hits if eid in by_id]
+
+    async def _search_trigram(
+        self,
+        query: str,
+        limit: int,
+    ) -> list[tuple[HAEntity, float]]:
+        """Rank entities by trigram word similarity in Postgres."""
         escaped = _escape_ilike(query)
         search_pattern = f"%{escaped}%"
+        score = func.greatest(
+            func.word_similarity(query, HAEntity.name),
+            func.word_similarity(query, HAEntity.entity_id),
+        )
         result = await self.session.execute(
-            select(HAEntity)
+            select(HAEntity, score)
             .where(
-                (HAEntity.name.ilike(search_pattern, escape="\\"))
+                literal(query).op("<%")(HAEntity.name)
+                | literal(query).op("<%")(HAEntity.entity_id)
+                | (HAEntity.name.ilike(search_pattern, escape="\\"))
                 | (HAEntity.entity_id.ilike(search_pattern, escape="\\"))
             )
+            .order_by(score.desc(), HAEntity.entity_id)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return [(entity, round(float(s or 0.0), 4)) for entity, s in result.all()]
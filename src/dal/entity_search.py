@@ -0,0 +1,225 @@
+"""Ranked fuzzy search over discovered HA entities.
+
+``EntityRepository.search`` used to run ``ILIKE '%q%'`` over name and
+entity_id, which scans the whole table and returns matches in arbitrary
+order. This module keeps an in-process BM25 index of character trigrams
+and whole words drawn from each entity's id, friendly name, area and
+device, so a query such as ``"livng room lamp"`` still ranks
+``light.living_room_lamp`` first.
+
+Postings are numpy arrays with each document's BM25 contribution
+precomputed, so a query costs one vectorized add per query term rather
+than a Python loop over every matching entity.
+
+The index is shared per process, rebuilt after ``ttl_seconds`` and
+dropped by discovery syncs via ``invalidate_search_index()``.
+
+Usage::
+
+    index = await get_search_index(session)
+    for entity_id, score in index.search("kitchen light", limit=10):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
+
+from src.storage.entities import Area, Device, HAEntity
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# BM25 parameters (standard Okapi defaults)
+_K1 = 1.2
+_B = 0.75
+
+# Relative weight of each field's terms in an entity's document
+_FIELD_WEIGHTS = {
+    "entity_id": 1.0,
+    "name": 1.5,
+    "area": 1.0,
+    "device": 0.75,
+}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _words(text: str) -> list[str]:
+    return _NON_ALNUM.sub(" ", text.lower()).split()
+
+
+def _terms(text: str) -> list[str]:
+    """Whole words plus padded character trigrams, as in ``pg_trgm``."""
+    terms: list[str] = []
+    for word in _words(text):
+        terms.append(f"w:{word}")
+        padded = f"  {word} "
+        terms.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+    return terms
+
+
+class EntitySearchIndex:
+    """Immutable BM25 index over entity ids, names, areas and devices."""
+
+    def __init__(
+        self,
+        rows: list[tuple[str, str | None, str | None, str | None]],
+    ) -> None:
+        """Build the index.
+
+        Args:
+            rows: ``(entity_id, name, area_name, device_name)`` per entity
+        """
+        self.entity_ids = [row[0] for row in rows]
+        self.built_at = time.monotonic()
+        # Lowercased "entity_id\0name" per entity for plain substring matches
+        self._haystacks = np.array(
+            [f"{entity_id}\0{name or ''}".lower() for entity_id, name, _, _ in rows], dtype=str
+        )
+
+        doc_terms: list[dict[str, float]] = []
+        for entity_id, name, area, device in rows:
+            tf: defaultdict[str, float] = defaultdict(float)
+            for field, text in (
+                ("entity_id", entity_id),
+                ("name", name),
+                ("area", area),
+                ("device", device),
+            ):
+                if text:
+                    weight = _FIELD_WEIGHTS[field]
+                    for term in _terms(text):
+                        tf[term] += weight
+            doc_terms.append(tf)
+
+        lengths = np.array([sum(tf.values()) for tf in doc_terms], dtype=np.float64)
+        avg_length = float(lengths.mean()) if len(lengths) else 0.0
+        norms = _K1 * (1 - _B + _B * lengths / avg_length) if avg_length else lengths
+
+        grouped: dict[str, tuple[list[int], list[float]]] = defaultdict(lambda: ([], []))
+        for doc, doc_tf in enumerate(doc_terms):
+            for term, freq in doc_tf.items():
+                docs, freqs = grouped[term]
+                docs.append(doc)
+                freqs.append(freq)
+
+        n_docs = len(rows)
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for term, (docs, freqs) in grouped.items():
+            idx = np.array(docs, dtype=np.int32)
+            tf_arr = np.array(freqs, dtype=np.float64)
+            weights = self._idf(len(docs), n_docs) * tf_arr * (_K1 + 1) / (tf_arr + norms[idx])
+            self._postings[term] = (idx, weights)
+
+    @staticmethod
+    def _idf(df: int, n_docs: int) -> float:
+        return math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        min_score: float = 0.15,
+    ) -> list[tuple[str, float]]:
+        """Rank entities against a free-text query.
+
+        Args:
+            query: Search text; typos and word order are tolerated
+            limit: Max results
+            min_score: Drop results scoring below this (0-1); entities
+                whose id or name contains the query verbatim are kept
+                regardless, as the old ``ILIKE`` search matched them
+
+        Returns:
+            ``(entity_id, score)`` pairs, best first. Scores are the BM25
+            total divided by the best total the query could reach, so 1.0
+            means every query term matched with saturated frequency.
+        """
+        terms = Counter(_terms(query))
+        if not terms or not self.entity_ids:
+            return []
+
+        n_docs = len(self.entity_ids)
+        scores = np.zeros(n_docs, dtype=np.float64)
+        ideal = 0.0
+        for term, count in terms.items():
+            posting = self._postings.get(term)
+            df = len(posting[0]) if posting is not None else 0
+            ideal += count * self._idf(df, n_docs) * (_K1 + 1)
+            if posting is not None:
+                scores[posting[0]] += count * posting[1]
+        scores /= ideal
+        needle = query.strip().lower()
+        if needle:
+            contains = np.char.find(self._haystacks, needle) >= 0
+            scores[contains] = np.maximum(scores[contains], min_score)
+
+        candidates = np.flatnonzero(scores >= min_score)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.entity_ids[i], round(min(float(scores[i]), 1.0), 4)) for i in ranked]
+
+
+_index: EntitySearchIndex | None = None
+_build_lock = asyncio.Lock()
+
+
+async def _load_rows(
+    session: AsyncSession,
+) -> list[tuple[str, str | None, str | None, str | None]]:
+    """Fetch the searchable text of every entity in one query."""
+    device_area = aliased(Area)
+    result = await session.execute(
+        select(
+            HAEntity.entity_id,
+            HAEntity.name,
+            func.coalesce(Area.name, device_area.name),
+            func.coalesce(Device.name_by_user, Device.name),
+        )
+        .outerjoin(Area, HAEntity.area_id == Area.id)
+        .outerjoin(Device, HAEntity.device_id == Device.id)
+        .outerjoin(device_area, Device.area_id == device_area.id)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+async def get_search_index(session: AsyncSession, ttl_seconds: float) -> EntitySearchIndex:
+    """Return the process-wide index, rebuilding it if missing or stale.
+
+    Args:
+        session: Database session used when a rebuild is needed
+        ttl_seconds: Oldest the index may be before it is rebuilt
+    """
+    global _index
+    index = _index
+    if index is not None and time.monotonic() - index.built_at < ttl_seconds:
+        return index
+    async with _build_lock:
+        index = _index
+        if index is None or time.monotonic() - index.built_at >= ttl_seconds:
+            index = EntitySearchIndex(await _load_rows(session))
+            _index = index
+    return index
+
+
+def invalidate_search_index() -> None:
+    """Drop the index so the next search rebuilds it (after a sync)."""
+    global _index
+    _index = None
+
+
+__all__ = ["EntitySearchIndex", "get_search_index", "invalidate_search_index"]
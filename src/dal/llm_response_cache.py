@@ -0,0 +1,63 @@
+"""LLM response cache data access layer."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.storage.entities.llm_response_cache import LLMResponseCacheEntry
+
+
+class LLMResponseCacheRepository:
+    """Repository for persisted LLM response cache entries."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def upsert_many(self, rows: list[dict[str, Any]]) -> int:
+        """Insert or refresh cache entries in one statement.
+
+        Args:
+            rows: Column values of ``LLMResponseCacheEntry``
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        stmt = pg_insert(LLMResponseCacheEntry).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "response": stmt.excluded.response,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+        return len(rows)
+
+    async def list_unexpired(self, now: datetime, limit: int) -> list[LLMResponseCacheEntry]:
+        """Most recently created entries that have not expired yet."""
+        result = await self.session.execute(
+            select(LLMResponseCacheEntry)
+            .where(LLMResponseCacheEntry.expires_at > now)
+            .order_by(LLMResponseCacheEntry.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def delete_expired(self, now: datetime) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of rows deleted
+        """
+        result = await self.session.execute(
+            delete(LLMResponseCacheEntry).where(LLMResponseCacheEntry.expires_at <= now)
+        )
+        await self.session.commit()
+        return result.rowcount or 0  # type: ignore[attr-defined]
@@ -1,15 +1,51 @@
 """LLM Usage data access layer.
 
-Provides queries for LLM usage tracking and aggregation.
+Provides queries for LLM usage tracking and aggregation. Reporting
+queries read hourly rollups (``llm_usage_rollups``) plus the raw rows
+that have not been rolled up yet, so their cost grows with the period
+length rather than with call volume.
 """
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import func, select, text
+from sqlalchemy import (
+    ColumnElement,
+    String,
+    Subquery,
+    case,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.entities.llm_usage import LLMUsage
+from src.storage.entities.llm_usage_rollup import LLMUsageRollup
+
+# Rollup granularity
+_BUCKET = timedelta(hours=1)
+
+# Summable columns carried by llm_usage_rollups
+_MEASURES = (
+    "calls",
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "cost_usd",
+    "latency_ms_sum",
+    "latency_count",
+)
+
+# pg_advisory_xact_lock key serializing rollup runs
+_ROLLUP_LOCK_ID = 0x4C4C4D55  # "LLMU"
 
 
 class LLMUsageRepository:
@@ -65,6 +101,76 @@ class LLMUsageRepository:
         await self.session.commit()
         return usage
 
+    async def record_many(self, records: list[dict[str, Any]]) -> int:
+        """Insert many usage entries with a single multi-row INSERT.
+
+        Args:
+            records: Dicts with the keyword arguments accepted by ``record``
+
+        Returns:
+            Number of rows inserted
+        """
+        if not records:
+            return 0
+        rows = [{"id": str(uuid4()), "request_type": "chat", **r} for r in records]
+        await self.session.execute(insert(LLMUsage).values(rows))
+        await self.session.commit()
+        return len(rows)
+
+    @staticmethod
+    def _usage(
+        since: datetime | None = None,
+        conversation_id: str | None = None,
+    ) -> Subquery:
+        """Usage rows to aggregate: hourly rollups plus the raw tail.
+
+        Raw rows at or after the rollup watermark (the hour after the
+        newest rollup bucket) have not been folded in yet and are read
+        directly, so every call is counted exactly once. Each output row
+        carries summable ``calls``/token/cost/latency columns.
+
+        Args:
+            since: Only usage from this (hour-aligned) time onwards
+            conversation_id: Only usage for this conversation
+        """
+        watermark = select(func.max(LLMUsageRollup.bucket_start) + _BUCKET).scalar_subquery()
+
+        rolled = select(
+            LLMUsageRollup.bucket_start.label("ts"),
+            LLMUsageRollup.provider,
+            LLMUsageRollup.model,
+            func.nullif(LLMUsageRollup.agent_role, "").label("agent_role"),
+            LLMUsageRollup.calls,
+            LLMUsageRollup.input_tokens,
+            LLMUsageRollup.output_tokens,
+            LLMUsageRollup.total_tokens,
+            LLMUsageRollup.cost_usd,
+            LLMUsageRollup.latency_ms_sum,
+            LLMUsageRollup.latency_count,
+        )
+        tail = select(
+            LLMUsage.created_at.label("ts"),
+            LLMUsage.provider,
+            LLMUsage.model,
+            LLMUsage.agent_role,
+            literal(1).label("calls"),
+            LLMUsage.input_tokens,
+            LLMUsage.output_tokens,
+            LLMUsage.total_tokens,
+            func.coalesce(LLMUsage.cost_usd, 0.0).label("cost_usd"),
+            func.coalesce(LLMUsage.latency_ms, 0).label("latency_ms_sum"),
+            case((LLMUsage.latency_ms.is_(None), 0), else_=1).label("latency_count"),
+        ).where(or_(watermark.is_(None), LLMUsage.created_at >= watermark))
+
+        if since is not None:
+            rolled = rolled.where(LLMUsageRollup.bucket_start >= since)
+            tail = tail.where(LLMUsage.created_at >= since)
+        if conversation_id is not None:
+            rolled = rolled.where(LLMUsageRollup.conversation_id == conversation_id)
+            tail = tail.where(LLMUsage.conversation_id == conversation_id)
+
+        return union_all(rolled, tail).subquery("usage")
+
     async def get_summary(
         self,
         days: int = 30,
@@ -74,32 +180,32 @@ class LLMUsageRepository:
         Returns:
             Dict with total_calls, total_tokens, total_cost_usd, by_model
         """
-        since = datetime.now(UTC) - timedelta(days=days)
+        since = _hour_floor(datetime.now(UTC) - timedelta(days=days))
+        usage = self._usage(since)
 
         # Total aggregates
         result = await self.session.execute(
             select(
-                func.count(LLMUsage.id).label("total_calls"),
-                func.coalesce(func.sum(LLMUsage.input_tokens), 0).label("total_input_tokens"),
-                func.coalesce(func.sum(LLMUsage.output_tokens), 0).label("total_output_tokens"),
-                func.coalesce(func.sum(LLMUsage.total_tokens), 0).label("total_tokens"),
-                func.coalesce(func.sum(LLMUsage.cost_usd), 0.0).label("total_cost_usd"),
-            ).where(LLMUsage.created_at >= since)
+                func.coalesce(func.sum(usage.c.calls), 0).label("total_calls"),
+                func.coalesce(func.sum(usage.c.input_tokens), 0).label("total_input_tokens"),
+                func.coalesce(func.sum(usage.c.output_tokens), 0).label("total_output_tokens"),
+                func.coalesce(func.sum(usage.c.total_tokens), 0).label("total_tokens"),
+                func.coalesce(func.sum(usage.c.cost_usd), 0.0).label("total_cost_usd"),
+            )
         )
         row = result.one()
 
         # Per-model breakdown
         model_result = await self.session.execute(
             select(
-                LLMUsage.model,
-                LLMUsage.provider,
-                func.count(LLMUsage.id).label("calls"),
-                func.coalesce(func.sum(LLMUsage.total_tokens), 0).label("tokens"),
-                func.coalesce(func.sum(LLMUsage.cost_usd), 0.0).label("cost_usd"),
+                usage.c.model,
+                usage.c.provider,
+                func.sum(usage.c.calls).label("calls"),
+                func.coalesce(func.sum(usage.c.total_tokens), 0).label("tokens"),
+                func.coalesce(func.sum(usage.c.cost_usd), 0.0).label("cost_usd"),
             )
-            .where(LLMUsage.created_at >= since)
-            .group_by(LLMUsage.model, LLMUsage.provider)
-            .order_by(func.sum(LLMUsage.cost_usd).desc())
+            .group_by(usage.c.model, usage.c.provider)
+            .order_by(func.sum(usage.c.cost_usd).desc())
         )
 
         return {
@@ -127,16 +233,16 @@ class LLMUsageRepository:
         Returns:
             List of dicts with date, calls, tokens, cost_usd
         """
-        since = datetime.now(UTC) - timedelta(days=days)
+        since = _hour_floor(datetime.now(UTC) - timedelta(days=days))
+        usage = self._usage(since)
 
         result = await self.session.execute(
             select(
-                func.date_trunc("day", LLMUsage.created_at).label("day"),
-                func.count(LLMUsage.id).label("calls"),
-                func.coalesce(func.sum(LLMUsage.total_tokens), 0).label("tokens"),
-                func.coalesce(func.sum(LLMUsage.cost_usd), 0.0).label("cost_usd"),
+                func.date_trunc("day", usage.c.ts).label("day"),
+                func.sum(usage.c.calls).label("calls"),
+                func.coalesce(func.sum(usage.c.total_tokens), 0).label("tokens"),
+                func.coalesce(func.sum(usage.c.cost_usd), 0.0).label("cost_usd"),
             )
-            .where(LLMUsage.created_at >= since)
             .group_by(text("1"))
             .order_by(text("1"))
         )
@@ -160,31 +266,32 @@ class LLMUsageRepository:
         Returns:
             Dict with total_calls, total_tokens, total_cost_usd, by_agent
         """
+        usage = self._usage(conversation_id=conversation_id)
+
         # Total for conversation
         result = await self.session.execute(
             select(
-                func.count(LLMUsage.id).label("total_calls"),
-                func.coalesce(func.sum(LLMUsage.input_tokens), 0).label("total_input_tokens"),
-                func.coalesce(func.sum(LLMUsage.output_tokens), 0).label("total_output_tokens"),
-                func.coalesce(func.sum(LLMUsage.total_tokens), 0).label("total_tokens"),
-                func.coalesce(func.sum(LLMUsage.cost_usd), 0.0).label("total_cost_usd"),
-            ).where(LLMUsage.conversation_id == conversation_id)
+                func.coalesce(func.sum(usage.c.calls), 0).label("total_calls"),
+                func.coalesce(func.sum(usage.c.input_tokens), 0).label("total_input_tokens"),
+                func.coalesce(func.sum(usage.c.output_tokens), 0).label("total_output_tokens"),
+                func.coalesce(func.sum(usage.c.total_tokens), 0).label("total_tokens"),
+                func.coalesce(func.sum(usage.c.cost_usd), 0.0).label("total_cost_usd"),
+            )
         )
         row = result.one()
 
         # Per-agent breakdown
         agent_result = await self.session.execute(
             select(
-                LLMUsage.agent_role,
-                LLMUsage.model,
-                func.count(LLMUsage.id).label("calls"),
-                func.coalesce(func.sum(LLMUsage.total_tokens), 0).label("tokens"),
-                func.coalesce(func.sum(LLMUsage.cost_usd), 0.0).label("cost_usd"),
-                func.avg(LLMUsage.latency_ms).label("avg_latency_ms"),
+                usage.c.agent_role,
+                usage.c.model,
+                func.sum(usage.c.calls).label("calls"),
+                func.coalesce(func.sum(usage.c.total_tokens), 0).label("tokens"),
+                func.coalesce(func.sum(usage.c.cost_usd), 0.0).label("cost_usd"),
+                _avg_latency(usage).label("avg_latency_ms"),
             )
-            .where(LLMUsage.conversation_id == conversation_id)
-            .group_by(LLMUsage.agent_role, LLMUsage.model)
-            .order_by(func.sum(LLMUsage.cost_usd).desc())
+            .group_by(usage.c.agent_role, usage.c.model)
+            .order_by(func.sum(usage.c.cost_usd).desc())
         )
 
         return {
@@ -216,22 +323,22 @@ class LLMUsageRepository:
             List of dicts with model, provider, calls, input_tokens,
             output_tokens, tokens, cost_usd, avg_latency_ms
         """
-        since = datetime.now(UTC) - timedelta(days=days)
+        since = _hour_floor(datetime.now(UTC) - timedelta(days=days))
+        usage = self._usage(since)
 
         result = await self.session.execute(
             select(
-                LLMUsage.model,
-                LLMUsage.provider,
-                func.count(LLMUsage.id).label("calls"),
-                func.coalesce(func.sum(LLMUsage.input_tokens), 0).label("input_tokens"),
-                func.coalesce(func.sum(LLMUsage.output_tokens), 0).label("output_tokens"),
-                func.coalesce(func.sum(LLMUsage.total_tokens), 0).label("tokens"),
-                func.coalesce(func.sum(LLMUsage.cost_usd), 0.0).label("cost_usd"),
-                func.avg(LLMUsage.latency_ms).label("avg_latency_ms"),
+                usage.c.model,
+                usage.c.provider,
+                func.sum(usage.c.calls).label("calls"),
+                func.coalesce(func.sum(usage.c.input_tokens), 0).label("input_tokens"),
+                func.coalesce(func.sum(usage.c.output_tokens), 0).label("output_tokens"),
+                func.coalesce(func.sum(usage.c.total_tokens), 0).label("tokens"),
+                func.coalesce(func.sum(usage.c.cost_usd), 0.0).label("cost_usd"),
+                _avg_latency(usage).label("avg_latency_ms"),
             )
-            .where(LLMUsage.created_at >= since)
-            .group_by(LLMUsage.model, LLMUsage.provider)
-            .order_by(func.sum(LLMUsage.cost_usd).desc())
+            .group_by(usage.c.model, usage.c.provider)
+            .order_by(func.sum(usage.c.cost_usd).desc())
         )
 
         return [
@@ -247,3 +354,90 @@ class LLMUsageRepository:
             }
             for r in result
         ]
+
+    async def get_rollup_watermark(self) -> datetime | None:
+        """Return the time before which all raw usage has been rolled up.
+
+        Returns:
+            The hour after the newest rollup bucket, or None if nothing
+            has been rolled up yet
+        """
+        result = await self.session.execute(select(func.max(LLMUsageRollup.bucket_start)))
+        newest = result.scalar()
+        return newest + _BUCKET if newest is not None else None
+
+    async def roll_up(self, settle_seconds: int = 300) -> int:
+        """Fold complete hours of raw usage into ``llm_usage_rollups``.
+
+        Aggregates raw rows from the current watermark up to the last
+        hour that ended at least ``settle_seconds`` ago (so buffered
+        writes have landed) with one INSERT ... SELECT, adding onto any
+        existing bucket. A transaction-scoped advisory lock keeps two
+        runs from folding the same rows twice.
+
+        Args:
+            settle_seconds: Grace period after an hour ends before it is
+                rolled up
+
+        Returns:
+            Number of rollup rows inserted or updated
+        """
+        await self.session.execute(select(func.pg_advisory_xact_lock(_ROLLUP_LOCK_ID)))
+
+        until = _hour_floor(datetime.now(UTC) - timedelta(seconds=settle_seconds))
+        watermark = await self.get_rollup_watermark()
+        if watermark is not None and watermark >= until:
+            await self.session.commit()
+            return 0
+
+        bucket = func.date_trunc("hour", LLMUsage.created_at)
+        agent_role = func.coalesce(LLMUsage.agent_role, "")
+        conversation_id = func.coalesce(cast(LLMUsage.conversation_id, String), "")
+        aggregated = select(
+            func.gen_random_uuid(),
+            bucket,
+            LLMUsage.provider,
+            LLMUsage.model,
+            agent_role,
+            conversation_id,
+            func.count(LLMUsage.id),
+            func.sum(LLMUsage.input_tokens),
+            func.sum(LLMUsage.output_tokens),
+            func.sum(LLMUsage.total_tokens),
+            func.coalesce(func.sum(LLMUsage.cost_usd), 0.0),
+            func.coalesce(func.sum(LLMUsage.latency_ms), 0),
+            func.count(LLMUsage.latency_ms),
+        ).where(LLMUsage.created_at < until)
+        if watermark is not None:
+            aggregated = aggregated.where(LLMUsage.created_at >= watermark)
+        # Ordinal GROUP BY: the bucket/coalesce expressions carry bind params
+        aggregated = aggregated.group_by(text("2, 3, 4, 5, 6"))
+
+        stmt = pg_insert(LLMUsageRollup).from_select(
+            [
+                "id",
+                "bucket_start",
+                "provider",
+                "model",
+                "agent_role",
+                "conversation_id",
+                *_MEASURES,
+            ],
+            aggregated,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["bucket_start", "provider", "model", "agent_role", "conversation_id"],
+            set_={m: getattr(LLMUsageRollup, m) + getattr(stmt.excluded, m) for m in _MEASURES},
+        )
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.rowcount or 0
+
+
+def _hour_floor(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def _avg_latency(usage: Subquery) -> ColumnElement[Any]:
+    """Mean latency over the calls that reported one (NULL if none did)."""
+    return func.sum(usage.c.latency_ms_sum) * 1.0 / func.nullif(func.sum(usage.c.latency_count), 0)
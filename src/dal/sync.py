@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from datetime import UTC, datetime
@@ -12,6 +13,8 @@ import httpx
 from sqlalchemy.exc import SQLAlchemyError
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -36,12 +39,14 @@ from src.dal.areas import AreaRepository
 from src.dal.automations import AutomationRepository, SceneRepository, ScriptRepository
 from src.dal.devices import DeviceRepository
 from src.dal.entities import EntityRepository
+from src.dal.entity_search import invalidate_search_index
 from src.ha import HAClient, parse_entity_list
 from src.ha.workarounds import (
     extract_entity_metadata,
     infer_areas_from_entities,
     infer_devices_from_entities,
 )
+from src.settings import get_settings
 from src.storage.entities import DiscoverySession, DiscoveryStatus
 
 
@@ -161,6 +166,7 @@ class DiscoverySyncService:
             raise
 
         await self.session.commit()
+        invalidate_search_index()
         return discovery
 
     async def _fetch_areas(
@@ -330,11 +336,43 @@ class DiscoverySyncService:
             "removed": removed_count,
         }
 
+    async def _fetch_configs(
+        self,
+        fetch: Callable[[str], Awaitable[dict[str, Any] | None]],
+        ids: list[str],
+        kind: str,
+    ) -> dict[str, dict[str, Any] | None]:
+        """Fetch registry configs from HA with bounded concurrency.
+
+        Args:
+            fetch: HA client getter (e.g. ``get_automation_config``)
+            ids: IDs to fetch
+            kind: Label for failure logs ("automation", "script")
+
+        Returns:
+            Dictionary of id -> config (None when the fetch failed)
+        """
+        semaphore = asyncio.Semaphore(get_settings().discovery_sync_config_concurrency)
+
+        async def _one(item_id: str) -> dict[str, Any] | None:
+            async with semaphore:
+                try:
+                    return await fetch(item_id)
+                except (httpx.HTTPError, TimeoutError, ConnectionError) as exc:
+                    logger.warning("Failed to fetch config for %s %s: %s", kind, item_id, exc)
+                    return None
+
+        configs = await asyncio.gather(*(_one(item_id) for item_id in ids))
+        return dict(zip(ids, configs, strict=True))
+
     async def _sync_automation_entities(self, entities: list[Any]) -> dict[str, int]:
         """Sync automation, script, and scene entities to registry tables.
 
         Populates ha_automations, scripts, and scenes tables from parsed
-        entity data. Removes stale records no longer present in HA.
+        entity data. Automation and script configs are fetched from HA
+        concurrently; rows whose content is unchanged are not rewritten,
+        and records no longer present in HA are removed in one DELETE
+        per table.
 
         Args:
             entities: All parsed entities (filters to automation/script/scene)
@@ -342,32 +380,23 @@ class DiscoverySyncService:
         Returns:
             Stats dict with automations_synced, scripts_synced, scenes_synced
         """
-        stats = {"automations_synced": 0, "scripts_synced": 0, "scenes_synced": 0}
-
         # Partition entities by domain
         automations = [e for e in entities if e.domain == "automation"]
         scripts = [e for e in entities if e.domain == "script"]
         scenes = [e for e in entities if e.domain == "scene"]
 
         # --- Automations ---
-        seen_automation_ids: set[str] = set()
-        for entity in automations:
+        automation_ids = [
+            (e.attributes or {}).get("id", e.entity_id.split(".", 1)[-1]) for e in automations
+        ]
+        # Full config from HA (trigger/condition/action)
+        automation_configs = await self._fetch_configs(
+            self.ha.get_automation_config, automation_ids, "automation"
+        )
+        automation_rows = []
+        for entity, ha_automation_id in zip(automations, automation_ids, strict=True):
             attrs = entity.attributes or {}
-            ha_automation_id = attrs.get("id", entity.entity_id.split(".", 1)[-1])
-            seen_automation_ids.add(ha_automation_id)
-
-            # Fetch full config from HA (trigger/condition/action)
-            config: dict[str, Any] | None = None
-            try:
-                config = await self.ha.get_automation_config(ha_automation_id)
-            except (httpx.HTTPError, TimeoutError, ConnectionError) as exc:
-                logger.warning(
-                    "Failed to fetch config for automation %s: %s",
-                    ha_automation_id,
-                    exc,
-                )
-
-            await self.automation_repo.upsert(
+            automation_rows.append(
                 {
                     "ha_automation_id": ha_automation_id,
                     "entity_id": entity.entity_id,
@@ -375,39 +404,24 @@ class DiscoverySyncService:
                     "state": entity.state or "off",
                     "mode": attrs.get("mode", "single"),
                     "last_triggered": attrs.get("last_triggered"),
-                    "config": config,
+                    "config": automation_configs[ha_automation_id],
                 }
             )
-            stats["automations_synced"] += 1
+        await self.automation_repo.upsert_many(automation_rows, skip_unchanged=True)
 
         # Remove stale automations
         existing_automation_ids = await self.automation_repo.get_all_ha_ids()
-        for stale_id in existing_automation_ids - seen_automation_ids:
-            await self.automation_repo.delete(stale_id)
+        await self.automation_repo.delete_by_ha_ids(existing_automation_ids - set(automation_ids))
 
         # --- Scripts ---
-        seen_script_ids: set[str] = set()
-        for entity in scripts:
+        script_ids = [e.entity_id.split(".", 1)[-1] for e in scripts]
+        # Full config from HA (sequence/fields)
+        script_configs = await self._fetch_configs(self.ha.get_script_config, script_ids, "script")
+        script_rows = []
+        for entity, script_id in zip(scripts, script_ids, strict=True):
             attrs = entity.attributes or {}
-            seen_script_ids.add(entity.entity_id)
-
-            # Fetch full config from HA (sequence/fields)
-            script_id = entity.entity_id.split(".", 1)[-1]
-            sequence: list[Any] | None = None
-            fields: dict[str, Any] | None = None
-            try:
-                script_config = await self.ha.get_script_config(script_id)
-                if script_config:
-                    sequence = script_config.get("sequence")
-                    fields = script_config.get("fields")
-            except (httpx.HTTPError, TimeoutError, ConnectionError) as exc:
-                logger.warning(
-                    "Failed to fetch config for script %s: %s",
-                    script_id,
-                    exc,
-                )
-
-            await self.script_repo.upsert(
+            script_config = script_configs[script_id] or {}
+            script_rows.append(
                 {
                     "entity_id": entity.entity_id,
                     "alias": attrs.get("friendly_name", entity.name),
@@ -415,38 +429,38 @@ class DiscoverySyncService:
                     "mode": attrs.get("mode", "single"),
                     "icon": attrs.get("icon"),
                     "last_triggered": attrs.get("last_triggered"),
-                    "sequence": sequence,
-                    "fields": fields,
+                    "sequence": script_config.get("sequence"),
+                    "fields": script_config.get("fields"),
                 }
             )
-            stats["scripts_synced"] += 1
+        await self.script_repo.upsert_many(script_rows, skip_unchanged=True)
 
         # Remove stale scripts
         existing_script_ids = await self.script_repo.get_all_ha_ids()
-        for stale_id in existing_script_ids - seen_script_ids:
-            await self.script_repo.delete(stale_id)
+        await self.script_repo.delete_by_ha_ids(
+            existing_script_ids - {e.entity_id for e in scripts}
+        )
 
         # --- Scenes ---
-        seen_scene_ids: set[str] = set()
-        for entity in scenes:
-            attrs = entity.attributes or {}
-            seen_scene_ids.add(entity.entity_id)
-
-            await self.scene_repo.upsert(
-                {
-                    "entity_id": entity.entity_id,
-                    "name": attrs.get("friendly_name", entity.name),
-                    "icon": attrs.get("icon"),
-                }
-            )
-            stats["scenes_synced"] += 1
+        scene_rows = [
+            {
+                "entity_id": entity.entity_id,
+                "name": (entity.attributes or {}).get("friendly_name", entity.name),
+                "icon": (entity.attributes or {}).get("icon"),
+            }
+            for entity in scenes
+        ]
+        await self.scene_repo.upsert_many(scene_rows, skip_unchanged=True)
 
         # Remove stale scenes
         existing_scene_ids = await self.scene_repo.get_all_ha_ids()
-        for stale_id in existing_scene_ids - seen_scene_ids:
-            await self.scene_repo.delete(stale_id)
+        await self.scene_repo.delete_by_ha_ids(existing_scene_ids - {e.entity_id for e in scenes})
 
-        return stats
+        return {
+            "automations_synced": len(automation_rows),
+            "scripts_synced": len(script_rows),
+            "scenes_synced": len(scene_rows),
+        }
 
     async def _sync_entities_delta(
         self,
@@ -457,8 +471,9 @@ class DiscoverySyncService:
         """Sync entities using delta logic — skip unchanged ones.
 
         Compares each entity's ``last_updated`` timestamp from HA against
-        the ``last_synced_at`` on the DB record.  Only upserts when the
-        entity is new or has been updated since the last sync.
+        the ``last_synced_at`` on the DB record, loaded for all entities
+        in one query. New or updated entities are written with a single
+        batch upsert and removed ones with a single DELETE.
 
         Args:
             entities: Parsed entities from MCP
@@ -468,22 +483,20 @@ class DiscoverySyncService:
         Returns:
             Stats dict with added, updated, skipped, removed counts
         """
-        stats = {"added": 0, "updated": 0, "skipped": 0, "removed": 0}
-
-        existing_ids = await self.entity_repo.get_all_entity_ids()
+        synced_at = await self.entity_repo.get_sync_timestamps()
         seen_ids: set[str] = set()
+        skipped = 0
 
+        data_list = []
         for entity in entities:
             seen_ids.add(entity.entity_id)
 
             # Check if we can skip this entity
-            db_record = await self.entity_repo.get_by_entity_id(entity.entity_id)
-            if db_record is not None:
-                ha_updated = getattr(entity, "last_updated", None)
-                db_synced = db_record.last_synced_at
-                if ha_updated is not None and db_synced is not None and ha_updated <= db_synced:
-                    stats["skipped"] += 1
-                    continue
+            ha_updated = getattr(entity, "last_updated", None)
+            db_synced = synced_at.get(entity.entity_id)
+            if ha_updated is not None and db_synced is not None and ha_updated <= db_synced:
+                skipped += 1
+                continue
 
             # Entity is new or changed — upsert
             metadata = extract_entity_metadata(entity)
@@ -496,36 +509,36 @@ class DiscoverySyncService:
                 internal_device_id = device_id_mapping.get(entity.device_id)
 
             raw_attrs = getattr(entity, "attributes", None)
-            entity_data = {
-                "entity_id": entity.entity_id,
-                "domain": entity.domain,
-                "name": entity.name,
-                "state": entity.state,
-                "attributes": _strip_null_bytes(raw_attrs) if raw_attrs else raw_attrs,
-                "area_id": internal_area_id,
-                "device_id": internal_device_id,
-                "device_class": metadata.get("device_class"),
-                "unit_of_measurement": metadata.get("unit_of_measurement"),
-                "supported_features": metadata.get("supported_features", 0),
-                "state_class": metadata.get("state_class"),
-                "icon": metadata.get("icon"),
-                "entity_category": metadata.get("entity_category"),
-                "platform": metadata.get("platform"),
-            }
+            data_list.append(
+                {
+                    "entity_id": entity.entity_id,
+                    "domain": entity.domain,
+                    "name": entity.name,
+                    "state": entity.state,
+                    "attributes": _strip_null_bytes(raw_attrs) if raw_attrs else raw_attrs,
+                    "area_id": internal_area_id,
+                    "device_id": internal_device_id,
+                    "device_class": metadata.get("device_class"),
+                    "unit_of_measurement": metadata.get("unit_of_measurement"),
+                    "supported_features": metadata.get("supported_features", 0),
+                    "state_class": metadata.get("state_class"),
+                    "icon": metadata.get("icon"),
+                    "entity_category": metadata.get("entity_category"),
+                    "platform": metadata.get("platform"),
+                }
+            )
 
-            _, created = await self.entity_repo.upsert(entity_data)
-            if created:
-                stats["added"] += 1
-            else:
-                stats["updated"] += 1
+        _, upsert_stats = await self.entity_repo.upsert_many(data_list)
 
         # Remove entities no longer in HA
-        removed_ids = existing_ids - seen_ids
-        for entity_id in removed_ids:
-            await self.entity_repo.delete(entity_id)
-            stats["removed"] += 1
+        removed = await self.entity_repo.delete_by_ha_ids(set(synced_at) - seen_ids)
 
-        return stats
+        return {
+            "added": upsert_stats["created"],
+            "updated": upsert_stats["updated"],
+            "skipped": skipped,
+            "removed": removed,
+        }
 
     async def run_delta_sync(self) -> dict[str, Any]:
         """Run a lightweight delta sync.
@@ -552,6 +565,7 @@ class DiscoverySyncService:
         duration = time.monotonic() - start
 
         await self.session.commit()
+        invalidate_search_index()
 
         return {
             **entity_stats,
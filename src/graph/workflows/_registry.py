@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
@@ -9,6 +10,7 @@ if TYPE_CHECKING:
 
 from src.graph.workflows.analysis import build_analysis_graph
 from src.graph.workflows.automation_builder import build_automation_builder_graph
+from src.graph.workflows.conversation import INTERRUPT_BEFORE as CONVERSATION_INTERRUPT_BEFORE
 from src.graph.workflows.conversation import build_conversation_graph
 from src.graph.workflows.dashboard import build_dashboard_graph
 from src.graph.workflows.discovery import build_discovery_graph, build_simple_discovery_graph
@@ -29,6 +31,14 @@ WORKFLOW_REGISTRY = {
     "review": build_review_graph,
 }
 
+# Options passed to StateGraph.compile() for each workflow
+WORKFLOW_COMPILE_OPTIONS: dict[str, dict[str, Any]] = {
+    "conversation": {"interrupt_before": CONVERSATION_INTERRUPT_BEFORE},
+}
+
+# Definition hashes of workflows registered from a WorkflowDefinition
+_WORKFLOW_VERSIONS: dict[str, str] = {}
+
 
 def register_dynamic_workflow(name: str, builder: object) -> None:
     """Register a dynamic workflow builder at runtime.
@@ -37,12 +47,25 @@ def register_dynamic_workflow(name: str, builder: object) -> None:
         name: Workflow name (used as lookup key).
         builder: A callable that returns a StateGraph when called.
     """
+    from src.graph.workflows.cache import invalidate_compiled_graphs
+
     WORKFLOW_REGISTRY[name] = builder  # type: ignore[assignment]
+    _WORKFLOW_VERSIONS.pop(name, None)
+    invalidate_compiled_graphs(name)
 
 
 def unregister_dynamic_workflow(name: str) -> None:
     """Remove a dynamic workflow from the registry."""
+    from src.graph.workflows.cache import invalidate_compiled_graphs
+
     WORKFLOW_REGISTRY.pop(name, None)
+    _WORKFLOW_VERSIONS.pop(name, None)
+    invalidate_compiled_graphs(name)
+
+
+def workflow_version(name: str) -> str:
+    """Definition hash of a dynamic workflow ("" for built-in workflows)."""
+    return _WORKFLOW_VERSIONS.get(name, "")
 
 
 def compile_and_register(
@@ -70,6 +93,7 @@ def compile_and_register(
     compiler = WorkflowCompiler(manifest)
     graph = compiler.compile(defn)
     register_dynamic_workflow(defn.name, lambda _defn=defn, _g=graph: _g)
+    _WORKFLOW_VERSIONS[defn.name] = hashlib.sha256(defn.model_dump_json().encode()).hexdigest()[:16]
 
 
 def get_workflow(name: str, **kwargs: object) -> StateGraph:
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any, cast
 import mlflow
 
 if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.ha.client import HAClient
@@ -25,6 +26,7 @@ from src.graph.nodes import (
     generate_script_node,
 )
 from src.graph.state import AnalysisState
+from src.graph.workflows.cache import bind_graph, get_compiled_graph, resolve_dependency
 from src.tracing import start_experiment_run, traced_node
 
 
@@ -66,17 +68,23 @@ def build_analysis_graph(
     graph = create_graph(AnalysisState)
 
     # Define node wrappers with dependency injection (traced for MLflow per-node spans)
-    async def _collect_data(state: AnalysisState) -> dict[str, object]:
-        return await collect_energy_data_node(state, ha_client=ha_client)
+    async def _collect_data(state: AnalysisState, config: RunnableConfig) -> dict[str, object]:
+        return await collect_energy_data_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
-    async def _generate_script(state: AnalysisState) -> dict[str, object]:
-        return await generate_script_node(state, session=session)
+    async def _generate_script(state: AnalysisState, config: RunnableConfig) -> dict[str, object]:
+        return await generate_script_node(
+            state, session=resolve_dependency(config, "session", session)
+        )
 
     async def _execute_sandbox(state: AnalysisState) -> dict[str, object]:
         return await execute_sandbox_node(state)
 
-    async def _extract_insights(state: AnalysisState) -> dict[str, object]:
-        return await extract_insights_node(state, session=session)
+    async def _extract_insights(state: AnalysisState, config: RunnableConfig) -> dict[str, object]:
+        return await extract_insights_node(
+            state, session=resolve_dependency(config, "session", session)
+        )
 
     async def _handle_error(state: AnalysisState) -> dict[str, object]:
         # Get error from state if available
@@ -143,9 +151,7 @@ async def run_analysis_workflow(
         custom_query=custom_query,
     )
 
-    # Build and compile graph
-    graph = build_analysis_graph(ha_client=ha_client, session=session)
-    compiled = graph.compile()
+    compiled = bind_graph(get_compiled_graph("analysis"), ha_client=ha_client, session=session)
 
     # Run with tracing (inherit parent session if one exists)
     with (
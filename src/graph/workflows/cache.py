@@ -0,0 +1,139 @@
+"""Compiled workflow graph cache.
+
+Compiling a ``StateGraph`` validates the topology and builds the Pregel
+channels and nodes, which is wasted work when the same workflow is
+compiled on every request. Registered workflows are compiled once per
+process, keyed by name and definition version, and shared.
+
+A cached graph holds no request state:
+
+- Per-request dependencies (DB session, HA client) travel in
+  ``config["configurable"]``. Nodes read them with
+  ``resolve_dependency``.
+- The checkpointer is attached per invocation with ``bind_graph``. That
+  is a shallow copy, not a recompile.
+
+Entries are dropped when a workflow is (re)registered, including by
+``compile_and_register``.
+
+Usage::
+
+    compiled = bind_graph(
+        get_compiled_graph("conversation"),
+        checkpointer=PostgresCheckpointer(session),
+        session=session,
+    )
+    await compiled.ainvoke(state, config={"configurable": {"thread_id": tid}})
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.runnables.config import merge_configs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.graph.state import CompiledStateGraph
+
+logger = logging.getLogger(__name__)
+
+# Workflows compiled at application startup
+WARM_WORKFLOWS = ("conversation", "analysis", "optimization", "discovery", "review")
+
+_compiled: dict[tuple[str, str], CompiledStateGraph] = {}
+_lock = threading.Lock()
+
+
+def get_compiled_graph(name: str) -> CompiledStateGraph:
+    """The shared compiled graph for a registered workflow.
+
+    Compiled on first use with the workflow's registered compile options
+    (e.g. HITL interrupts) and no checkpointer.
+
+    Raises:
+        ValueError: If workflow name is not found
+    """
+    from src.graph.workflows._registry import (
+        WORKFLOW_COMPILE_OPTIONS,
+        get_workflow,
+        workflow_version,
+    )
+
+    key = (name, workflow_version(name))
+    compiled = _compiled.get(key)
+    if compiled is None:
+        with _lock:
+            compiled = _compiled.get(key)
+            if compiled is None:
+                started = time.perf_counter()
+                compiled = get_workflow(name).compile(**WORKFLOW_COMPILE_OPTIONS.get(name, {}))
+                _compiled[key] = compiled
+                logger.debug(
+                    "Compiled workflow %s in %.1fms", name, (time.perf_counter() - started) * 1000
+                )
+    return compiled
+
+
+def bind_graph(
+    compiled: CompiledStateGraph,
+    *,
+    checkpointer: Any = None,
+    **dependencies: Any,
+) -> CompiledStateGraph:
+    """Attach a checkpointer and per-request dependencies to a compiled graph.
+
+    Returns a shallow copy; the shared graph is not modified. Dependencies
+    that are None are left out, so nodes fall back to their defaults.
+    """
+    update: dict[str, Any] = {}
+    if checkpointer is not None:
+        update["checkpointer"] = checkpointer
+    bound = {k: v for k, v in dependencies.items() if v is not None}
+    if bound:
+        update["config"] = merge_configs(compiled.config, {"configurable": bound})
+    return compiled.copy(update=update) if update else compiled
+
+
+def resolve_dependency(config: RunnableConfig | None, name: str, default: Any = None) -> Any:
+    """A dependency bound with ``bind_graph`` (or passed in the invoke config)."""
+    value = ((config or {}).get("configurable") or {}).get(name)
+    return default if value is None else value
+
+
+def invalidate_compiled_graphs(name: str | None = None) -> None:
+    """Drop cached graphs for one workflow, or all of them."""
+    with _lock:
+        for key in [k for k in _compiled if name is None or k[0] == name]:
+            del _compiled[key]
+
+
+def warm_up_compiled_graphs(names: Iterable[str] = WARM_WORKFLOWS) -> int:
+    """Compile workflows ahead of the first request.
+
+    Returns:
+        Number of workflows compiled (failures are logged and skipped)
+    """
+    warmed = 0
+    for name in names:
+        try:
+            get_compiled_graph(name)
+            warmed += 1
+        except Exception:
+            logger.warning("Failed to pre-compile workflow %s", name, exc_info=True)
+    return warmed
+
+
+__all__ = [
+    "WARM_WORKFLOWS",
+    "bind_graph",
+    "get_compiled_graph",
+    "invalidate_compiled_graphs",
+    "resolve_dependency",
+    "warm_up_compiled_graphs",
+]
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Literal, cast
 from langgraph.checkpoint.memory import MemorySaver
 
 if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
     from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.graph import END, START, StateGraph, create_graph
@@ -21,8 +22,12 @@ from src.graph.nodes import (
     process_approval_node,
 )
 from src.graph.state import ConversationState, ConversationStatus
+from src.graph.workflows.cache import bind_graph, get_compiled_graph, resolve_dependency
 from src.tracing import start_experiment_run, trace_with_uri, traced_node
 
+# HITL: pause before the approval gate so a human decides before deployment
+INTERRUPT_BEFORE = ["approval_gate"]
+
 
 def build_conversation_graph(
     session: AsyncSession | None = None,
@@ -59,7 +64,8 @@ def build_conversation_graph(
     Constitution: Safety First - HITL approval required before deployment.
 
     Args:
-        session: Database session for persistence
+        session: Database session for persistence (a ``session`` bound
+            per invocation with ``bind_graph`` takes precedence)
         checkpointer: Optional checkpointer for state persistence
 
     Returns:
@@ -68,26 +74,34 @@ def build_conversation_graph(
     graph = create_graph(ConversationState)
 
     # Define node wrappers with injected dependencies
-    async def _architect_propose(state: ConversationState) -> dict[str, object]:
-        return await architect_propose_node(state, session=session)
+    async def _architect_propose(
+        state: ConversationState, config: RunnableConfig
+    ) -> dict[str, object]:
+        return await architect_propose_node(
+            state, session=resolve_dependency(config, "session", session)
+        )
 
     async def _approval_gate(state: ConversationState) -> dict[str, object]:
         return await approval_gate_node(state)
 
-    async def _process_approval(state: ConversationState) -> dict[str, object]:
+    async def _process_approval(
+        state: ConversationState, config: RunnableConfig
+    ) -> dict[str, object]:
         # Default to rejection if no explicit approval
         # Real approval happens via external input before resuming
         approved = state.status == ConversationStatus.APPROVED
         return await process_approval_node(
             state,
             approved=approved,
-            session=session,
+            session=resolve_dependency(config, "session", session),
         )
 
-    async def _deploy(state: ConversationState) -> dict[str, object]:
+    async def _deploy(state: ConversationState, config: RunnableConfig) -> dict[str, object]:
         if state.approved_items:
             proposal_id = state.approved_items[-1]
-            return await developer_deploy_node(state, proposal_id, session=session)
+            return await developer_deploy_node(
+                state, proposal_id, session=resolve_dependency(config, "session", session)
+            )
         return {"error": "No approved proposals to deploy"}
 
     # Add nodes (traced for MLflow per-node spans)
@@ -135,6 +149,9 @@ def compile_conversation_graph(
     Constitution: Safety First - interrupt_before at approval_gate
     ensures human approval before any deployment.
 
+    The graph itself is compiled once per process; each call binds this
+    request's checkpointer and session to the shared compiled graph.
+
     Args:
         session: Database session
         thread_id: Optional thread ID for checkpointing
@@ -150,18 +167,10 @@ def compile_conversation_graph(
     else:
         checkpointer = MemorySaver()
 
-    # Build graph
-    graph = build_conversation_graph(session=session)
-
-    # Compile with interrupt_before at approval gate
-    # This pauses execution for HITL approval
-    compiled = graph.compile(
-        checkpointer=checkpointer,
-        interrupt_before=["approval_gate"],  # HITL: Pause before approval
+    return bind_graph(
+        get_compiled_graph("conversation"), checkpointer=checkpointer, session=session
     )
 
-    return compiled
-
 
 @trace_with_uri(name="workflow.run_conversation", span_type="CHAIN")
 async def run_conversation_workflow(
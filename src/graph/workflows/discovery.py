@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.ha.client import HAClient
@@ -24,6 +25,7 @@ from src.graph.nodes import (
     sync_automations_node,
 )
 from src.graph.state import DiscoveryState, DiscoveryStatus
+from src.graph.workflows.cache import bind_graph, get_compiled_graph, resolve_dependency
 from src.tracing import start_experiment_run, trace_with_uri
 
 
@@ -76,20 +78,32 @@ def build_discovery_graph(
     async def _initialize(state: DiscoveryState) -> dict[str, object]:
         return await initialize_discovery_node(state)
 
-    async def _fetch_entities(state: DiscoveryState) -> dict[str, object]:
-        return await fetch_entities_node(state, ha_client=ha_client)
+    async def _fetch_entities(state: DiscoveryState, config: RunnableConfig) -> dict[str, object]:
+        return await fetch_entities_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
-    async def _infer_devices(state: DiscoveryState) -> dict[str, object]:
-        return await infer_devices_node(state, ha_client=ha_client)
+    async def _infer_devices(state: DiscoveryState, config: RunnableConfig) -> dict[str, object]:
+        return await infer_devices_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
-    async def _infer_areas(state: DiscoveryState) -> dict[str, object]:
-        return await infer_areas_node(state, ha_client=ha_client)
+    async def _infer_areas(state: DiscoveryState, config: RunnableConfig) -> dict[str, object]:
+        return await infer_areas_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
-    async def _sync_automations(state: DiscoveryState) -> dict[str, object]:
-        return await sync_automations_node(state, ha_client=ha_client)
+    async def _sync_automations(state: DiscoveryState, config: RunnableConfig) -> dict[str, object]:
+        return await sync_automations_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
-    async def _persist_entities(state: DiscoveryState) -> dict[str, object]:
-        return await persist_entities_node(state, session=session, ha_client=ha_client)
+    async def _persist_entities(state: DiscoveryState, config: RunnableConfig) -> dict[str, object]:
+        return await persist_entities_node(
+            state,
+            session=resolve_dependency(config, "session", session),
+            ha_client=resolve_dependency(config, "ha_client", ha_client),
+        )
 
     async def _finalize(state: DiscoveryState) -> dict[str, object]:
         return await finalize_discovery_node(state)
@@ -141,11 +155,8 @@ async def run_discovery_workflow(
     # Start a trace session for this workflow (inherit parent session if one exists)
     from src.tracing.context import get_session_id, session_context
 
-    # Build the graph with injected dependencies
-    graph = build_discovery_graph(ha_client=ha_client, session=session)
-
-    # Compile the graph
-    compiled = graph.compile()
+    # Shared compiled graph with this run's dependencies bound
+    compiled = bind_graph(get_compiled_graph("discovery"), ha_client=ha_client, session=session)
 
     # Initialize state
     if initial_state is None:
@@ -11,12 +11,14 @@ from typing import TYPE_CHECKING
 import mlflow
 
 if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.ha.client import HAClient
 
 from src.graph import END, START, StateGraph, create_graph
 from src.graph.state import AgentRole, AnalysisState, AnalysisType
+from src.graph.workflows.cache import bind_graph, get_compiled_graph, resolve_dependency
 
 
 def build_optimization_graph(
@@ -68,14 +70,24 @@ def build_optimization_graph(
     graph = create_graph(AnalysisState)
 
     # Node wrappers with dependency injection
-    async def _collect_behavioral(state: AnalysisState) -> dict[str, object]:
-        return await collect_behavioral_data_node(state, ha_client=ha_client)
+    async def _collect_behavioral(
+        state: AnalysisState, config: RunnableConfig
+    ) -> dict[str, object]:
+        return await collect_behavioral_data_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
-    async def _analyze_and_suggest(state: AnalysisState) -> dict[str, object]:
-        return await analyze_and_suggest_node(state, session=session)
+    async def _analyze_and_suggest(
+        state: AnalysisState, config: RunnableConfig
+    ) -> dict[str, object]:
+        return await analyze_and_suggest_node(
+            state, session=resolve_dependency(config, "session", session)
+        )
 
-    async def _architect_review(state: AnalysisState) -> dict[str, object]:
-        return await architect_review_node(state, session=session)
+    async def _architect_review(state: AnalysisState, config: RunnableConfig) -> dict[str, object]:
+        return await architect_review_node(
+            state, session=resolve_dependency(config, "session", session)
+        )
 
     async def _present_recommendations(state: AnalysisState) -> dict[str, object]:
         return await present_recommendations_node(state)
@@ -179,9 +191,9 @@ async def run_optimization_workflow(
         log_param("analysis_type", analysis_type)
         log_param("hours", hours)
 
-        # Build and compile graph
-        graph = build_optimization_graph(ha_client=ha_client, session=session)
-        compiled = graph.compile()
+        compiled = bind_graph(
+            get_compiled_graph("optimization"), ha_client=ha_client, session=session
+        )
 
         # Initialize state
         initial_state = AnalysisState(
@@ -13,6 +13,7 @@ import httpx
 from sqlalchemy.exc import SQLAlchemyError
 
 if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from src.ha.client import HAClient
@@ -25,6 +26,7 @@ from src.graph.nodes import (
     resolve_targets_node,
 )
 from src.graph.state import ReviewState
+from src.graph.workflows.cache import resolve_dependency
 from src.tracing import traced_node
 
 logger = logging.getLogger(__name__)
@@ -75,14 +77,20 @@ def build_review_graph(
     graph = create_graph(ReviewState)
 
     # Node wrappers with dependency injection
-    async def _resolve_targets(state: ReviewState) -> dict:
-        return await resolve_targets_node(state, ha_client=ha_client)
+    async def _resolve_targets(state: ReviewState, config: RunnableConfig) -> dict:
+        return await resolve_targets_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
-    async def _fetch_configs(state: ReviewState) -> dict:
-        return await fetch_configs_node(state, ha_client=ha_client)
+    async def _fetch_configs(state: ReviewState, config: RunnableConfig) -> dict:
+        return await fetch_configs_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
-    async def _gather_context(state: ReviewState) -> dict:
-        return await gather_context_node(state, ha_client=ha_client)
+    async def _gather_context(state: ReviewState, config: RunnableConfig) -> dict:
+        return await gather_context_node(
+            state, ha_client=resolve_dependency(config, "ha_client", ha_client)
+        )
 
     async def _consult_ds_team(state: ReviewState) -> dict:
         """Consult DS team specialists for analysis findings."""
@@ -135,8 +143,10 @@ def build_review_graph(
         )
         return {"suggestions": suggestions}
 
-    async def _create_proposals(state: ReviewState) -> dict:
-        return await create_review_proposals_node(state, session=session)
+    async def _create_proposals(state: ReviewState, config: RunnableConfig) -> dict:
+        return await create_review_proposals_node(
+            state, session=resolve_dependency(config, "session", session)
+        )
 
     # Wire up nodes (traced for MLflow per-node spans)
     graph.add_node("resolve_targets", traced_node("resolve_targets", _resolve_targets))
@@ -39,6 +39,10 @@ _EXPORTS = {
     "EnergyStats": "src.ha.history",
     "discover_energy_sensors": "src.ha.history",
     "get_energy_history": "src.ha.history",
+    # history_store
+    "HistoryStore": "src.ha.history_store",
+    # state_mirror
+    "StateMirror": "src.ha.state_mirror",
     # logbook
     "LogbookHistoryClient": "src.ha.logbook",
     "LogbookStats": "src.ha.logbook",
@@ -105,6 +109,7 @@ if TYPE_CHECKING:
         discover_energy_sensors,
         get_energy_history,
     )
+    from src.ha.history_store import HistoryStore
     from src.ha.logbook import (
         LogbookHistoryClient,
         LogbookStats,
@@ -120,6 +125,7 @@ if TYPE_CHECKING:
         parse_logbook_list,
         parse_system_overview,
     )
+    from src.ha.state_mirror import StateMirror
     from src.ha.workarounds import infer_areas_from_entities, infer_devices_from_entities
 
 __all__ = [
@@ -134,9 +140,11 @@ __all__ = [
     "EventHandler",
     "HAClient",
     "HAEventStream",
+    "HistoryStore",
     "LogbookHistoryClient",
     "LogbookStats",
     "ParsedLogbookEntry",
+    "StateMirror",
     "build_condition",
     "build_delay_action",
     "build_service_action",
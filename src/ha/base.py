@@ -4,16 +4,33 @@ Provides the core HTTP client functionality including URL fallback,
 connection management, and tracing decorators.
 """
 
+import asyncio
 import time
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.exceptions import HAClientError
+from src.ha.request_cache import _record_cache_event, request_key
+from src.ha.websocket import HAWebSocketSession, close_ws_sessions, get_ws_session
 from src.settings import get_settings
 
+if TYPE_CHECKING:
+    from src.ha.history_store import HistoryStore
+    from src.ha.logbook import LogbookSnapshotCache
+    from src.ha.request_cache import RequestCache
+    from src.ha.state_mirror import StateMirror
+
+
+def _decode(body: bytes | None) -> Any:
+    """Decode a raw HA response body (None on 404, {} when empty)."""
+    if body is None:
+        return None
+    return orjson.loads(body) if body else {}
+
 
 class HAClientConfig(BaseModel):
     """Configuration for HA client."""
@@ -102,6 +119,16 @@ class BaseHAClient:
         self._connected = False
         self._active_url: str | None = None  # Which URL is currently working
         self._http_client: Any | None = None  # Shared httpx.AsyncClient
+        # Local history cache; attached by the zone client factory
+        self.history_store: HistoryStore | None = None
+        # Short-TTL logbook snapshot cache; attached by the zone client factory
+        self.logbook_cache: LogbookSnapshotCache | None = None
+        # Event-stream-fed state mirror; attached by the zone client factory
+        self.state_mirror: StateMirror | None = None
+        # Micro-TTL cache of GET bodies; attached by the zone client factory
+        self.request_cache: RequestCache | None = None
+        # Identical GETs in flight, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Future[bytes | None]] = {}
 
     @staticmethod
     def _resolve_config() -> HAClientConfig:
@@ -242,11 +269,16 @@ class BaseHAClient:
             )
         return self._http_client
 
+    def _get_ws_session(self) -> HAWebSocketSession:
+        """Get the shared WebSocket session for this zone's active URL."""
+        return get_ws_session(self._get_ws_url(), self.config.ha_token)
+
     async def close(self) -> None:
-        """Close the shared HTTP client and release connections."""
+        """Close the shared HTTP client and WebSocket session."""
         if self._http_client is not None:
             await self._http_client.aclose()
             self._http_client = None
+        await close_ws_sessions(self._get_ws_url())
 
     async def _request(
         self,
@@ -257,7 +289,10 @@ class BaseHAClient:
     ) -> Any:
         """Make a request to HA, with automatic URL fallback.
 
-        Uses a shared httpx.AsyncClient for connection pooling.
+        Uses a shared httpx.AsyncClient for connection pooling. Concurrent
+        identical GETs share one HTTP round trip, and GETs of opted-in
+        paths are served from the attached ``request_cache`` while fresh;
+        any other method clears that cache.
 
         Args:
             method: HTTP method
@@ -268,6 +303,76 @@ class BaseHAClient:
         Returns:
             Response JSON
         """
+        if method.upper() != "GET":
+            if self.request_cache is not None:
+                self.request_cache.clear()
+            # GETs issued from now on must not join reads that predate the write
+            self._inflight.clear()
+            return await self._send(method, path, json, params)
+
+        cache = self.request_cache
+        if cache is not None and not cache.cacheable(path):
+            cache = None
+        key = request_key(path, params)
+        if cache is not None and (body := cache.get(key)) is not None:
+            return orjson.loads(body)
+
+        while (inflight := self._inflight.get(key)) is not None:
+            _record_cache_event("coalesced")
+            try:
+                return _decode(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # Only the leader's caller was cancelled: retry or lead the next GET
+
+        generation = cache.generation if cache is not None else 0
+        future: asyncio.Future[bytes | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = await self._send_raw("GET", path, None, params)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a burst with no followers doesn't log it
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        future.set_result(body)
+        if cache is not None and body is not None:
+            cache.put(key, path, body, generation=generation)
+        return _decode(body)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        json: dict | None,
+        params: dict | None,
+    ) -> Any:
+        """Send one request and decode its JSON (None on 404)."""
+        return _decode(await self._send_raw(method, path, json, params))
+
+    async def _send_raw(
+        self,
+        method: str,
+        path: str,
+        json: dict | None,
+        params: dict | None,
+    ) -> bytes | None:
+        """Send one request over the first working URL.
+
+        Returns:
+            Raw response body, or None on 404
+
+        Raises:
+            HAClientError: If every URL fails
+        """
         from src.tracing import log_metric
 
         start_time = time.perf_counter()
@@ -296,7 +401,7 @@ class BaseHAClient:
 
                 if response.status_code in (200, 201):
                     self._active_url = url  # Remember working URL
-                    return response.json() if response.content else {}
+                    return cast("bytes", response.content)
                 elif response.status_code == 404:
                     return None
                 errors.append(f"{url}: HTTP {response.status_code}")
@@ -331,12 +436,14 @@ class BaseHAClient:
         Returns:
             Dictionary with total_entities, domains, domain_samples, etc.
         """
-        states = await self._request("GET", "/api/states")
+        mirror = self.state_mirror
+        if mirror is not None and mirror.is_usable():
+            states = mirror.states()
+        else:
+            states = await self._request("GET", "/api/states")
         if not states:
             raise HAClientError("Failed to get states", "system_overview")
 
-        states = cast("list[dict[str, Any]]", states)
-
         # Build overview from states
         domains: dict[str, dict[str, Any]] = {}
         for state in states:
@@ -15,13 +15,23 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import httpx
-
+import numpy as np
+
+from src.ha.correlation import (
+    RANK_BY_COUNT,
+    RANK_BY_LIFT,
+    RANK_BY_PMI,
+    RANK_CHOICES,
+    count_co_occurrences,
+    top_k,
+)
 from src.ha.logbook import (
     ACTION_TYPE_AUTOMATION,
     ACTION_TYPE_BUTTON,
     LogbookHistoryClient,
     classify_action,
 )
+from src.ha.timestamps import parse_timestamps_us
 
 if TYPE_CHECKING:
     from src.ha.parsers import ParsedLogbookEntry
@@ -61,6 +71,8 @@ class CorrelationResult:
     co_occurrence_count: int = 0
     avg_time_delta_seconds: float = 0.0
     confidence: float = 0.0
+    lift: float = 0.0  # observed / expected co-occurrences
+    pmi: float = 0.0  # log2(lift)
 
 
 @dataclass
@@ -212,20 +224,32 @@ class BehavioralAnalysisClient:
         entity_ids: list[str] | None = None,
         hours: int = 168,
         time_window_seconds: int = 300,
+        *,
+        min_occurrences: int = 3,
+        limit: int = 20,
+        rank_by: str = RANK_BY_COUNT,
     ) -> list[CorrelationResult]:
         """Discover entity correlations from timing patterns.
 
         Finds entities that change state within a time window of each other,
-        suggesting they're related (used together).
+        suggesting they're related (used together). Pairs are counted with
+        a vectorized sweep over the time-sorted logbook and scored by lift
+        and PMI against the co-occurrences expected by chance.
 
         Args:
             entity_ids: Specific entities to check (None = all)
             hours: Hours of history
             time_window_seconds: Co-occurrence window (default: 5 min)
+            min_occurrences: Minimum co-occurrences to report a pair
+            limit: Maximum number of results
+            rank_by: Ordering key: "count", "lift" or "pmi"
 
         Returns:
             List of correlation results
         """
+        if rank_by not in RANK_CHOICES:
+            raise ValueError(f"rank_by must be one of {RANK_CHOICES}, got {rank_by!r}")
+
         entries = await self._logbook.get_entries(hours=hours)
 
         # Filter to specific entities if provided
@@ -233,59 +257,44 @@ class BehavioralAnalysisClient:
             entity_set = set(entity_ids)
             entries = [e for e in entries if e.entity_id in entity_set]
 
-        # Parse timestamps and sort
-        timed_entries: list[tuple[datetime, ParsedLogbookEntry]] = []
-        for entry in entries:
-            if entry.when and entry.entity_id:
-                try:
-                    dt = datetime.fromisoformat(entry.when.replace("Z", "+00:00"))
-                    timed_entries.append((dt, entry))
-                except (ValueError, AttributeError):
-                    pass
-
-        timed_entries.sort(key=lambda x: x[0])
+        timed = [(e.entity_id, e.when) for e in entries if e.when and e.entity_id]
+        if not timed:
+            return []
 
-        # Find co-occurrences within the time window
-        co_occurrences: dict[tuple[str, str], list[float]] = defaultdict(list)
+        timestamps = parse_timestamps_us([when for _, when in timed])
+        valid = timestamps != np.iinfo(np.int64).min
+        matrix = count_co_occurrences(
+            [eid for (eid, _), ok in zip(timed, valid, strict=True) if ok],
+            timestamps[valid],
+            time_window_seconds,
+        )
 
-        for i, (dt_a, entry_a) in enumerate(timed_entries):
-            for j in range(i + 1, len(timed_entries)):
-                dt_b, entry_b = timed_entries[j]
-                delta = (dt_b - dt_a).total_seconds()
+        keep = np.flatnonzero(matrix.counts >= min_occurrences)
+        if not keep.size:
+            return []
 
-                if delta > time_window_seconds:
-                    break  # Beyond window
+        lift = matrix.lift()[keep]
+        pmi = np.log2(lift)
+        counts = matrix.counts[keep]
+        scores = {RANK_BY_COUNT: counts, RANK_BY_LIFT: lift, RANK_BY_PMI: pmi}[rank_by]
 
-                if (
-                    entry_a.entity_id != entry_b.entity_id
-                    and entry_a.entity_id
-                    and entry_b.entity_id
-                ):
-                    pair = tuple(sorted([entry_a.entity_id, entry_b.entity_id]))
-                    co_occurrences[pair].append(delta)
-
-        # Build results
         results = []
-        for (entity_a, entity_b), deltas in co_occurrences.items():
-            # Filter out None values from keys
-            if entity_a is None or entity_b is None:
-                continue
-            if len(deltas) >= 3:  # Minimum 3 co-occurrences
-                avg_delta = sum(deltas) / len(deltas)
-                # Confidence based on frequency
-                confidence = min(1.0, len(deltas) / 20)
-                results.append(
-                    CorrelationResult(
-                        entity_a=entity_a,
-                        entity_b=entity_b,
-                        co_occurrence_count=len(deltas),
-                        avg_time_delta_seconds=avg_delta,
-                        confidence=confidence,
-                    )
+        for i in top_k(scores.astype(np.float64), limit):
+            pair = keep[i]
+            count = int(counts[i])
+            results.append(
+                CorrelationResult(
+                    entity_a=str(matrix.entities[matrix.rows[pair]]),
+                    entity_b=str(matrix.entities[matrix.cols[pair]]),
+                    co_occurrence_count=count,
+                    avg_time_delta_seconds=float(matrix.delta_sums[pair]) / count,
+                    # Confidence based on frequency
+                    confidence=min(1.0, count / 20),
+                    lift=float(lift[i]),
+                    pmi=float(pmi[i]),
                 )
-
-        results.sort(key=lambda r: r.co_occurrence_count, reverse=True)
-        return results[:20]  # Top 20
+            )
+        return results
 
     async def detect_automation_gaps(
         self,
@@ -117,6 +117,36 @@ def _resolve_zone_config(zone_id: str) -> HAClientConfig | None:
         return None
 
 
+def _build_client(config: HAClientConfig | None = None) -> HAClient:
+    """Create a zone client with its local history, logbook and state caches attached."""
+    from src.ha.history_store import HistoryStore
+    from src.ha.logbook import LogbookSnapshotCache
+    from src.ha.request_cache import CACHEABLE_PATHS, RequestCache
+    from src.ha.state_mirror import StateMirror
+    from src.settings import get_settings
+
+    client = HAClient(config=config)
+    settings = get_settings()
+    if settings.ha_history_store_enabled:
+        client.history_store = HistoryStore(
+            retention_hours=settings.ha_history_store_retention_hours,
+        )
+    if settings.ha_logbook_cache_ttl_seconds > 0:
+        client.logbook_cache = LogbookSnapshotCache(
+            ttl_seconds=settings.ha_logbook_cache_ttl_seconds,
+        )
+    if settings.ha_state_mirror_enabled:
+        client.state_mirror = StateMirror(
+            max_staleness_seconds=settings.ha_state_mirror_max_staleness_seconds,
+        )
+    if settings.ha_request_cache_ttl_seconds > 0:
+        client.request_cache = RequestCache(
+            dict.fromkeys(CACHEABLE_PATHS, settings.ha_request_cache_ttl_seconds),
+            max_bytes=settings.ha_request_cache_max_bytes,
+        )
+    return client
+
+
 def get_ha_client(zone_id: str | None = None) -> HAClient:
     """Get or create an HA client (sync). Prefer get_ha_client_async in async code.
 
@@ -128,10 +158,7 @@ def get_ha_client(zone_id: str | None = None) -> HAClient:
         with _client_lock:
             if key not in _clients:
                 config = _resolve_zone_config(key)
-                if config:
-                    _clients[key] = HAClient(config=config)
-                else:
-                    _clients[key] = HAClient()
+                _clients[key] = _build_client(config)
     return _clients[key]
 
 
@@ -145,7 +172,7 @@ async def get_ha_client_async(zone_id: str | None = None) -> HAClient:
         config = await HAClient._resolve_config_async()
     with _client_lock:
         if key not in _clients:
-            _clients[key] = HAClient(config=config)
+            _clients[key] = _build_client(config)
     return _clients[key]
 
 
@@ -4,21 +4,94 @@ Provides methods for listing, getting, searching, and managing entities.
 """
 
 import asyncio
+import contextlib
 import logging
+import time
 from datetime import UTC, datetime, timedelta
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 import httpx
 
 from src.ha.base import HAClientError, _trace_ha_call
 from src.tracing import log_param
 
+if TYPE_CHECKING:
+    from src.ha.history_store import HistoryStore
+    from src.ha.state_mirror import StateMirror
+
 logger = logging.getLogger(__name__)
 
 
+def _entity_view(
+    state: dict[str, Any],
+    reg_entry: dict[str, Any],
+    detailed: bool,
+) -> dict[str, Any]:
+    """Build the entity dict returned by list/get from a raw state and registry entry."""
+    entity_id = state.get("entity_id", "")
+    attrs = state.get("attributes", {})
+    entity = {
+        "entity_id": entity_id,
+        "state": state.get("state"),
+        "name": attrs.get("friendly_name", entity_id),
+        "domain": entity_id.split(".")[0] if "." in entity_id else "",
+    }
+
+    if detailed:
+        entity["attributes"] = attrs
+        entity["last_changed"] = state.get("last_changed")
+        entity["last_updated"] = state.get("last_updated")
+
+    # Merge registry metadata (area_id, device_id, etc.)
+    if reg_entry.get("area_id"):
+        entity["area_id"] = reg_entry["area_id"]
+    if reg_entry.get("device_id"):
+        entity["device_id"] = reg_entry["device_id"]
+    if reg_entry.get("icon"):
+        entity["icon"] = reg_entry["icon"]
+
+    # Fallback: try extracting area_id from state attributes
+    if "area_id" not in entity and "area_id" in attrs:
+        entity["area_id"] = attrs["area_id"]
+
+    return entity
+
+
 class EntityMixin:
     """Mixin providing entity-related operations."""
 
+    async def _ready_state_mirror(self) -> "StateMirror | None":
+        """Return the zone's state mirror when reads can be served from it.
+
+        Bootstraps (or re-bootstraps) the mirror with one states + registry
+        fetch when the event stream is live but the mirror is not yet
+        current, and refreshes the registry after registry events.
+
+        Returns:
+            The mirror, or None when it is absent or too stale (REST path)
+        """
+        mirror: StateMirror | None = getattr(self, "state_mirror", None)
+        if mirror is None:
+            return None
+        if mirror.is_live and mirror.needs_bootstrap():
+            await self._bootstrap_state_mirror(mirror)
+        if not mirror.is_usable():
+            return None
+        if mirror.registry_dirty:
+            mirror.replace_registry(await self._fetch_entity_registry())
+        return mirror
+
+    async def _bootstrap_state_mirror(self, mirror: "StateMirror") -> None:
+        """Load a full states + registry snapshot into the mirror."""
+        with mirror.bootstrapping():
+            fetched_at = time.time()
+            states, registry = await asyncio.gather(
+                self._request("GET", "/api/states"),
+                self._fetch_entity_registry(),
+            )
+            if states:
+                mirror.bootstrap(states, registry, fetched_at)
+
     async def _fetch_entity_registry(self) -> dict[str, dict[str, Any]]:
         """Fetch the HA entity registry to get area_id, device_id, etc.
 
@@ -89,61 +162,41 @@ class EntityMixin:
         if search_query:
             log_param("ha.list_entities.search_query", search_query)
 
-        # Fetch states and entity registry in parallel
-        states, registry = await asyncio.gather(
-            self._request("GET", "/api/states"),
-            self._fetch_entity_registry(),
-        )
-        if not states:
-            raise HAClientError("Failed to list entities", "list_entities")
+        search = search_query.lower() if search_query else None
+        mirror = await self._ready_state_mirror()
+        if mirror is not None:
+            states = [mirror.get_state(eid) or {} for eid in mirror.entity_ids(domain=domain)]
+            registry = mirror.registry
+        else:
+            # Fetch states and entity registry in parallel
+            idle_mirror: StateMirror | None = getattr(self, "state_mirror", None)
+            with idle_mirror.bootstrapping() if idle_mirror else contextlib.nullcontext():
+                fetched_at = time.time()
+                states, registry = await asyncio.gather(
+                    self._request("GET", "/api/states"),
+                    self._fetch_entity_registry(),
+                )
+                if not states:
+                    raise HAClientError("Failed to list entities", "list_entities")
+                if idle_mirror is not None:
+                    idle_mirror.bootstrap(states, registry, fetched_at)
 
         entities = []
 
         for state in states:
             entity_id = state.get("entity_id", "")
-            entity_domain = entity_id.split(".")[0] if "." in entity_id else ""
 
             # Filter by domain
-            if domain and entity_domain != domain:
+            if domain and (entity_id.split(".")[0] if "." in entity_id else "") != domain:
                 continue
 
             # Filter by search query
-            if search_query:
+            if search:
                 name = state.get("attributes", {}).get("friendly_name", entity_id)
-                if (
-                    search_query.lower() not in name.lower()
-                    and search_query.lower() not in entity_id.lower()
-                ):
+                if search not in name.lower() and search not in entity_id.lower():
                     continue
 
-            entity = {
-                "entity_id": entity_id,
-                "state": state.get("state"),
-                "name": state.get("attributes", {}).get("friendly_name", entity_id),
-                "domain": entity_domain,
-            }
-
-            if detailed:
-                entity["attributes"] = state.get("attributes", {})
-                entity["last_changed"] = state.get("last_changed")
-                entity["last_updated"] = state.get("last_updated")
-
-            # Merge registry metadata (area_id, device_id, etc.)
-            reg_entry = registry.get(entity_id, {})
-            if reg_entry.get("area_id"):
-                entity["area_id"] = reg_entry["area_id"]
-            if reg_entry.get("device_id"):
-                entity["device_id"] = reg_entry["device_id"]
-            if reg_entry.get("icon"):
-                entity["icon"] = reg_entry["icon"]
-
-            # Fallback: try extracting area_id from state attributes
-            if "area_id" not in entity:
-                attrs = state.get("attributes", {})
-                if "area_id" in attrs:
-                    entity["area_id"] = attrs["area_id"]
-
-            entities.append(entity)
+            entities.append(_entity_view(state, registry.get(entity_id, {}), detailed))
 
             if len(entities) >= limit:
                 break
@@ -167,7 +220,11 @@ class EntityMixin:
         """
         log_param("ha.get_entity.entity_id", entity_id)
 
-        state = await self._request("GET", f"/api/states/{entity_id}")
+        mirror = await self._ready_state_mirror()
+        if mirror is not None:
+            state = mirror.get_state(entity_id)
+        else:
+            state = await self._request("GET", f"/api/states/{entity_id}")
         if not state:
             return None
 
@@ -308,6 +365,11 @@ class EntityMixin:
         end_time = datetime.now(UTC)
         start_time = end_time - timedelta(hours=hours)
 
+        store = getattr(self, "history_store", None)
+        if store is not None:
+            cached = await self._get_history_via_store(store, [entity_id], start_time, end_time)
+            return cached[entity_id]
+
         history = await self._request(
             "GET",
             f"/api/history/period/{start_time.isoformat()}",
@@ -358,6 +420,10 @@ class EntityMixin:
         end_time = datetime.now(UTC)
         start_time = end_time - timedelta(hours=hours)
 
+        store = getattr(self, "history_store", None)
+        if store is not None:
+            return await self._get_history_via_store(store, entity_ids, start_time, end_time)
+
         history = await self._request(
             "GET",
             f"/api/history/period/{start_time.isoformat()}",
@@ -394,6 +460,67 @@ class EntityMixin:
 
         return results
 
+    async def _get_history_via_store(
+        self,
+        store: "HistoryStore",
+        entity_ids: list[str],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> dict[str, dict[str, Any]]:
+        """Serve history from the local store, fetching only missing tails.
+
+        Entities that need data are fetched together in one batch request
+        starting at the earliest missing timestamp; the store de-duplicates
+        samples it already holds.
+
+        Args:
+            store: History store attached to this client
+            entity_ids: Entity IDs to read
+            start_time: Window start
+            end_time: Window end
+
+        Returns:
+            Mapping of entity_id to history data (same format as get_history)
+        """
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
+
+        plans = {eid: store.plan_fetch(eid, start_ts, end_ts) for eid in entity_ids}
+        to_fetch = {eid: since for eid, since in plans.items() if since is not None}
+
+        if to_fetch:
+            fetch_from = min(to_fetch.values())
+            history = await self._request(
+                "GET",
+                f"/api/history/period/{datetime.fromtimestamp(fetch_from, UTC).isoformat()}",
+                params={
+                    "filter_entity_id": ",".join(to_fetch),
+                    "end_time": end_time.isoformat(),
+                },
+            )
+            fetched: dict[str, list[dict[str, Any]]] = {}
+            for entity_states in history or []:
+                if not entity_states:
+                    continue
+                eid = entity_states[0].get("entity_id")
+                if eid is None and len(to_fetch) == 1:
+                    eid = next(iter(to_fetch))
+                fetched[eid] = entity_states
+            for eid in to_fetch:
+                store.ingest(eid, fetched.get(eid, []), fetch_from, end_ts)
+
+        results: dict[str, dict[str, Any]] = {}
+        for eid in entity_ids:
+            states = store.query(eid, start_ts, end_ts)
+            results[eid] = {
+                "entity_id": eid,
+                "states": states,
+                "count": len(states),
+                "first_changed": states[0]["last_changed"] if states else None,
+                "last_changed": states[-1]["last_changed"] if states else None,
+            }
+        return results
+
     @_trace_ha_call("ha.get_logbook")
     async def get_logbook(
         self,
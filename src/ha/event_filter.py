@@ -0,0 +1,114 @@
+"""Ingestion filter for HA state_changed events.
+
+Feature 35: Real-Time HA Event Stream.
+
+Decides which entities the event handler persists and which parts of a
+state count as a change worth writing. Patterns are ``fnmatch`` globs
+matched against entity_ids; a pattern without a dot names a whole
+domain, so ``"sensor"`` is the same as ``"sensor.*"``. Excludes win over
+includes, and an empty include list accepts every entity.
+
+The filter only governs DB ingestion. The state mirror and history
+store still see every event so they stay exact.
+
+Usage::
+
+    event_filter = EventFilter(include=["light", "sensor.*_temperature"])
+    if event_filter.accepts("light.kitchen"):
+        signature = event_filter.signature(new_state)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.settings import Settings
+
+_GLOB_CHARS = frozenset("*?[")
+
+# Written to the DB as the entity name, so always part of the signature
+_ALWAYS_COMPARED = frozenset({"friendly_name"})
+
+
+def _normalize(pattern: str) -> str:
+    return pattern if "." in pattern else f"{pattern}.*"
+
+
+def _split(value: str) -> list[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+class EventFilter:
+    """Entity include/exclude globs plus an attribute allowlist."""
+
+    def __init__(
+        self,
+        include: Iterable[str] = (),
+        exclude: Iterable[str] = (),
+        attributes: Iterable[str] = (),
+    ) -> None:
+        """Build the filter.
+
+        Args:
+            include: Entity globs to persist (empty = all entities)
+            exclude: Entity globs never persisted
+            attributes: Attributes whose changes trigger a write (empty =
+                all attributes; state changes always trigger a write)
+        """
+        self.include = tuple(_normalize(p) for p in include)
+        self.exclude = tuple(_normalize(p) for p in exclude)
+        allowed = frozenset(attributes)
+        self.attributes = allowed | _ALWAYS_COMPARED if allowed else None
+        self._decisions: dict[str, bool] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> EventFilter:
+        """Build the filter from the comma-separated ``HA_EVENT_*`` settings."""
+        return cls(
+            include=_split(settings.ha_event_include),
+            exclude=_split(settings.ha_event_exclude),
+            attributes=_split(settings.ha_event_attributes),
+        )
+
+    @property
+    def is_passthrough(self) -> bool:
+        """Whether every entity is accepted."""
+        return not self.include and not self.exclude
+
+    def accepts(self, entity_id: str) -> bool:
+        """Whether state changes of ``entity_id`` are persisted."""
+        decision = self._decisions.get(entity_id)
+        if decision is None:
+            decision = not any(fnmatch.fnmatchcase(entity_id, p) for p in self.exclude) and (
+                not self.include or any(fnmatch.fnmatchcase(entity_id, p) for p in self.include)
+            )
+            self._decisions[entity_id] = decision
+        return decision
+
+    def signature(self, state: dict[str, Any]) -> tuple[Any, Any]:
+        """The parts of a state that must differ for it to be written.
+
+        ``last_updated``/``last_changed`` and context are deliberately
+        left out, as are attributes outside the allowlist.
+        """
+        attrs = state.get("attributes") or {}
+        if self.attributes is not None:
+            attrs = {k: v for k, v in attrs.items() if k in self.attributes}
+        return state.get("state"), attrs
+
+    def literal_entity_ids(self) -> list[str] | None:
+        """Entity ids to subscribe to server-side, if the filter names them exactly.
+
+        Returns None when any include is a glob (or there are no
+        includes), in which case HA must send every entity.
+        """
+        if not self.include or any(_GLOB_CHARS & set(p) for p in self.include):
+            return None
+        return sorted(p for p in set(self.include) if self.accepts(p))
+
+
+__all__ = ["EventFilter"]
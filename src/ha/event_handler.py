@@ -2,8 +2,10 @@
 
 Feature 35: Real-Time HA Event Stream.
 
-Receives state_changed events, debounces per entity_id, and batch-upserts
-to the database on a configurable interval.
+Receives state_changed events, drops those excluded by the ingestion
+filter or identical to the last accepted state, debounces per entity_id,
+and batch-upserts to the database. The flush interval shrinks as the
+queue fills, and a near-full queue wakes the flusher immediately.
 """
 
 from __future__ import annotations
@@ -12,47 +14,107 @@ import asyncio
 import contextlib
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from src.ha.event_filter import EventFilter
+
+if TYPE_CHECKING:
+    from src.ha.history_store import HistoryStore
+    from src.ha.state_mirror import StateMirror
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_BATCH_INTERVAL = 1.5  # seconds
+_DEFAULT_MIN_BATCH_INTERVAL = 0.25  # seconds, at a full queue
 _DEFAULT_QUEUE_SIZE = 1000
+_WAKE_FILL = 0.5  # queue fraction that triggers an immediate flush
 
 
 class EventHandler:
     """Debounced batch handler for HA state_changed events.
 
     Collects events into a per-entity buffer, then flushes to the DB
-    at a configurable interval. Only the latest state per entity is kept.
+    at an interval between ``min_batch_interval`` and ``batch_interval``
+    depending on how full the queue is. Only the latest state per entity
+    is kept, and states whose ``EventFilter.signature`` matches the last
+    accepted one (e.g. only ``last_updated`` moved) never reach the DB.
+    When a history store is attached, every state change is also appended
+    to it so cached history windows stay current. An attached state
+    mirror is updated immediately on receipt (not debounced). Both see
+    every event regardless of the ingestion filter.
     """
 
     def __init__(
         self,
         batch_interval: float = _DEFAULT_BATCH_INTERVAL,
         queue_size: int = _DEFAULT_QUEUE_SIZE,
+        history_store: HistoryStore | None = None,
+        state_mirror: StateMirror | None = None,
+        event_filter: EventFilter | None = None,
+        min_batch_interval: float = _DEFAULT_MIN_BATCH_INTERVAL,
     ) -> None:
         self._batch_interval = batch_interval
+        self._min_batch_interval = min(min_batch_interval, batch_interval)
+        self._filter = event_filter or EventFilter()
+        self._history_store = history_store
+        self._state_mirror = state_mirror
         self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=queue_size)
         self._pending: dict[str, dict[str, Any]] = {}
+        # Signature of the newest state accepted per entity (queued, pending or written)
+        self._latest: dict[str, tuple[Any, Any]] = {}
+        self._wake = asyncio.Event()
+        self._flush_failed = False
         self._running = False
         self._flush_task: asyncio.Task[None] | None = None
         self._events_received = 0
+        self._events_filtered = 0
+        self._events_unchanged = 0
+        self._events_coalesced = 0
+        self._events_dropped = 0
         self._events_flushed = 0
 
     async def handle_event(self, event: dict[str, Any]) -> None:
         """Receive a state_changed event and queue it for processing."""
+        if self._state_mirror is not None:
+            self._state_mirror.apply_event(event)
+        if event.get("event_type", "state_changed") != "state_changed":
+            return
+        self._events_received += 1
+        data = event.get("data", {})
+        entity_id = data.get("entity_id")
+        new_state = data.get("new_state")
+        if entity_id and new_state and self._history_store is not None:
+            self._history_store.record(
+                entity_id,
+                new_state.get("state", "unknown"),
+                new_state.get("last_changed"),
+            )
+        if entity_id:
+            if not self._filter.accepts(entity_id):
+                self._events_filtered += 1
+                return
+            if new_state:
+                signature = self._filter.signature(new_state)
+                if self._latest.get(entity_id) == signature:
+                    self._events_unchanged += 1
+                    return
+                self._latest[entity_id] = signature
+            else:
+                self._latest.pop(entity_id, None)
         try:
             self._queue.put_nowait(event)
-            self._events_received += 1
         except asyncio.QueueFull:
             logger.warning("Event queue full, dropping oldest event")
             try:
-                self._queue.get_nowait()
+                dropped = self._queue.get_nowait()
+                # Forget what the dropped event claimed so a repeat is not deduplicated
+                self._latest.pop(dropped.get("data", {}).get("entity_id"), None)
+                self._events_dropped += 1
                 self._queue.put_nowait(event)
-                self._events_received += 1
             except asyncio.QueueEmpty:
                 pass
+        if self._queue.maxsize and self._queue.qsize() >= self._queue.maxsize * _WAKE_FILL:
+            self._wake.set()
 
     async def start(self) -> None:
         """Start the flush loop."""
@@ -70,10 +132,20 @@ class EventHandler:
         if self._pending:
             await self._flush_to_db()
 
+    def _next_interval(self) -> float:
+        """Seconds until the next flush, shorter the fuller the queue is."""
+        if self._flush_failed:
+            return self._batch_interval
+        depth = self._queue.qsize() + len(self._pending)
+        fill = min(depth / self._queue.maxsize, 1.0) if self._queue.maxsize else 0.0
+        return max(self._batch_interval * (1.0 - fill), self._min_batch_interval)
+
     async def _flush_loop(self) -> None:
         """Periodically drain the queue and flush to DB."""
         while self._running:
-            await asyncio.sleep(self._batch_interval)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self._next_interval())
+            self._wake.clear()
             self._drain_queue()
             if self._pending:
                 await self._flush_to_db()
@@ -87,6 +159,8 @@ class EventHandler:
                 entity_id = data.get("entity_id")
                 new_state = data.get("new_state")
                 if entity_id and new_state:
+                    if entity_id in self._pending:
+                        self._events_coalesced += 1
                     self._pending[entity_id] = new_state
             except asyncio.QueueEmpty:
                 break
@@ -127,6 +201,7 @@ class EventHandler:
                 await session.commit()
 
             self._events_flushed += len(batch)
+            self._flush_failed = False
             if stats.get("created", 0) > 0:
                 logger.info(
                     "Event stream flush: %d entities (%d created, %d updated)",
@@ -137,6 +212,7 @@ class EventHandler:
 
         except Exception:
             logger.exception("Failed to flush %d entity updates to DB", len(batch))
+            self._flush_failed = True
             for entity_id, state in batch.items():
                 if entity_id not in self._pending:
                     self._pending[entity_id] = state
@@ -184,6 +260,10 @@ class EventHandler:
     def stats(self) -> dict[str, int]:
         return {
             "events_received": self._events_received,
+            "events_filtered": self._events_filtered,
+            "events_unchanged": self._events_unchanged,
+            "events_coalesced": self._events_coalesced,
+            "events_dropped": self._events_dropped,
             "events_flushed": self._events_flushed,
             "pending": len(self._pending),
             "queue_size": self._queue.qsize(),
@@ -4,7 +4,15 @@ Feature 35: Real-Time HA Event Stream.
 
 Maintains a persistent connection to Home Assistant's WebSocket API,
 subscribing to state_changed events and dispatching them to a handler.
-Reconnects with exponential backoff on connection loss.
+Reconnects with exponential backoff on connection loss.  When given a
+shared :class:`~src.ha.websocket.HAWebSocketSession`, the subscription
+rides the same socket that serves the zone's commands.
+
+With ``compressed=True`` state changes are subscribed via HA's
+``subscribe_entities`` command, which sends only per-entity diffs (and
+can be narrowed to explicit ``entity_ids`` server-side). The diffs are
+expanded back into ``state_changed`` events so handlers see one shape.
+HA versions without the command fall back to ``subscribe_events``.
 """
 
 from __future__ import annotations
@@ -13,6 +21,7 @@ import asyncio
 import contextlib
 import json
 import logging
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -22,13 +31,86 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
 from src.exceptions import HAClientError
-from src.ha.websocket import _authenticate
+from src.ha.websocket import (
+    SUBSCRIPTION_QUEUE_SIZE,
+    HAWebSocketSession,
+    _authenticate,
+    _put_dropping_oldest,
+)
 
 logger = logging.getLogger(__name__)
 
 _BACKOFF_BASE = 1.0
 _BACKOFF_MAX = 60.0
 _BACKOFF_FACTOR = 2.0
+# Seconds to wait for HA to confirm an unsubscribe before moving on
+_UNSUBSCRIBE_TIMEOUT = 5.0
+
+
+def _iso(timestamp: float | None) -> str | None:
+    return datetime.fromtimestamp(timestamp, UTC).isoformat() if timestamp is not None else None
+
+
+def _context(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {"id": value}
+
+
+class _CompressedStates:
+    """Expands ``subscribe_entities`` messages into ``state_changed`` events.
+
+    HA sends compressed full states under ``"a"`` (initially, and for new
+    entities), per-entity ``"+"``/``"-"`` diffs under ``"c"`` and removed
+    entity ids under ``"r"``. The last full state per entity is kept so
+    diffs can be applied.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[str, dict[str, Any]] = {}
+
+    def decode(self, message: dict[str, Any]) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+        for entity_id, compressed in (message.get("a") or {}).items():
+            last_changed = compressed.get("lc")
+            state: dict[str, Any] = {
+                "entity_id": entity_id,
+                "state": compressed.get("s"),
+                "attributes": compressed.get("a") or {},
+                "last_changed": _iso(last_changed),
+                "last_updated": _iso(compressed.get("lu", last_changed)),
+            }
+            if "c" in compressed:
+                state["context"] = _context(compressed["c"])
+            events.append(self._changed(entity_id, state))
+        for entity_id, diff in (message.get("c") or {}).items():
+            old = self._states.get(entity_id)
+            if old is None:
+                continue
+            additions = diff.get("+") or {}
+            attributes = {**old["attributes"], **(additions.get("a") or {})}
+            for key in (diff.get("-") or {}).get("a") or ():
+                attributes.pop(key, None)
+            state = {**old, "attributes": attributes}
+            if "s" in additions:
+                state["state"] = additions["s"]
+            if "lc" in additions:
+                state["last_changed"] = state["last_updated"] = _iso(additions["lc"])
+            elif "lu" in additions:
+                state["last_updated"] = _iso(additions["lu"])
+            if "c" in additions:
+                state["context"] = _context(additions["c"])
+            events.append(self._changed(entity_id, state))
+        for entity_id in message.get("r") or ():
+            events.append(self._changed(entity_id, None))
+        return events
+
+    def _changed(self, entity_id: str, state: dict[str, Any] | None) -> dict[str, Any]:
+        old = self._states.pop(entity_id, None)
+        if state is not None:
+            self._states[entity_id] = state
+        return {
+            "event_type": "state_changed",
+            "data": {"entity_id": entity_id, "old_state": old, "new_state": state},
+        }
 
 
 class HAEventStream:
@@ -47,13 +129,32 @@ class HAEventStream:
         ws_url: str,
         token: str,
         handler: Callable[[dict[str, Any]], Awaitable[None]],
+        on_connected: Callable[[], None] | None = None,
+        on_disconnected: Callable[[], None] | None = None,
+        session: HAWebSocketSession | None = None,
+        event_types: tuple[str, ...] = ("state_changed",),
+        compressed: bool = False,
+        entity_ids: list[str] | None = None,
     ) -> None:
         self._ws_url = ws_url
+        self._session = session
+        self._event_types = event_types
+        self._compressed = compressed
+        self._entity_ids = entity_ids
         self._token = token
         self._handler = handler
+        self._on_connected = on_connected
+        self._on_disconnected = on_disconnected
         self._running = False
         self._task: asyncio.Task[None] | None = None
         self._backoff = _BACKOFF_BASE
+        self._forwarders: set[asyncio.Task[None]] = set()
+        self._events_dropped = 0
+
+    @property
+    def events_dropped(self) -> int:
+        """Events dropped from the merged subscription queue while it was full."""
+        return self._events_dropped
 
     async def run(self) -> None:
         """Main event loop with reconnection."""
@@ -75,38 +176,154 @@ class HAEventStream:
 
     async def _connect_and_subscribe(self) -> None:
         """Connect, authenticate, subscribe, and process events."""
+        if self._session is not None:
+            await self._subscribe_shared(self._session)
+            return
         async with ws_connect(self._ws_url) as ws:
             await _authenticate(ws, self._token)
             logger.info("Event stream connected and authenticated")
             self._backoff = _BACKOFF_BASE
 
-            subscribe_msg = {
-                "id": 1,
-                "type": "subscribe_events",
-                "event_type": "state_changed",
-            }
-            await ws.send(json.dumps(subscribe_msg))
+            decoder = _CompressedStates() if self._compressed else None
+            await ws.send(json.dumps({"id": 1, **self._state_subscription()}))
             raw = await ws.recv()
             msg = json.loads(raw)
             if not msg.get("success"):
+                self._disable_compression()
                 raise HAClientError("Failed to subscribe to events", tool="event_stream")
-            logger.info("Subscribed to state_changed events")
+            logger.info("Subscribed to state_changed events%s", " (compressed)" if decoder else "")
+            # Extra event types are confirmed asynchronously; results are ignored below
+            for msg_id, event_type in enumerate(self._event_types[1:], start=2):
+                await ws.send(
+                    json.dumps({"id": msg_id, "type": "subscribe_events", "event_type": event_type})
+                )
 
-            async for raw_msg in ws:
-                if not self._running:
-                    break
+            if self._on_connected is not None:
+                self._on_connected()
+            try:
+                async for raw_msg in ws:
+                    if not self._running:
+                        break
+                    try:
+                        event = json.loads(raw_msg)
+                        if event.get("type") != "event":
+                            continue
+                        if decoder is not None and event.get("id") == 1:
+                            for decoded in decoder.decode(event.get("event", {})):
+                                await self._handler(decoded)
+                        else:
+                            await self._handler(event.get("event", {}))
+                    except json.JSONDecodeError:
+                        logger.warning("Failed to decode event: %s", raw_msg[:200])
+                    except (httpx.HTTPError, TimeoutError, ConnectionError):
+                        logger.exception("Error processing event")
+            finally:
+                if self._on_disconnected is not None:
+                    self._on_disconnected()
+
+    async def _subscribe_shared(self, session: HAWebSocketSession) -> None:
+        """Subscribe over the shared session and process events until it drops.
+
+        The subscriptions and their forwarders end with this call, so a
+        resubscribe after an error never leaves the old ones running.
+        """
+        sources: list[tuple[asyncio.Queue[dict[str, Any] | None], _CompressedStates | None]] = []
+        forwarders: list[asyncio.Task[None]] = []
+        try:
+            for event_type in self._event_types:
+                if event_type == "state_changed" and self._compressed:
+                    try:
+                        subscription = self._state_subscription()
+                        command = subscription.pop("type")
+                        sources.append(
+                            (await session.subscribe(command, **subscription), _CompressedStates())
+                        )
+                    except HAClientError:
+                        self._disable_compression()
+                        raise
+                else:
+                    sources.append(
+                        (await session.subscribe("subscribe_events", event_type=event_type), None)
+                    )
+            queue = sources[0][0]
+            if len(sources) > 1 or sources[0][1] is not None:
+                queue = asyncio.Queue(maxsize=SUBSCRIPTION_QUEUE_SIZE)
+                forwarders = [self._forward(source, queue, decoder) for source, decoder in sources]
+            logger.info("Subscribed to %s events (shared session)", ", ".join(self._event_types))
+            self._backoff = _BACKOFF_BASE
+            if self._on_connected is not None:
+                self._on_connected()
+            try:
+                while self._running:
+                    event = await queue.get()
+                    if event is None:
+                        raise ConnectionError("HA WebSocket session closed")
+                    try:
+                        await self._handler(event)
+                    except (httpx.HTTPError, TimeoutError, ConnectionError):
+                        logger.exception("Error processing event")
+            finally:
+                if self._on_disconnected is not None:
+                    self._on_disconnected()
+        finally:
+            for forwarder in forwarders:
+                forwarder.cancel()
+            for source, _ in sources:
                 try:
-                    event = json.loads(raw_msg)
-                    if event.get("type") == "event":
-                        await self._handler(event.get("event", {}))
-                except json.JSONDecodeError:
-                    logger.warning("Failed to decode event: %s", raw_msg[:200])
-                except (httpx.HTTPError, TimeoutError, ConnectionError):
-                    logger.exception("Error processing event")
+                    await session.unsubscribe(source, timeout=_UNSUBSCRIBE_TIMEOUT)
+                except (HAClientError, TimeoutError, ConnectionError) as e:
+                    logger.debug("Failed to unsubscribe shared event subscription: %s", e)
+
+    def _forward(
+        self,
+        source: asyncio.Queue[dict[str, Any] | None],
+        target: asyncio.Queue[dict[str, Any] | None],
+        decoder: _CompressedStates | None = None,
+    ) -> asyncio.Task[None]:
+        """Pump one subscription queue into the merged queue."""
+
+        async def pump() -> None:
+            while True:
+                event = await source.get()
+                if event is not None and decoder is not None:
+                    for decoded in decoder.decode(event):
+                        self._put(target, decoded)
+                    continue
+                self._put(target, event)
+                if event is None:
+                    return
+
+        task = asyncio.create_task(pump())
+        self._forwarders.add(task)
+        task.add_done_callback(self._forwarders.discard)
+        return task
+
+    def _put(
+        self, queue: asyncio.Queue[dict[str, Any] | None], event: dict[str, Any] | None
+    ) -> None:
+        if _put_dropping_oldest(queue, event):
+            self._events_dropped += 1
+
+    def _state_subscription(self) -> dict[str, Any]:
+        """The command that subscribes to state changes (without an id)."""
+        if not self._compressed:
+            return {"type": "subscribe_events", "event_type": "state_changed"}
+        command: dict[str, Any] = {"type": "subscribe_entities"}
+        if self._entity_ids is not None:
+            command["entity_ids"] = self._entity_ids
+        return command
+
+    def _disable_compression(self) -> None:
+        """Use ``subscribe_events`` from the next connection on."""
+        if self._compressed:
+            logger.warning("HA rejected subscribe_entities, falling back to subscribe_events")
+            self._compressed = False
 
     async def stop(self) -> None:
         """Stop the event stream."""
         self._running = False
+        for forwarder in list(self._forwarders):
+            forwarder.cancel()
         if self._task and not self._task.done():
             self._task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
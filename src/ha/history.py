@@ -3,7 +3,9 @@
 User Story 3: Energy Optimization Suggestions.
 
 Wraps the base HA get_history with energy-specific filtering,
-aggregation, and statistical calculations.
+aggregation, and statistical calculations. Samples are held as NumPy
+columns (int64 epoch microseconds, float64 values) and statistics are
+computed with vectorized group-bys rather than per-sample objects.
 """
 
 import asyncio
@@ -13,11 +15,16 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import httpx
+import numpy as np
 
 from src.ha.client import HAClient
+from src.ha.timestamps import US_PER_SECOND, parse_timestamps_us
 
 logger = logging.getLogger(__name__)
 
+_US_PER_HOUR = 3600 * US_PER_SECOND
+_US_PER_DAY = 24 * _US_PER_HOUR
+
 
 @dataclass
 class EnergyDataPoint:
@@ -36,6 +43,128 @@ class EnergyDataPoint:
         }
 
 
+@dataclass
+class EnergySeries:
+    """Columnar energy samples.
+
+    ``timestamps`` are UTC epoch microseconds (int64) and ``values`` the
+    numeric readings (float64), both sorted by time.
+    """
+
+    timestamps: np.ndarray
+    values: np.ndarray
+    unit: str = "kWh"
+
+    @classmethod
+    def empty(cls, unit: str = "kWh") -> "EnergySeries":
+        """Create a series with no samples."""
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64), unit)
+
+    @classmethod
+    def from_states(cls, states: list[dict[str, Any]], unit: str) -> "EnergySeries":
+        """Build a series from raw HA history states.
+
+        Unavailable, unknown and non-numeric states are skipped.
+
+        Args:
+            states: Raw state list from history
+            unit: Unit of measurement
+
+        Returns:
+            EnergySeries sorted by timestamp
+        """
+        raw_values: list[float] = []
+        raw_times: list[str] = []
+        for state in states:
+            state_value = state.get("state")
+            timestamp_str = state.get("last_changed")
+            if state_value in ("unavailable", "unknown", None) or timestamp_str is None:
+                continue
+            try:
+                raw_values.append(float(state_value))
+            except (ValueError, TypeError):
+                continue
+            raw_times.append(timestamp_str)
+
+        if not raw_values:
+            return cls.empty(unit)
+
+        timestamps = parse_timestamps_us(raw_times)
+        values = np.asarray(raw_values, dtype=np.float64)
+        valid = timestamps != np.iinfo(np.int64).min
+        timestamps, values = timestamps[valid], values[valid]
+        order = np.argsort(timestamps, kind="stable")
+        return cls(timestamps[order], values[order], unit)
+
+    @classmethod
+    def from_datapoints(cls, data_points: list[EnergyDataPoint]) -> "EnergySeries":
+        """Build a series from EnergyDataPoint objects."""
+        if not data_points:
+            return cls.empty()
+        timestamps = np.fromiter(
+            (round(dp.timestamp.timestamp() * US_PER_SECOND) for dp in data_points),
+            dtype=np.int64,
+            count=len(data_points),
+        )
+        values = np.fromiter(
+            (dp.value for dp in data_points), dtype=np.float64, count=len(data_points)
+        )
+        return cls(timestamps, values, data_points[0].unit)
+
+    def __len__(self) -> int:
+        return int(self.values.size)
+
+    def datetime_at(self, index: int) -> datetime:
+        """Return the UTC datetime of the sample at ``index``."""
+        return datetime.fromtimestamp(int(self.timestamps[index]) / US_PER_SECOND, UTC)
+
+    def to_datapoints(self) -> list[EnergyDataPoint]:
+        """Materialize the samples as EnergyDataPoint objects."""
+        return [
+            EnergyDataPoint(timestamp=self.datetime_at(i), value=float(v), unit=self.unit)
+            for i, v in enumerate(self.values)
+        ]
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Serialize samples in EnergyDataPoint.to_dict format."""
+        return [
+            {"timestamp": self.datetime_at(i).isoformat(), "value": float(v), "unit": self.unit}
+            for i, v in enumerate(self.values)
+        ]
+
+    def resample(self, interval_seconds: int) -> "EnergySeries":
+        """Downsample to the mean value of each fixed-width time bucket.
+
+        Args:
+            interval_seconds: Bucket width in seconds
+
+        Returns:
+            New series with one sample per non-empty bucket, stamped at
+            the bucket start
+        """
+        if not len(self):
+            return EnergySeries.empty(self.unit)
+        width = interval_seconds * US_PER_SECOND
+        buckets, inverse = np.unique(self.timestamps // width, return_inverse=True)
+        sums = np.bincount(inverse, weights=self.values)
+        counts = np.bincount(inverse)
+        return EnergySeries(buckets * width, sums / counts, self.unit)
+
+    def integrate_kwh(self, kw_per_unit: float) -> float:
+        """Trapezoidal integral of a power series, in kWh.
+
+        Args:
+            kw_per_unit: Conversion factor from the series unit to kW
+
+        Returns:
+            Energy over the series time span in kWh
+        """
+        if len(self) < 2:
+            return 0.0
+        hours = (self.timestamps - self.timestamps[0]) / _US_PER_HOUR
+        return float(np.trapezoid(self.values, hours)) * kw_per_unit
+
+
 @dataclass
 class EnergyStats:
     """Statistical summary of energy data."""
@@ -55,6 +184,14 @@ class EnergyStats:
     daily_totals: dict[str, float] = field(default_factory=dict)
     hourly_averages: dict[int, float] = field(default_factory=dict)
 
+    # Integrated energy for power sensors (W/kW/MW), None for energy units
+    energy_kwh: float | None = None
+
+    @property
+    def consumed_kwh(self) -> float:
+        """Energy consumed: integrated kWh for power sensors, else the total."""
+        return self.energy_kwh if self.energy_kwh is not None else self.total
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -68,6 +205,7 @@ class EnergyStats:
             "peak_timestamp": self.peak_timestamp.isoformat() if self.peak_timestamp else None,
             "daily_totals": self.daily_totals,
             "hourly_averages": {str(k): v for k, v in self.hourly_averages.items()},
+            "energy_kwh": self.energy_kwh,
         }
 
 
@@ -79,11 +217,16 @@ class EnergyHistory:
     friendly_name: str | None
     device_class: str | None
     unit: str
-    data_points: list[EnergyDataPoint]
+    series: EnergySeries
     stats: EnergyStats
     start_time: datetime
     end_time: datetime
 
+    @property
+    def data_points(self) -> list[EnergyDataPoint]:
+        """Samples as EnergyDataPoint objects (materialized on access)."""
+        return self.series.to_datapoints()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -91,7 +234,7 @@ class EnergyHistory:
             "friendly_name": self.friendly_name,
             "device_class": self.device_class,
             "unit": self.unit,
-            "data_points": [dp.to_dict() for dp in self.data_points],
+            "data_points": self.series.to_records(),
             "stats": self.stats.to_dict(),
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat(),
@@ -106,6 +249,7 @@ class EnergyHistoryClient:
     - Unit conversion (W, kW, Wh, kWh)
     - Statistical aggregation (sum, average, peak)
     - Daily/hourly breakdowns
+    - Time integration of power sensors into kWh
     """
 
     # Energy-related device classes (excluding battery - those are percentages, not power)
@@ -121,6 +265,13 @@ class EnergyHistoryClient:
         "MW": None,
     }
 
+    # Power units and their conversions to kW (integrated over time into kWh)
+    POWER_CONVERSIONS = {
+        "W": 0.001,
+        "kW": 1.0,
+        "MW": 1000.0,
+    }
+
     def __init__(self, ha_client: HAClient):
         """Initialize with HA client.
 
@@ -152,14 +303,14 @@ class EnergyHistoryClient:
         # HAClient uses "attributes" key for detailed entity info
         attrs = entity_info.get("attributes", {})
 
-        # Parse into data points
-        data_points = self._parse_history_to_datapoints(
+        # Parse into columnar samples
+        series = EnergySeries.from_states(
             history.get("states", []),
             attrs.get("unit_of_measurement", "kWh"),
         )
 
         # Calculate statistics
-        stats = self._calculate_stats(data_points)
+        stats = self._calculate_series_stats(series)
 
         end_time = datetime.now(UTC)
         start_time = end_time - timedelta(hours=hours)
@@ -169,7 +320,7 @@ class EnergyHistoryClient:
             friendly_name=attrs.get("friendly_name"),
             device_class=attrs.get("device_class"),
             unit=attrs.get("unit_of_measurement", "kWh"),
-            data_points=data_points,
+            series=series,
             stats=stats,
             start_time=start_time,
             end_time=end_time,
@@ -261,11 +412,11 @@ class EnergyHistoryClient:
                 history_data = batch_history.get(eid, {"states": [], "count": 0})
                 attrs = (entity_info or {}).get("attributes", {})
 
-                data_points = self._parse_history_to_datapoints(
+                series = EnergySeries.from_states(
                     history_data.get("states", []),
                     attrs.get("unit_of_measurement", "kWh"),
                 )
-                stats = self._calculate_stats(data_points)
+                stats = self._calculate_series_stats(series)
 
                 histories.append(
                     EnergyHistory(
@@ -273,7 +424,7 @@ class EnergyHistoryClient:
                         friendly_name=attrs.get("friendly_name"),
                         device_class=attrs.get("device_class"),
                         unit=attrs.get("unit_of_measurement", "kWh"),
-                        data_points=data_points,
+                        series=series,
                         stats=stats,
                         start_time=start_time,
                         end_time=end_time,
@@ -295,8 +446,8 @@ class EnergyHistoryClient:
                 "hours": hours,
             }
 
-        # Aggregate totals
-        total_kwh = sum(h.stats.total for h in histories)
+        # Aggregate totals (power sensors contribute their integrated energy)
+        total_kwh = sum(h.stats.consumed_kwh for h in histories)
 
         return {
             "entities": [h.to_dict() for h in histories],
@@ -304,7 +455,7 @@ class EnergyHistoryClient:
             "average_kwh": total_kwh / len(histories) if histories else 0.0,
             "entity_count": len(histories),
             "hours": hours,
-            "by_entity": {h.entity_id: h.stats.total for h in histories},
+            "by_entity": {h.entity_id: h.stats.consumed_kwh for h in histories},
         }
 
     async def get_daily_breakdown(
@@ -375,32 +526,7 @@ class EnergyHistoryClient:
         Returns:
             List of EnergyDataPoints
         """
-        data_points = []
-
-        for state in states:
-            state_value = state.get("state")
-            timestamp_str = state.get("last_changed")
-
-            # Skip unavailable/unknown states
-            if state_value in ("unavailable", "unknown", None):
-                continue
-
-            try:
-                value = float(state_value)
-                if timestamp_str is not None:
-                    timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    data_points.append(
-                        EnergyDataPoint(
-                            timestamp=timestamp,
-                            value=value,
-                            unit=unit,
-                        )
-                    )
-            except (ValueError, TypeError):
-                # Skip invalid values
-                continue
-
-        return data_points
+        return EnergySeries.from_states(states, unit).to_datapoints()
 
     def _calculate_stats(
         self,
@@ -414,52 +540,63 @@ class EnergyHistoryClient:
         Returns:
             EnergyStats with aggregated values
         """
-        if not data_points:
-            return EnergyStats()
+        return self._calculate_series_stats(EnergySeries.from_datapoints(data_points))
 
-        values = [dp.value for dp in data_points]
-        unit = data_points[0].unit if data_points else "kWh"
+    def _calculate_series_stats(
+        self,
+        series: EnergySeries,
+    ) -> EnergyStats:
+        """Calculate statistics from a columnar series.
 
-        # Basic stats
-        total = sum(values)
-        average = total / len(values)
-        min_value = min(values)
-        max_value = max(values)
+        Daily totals and hourly averages are computed with ``bincount``
+        group-bys over UTC day/hour indexes.
 
-        # Find peak
-        peak_idx = values.index(max_value)
-        peak_timestamp = data_points[peak_idx].timestamp
+        Args:
+            series: Energy samples
+
+        Returns:
+            EnergyStats with aggregated values
+        """
+        if not len(series):
+            return EnergyStats()
+
+        values = series.values
+        total = float(values.sum())
+        peak_idx = int(values.argmax())
+        max_value = float(values[peak_idx])
 
         # Daily aggregates
-        daily_totals: dict[str, float] = {}
-        for dp in data_points:
-            day_key = dp.timestamp.strftime("%Y-%m-%d")
-            daily_totals[day_key] = daily_totals.get(day_key, 0.0) + dp.value
+        days, day_inverse = np.unique(series.timestamps // _US_PER_DAY, return_inverse=True)
+        day_sums = np.bincount(day_inverse, weights=values)
+        daily_totals = {
+            str(np.datetime64(int(day), "D")): float(day_sum)
+            for day, day_sum in zip(days, day_sums, strict=True)
+        }
 
         # Hourly averages
-        hourly_sums: dict[int, list[float]] = {}
-        for dp in data_points:
-            hour = dp.timestamp.hour
-            if hour not in hourly_sums:
-                hourly_sums[hour] = []
-            hourly_sums[hour].append(dp.value)
-
+        hours = (series.timestamps // _US_PER_HOUR) % 24
+        hour_sums = np.bincount(hours, weights=values, minlength=24)
+        hour_counts = np.bincount(hours, minlength=24)
         hourly_averages = {
-            hour: sum(hourly_sums[hour]) / len(hourly_sums[hour]) if hour in hourly_sums else 0.0
+            hour: float(hour_sums[hour] / hour_counts[hour]) if hour_counts[hour] else 0.0
             for hour in range(24)
         }
 
+        kw_per_unit = self.POWER_CONVERSIONS.get(series.unit)
+        energy_kwh = series.integrate_kwh(kw_per_unit) if kw_per_unit is not None else None
+
         return EnergyStats(
             total=total,
-            average=average,
-            min_value=min_value,
+            average=total / len(series),
+            min_value=float(values.min()),
             max_value=max_value,
-            count=len(values),
-            unit=unit,
+            count=len(series),
+            unit=series.unit,
             peak_value=max_value,
-            peak_timestamp=peak_timestamp,
+            peak_timestamp=series.datetime_at(peak_idx),
             daily_totals=daily_totals,
             hourly_averages=hourly_averages,
+            energy_kwh=energy_kwh,
         )
 
 
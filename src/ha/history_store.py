@@ -0,0 +1,273 @@
+"""Append-only columnar store for HA state history.
+
+Keeps per-entity history as parallel columns (epoch timestamps in an
+``array('d')``, states and raw ``last_changed`` strings in lists) together
+with the time range each series is known to be complete for. History
+reads only fetch the missing tail from ``/api/history/period``; the live
+event stream appends state changes and keeps covered series current while
+it is connected, so repeated analysis windows are answered from memory.
+
+Usage::
+
+    store = HistoryStore()
+    since = store.plan_fetch("sensor.power", start_ts, end_ts)
+    if since is not None:
+        store.ingest("sensor.power", fetched_states, since, end_ts)
+    states = store.query("sensor.power", start_ts, end_ts)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_RETENTION_HOURS = 24 * 30
+_DEFAULT_MAX_SAMPLES = 100_000
+
+
+def parse_timestamp(value: str | None) -> float | None:
+    """Parse an HA ISO-8601 timestamp into epoch seconds.
+
+    Naive timestamps are treated as UTC, matching HA's API output.
+
+    Args:
+        value: ISO-8601 string (``Z`` suffix accepted)
+
+    Returns:
+        Epoch seconds, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.timestamp()
+
+
+@dataclass(slots=True)
+class _Series:
+    """Columnar history for a single entity."""
+
+    covered_from: float
+    covered_to: float
+    timestamps: array[float] = field(default_factory=lambda: array("d"))
+    states: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    def append(self, ts: float, state: str, changed: str) -> bool:
+        """Append a sample if it is newer than the last one."""
+        if self.timestamps and ts <= self.timestamps[-1]:
+            return False
+        self.timestamps.append(ts)
+        self.states.append(state)
+        self.changed.append(changed)
+        return True
+
+    def drop_before(self, index: int) -> None:
+        """Discard the first ``index`` samples."""
+        if index <= 0:
+            return
+        del self.timestamps[:index]
+        del self.states[:index]
+        del self.changed[:index]
+
+
+class HistoryStore:
+    """In-process, append-only history store with coverage tracking.
+
+    A series is *covered* for ``[covered_from, covered_to]``: every state
+    change in that range is present. While the event stream is live
+    (``mark_live``), series covered up to the connection time are treated
+    as complete up to now because every subsequent change is recorded.
+    """
+
+    def __init__(
+        self,
+        retention_hours: int = _DEFAULT_RETENTION_HOURS,
+        max_samples_per_entity: int = _DEFAULT_MAX_SAMPLES,
+    ) -> None:
+        self._retention_seconds = retention_hours * 3600
+        self._max_samples = max_samples_per_entity
+        self._series: dict[str, _Series] = {}
+        self._live_since: float | None = None
+        self._hits = 0
+        self._tail_fetches = 0
+        self._full_fetches = 0
+        self._live_appends = 0
+
+    # ─── Event stream integration ─────────────────────────────────────────
+
+    def mark_live(self, since: float | None = None) -> None:
+        """Record that the event stream is connected and subscribed."""
+        self._live_since = since if since is not None else time.time()
+
+    def mark_stale(self, at: float | None = None) -> None:
+        """Record that the event stream disconnected.
+
+        Series that were being kept current are closed off at the
+        disconnect time so the next read fetches only what was missed.
+        """
+        if self._live_since is None:
+            return
+        now = at if at is not None else time.time()
+        for series in self._series.values():
+            if series.covered_to >= self._live_since:
+                series.covered_to = max(series.covered_to, now)
+        self._live_since = None
+
+    @property
+    def is_live(self) -> bool:
+        return self._live_since is not None
+
+    def record(self, entity_id: str, state: str, last_changed: str | None) -> None:
+        """Append a live state change for an already-tracked entity.
+
+        Entities nobody has read history for are ignored so the store only
+        grows with the working set of analysed sensors. Series with a gap
+        since their last fetch are ignored too; the next read fetches the
+        gap (including this change) from HA.
+        """
+        series = self._series.get(entity_id)
+        if series is None or not self._is_current(series):
+            return
+        ts = parse_timestamp(last_changed)
+        if ts is None:
+            return
+        if series.append(ts, state, last_changed or ""):
+            self._live_appends += 1
+            self._enforce_limits(series)
+
+    # ─── Read path ────────────────────────────────────────────────────────
+
+    def _is_current(self, series: _Series) -> bool:
+        return self._live_since is not None and series.covered_to >= self._live_since
+
+    def plan_fetch(self, entity_id: str, start: float, end: float) -> float | None:
+        """Return the timestamp HA history must be fetched from.
+
+        Args:
+            entity_id: Entity to read
+            start: Window start (epoch seconds)
+            end: Window end (epoch seconds)
+
+        Returns:
+            None when the window is fully covered, otherwise the start of
+            the missing range (``start`` for a full fetch, the end of the
+            covered range for a tail fetch).
+        """
+        series = self._series.get(entity_id)
+        if series is None or series.covered_from > start:
+            self._full_fetches += 1
+            return start
+        if self._is_current(series) or series.covered_to >= end:
+            self._hits += 1
+            return None
+        self._tail_fetches += 1
+        return series.covered_to
+
+    def ingest(
+        self,
+        entity_id: str,
+        states: list[dict[str, Any]],
+        fetched_from: float,
+        fetched_to: float,
+    ) -> None:
+        """Merge states fetched from HA for ``[fetched_from, fetched_to]``.
+
+        A fetch that starts before the covered range replaces the series;
+        otherwise the states are appended after the last stored sample.
+
+        Args:
+            entity_id: Entity the states belong to
+            states: Raw HA history rows (``state`` and ``last_changed``)
+            fetched_from: Start of the fetched range (epoch seconds)
+            fetched_to: End of the fetched range (epoch seconds)
+        """
+        series = self._series.get(entity_id)
+        if series is None or fetched_from < series.covered_from:
+            series = _Series(covered_from=fetched_from, covered_to=fetched_to)
+            self._series[entity_id] = series
+        else:
+            series.covered_to = max(series.covered_to, fetched_to)
+
+        for row in states:
+            changed = row.get("last_changed")
+            ts = parse_timestamp(changed)
+            state = row.get("state")
+            if ts is None or state is None:
+                continue
+            # HA repeats the state in effect at the window start; skip it
+            # when it is just the continuation of the last stored sample.
+            if series.states and ts <= fetched_from and state == series.states[-1]:
+                continue
+            series.append(ts, state, changed or "")
+
+        self._enforce_limits(series)
+
+    def query(self, entity_id: str, start: float, end: float) -> list[dict[str, Any]]:
+        """Return history rows for ``[start, end]`` in HA's format.
+
+        Like HA, the state in effect at ``start`` is included as the first
+        row (stamped with the window start) when it changed earlier.
+        """
+        series = self._series.get(entity_id)
+        if series is None:
+            return []
+        lo = bisect_left(series.timestamps, start)
+        hi = bisect_right(series.timestamps, end)
+        rows: list[dict[str, Any]] = []
+        if lo > 0 and (lo == len(series.timestamps) or series.timestamps[lo] > start):
+            rows.append(
+                {
+                    "state": series.states[lo - 1],
+                    "last_changed": datetime.fromtimestamp(start, UTC).isoformat(),
+                }
+            )
+        rows.extend(
+            {"state": series.states[i], "last_changed": series.changed[i]} for i in range(lo, hi)
+        )
+        return rows
+
+    # ─── Housekeeping ─────────────────────────────────────────────────────
+
+    def _enforce_limits(self, series: _Series) -> None:
+        """Apply retention and per-entity sample caps."""
+        cutoff = time.time() - self._retention_seconds
+        # Keep one sample before the cutoff so the state at the new
+        # coverage start can still be reported.
+        drop = bisect_left(series.timestamps, cutoff) - 1
+        drop = max(drop, len(series.timestamps) - self._max_samples)
+        if drop > 0:
+            series.drop_before(drop)
+            series.covered_from = max(series.covered_from, series.timestamps[0])
+
+    def invalidate(self, entity_id: str | None = None) -> None:
+        """Forget one entity's history, or everything."""
+        if entity_id is None:
+            self._series.clear()
+        else:
+            self._series.pop(entity_id, None)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "entities": len(self._series),
+            "samples": sum(len(s.timestamps) for s in self._series.values()),
+            "hits": self._hits,
+            "tail_fetches": self._tail_fetches,
+            "full_fetches": self._full_fetches,
+            "live_appends": self._live_appends,
+        }
+
+
+__all__ = ["HistoryStore", "parse_timestamp"]
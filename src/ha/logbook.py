@@ -3,17 +3,29 @@
 Wraps the HAClient.get_logbook() method with parsing,
 filtering, and aggregation for behavioral pattern detection.
 
+A behavioral analysis run fetches the logbook once into a
+``LogbookSnapshot``: entries are parsed once into columns (epoch
+timestamps, interned entity/domain codes, action types) with
+entity/domain/hour indexes that every query of the run reuses. Snapshots
+can additionally be shared across runs of the same zone for a short TTL
+via ``LogbookSnapshotCache``.
+
 Feature 03: Intelligent Optimization & Multi-Agent Collaboration.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
+from functools import cached_property
 from typing import Any
 
+import numpy as np
+
 from src.ha.parsers import ParsedLogbookEntry, parse_logbook_list
+from src.ha.timestamps import parse_timestamps_us
 
 # Action type classification
 ACTION_TYPE_AUTOMATION = "automation_triggered"
@@ -23,6 +35,19 @@ ACTION_TYPE_STATE_CHANGE = "state_change"
 ACTION_TYPE_SERVICE = "service_call"
 ACTION_TYPE_UNKNOWN = "unknown"
 
+ACTION_TYPES = (
+    ACTION_TYPE_AUTOMATION,
+    ACTION_TYPE_BUTTON,
+    ACTION_TYPE_SCRIPT,
+    ACTION_TYPE_STATE_CHANGE,
+    ACTION_TYPE_SERVICE,
+    ACTION_TYPE_UNKNOWN,
+)
+_ACTION_CODES = {action: code for code, action in enumerate(ACTION_TYPES)}
+
+_US_PER_HOUR = 3600 * 1_000_000
+_NO_TIMESTAMP = np.iinfo(np.int64).min
+
 
 def classify_action(entry: ParsedLogbookEntry) -> str:
     """Classify a logbook entry into an action type.
@@ -68,11 +93,239 @@ class LogbookStats:
     unique_entities: int = 0
 
 
+def _intern(values: list[str | None]) -> tuple[list[str], np.ndarray]:
+    """Map values to dense int32 codes; None maps to -1."""
+    table: dict[str, int] = {}
+    codes = np.fromiter(
+        (-1 if v is None else table.setdefault(v, len(table)) for v in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return list(table), codes
+
+
+@dataclass
+class LogbookSnapshot:
+    """Logbook entries for one window, parsed once into columns.
+
+    Columns are aligned with ``entries``: ``timestamps`` holds UTC epoch
+    microseconds (int64 minimum when ``when`` is missing or invalid),
+    ``entity_codes``/``domain_codes`` index into ``entity_ids``/``domains``
+    (-1 when absent) and ``action_codes`` index into ``ACTION_TYPES``.
+    """
+
+    hours: int
+    end_us: int
+    entries: list[ParsedLogbookEntry]
+    timestamps: np.ndarray
+    entity_ids: list[str]
+    entity_codes: np.ndarray
+    domains: list[str]
+    domain_codes: np.ndarray
+    action_codes: np.ndarray
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: list[ParsedLogbookEntry],
+        hours: int,
+        end_us: int | None = None,
+    ) -> LogbookSnapshot:
+        """Build a snapshot from parsed entries.
+
+        Args:
+            entries: Parsed logbook entries
+            hours: Window length the entries cover
+            end_us: Window end (epoch microseconds); defaults to now
+
+        Returns:
+            LogbookSnapshot
+        """
+        timestamps = np.full(len(entries), _NO_TIMESTAMP, dtype=np.int64)
+        timed = [i for i, e in enumerate(entries) if e.when]
+        if timed:
+            timestamps[timed] = parse_timestamps_us([entries[i].when or "" for i in timed])
+
+        entity_ids, entity_codes = _intern([e.entity_id or None for e in entries])
+        domains, domain_codes = _intern([e.domain or None for e in entries])
+        action_codes = np.fromiter(
+            (_ACTION_CODES[classify_action(e)] for e in entries),
+            dtype=np.int8,
+            count=len(entries),
+        )
+        return cls(
+            hours=hours,
+            end_us=end_us if end_us is not None else int(time.time() * 1_000_000),
+            entries=entries,
+            timestamps=timestamps,
+            entity_ids=entity_ids,
+            entity_codes=entity_codes,
+            domains=domains,
+            domain_codes=domain_codes,
+            action_codes=action_codes,
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _select(self, mask: np.ndarray) -> list[ParsedLogbookEntry]:
+        return [self.entries[i] for i in np.flatnonzero(mask)]
+
+    @cached_property
+    def hour_of_day(self) -> np.ndarray:
+        """UTC hour (0-23) per entry, -1 when the timestamp is missing."""
+        hours = (self.timestamps // _US_PER_HOUR) % 24
+        return np.where(self.timestamps == _NO_TIMESTAMP, -1, hours).astype(np.int8)
+
+    @cached_property
+    def by_entity(self) -> dict[str, np.ndarray]:
+        """Entry indexes per entity ID, in logbook order."""
+        return self._group(self.entity_codes, self.entity_ids)
+
+    @cached_property
+    def by_domain(self) -> dict[str, np.ndarray]:
+        """Entry indexes per domain, in logbook order."""
+        return self._group(self.domain_codes, self.domains)
+
+    @cached_property
+    def by_hour(self) -> dict[int, np.ndarray]:
+        """Entry indexes per UTC hour of day."""
+        return self._group(self.hour_of_day, list(range(24)))
+
+    @staticmethod
+    def _group(codes: np.ndarray, labels: list[Any]) -> dict[Any, np.ndarray]:
+        valid = np.flatnonzero(codes >= 0)
+        order = valid[np.argsort(codes[valid], kind="stable")]
+        bounds = np.searchsorted(codes[order], np.arange(len(labels) + 1))
+        return {
+            label: order[bounds[i] : bounds[i + 1]]
+            for i, label in enumerate(labels)
+            if bounds[i + 1] > bounds[i]
+        }
+
+    def for_entity(self, entity_id: str) -> list[ParsedLogbookEntry]:
+        """Entries for one entity."""
+        return [self.entries[i] for i in self.by_entity.get(entity_id, ())]
+
+    def for_domain(self, domain: str) -> list[ParsedLogbookEntry]:
+        """Entries for one domain."""
+        return [self.entries[i] for i in self.by_domain.get(domain, ())]
+
+    def for_action(self, action_type: str) -> list[ParsedLogbookEntry]:
+        """Entries classified as ``action_type``."""
+        return self._select(self.action_codes == _ACTION_CODES[action_type])
+
+    def manual_actions(self) -> list[ParsedLogbookEntry]:
+        """Manually triggered (user-initiated) entries."""
+        return self.for_action(ACTION_TYPE_BUTTON)
+
+    def window(self, hours: int) -> LogbookSnapshot:
+        """Trailing sub-window of this snapshot.
+
+        Entries without a timestamp are dropped from narrower windows.
+
+        Args:
+            hours: Window length, at most ``self.hours``
+
+        Returns:
+            This snapshot if ``hours`` covers it, else a sliced snapshot
+        """
+        if hours >= self.hours:
+            return self
+        keep = self.timestamps >= self.end_us - hours * _US_PER_HOUR
+        idx = np.flatnonzero(keep)
+        return LogbookSnapshot(
+            hours=hours,
+            end_us=self.end_us,
+            entries=[self.entries[i] for i in idx],
+            timestamps=self.timestamps[idx],
+            entity_ids=self.entity_ids,
+            entity_codes=self.entity_codes[idx],
+            domains=self.domains,
+            domain_codes=self.domain_codes[idx],
+            action_codes=self.action_codes[idx],
+        )
+
+    @cached_property
+    def stats(self) -> LogbookStats:
+        """Aggregated statistics over the snapshot."""
+        action_counts = np.bincount(self.action_codes, minlength=len(ACTION_TYPES))
+        domain_counts = np.bincount(
+            self.domain_codes[self.domain_codes >= 0], minlength=len(self.domains)
+        )
+        entity_counts = np.bincount(
+            self.entity_codes[self.entity_codes >= 0], minlength=len(self.entity_ids)
+        )
+        hour_counts = np.bincount(self.hour_of_day[self.hour_of_day >= 0], minlength=24)
+
+        by_action_type = {ACTION_TYPES[code]: int(n) for code, n in enumerate(action_counts) if n}
+        return LogbookStats(
+            total_entries=len(self.entries),
+            by_action_type=by_action_type,
+            by_domain={d: int(n) for d, n in zip(self.domains, domain_counts, strict=True) if n},
+            by_entity={e: int(n) for e, n in zip(self.entity_ids, entity_counts, strict=True) if n},
+            by_hour={h: int(n) for h, n in enumerate(hour_counts) if n},
+            time_range_hours=self.hours,
+            automation_triggers=by_action_type.get(ACTION_TYPE_AUTOMATION, 0),
+            manual_actions=by_action_type.get(ACTION_TYPE_BUTTON, 0),
+            unique_entities=int(np.count_nonzero(entity_counts)),
+        )
+
+
+class LogbookSnapshotCache:
+    """Short-TTL cache of logbook snapshots for one HA zone.
+
+    Attached to zone clients by the client factory so consecutive
+    behavioral analysis runs over the same window share one fetch.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 4) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds a snapshot stays reusable
+            max_entries: Maximum number of cached windows
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[int, tuple[float, LogbookSnapshot]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, hours: int) -> LogbookSnapshot | None:
+        """Return a fresh snapshot covering ``hours``, if any."""
+        now = time.monotonic()
+        for cached_hours, (expires, _) in list(self._entries.items()):
+            if expires <= now:
+                del self._entries[cached_hours]
+        candidates = [h for h in self._entries if h >= hours]
+        if not candidates:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._entries[min(candidates)][1].window(hours)
+
+    def put(self, snapshot: LogbookSnapshot) -> None:
+        """Store a snapshot, evicting the oldest when full."""
+        self._entries[snapshot.hours] = (time.monotonic() + self.ttl_seconds, snapshot)
+        while len(self._entries) > self.max_entries:
+            oldest = min(self._entries, key=lambda h: self._entries[h][0])
+            del self._entries[oldest]
+
+    def clear(self) -> None:
+        """Drop all cached snapshots."""
+        self._entries.clear()
+
+
 class LogbookHistoryClient:
     """Client for logbook-based behavioral analysis.
 
     Wraps HAClient.get_logbook() with parsing, filtering,
     and aggregation capabilities for behavioral pattern detection.
+
+    Unfiltered reads are served from a ``LogbookSnapshot`` fetched once
+    per window for the lifetime of the client, so one analysis run
+    downloads and parses the logbook a single time.
     """
 
     def __init__(self, ha_client: Any) -> None:
@@ -82,6 +335,40 @@ class LogbookHistoryClient:
             ha_client: HAClient instance
         """
         self._ha_client = ha_client
+        self._snapshots: dict[int, LogbookSnapshot] = {}
+        self._snapshot_lock = asyncio.Lock()
+
+    async def get_snapshot(self, hours: int = 24) -> LogbookSnapshot:
+        """Get the logbook snapshot for the trailing ``hours``.
+
+        Reuses a snapshot already taken by this client (or a wider one,
+        sliced down), then the zone's ``LogbookSnapshotCache``, and only
+        then fetches from HA.
+
+        Args:
+            hours: Hours of history
+
+        Returns:
+            LogbookSnapshot covering the window
+        """
+        async with self._snapshot_lock:
+            wider = [h for h in self._snapshots if h >= hours]
+            if wider:
+                return self._snapshots[min(wider)].window(hours)
+
+            cache = getattr(self._ha_client, "logbook_cache", None)
+            if not isinstance(cache, LogbookSnapshotCache):
+                cache = None
+
+            snapshot = cache.get(hours) if cache else None
+            if snapshot is None:
+                raw = await self._ha_client.get_logbook(hours=hours, entity_id=None)
+                snapshot = LogbookSnapshot.from_entries(parse_logbook_list(raw), hours)
+                if cache:
+                    cache.put(snapshot)
+
+            self._snapshots[hours] = snapshot
+            return snapshot
 
     async def get_entries(
         self,
@@ -95,8 +382,10 @@ class LogbookHistoryClient:
             entity_id: Optional entity filter
 
         Returns:
-            List of parsed logbook entries
+            List of parsed logbook entries (a copy; the snapshot is shared)
         """
+        if entity_id is None:
+            return list((await self.get_snapshot(hours)).entries)
         raw = await self._ha_client.get_logbook(hours=hours, entity_id=entity_id)
         return parse_logbook_list(raw)
 
@@ -114,8 +403,7 @@ class LogbookHistoryClient:
         Returns:
             Filtered entries
         """
-        entries = await self.get_entries(hours=hours)
-        return [e for e in entries if e.domain == domain]
+        return (await self.get_snapshot(hours)).for_domain(domain)
 
     async def get_stats(
         self,
@@ -131,6 +419,8 @@ class LogbookHistoryClient:
         Returns:
             Aggregated statistics
         """
+        if entity_id is None:
+            return (await self.get_snapshot(hours)).stats
         entries = await self.get_entries(hours=hours, entity_id=entity_id)
         return self._calculate_stats(entries, hours)
 
@@ -160,8 +450,7 @@ class LogbookHistoryClient:
         Returns:
             Manual action entries
         """
-        entries = await self.get_entries(hours=hours)
-        return [e for e in entries if classify_action(e) == ACTION_TYPE_BUTTON]
+        return (await self.get_snapshot(hours)).manual_actions()
 
     def _calculate_stats(
         self,
@@ -177,39 +466,7 @@ class LogbookHistoryClient:
         Returns:
             Aggregated statistics
         """
-        stats = LogbookStats(
-            total_entries=len(entries),
-            time_range_hours=hours,
-        )
-
-        action_counts: dict[str, int] = defaultdict(int)
-        domain_counts: dict[str, int] = defaultdict(int)
-        entity_counts: dict[str, int] = defaultdict(int)
-        hour_counts: dict[int, int] = defaultdict(int)
-
-        for entry in entries:
-            action = classify_action(entry)
-            action_counts[action] += 1
-            if entry.domain:
-                domain_counts[entry.domain] += 1
-            if entry.entity_id:
-                entity_counts[entry.entity_id] += 1
-            if entry.when:
-                try:
-                    dt = datetime.fromisoformat(entry.when.replace("Z", "+00:00"))
-                    hour_counts[dt.hour] += 1
-                except (ValueError, AttributeError):
-                    pass
-
-        stats.by_action_type = dict(action_counts)
-        stats.by_domain = dict(domain_counts)
-        stats.by_entity = dict(entity_counts)
-        stats.by_hour = dict(hour_counts)
-        stats.automation_triggers = action_counts.get(ACTION_TYPE_AUTOMATION, 0)
-        stats.manual_actions = action_counts.get(ACTION_TYPE_BUTTON, 0)
-        stats.unique_entities = len(entity_counts)
-
-        return stats
+        return LogbookSnapshot.from_entries(entries, hours).stats
 
     def aggregate_by_action_type(
         self,
@@ -256,6 +513,8 @@ __all__ = [
     "ACTION_TYPE_STATE_CHANGE",
     "ACTION_TYPE_UNKNOWN",
     "LogbookHistoryClient",
+    "LogbookSnapshot",
+    "LogbookSnapshotCache",
     "LogbookStats",
     "classify_action",
     "get_logbook_stats",
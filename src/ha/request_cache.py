@@ -0,0 +1,137 @@
+"""Micro-TTL response cache for idempotent HA GETs.
+
+Agents, the registry cache and diagnostics often read the same HA
+endpoints (``/api/states``, the entity and area registries, services)
+within the same second. Zone clients keep the raw response bodies of
+opted-in paths for a short TTL, bounded by total bytes, and decode a
+fresh copy per read so callers can never mutate each other's results.
+Any non-GET request through the client clears the cache.
+
+Usage::
+
+    cache = RequestCache({"/api/states": 1.0}, max_bytes=16 * 1024 * 1024)
+    body = cache.get(key)
+    if body is None:
+        cache.put(key, "/api/states", fetched_body)
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Read-mostly endpoints that are safe to share for a second or two
+CACHEABLE_PATHS = (
+    "/api/states",
+    "/api/config",
+    "/api/config/entity_registry",
+    "/api/config/area_registry/list",
+    "/api/services",
+)
+
+
+def request_key(path: str, params: dict[str, Any] | None = None) -> str:
+    """Identity of a GET: path plus its sorted query parameters."""
+    if not params:
+        return path
+    return f"{path}?{urlencode(sorted(params.items()), doseq=True)}"
+
+
+def _record_cache_event(event: str) -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_ha_request_cache(event)
+
+
+class RequestCache:
+    """Per-path TTL cache of raw HA response bodies with a byte budget."""
+
+    def __init__(self, ttls: Mapping[str, float], max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttls: Seconds each opted-in path stays cached, keyed by exact path
+            max_bytes: Total size of cached bodies; least recently used
+                entries are evicted beyond it
+        """
+        self.ttls = {path: ttl for path, ttl in ttls.items() if ttl > 0}
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        # Bumped by clear(); a GET started before a write must not be cached
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def cacheable(self, path: str) -> bool:
+        """Whether responses for ``path`` are cached at all."""
+        return path in self.ttls
+
+    def get(self, key: str) -> bytes | None:
+        """Return a fresh cached body for ``key``, if any."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            _record_cache_event("hit")
+            return entry[1]
+        if entry is not None:
+            self._drop(key)
+        self.misses += 1
+        _record_cache_event("miss")
+        return None
+
+    def put(self, key: str, path: str, body: bytes, generation: int | None = None) -> None:
+        """Store a response body for ``path``'s TTL.
+
+        Bodies larger than the whole budget are not cached, nor are
+        bodies fetched before the last ``clear()``.
+
+        Args:
+            key: Request key
+            path: Request path (selects the TTL)
+            body: Raw response body
+            generation: ``self.generation`` when the request was sent
+        """
+        ttl = self.ttls.get(path)
+        if ttl is None or len(body) > self.max_bytes:
+            return
+        if generation is not None and generation != self.generation:
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (time.monotonic() + ttl, body)
+        self._bytes += len(body)
+        while self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+            _record_cache_event("evict")
+
+    def _drop(self, key: str) -> None:
+        _, body = self._entries.pop(key)
+        self._bytes -= len(body)
+
+    def clear(self) -> None:
+        """Drop every cached body (after a write to HA)."""
+        self._entries.clear()
+        self._bytes = 0
+        self.generation += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+__all__ = ["CACHEABLE_PATHS", "RequestCache", "request_key"]
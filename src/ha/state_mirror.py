@@ -0,0 +1,294 @@
+"""In-process mirror of HA entity states and registry entries.
+
+Bootstrapped once from ``/api/states`` and ``/api/config/entity_registry``
+and then kept current by the live event stream (``state_changed`` and
+``entity_registry_updated``), so entity reads are answered from memory
+instead of downloading every state per call. Entities are indexed by
+domain, area and device.
+
+The mirror tracks how current it is: while the event stream is live and
+the mirror was bootstrapped after the stream connected, every change is
+applied and the mirror is exact. Otherwise it is as old as the last
+bootstrap (or disconnect), and readers fall back to REST once that
+exceeds ``max_staleness_seconds``.
+
+Events that arrive while a bootstrap fetch is in flight are buffered and
+replayed onto the snapshot, and a state is never replaced by one with an
+older ``last_updated``, so the snapshot cannot undo newer changes.
+
+Usage::
+
+    mirror = StateMirror(max_staleness_seconds=30)
+    with mirror.bootstrapping():
+        states, registry = await fetch()
+        mirror.bootstrap(states, registry, fetched_at=start)
+    if mirror.is_usable():
+        entity = mirror.get_state("light.kitchen")
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_STALENESS = 30.0
+
+
+def _domain(entity_id: str) -> str:
+    return entity_id.split(".")[0] if "." in entity_id else ""
+
+
+def _is_older(state: dict[str, Any], than: dict[str, Any]) -> bool:
+    # HA writes last_updated as UTC ISO-8601, so strings compare in time order
+    new, current = state.get("last_updated"), than.get("last_updated")
+    return isinstance(new, str) and isinstance(current, str) and new < current
+
+
+class StateMirror:
+    """Per-zone mirror of HA states with domain/area/device indexes."""
+
+    def __init__(self, max_staleness_seconds: float = _DEFAULT_MAX_STALENESS) -> None:
+        self.max_staleness_seconds = max_staleness_seconds
+        self._states: dict[str, dict[str, Any]] = {}
+        self._registry: dict[str, dict[str, Any]] = {}
+        # Ordered sets (dict keys) so index reads keep HA's entity order
+        self._by_domain: dict[str, dict[str, None]] = {}
+        self._by_area: dict[str, dict[str, None]] = {}
+        self._by_device: dict[str, dict[str, None]] = {}
+        self._synced_at: float | None = None
+        self._live_since: float | None = None
+        self.registry_dirty = False
+        # Events received while a bootstrap fetch is in flight
+        self._bootstrapping = 0
+        self._buffered: list[dict[str, Any]] = []
+        self._hits = 0
+        self._bootstraps = 0
+        self._events_applied = 0
+
+    # ─── Freshness ────────────────────────────────────────────────────────
+
+    def mark_live(self, since: float | None = None) -> None:
+        """Record that the event stream is connected and subscribed."""
+        self._live_since = since if since is not None else time.time()
+
+    def mark_stale(self, at: float | None = None) -> None:
+        """Record that the event stream disconnected.
+
+        A mirror that was being kept current is complete up to the
+        disconnect, so its staleness is measured from then.
+        """
+        if self._is_current():
+            self._synced_at = at if at is not None else time.time()
+        self._live_since = None
+
+    @property
+    def is_live(self) -> bool:
+        return self._live_since is not None
+
+    @property
+    def is_bootstrapped(self) -> bool:
+        return self._synced_at is not None
+
+    def _is_current(self) -> bool:
+        return (
+            self._live_since is not None
+            and self._synced_at is not None
+            and self._synced_at >= self._live_since
+        )
+
+    def staleness(self) -> float:
+        """Seconds of changes the mirror may be missing (0 while exact)."""
+        if self._synced_at is None:
+            return float("inf")
+        if self._is_current():
+            return 0.0
+        return max(time.time() - self._synced_at, 0.0)
+
+    def is_usable(self) -> bool:
+        """Whether reads may be served from the mirror."""
+        return self.staleness() <= self.max_staleness_seconds
+
+    def needs_bootstrap(self) -> bool:
+        """Whether a (re-)bootstrap would make the mirror usable or exact."""
+        return not self.is_usable() or (self.is_live and not self._is_current())
+
+    # ─── Writes ───────────────────────────────────────────────────────────
+
+    @contextmanager
+    def bootstrapping(self) -> Iterator[None]:
+        """Buffer incoming events while a bootstrap snapshot is fetched."""
+        self._bootstrapping += 1
+        try:
+            yield
+        finally:
+            self._bootstrapping -= 1
+            if not self._bootstrapping:
+                self._buffered.clear()
+
+    def bootstrap(
+        self,
+        states: list[dict[str, Any]],
+        registry: dict[str, dict[str, Any]],
+        fetched_at: float,
+    ) -> None:
+        """Replace the mirror with a full snapshot fetched from HA.
+
+        Args:
+            states: Raw ``/api/states`` rows
+            registry: Entity registry entries keyed by entity_id
+            fetched_at: When the fetch started (epoch seconds); changes
+                after this are expected from the event stream
+        """
+        self._states = {s["entity_id"]: s for s in states if s.get("entity_id")}
+        self._registry = dict(registry)
+        self._reindex()
+        self._synced_at = fetched_at
+        self.registry_dirty = False
+        self._bootstraps += 1
+        for event in self._buffered:
+            self._apply(event)
+
+    def replace_registry(self, registry: dict[str, dict[str, Any]]) -> None:
+        """Swap in a freshly fetched entity registry."""
+        self._registry = dict(registry)
+        self._reindex()
+        self.registry_dirty = False
+
+    def apply_state_changed(self, data: dict[str, Any]) -> None:
+        """Apply a ``state_changed`` event's data."""
+        entity_id = data.get("entity_id")
+        if not entity_id or self._synced_at is None:
+            return
+        new_state = data.get("new_state")
+        current = self._states.get(entity_id)
+        if new_state is not None and current is not None and _is_older(new_state, current):
+            return
+        if new_state is None:
+            self._states.pop(entity_id, None)
+            self._unindex(entity_id)
+        elif entity_id not in self._states:
+            self._states[entity_id] = new_state
+            self._index(entity_id)
+        else:
+            self._states[entity_id] = new_state
+        self._events_applied += 1
+
+    def apply_registry_updated(self, data: dict[str, Any]) -> None:
+        """Apply an ``entity_registry_updated`` event's data.
+
+        Removals are applied directly; creates and updates only carry the
+        changed field names, so the registry is re-fetched on next read.
+        """
+        action = data.get("action")
+        entity_id = data.get("entity_id")
+        if not entity_id or self._synced_at is None:
+            return
+        if action == "remove":
+            self._registry.pop(entity_id, None)
+            self._unindex(entity_id)
+            if entity_id in self._states:
+                self._index(entity_id)
+        else:
+            self.registry_dirty = True
+        self._events_applied += 1
+
+    def apply_event(self, event: dict[str, Any]) -> None:
+        """Apply an HA event if it is one the mirror tracks."""
+        if self._bootstrapping:
+            self._buffered.append(event)
+        self._apply(event)
+
+    def _apply(self, event: dict[str, Any]) -> None:
+        event_type = event.get("event_type")
+        if event_type == "state_changed":
+            self.apply_state_changed(event.get("data", {}))
+        elif event_type == "entity_registry_updated":
+            self.apply_registry_updated(event.get("data", {}))
+
+    # ─── Indexes ──────────────────────────────────────────────────────────
+
+    def _area_of(self, entity_id: str) -> str | None:
+        area = self._registry.get(entity_id, {}).get("area_id")
+        if area:
+            return str(area)
+        attr_area = self._states.get(entity_id, {}).get("attributes", {}).get("area_id")
+        return str(attr_area) if attr_area else None
+
+    def _index(self, entity_id: str) -> None:
+        self._by_domain.setdefault(_domain(entity_id), {})[entity_id] = None
+        area = self._area_of(entity_id)
+        if area:
+            self._by_area.setdefault(area, {})[entity_id] = None
+        device = self._registry.get(entity_id, {}).get("device_id")
+        if device:
+            self._by_device.setdefault(device, {})[entity_id] = None
+
+    def _unindex(self, entity_id: str) -> None:
+        for index in (self._by_domain, self._by_area, self._by_device):
+            for members in index.values():
+                members.pop(entity_id, None)
+
+    def _reindex(self) -> None:
+        self._by_domain.clear()
+        self._by_area.clear()
+        self._by_device.clear()
+        for entity_id in self._states:
+            self._index(entity_id)
+
+    # ─── Reads ────────────────────────────────────────────────────────────
+
+    def entity_ids(
+        self,
+        domain: str | None = None,
+        area_id: str | None = None,
+        device_id: str | None = None,
+    ) -> list[str]:
+        """Entity IDs matching every given index filter, in HA's order."""
+        self._hits += 1
+        selected: list[dict[str, None]] = []
+        if domain is not None:
+            selected.append(self._by_domain.get(domain, {}))
+        if area_id is not None:
+            selected.append(self._by_area.get(area_id, {}))
+        if device_id is not None:
+            selected.append(self._by_device.get(device_id, {}))
+        if not selected:
+            return list(self._states)
+        smallest = min(selected, key=len)
+        return [eid for eid in smallest if all(eid in s for s in selected)]
+
+    def get_state(self, entity_id: str) -> dict[str, Any] | None:
+        """Raw HA state object for an entity."""
+        self._hits += 1
+        return self._states.get(entity_id)
+
+    @property
+    def registry(self) -> Mapping[str, dict[str, Any]]:
+        """Entity registry entries keyed by entity_id (read-only view)."""
+        return self._registry
+
+    def states(self) -> list[dict[str, Any]]:
+        """All raw HA state objects, in HA's order."""
+        self._hits += 1
+        return list(self._states.values())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entities": len(self._states),
+            "live": self.is_live,
+            "staleness_seconds": self.staleness(),
+            "hits": self._hits,
+            "bootstraps": self._bootstraps,
+            "events_applied": self._events_applied,
+        }
+
+
+__all__ = ["StateMirror"]
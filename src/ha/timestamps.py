@@ -0,0 +1,44 @@
+"""Bulk timestamp parsing for Home Assistant history and logbook data.
+
+HA timestamps are ISO-8601 strings. Analysis code holds them as int64
+UTC epoch microseconds so they can be sorted and bucketed with NumPy.
+"""
+
+import warnings
+from datetime import UTC, datetime
+
+import numpy as np
+
+US_PER_SECOND = 1_000_000
+
+
+def parse_timestamps_us(raw: list[str]) -> np.ndarray:
+    """Parse ISO-8601 strings to int64 UTC epoch microseconds.
+
+    HA reports UTC timestamps, which NumPy parses in bulk once the offset
+    suffix is stripped. Anything else falls back to ``datetime`` parsing.
+    Unparseable entries are returned as the int64 minimum.
+    """
+    stripped = [t.removesuffix("Z").removesuffix("+00:00") for t in raw]
+    try:
+        # NumPy only warns on non-UTC offsets; treat that as a parse failure
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            return np.array(stripped, dtype="datetime64[us]").astype(np.int64)
+    except (ValueError, UserWarning):
+        pass
+
+    out = np.empty(len(raw), dtype=np.int64)
+    for i, value in enumerate(raw):
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            out[i] = np.iinfo(np.int64).min
+            continue
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=UTC)
+        out[i] = round(dt.timestamp() * US_PER_SECOND)
+    return out
+
+
+__all__ = ["US_PER_SECOND", "parse_timestamps_us"]
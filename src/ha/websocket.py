@@ -1,9 +1,15 @@
-"""Lightweight HA WebSocket client for one-shot commands.
+"""Shared HA WebSocket sessions for commands and subscriptions.
 
-Provides a single ``ws_command`` helper that connects to HA's WebSocket API,
-authenticates, sends one command, and returns the result.  Used for Lovelace
-dashboard operations where the REST API is unreliable (e.g. default dashboard
-returns 404 via REST but works via WebSocket).
+``ws_command`` runs a command over a long-lived :class:`HAWebSocketSession`
+per HA instance (WebSocket URL + token, i.e. per zone).  The session
+authenticates once, multiplexes concurrent commands by message id, and
+reconnects lazily after the socket drops, so creating ten helpers or
+reading several dashboards costs one handshake instead of ten.  Event
+subscriptions (``HAEventStream``) can ride the same socket.
+
+Used for Lovelace dashboard operations where the REST API is unreliable
+(e.g. default dashboard returns 404 via REST but works via WebSocket),
+helper creation and registry commands.
 
 Protocol reference:
     https://developers.home-assistant.io/docs/api/websocket
@@ -13,6 +19,7 @@ Protocol reference:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 from typing import Any
@@ -21,13 +28,24 @@ from websockets.asyncio.client import connect as ws_connect
 
 from src.exceptions import HAClientError
 
-__all__ = ["_authenticate", "ws_command", "ws_connect"]
+__all__ = [
+    "HAWebSocketSession",
+    "_authenticate",
+    "_put_dropping_oldest",
+    "close_ws_sessions",
+    "get_ws_session",
+    "ws_command",
+    "ws_connect",
+]
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for the entire connect-auth-command cycle (seconds).
 DEFAULT_TIMEOUT = 15.0
 
+# Events buffered per subscription before the oldest are dropped
+SUBSCRIPTION_QUEUE_SIZE = 1000
+
 
 async def ws_command(
     ws_url: str,
@@ -37,11 +55,11 @@ async def ws_command(
     timeout: float = DEFAULT_TIMEOUT,
     **params: Any,
 ) -> Any:
-    """Execute a single WebSocket command against Home Assistant.
+    """Execute a WebSocket command against Home Assistant.
 
-    Opens a connection, authenticates, sends the command, reads the
-    result, and closes.  This is intentionally not a persistent
-    connection — each call is self-contained.
+    Runs over the shared :class:`HAWebSocketSession` for ``ws_url`` and
+    ``token``, connecting and authenticating only when the session has
+    no live socket.
 
     Args:
         ws_url: Full WebSocket URL, e.g. ``ws://ha.local:8123/api/websocket``.
@@ -59,8 +77,8 @@ async def ws_command(
                        or connection issues.
     """
     try:
-        async with asyncio.timeout(timeout):
-            return await _execute(ws_url, token, command_type, params)
+        session = get_ws_session(ws_url, token)
+        return await session.command(command_type, timeout=timeout, **params)
     except TimeoutError as exc:
         raise HAClientError(
             f"Timeout after {timeout}s waiting for HA WebSocket response",
@@ -75,6 +93,23 @@ async def ws_command(
         ) from exc
 
 
+def _put_dropping_oldest(queue: asyncio.Queue[Any], item: Any) -> bool:
+    """Put ``item`` on ``queue``, dropping the oldest entry when it is full.
+
+    Returns:
+        Whether an entry was dropped to make room.
+    """
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        logger.warning("Subscription queue full, dropping oldest event")
+        with contextlib.suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+        queue.put_nowait(item)
+        return True
+    return False
+
+
 async def _authenticate(ws: Any, token: str) -> None:
     """Authenticate a WebSocket connection to Home Assistant.
 
@@ -113,27 +148,255 @@ async def _authenticate(ws: Any, token: str) -> None:
         )
 
 
-async def _execute(
-    ws_url: str,
-    token: str,
-    command_type: str,
-    params: dict[str, Any],
-) -> Any:
-    """Internal: run the connect -> auth -> command -> close cycle."""
-    async with ws_connect(ws_url) as ws:
-        await _authenticate(ws, token)
+# Params that would clobber the protocol fields of a command message
+_WS_PROTOCOL_KEYS = frozenset({"id", "type"})
 
-        _WS_PROTOCOL_KEYS = {"id", "type"}
-        safe_params = {k: v for k, v in params.items() if k not in _WS_PROTOCOL_KEYS}
-        command: dict[str, Any] = {"id": 1, "type": command_type, **safe_params}
-        await ws.send(json.dumps(command))
 
-        raw = await ws.recv()
-        msg = json.loads(raw)
+class HAWebSocketSession:
+    """Long-lived, authenticated WebSocket connection to one HA instance.
+
+    A background reader task owns the socket: it authenticates, then
+    routes ``result`` messages to the waiting command by ``id`` and
+    ``event`` messages to the queue of the matching subscription.
+    Commands are pipelined — any number can be in flight at once.  When
+    the socket drops, in-flight commands fail with ``ConnectionError``,
+    subscription queues receive ``None``, and the next command
+    reconnects and re-authenticates.
+
+    Usage::
+
+        session = get_ws_session(ws_url, token)
+        config = await session.command("lovelace/config", url_path=None)
+        events = await session.subscribe("subscribe_events", event_type="state_changed")
+    """
+
+    def __init__(self, ws_url: str, token: str) -> None:
+        self.ws_url = ws_url
+        self._token = token
+        self._ws: Any | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._connect_lock = asyncio.Lock()
+        self._next_id = 1
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._subscriptions: dict[int, asyncio.Queue[dict[str, Any] | None]] = {}
+        self.loop = asyncio.get_running_loop()
+        self.connects = 0
+        self.events_dropped = 0
+
+    @property
+    def connected(self) -> bool:
+        """Whether the session currently has an authenticated socket."""
+        return self._ws is not None
 
+    async def command(
+        self,
+        command_type: str,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        **params: Any,
+    ) -> Any:
+        """Send a command and wait for its result.
+
+        Args:
+            command_type: HA WebSocket message type.
+            timeout: Maximum seconds for connecting plus the round trip.
+            **params: Additional command fields (``id``/``type`` are ignored).
+
+        Returns:
+            The ``result`` field of the response.
+
+        Raises:
+            HAClientError: On authentication failure or a failed command.
+            TimeoutError: When no response arrives in time.
+            ConnectionError: When the socket drops mid-command.
+        """
+        async with asyncio.timeout(timeout):
+            msg_id, future = await self._send(command_type, params)
+            try:
+                msg = await future
+            finally:
+                self._pending.pop(msg_id, None)
         if not msg.get("success"):
             error = msg.get("error", {})
             error_msg = error.get("message", "Unknown WebSocket command error")
             raise HAClientError(error_msg, tool="ws_command")
-
         return msg.get("result")
+
+    async def subscribe(
+        self,
+        command_type: str,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        **params: Any,
+    ) -> asyncio.Queue[dict[str, Any] | None]:
+        """Start a subscription and return the queue its events arrive on.
+
+        The queue receives each message's ``event`` payload, then ``None``
+        when the connection closes (the subscription does not survive a
+        reconnect; callers subscribe again).
+
+        Args:
+            command_type: Subscription command, e.g. ``"subscribe_events"``.
+            timeout: Maximum seconds to wait for the subscription result.
+            **params: Additional command fields (e.g. ``event_type``).
+
+        Raises:
+            HAClientError: When HA rejects the subscription.
+        """
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=SUBSCRIPTION_QUEUE_SIZE)
+        async with asyncio.timeout(timeout):
+            msg_id, future = await self._send(command_type, params, queue=queue)
+            try:
+                msg = await future
+            finally:
+                self._pending.pop(msg_id, None)
+        if not msg.get("success"):
+            self._subscriptions.pop(msg_id, None)
+            raise HAClientError(
+                msg.get("error", {}).get("message", "Subscription failed"),
+                tool="ws_subscribe",
+            )
+        return queue
+
+    async def unsubscribe(
+        self,
+        queue: asyncio.Queue[dict[str, Any] | None],
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """End a subscription started with ``subscribe``.
+
+        The queue stops receiving events at once; HA is told to stop
+        sending them while the socket is still up. Queues whose
+        subscription already ended (e.g. after a disconnect) are ignored.
+
+        Args:
+            queue: Queue returned by ``subscribe``.
+            timeout: Maximum seconds to wait for HA's confirmation.
+
+        Raises:
+            HAClientError: When HA rejects the unsubscribe.
+        """
+        msg_id = next((i for i, q in self._subscriptions.items() if q is queue), None)
+        if msg_id is None:
+            return
+        del self._subscriptions[msg_id]
+        if self._ws is not None:
+            await self.command("unsubscribe_events", subscription=msg_id, timeout=timeout)
+
+    async def _send(
+        self,
+        command_type: str,
+        params: dict[str, Any],
+        queue: asyncio.Queue[dict[str, Any] | None] | None = None,
+    ) -> tuple[int, asyncio.Future[Any]]:
+        ws = await self._ensure_connected()
+        msg_id = self._next_id
+        self._next_id += 1
+        future: asyncio.Future[Any] = self.loop.create_future()
+        self._pending[msg_id] = future
+        if queue is not None:
+            self._subscriptions[msg_id] = queue
+        safe_params = {k: v for k, v in params.items() if k not in _WS_PROTOCOL_KEYS}
+        try:
+            await ws.send(json.dumps({"id": msg_id, "type": command_type, **safe_params}))
+        except BaseException:
+            self._pending.pop(msg_id, None)
+            self._subscriptions.pop(msg_id, None)
+            raise
+        return msg_id, future
+
+    async def _ensure_connected(self) -> Any:
+        if self._ws is not None:
+            return self._ws
+        async with self._connect_lock:
+            if self._ws is not None:
+                return self._ws
+            ready: asyncio.Future[Any] = self.loop.create_future()
+            self._reader = self.loop.create_task(self._run(ready))
+            return await ready
+
+    async def _run(self, ready: asyncio.Future[Any]) -> None:
+        """Own one connection: authenticate, then dispatch until it drops."""
+        try:
+            async with ws_connect(self.ws_url) as ws:
+                await _authenticate(ws, self._token)
+                self._ws = ws
+                self._next_id = 1
+                self.connects += 1
+                ready.set_result(ws)
+                # Let the caller that triggered the connect send its command first
+                await asyncio.sleep(0)
+                while True:
+                    self._dispatch(json.loads(await ws.recv()))
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.set_exception(ConnectionError("WebSocket session closed"))
+            raise
+        except Exception as exc:
+            if not ready.done():
+                ready.set_exception(exc)
+            else:
+                logger.debug("HA WebSocket session to %s closed: %s", self.ws_url, exc)
+        finally:
+            self._ws = None
+            self._drop_waiters()
+
+    def _dispatch(self, msg: dict[str, Any]) -> None:
+        msg_id = msg.get("id")
+        if msg.get("type") == "event":
+            queue = self._subscriptions.get(msg_id)  # type: ignore[arg-type]
+            if queue is not None and _put_dropping_oldest(queue, msg.get("event", {})):
+                self.events_dropped += 1
+            return
+        future = self._pending.get(msg_id)  # type: ignore[arg-type]
+        if future is not None and not future.done():
+            future.set_result(msg)
+
+    def _drop_waiters(self) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("HA WebSocket connection lost"))
+        self._pending.clear()
+        for queue in self._subscriptions.values():
+            _put_dropping_oldest(queue, None)
+        self._subscriptions.clear()
+
+    async def close(self) -> None:
+        """Close the socket and fail anything still waiting on it."""
+        if self._reader is not None and not self._reader.done():
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+        self._reader = None
+
+
+# Shared sessions keyed by (ws_url, token); one per HA instance / zone
+_sessions: dict[tuple[str, str], HAWebSocketSession] = {}
+
+
+def get_ws_session(ws_url: str, token: str) -> HAWebSocketSession:
+    """Get the shared session for an HA instance, creating it if needed.
+
+    Sessions are bound to the event loop they were created on; a caller
+    on a different loop gets a fresh session.
+
+    Args:
+        ws_url: Full WebSocket URL.
+        token: Long-lived access token.
+    """
+    key = (ws_url, token)
+    session = _sessions.get(key)
+    if session is None or session.loop is not asyncio.get_running_loop():
+        session = HAWebSocketSession(ws_url, token)
+        _sessions[key] = session
+    return session
+
+
+async def close_ws_sessions(ws_url: str | None = None) -> None:
+    """Close shared sessions (all, or those for ``ws_url``)."""
+    loop = asyncio.get_running_loop()
+    for key in [k for k in _sessions if ws_url is None or k[0] == ws_url]:
+        session = _sessions.pop(key)
+        if session.loop is loop:
+            await session.close()
@@ -1,8 +1,9 @@
 """Structured job event helpers for the global activity SSE stream.
 
 Thin wrappers around :func:`publish_activity` that emit standardized
-``type: "job"`` events.  All helpers are fire-and-forget with zero DB
-cost — they only push to the in-memory SSE broadcast.
+``type: "job"`` events.  All helpers are fire-and-forget — they hand
+the event to the activity event bus (:mod:`src.api.event_bus`), which
+fans it out to SSE clients on every worker and buffers it for replay.
 
 Event format::
 
@@ -14,11 +14,23 @@ _EXPORTS = {
     "CircuitBreaker": "src.llm.circuit_breaker",
     "_circuit_breakers": "src.llm.circuit_breaker",
     "_get_circuit_breaker": "src.llm.circuit_breaker",
+    "retry_delay": "src.llm.circuit_breaker",
+    # concurrency
+    "AdaptiveConcurrencyLimiter": "src.llm.concurrency",
+    "Priority": "src.llm.concurrency",
+    "_concurrency_limiters": "src.llm.concurrency",
+    "_get_concurrency_limiter": "src.llm.concurrency",
+    "llm_priority": "src.llm.concurrency",
+    "set_llm_priority": "src.llm.concurrency",
     # factory
     "PROVIDER_BASE_URLS": "src.llm.factory",
     "get_default_llm": "src.llm.factory",
     "get_llm": "src.llm.factory",
     "list_supported_providers": "src.llm.factory",
+    # latency
+    "LatencyTracker": "src.llm.latency",
+    "_get_latency_tracker": "src.llm.latency",
+    "_latency_trackers": "src.llm.latency",
     # model_tiers
     "ModelTier": "src.llm.model_tiers",
     "get_default_model_for_tier": "src.llm.model_tiers",
@@ -26,6 +38,9 @@ _EXPORTS = {
     "resolve_model_for_tier": "src.llm.model_tiers",
     # resilient
     "ResilientLLM": "src.llm.resilient",
+    # response_cache
+    "ResponseCache": "src.llm.response_cache",
+    "get_response_cache": "src.llm.response_cache",
 }
 
 _cache: dict[str, Any] = {}
@@ -59,6 +74,15 @@ if TYPE_CHECKING:
         CircuitBreaker,
         _circuit_breakers,
         _get_circuit_breaker,
+        retry_delay,
+    )
+    from src.llm.concurrency import (
+        AdaptiveConcurrencyLimiter,
+        Priority,
+        _concurrency_limiters,
+        _get_concurrency_limiter,
+        llm_priority,
+        set_llm_priority,
     )
     from src.llm.factory import (
         PROVIDER_BASE_URLS,
@@ -66,6 +90,7 @@ if TYPE_CHECKING:
         get_llm,
         list_supported_providers,
     )
+    from src.llm.latency import LatencyTracker, _get_latency_tracker, _latency_trackers
     from src.llm.model_tiers import (
         ModelTier,
         get_default_model_for_tier,
@@ -73,20 +98,33 @@ if TYPE_CHECKING:
         resolve_model_for_tier,
     )
     from src.llm.resilient import ResilientLLM
+    from src.llm.response_cache import ResponseCache, get_response_cache
 
 __all__ = [
     "MAX_RETRIES",
     "PROVIDER_BASE_URLS",
     "RETRY_DELAYS",
+    "AdaptiveConcurrencyLimiter",
     "CircuitBreaker",
+    "LatencyTracker",
     "ModelTier",
+    "Priority",
     "ResilientLLM",
+    "ResponseCache",
     "_circuit_breakers",
+    "_concurrency_limiters",
     "_get_circuit_breaker",
+    "_get_concurrency_limiter",
+    "_get_latency_tracker",
+    "_latency_trackers",
     "get_default_llm",
     "get_default_model_for_tier",
     "get_llm",
     "get_model_tier",
+    "get_response_cache",
     "list_supported_providers",
+    "llm_priority",
     "resolve_model_for_tier",
+    "retry_delay",
+    "set_llm_priority",
 ]
@@ -1,20 +1,32 @@
 """Circuit breaker pattern for LLM providers."""
 
 import logging
+import random
 import time
 from collections.abc import Callable
+from email.utils import parsedate_to_datetime
 
 logger = logging.getLogger(__name__)
 
 # Retry configuration for resilient LLM calls
 MAX_RETRIES = 3
 RETRY_DELAYS = [1, 2, 4]  # Exponential backoff delays in seconds
+MAX_RETRY_AFTER_SECONDS = 30.0  # Cap on a provider's Retry-After
+
+
+def _record_resilience(event: str) -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_llm_resilience(event)
 
 
 class CircuitBreaker:
     """Simple circuit breaker pattern for LLM providers.
 
     After N consecutive failures, stops trying the provider for a cooldown period.
+    When the cooldown expires the circuit is half-open: one probe call is let
+    through at a time. A successful probe closes the circuit; a failed one
+    reopens it for another cooldown.
     """
 
     def __init__(
@@ -22,6 +34,7 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         cooldown_seconds: int = 60,
         time_func: Callable[[], float] | None = None,
+        probe_timeout_seconds: float = 30.0,
     ):
         """Initialize circuit breaker.
 
@@ -30,18 +43,27 @@ class CircuitBreaker:
             cooldown_seconds: Seconds to wait before allowing retry after circuit opens
             time_func: Callable returning current time in seconds (default: time.time).
                        Inject a mock clock for deterministic testing.
+            probe_timeout_seconds: Seconds after which a half-open probe that never
+                reported back (e.g. it was cancelled) no longer blocks the next one
         """
         self.failure_threshold = failure_threshold
         self.cooldown_seconds = cooldown_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
         self._time_func = time_func or time.time
         self.failure_count = 0
         self.last_failure_time: float | None = None
         self.circuit_open = False
+        self.half_open = False
+        self._probe_started: float | None = None
 
     def record_success(self) -> None:
         """Record a successful call, resetting failure count."""
+        if self.half_open:
+            logger.info("Circuit breaker probe succeeded, closing circuit")
         self.failure_count = 0
         self.circuit_open = False
+        self.half_open = False
+        self._probe_started = None
         self.last_failure_time = None
 
     def record_failure(self) -> None:
@@ -49,29 +71,83 @@ class CircuitBreaker:
         self.failure_count += 1
         self.last_failure_time = self._time_func()
 
-        if self.failure_count >= self.failure_threshold:
+        if self.half_open or self.failure_count >= self.failure_threshold:
             self.circuit_open = True
+            self.half_open = False
+            self._probe_started = None
+            _record_resilience("circuit_opened")
             logger.warning(
                 f"Circuit breaker opened after {self.failure_count} failures. "
                 f"Will retry after {self.cooldown_seconds}s cooldown."
             )
 
     def can_attempt(self) -> bool:
-        """Check if we can attempt a call (circuit not open or cooldown expired)."""
-        if not self.circuit_open:
-            return True
+        """Check if we can attempt a call.
 
-        if self.last_failure_time is None:
-            return True
-
-        elapsed = self._time_func() - self.last_failure_time
-        if elapsed >= self.cooldown_seconds:
-            logger.info("Circuit breaker cooldown expired, attempting call")
+        True while the circuit is closed, and for one probe at a time while
+        it is half-open (cooldown expired).
+        """
+        if self.circuit_open:
+            if self.last_failure_time is not None:
+                elapsed = self._time_func() - self.last_failure_time
+                if elapsed < self.cooldown_seconds:
+                    return False
+            logger.info("Circuit breaker cooldown expired, allowing a probe call")
             self.circuit_open = False
             self.failure_count = 0
+            self.half_open = True
+            self._probe_started = None
+
+        if not self.half_open:
             return True
 
-        return False
+        now = self._time_func()
+        if (
+            self._probe_started is not None
+            and now - self._probe_started < self.probe_timeout_seconds
+        ):
+            return False  # A probe is already in flight
+        self._probe_started = now
+        _record_resilience("circuit_probe")
+        return True
+
+
+def _retry_after_seconds(error: BaseException | None) -> float | None:
+    """Retry-After advertised by a rate-limited (429) or unavailable (503) response."""
+    if error is None:
+        return None
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, int | float):
+        return float(retry_after)
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if value := headers.get("retry-after-ms"):
+            return float(value) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return float(parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(base_seconds: float, error: BaseException | None = None) -> float:
+    """Seconds to wait before retrying a call that failed with ``error``.
+
+    Honors the provider's Retry-After (capped at MAX_RETRY_AFTER_SECONDS).
+    Otherwise uses ``base_seconds`` with equal jitter (between half and the
+    full delay), so callers that failed together do not retry in lockstep.
+    """
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        _record_resilience("retry_after")
+        return min(max(retry_after, 0.0), MAX_RETRY_AFTER_SECONDS)
+    return base_seconds / 2 + random.uniform(0, base_seconds / 2)
 
 
 # Global circuit breakers per provider
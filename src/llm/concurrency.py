@@ -0,0 +1,252 @@
+"""Adaptive per-provider concurrency limits for LLM calls.
+
+Each provider/model gets an ``AdaptiveConcurrencyLimiter`` that bounds
+how many calls are in flight at once. The limit is adjusted AIMD-style:
+
+- it grows by about one slot per "window" of successful calls, while
+  the limit is actually being used;
+- it is cut multiplicatively when the provider pushes back (429/503),
+  and more gently when recent latency rises well above its long-term
+  average (the provider is queueing our requests).
+
+Calls over the limit wait in a priority queue, so interactive chat is
+served before background work such as scheduled analysis. Callers mark
+their priority with ``llm_priority`` (or ``set_llm_priority`` for the
+rest of a task)::
+
+    with llm_priority(Priority.BACKGROUND):
+        await run_analysis_workflow(...)
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar, Token
+from enum import IntEnum
+
+from src.llm.circuit_breaker import _record_resilience
+
+logger = logging.getLogger(__name__)
+
+# Multiplicative decrease when the provider reports overload
+OVERLOAD_BACKOFF_RATIO = 0.7
+# Multiplicative decrease when latency rises above the long-term average
+LATENCY_BACKOFF_RATIO = 0.9
+# Short-term latency above this multiple of the long-term average counts as queueing
+LATENCY_TOLERANCE = 2.0
+_SHORT_EWMA = 0.3
+_LONG_EWMA = 0.05
+
+
+class Priority(IntEnum):
+    """Queue priority for LLM calls (lower is served first)."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_llm_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.NORMAL)
+
+
+def set_llm_priority(priority: Priority) -> Token[Priority]:
+    """Set the priority of LLM calls for the current async task.
+
+    Args:
+        priority: Queue priority for calls made from this context
+
+    Returns:
+        Token for resetting the priority
+    """
+    return _llm_priority.set(priority)
+
+
+def get_llm_priority() -> Priority:
+    """Priority of LLM calls in the current context."""
+    return _llm_priority.get()
+
+
+def reset_llm_priority(token: Token[Priority]) -> None:
+    """Reset the LLM call priority to its previous value.
+
+    Args:
+        token: Token returned by set_llm_priority
+    """
+    _llm_priority.reset(token)
+
+
+@contextmanager
+def llm_priority(priority: Priority) -> Iterator[None]:
+    """Run LLM calls made in this block (and its tasks) at ``priority``."""
+    token = set_llm_priority(priority)
+    try:
+        yield
+    finally:
+        reset_llm_priority(token)
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an LLM error means the provider is overloaded (429/503)."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status in (429, 503):
+        return True
+    return type(error).__name__ in ("RateLimitError", "ResourceExhausted")
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit with a priority wait queue."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 32,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            name: Provider/model key, used in metrics
+            initial_limit: Concurrent calls allowed before any feedback
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._short_latency: float | None = None
+        self._long_latency: float | None = None
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a slot."""
+        return len(self._waiters)
+
+    def _capacity(self) -> int:
+        return max(int(self.limit), self.min_limit)
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait for a slot; higher-priority waiters are served first."""
+        if self.in_flight < self._capacity() and not self._waiters:
+            self.in_flight += 1
+            self._publish()
+            return
+        priority = get_llm_priority() if priority is None else priority
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), waiter))
+        _record_resilience("concurrency_queued")
+        self._publish()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot just as we were cancelled; hand it on
+                self._release()
+            else:
+                self._waiters = [w for w in self._waiters if w[2] is not waiter]
+                heapq.heapify(self._waiters)
+                self._wake()
+                self._publish()
+            raise
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+        self._publish()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self._capacity():
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def release(self, latency_ms: float | None = None, *, overloaded: bool = False) -> None:
+        """Free a slot and adjust the limit from the call's outcome.
+
+        Args:
+            latency_ms: Latency of a successful call (None for failures)
+            overloaded: The provider rejected the call as overloaded
+        """
+        if overloaded:
+            self._decrease(OVERLOAD_BACKOFF_RATIO)
+            _record_resilience("concurrency_overload")
+            logger.info("%s overloaded, concurrency limit now %.1f", self.name, self.limit)
+        elif latency_ms is not None:
+            self._on_latency(latency_ms)
+        self._release()
+
+    def _on_latency(self, latency_ms: float) -> None:
+        if self._short_latency is None or self._long_latency is None:
+            self._short_latency = self._long_latency = latency_ms
+            return
+        self._short_latency += _SHORT_EWMA * (latency_ms - self._short_latency)
+        self._long_latency += _LONG_EWMA * (latency_ms - self._long_latency)
+        if self._short_latency > LATENCY_TOLERANCE * self._long_latency:
+            self._decrease(LATENCY_BACKOFF_RATIO)
+        elif self.in_flight * 2 >= self.limit:
+            # Only grow while the limit is being used
+            self.limit = min(self.limit + 1 / self.limit, float(self.max_limit))
+
+    def _decrease(self, ratio: float) -> None:
+        self.limit = max(self.limit * ratio, float(self.min_limit))
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of one call.
+
+        Success feeds the call's latency back into the limit; overload
+        errors cut it. Other errors and cancellation just free the slot.
+        """
+        await self.acquire(priority)
+        started = time.perf_counter()
+        latency_ms: float | None = None
+        overloaded = False
+        try:
+            yield
+        except Exception as e:
+            overloaded = is_overload_error(e)
+            raise
+        else:
+            latency_ms = (time.perf_counter() - started) * 1000
+        finally:
+            self.release(latency_ms, overloaded=overloaded)
+
+    def _publish(self) -> None:
+        from src.api.metrics import get_metrics_collector
+
+        get_metrics_collector().record_llm_concurrency(
+            self.name, limit=self.limit, in_flight=self.in_flight, queued=self.queued
+        )
+
+
+# Global limiters per provider/model
+_concurrency_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def _get_concurrency_limiter(provider: str, model: str) -> AdaptiveConcurrencyLimiter | None:
+    """Get or create the limiter for a provider/model (None when disabled)."""
+    from src.settings import get_settings
+
+    settings = get_settings()
+    if not settings.llm_concurrency_enabled:
+        return None
+    key = f"{provider}:{model}"
+    if key not in _concurrency_limiters:
+        _concurrency_limiters[key] = AdaptiveConcurrencyLimiter(
+            key,
+            initial_limit=settings.llm_concurrency_initial_limit,
+            max_limit=settings.llm_concurrency_max_limit,
+        )
+    return _concurrency_limiters[key]
@@ -16,7 +16,7 @@ Environment variables:
 
 import logging
 from functools import lru_cache
-from typing import Any
+from typing import Any, Literal
 
 from langchain_core.language_models import BaseChatModel
 
@@ -26,9 +26,10 @@ from src.settings import get_settings
 logger = logging.getLogger(__name__)
 
 # ─── LLM Instance Cache ──────────────────────────────────────────────────────
-# Cache LLM instances per (provider, model, temperature) to avoid creating
-# new HTTP connections and ResilientLLM wrappers on every request.
-_llm_cache: dict[tuple[str, str, float], BaseChatModel] = {}
+# Cache LLM instances per (provider, model, temperature, response cache mode)
+# to avoid creating new HTTP connections and ResilientLLM wrappers on every
+# request.
+_llm_cache: dict[tuple[str, str, float, str | None], BaseChatModel] = {}
 
 # Provider base URLs
 PROVIDER_BASE_URLS = {
@@ -44,6 +45,7 @@ def get_llm(
     temperature: float | None = None,
     model: str | None = None,
     provider: str | None = None,
+    response_cache: Literal["exact", "semantic"] | None = None,
     **kwargs: Any,
 ) -> BaseChatModel:
     """Get LLM instance based on configured provider.
@@ -52,6 +54,9 @@ def get_llm(
         temperature: Override default temperature
         model: Override default model name (can include provider prefix like "ollama/llama3")
         provider: Override default provider
+        response_cache: Serve repeated temperature-0 calls from the response
+            cache, by exact request or also by similar final user message
+            (see ``src.llm.response_cache``)
         **kwargs: Additional provider-specific arguments
 
     Returns:
@@ -89,8 +94,8 @@ def get_llm(
 
     provider = provider or detected_provider or settings.llm_provider
 
-    # Check cache: reuse LLM instance for same (provider, model, temperature)
-    cache_key = (provider, model_name, temp)
+    # Check cache: reuse LLM instance for same (provider, model, temperature, cache mode)
+    cache_key = (provider, model_name, temp, response_cache)
     if cache_key in _llm_cache and not kwargs:
         return _llm_cache[cache_key]
 
@@ -121,12 +126,14 @@ def get_llm(
             provider=provider,
             fallback_llm=fallback_llm,
             fallback_provider=fallback_provider,
+            response_cache=response_cache,
         )
     else:
         # No fallback, wrap primary with resilience
         llm = ResilientLLM(
             primary_llm=primary_llm,
             provider=provider,
+            response_cache=response_cache,
         )
 
     # Cache for reuse (skip caching if extra kwargs were provided)
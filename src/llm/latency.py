@@ -0,0 +1,82 @@
+"""Rolling per-provider LLM latency, used to time hedged requests.
+
+Each provider/model keeps a window of recent successful call latencies.
+Once it has enough samples, ``ResilientLLM`` uses a high percentile of
+that window as the deadline after which a still-running primary call is
+raced against the fallback provider (a hedged request).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.api.metrics import LatencyHistogram
+
+# Completed calls per window generation, per provider/model
+LATENCY_WINDOW = 200
+# Calls needed before the window's percentiles are trusted
+MIN_LATENCY_SAMPLES = 20
+
+
+def _histogram() -> LatencyHistogram:
+    from src.api.metrics import LatencyHistogram
+
+    return LatencyHistogram()
+
+
+class LatencyTracker:
+    """Recent call latencies for one provider/model.
+
+    Samples go into a ``LatencyHistogram``; once it holds ``window``
+    samples it becomes the previous generation and a new one starts, so
+    percentiles cover the last ``window`` to ``2 * window`` calls.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW, min_samples: int = MIN_LATENCY_SAMPLES):
+        """Initialize the tracker.
+
+        Args:
+            window: Latencies per generation (two generations are kept)
+            min_samples: Samples required before percentile() returns a value
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._current = _histogram()
+        self._previous = _histogram()
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float) -> None:
+        """Add a call latency in milliseconds."""
+        with self._lock:
+            if self._current.count >= self.window:
+                self._previous, self._current = self._current, _histogram()
+            self._current.record(latency_ms)
+
+    @property
+    def count(self) -> int:
+        """Latencies currently in the window."""
+        return self._current.count + self._previous.count
+
+    def percentile(self, q: float) -> float | None:
+        """The q-th percentile (0-100) of the window, or None if too few samples."""
+        combined = _histogram()
+        with self._lock:
+            combined.merge(self._previous)
+            combined.merge(self._current)
+        if combined.count < self.min_samples:
+            return None
+        return combined.percentile(q / 100)
+
+
+# Global latency trackers per provider/model
+_latency_trackers: dict[str, LatencyTracker] = {}
+
+
+def _get_latency_tracker(provider: str, model: str) -> LatencyTracker:
+    """Get or create the latency tracker for a provider/model."""
+    key = f"{provider}:{model}"
+    if key not in _latency_trackers:
+        _latency_trackers[key] = LatencyTracker()
+    return _latency_trackers[key]
@@ -1,22 +1,48 @@
-"""Resilient LLM wrapper with retry and failover logic."""
+"""Resilient LLM wrapper with retry, failover and hedging logic.
+
+Async calls are hedged when a fallback is configured: if the primary
+provider is slower than its recent ``LLM_HEDGE_PERCENTILE`` latency, the
+request is also sent to the fallback and whichever succeeds first wins
+(the other call is cancelled).
+
+Async calls and streams also hold a slot in the provider/model's
+adaptive concurrency limiter (``src.llm.concurrency``) while they run.
+
+When created with ``response_cache``, async calls at temperature 0 are
+served from the response cache (``src.llm.response_cache``) on a hit.
+"""
 
 import asyncio
 import logging
 import time
 from collections.abc import AsyncIterator
-from typing import Any
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any, Literal
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
-from langchain_core.outputs import ChatResult
+from langchain_core.outputs import ChatGeneration, ChatResult
 from pydantic import PrivateAttr
 
-from src.llm.circuit_breaker import MAX_RETRIES, RETRY_DELAYS, _get_circuit_breaker
-from src.llm.usage import _log_usage_async, _publish_llm_activity
+from src.llm.circuit_breaker import (
+    MAX_RETRIES,
+    RETRY_DELAYS,
+    _get_circuit_breaker,
+    _record_resilience,
+    retry_delay,
+)
+from src.llm.concurrency import _get_concurrency_limiter
+from src.llm.latency import LatencyTracker, _get_latency_tracker
+from src.llm.response_cache import CacheRequest, build_cache_request, get_response_cache
+from src.llm.usage import _log_usage_async, _publish_llm_activity, _record_llm_latency
 
 logger = logging.getLogger(__name__)
 
 
+def _model_name(llm: BaseChatModel) -> str:
+    return getattr(llm, "model_name", getattr(llm, "model", "unknown"))
+
+
 class ResilientLLM(BaseChatModel):
     """BaseChatModel wrapper that adds retry and failover logic."""
 
@@ -24,6 +50,7 @@ class ResilientLLM(BaseChatModel):
     provider: str
     fallback_llm: BaseChatModel | None = None
     fallback_provider: str | None = None
+    response_cache: Literal["exact", "semantic"] | None = None
     _circuit_breaker: Any = PrivateAttr()
 
     def model_post_init(self, __context: Any) -> None:
@@ -35,9 +62,27 @@ class ResilientLLM(BaseChatModel):
         return "resilient"
 
     def _get_model_name(self) -> str:
-        return getattr(
-            self.primary_llm, "model_name", getattr(self.primary_llm, "model", "unknown")
-        )
+        return _model_name(self.primary_llm)
+
+    def _concurrency_slot(
+        self, llm: BaseChatModel, provider: str
+    ) -> AbstractAsyncContextManager[None]:
+        """A slot in ``llm``'s provider/model concurrency limiter (no-op when disabled)."""
+        limiter = _get_concurrency_limiter(provider, _model_name(llm))
+        return limiter.slot() if limiter is not None else nullcontext()
+
+    async def _limited_agenerate(
+        self,
+        llm: BaseChatModel,
+        provider: str,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """Call ``llm`` within its provider/model concurrency limit."""
+        async with self._concurrency_slot(llm, provider):
+            return await llm._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
 
     def _generate(
         self,
@@ -71,9 +116,9 @@ class ResilientLLM(BaseChatModel):
                 last_error = e
                 self._circuit_breaker.record_failure()
                 if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_DELAYS[attempt]
+                    delay = retry_delay(RETRY_DELAYS[attempt], e)
                     logger.warning(
-                        "LLM call failed (attempt %d/%d): %s. Retrying in %ds...",
+                        "LLM call failed (attempt %d/%d): %s. Retrying in %.1fs...",
                         attempt + 1,
                         MAX_RETRIES,
                         e,
@@ -105,6 +150,18 @@ class ResilientLLM(BaseChatModel):
             raise last_error
         raise Exception(f"LLM provider {self.provider} failed after retries")
 
+    def _cache_request(
+        self, messages: list[BaseMessage], stop: list[str] | None, kwargs: dict[str, Any]
+    ) -> CacheRequest | None:
+        """Response cache identity of a call, or None when it is not cacheable."""
+        if self.response_cache is None or getattr(self.primary_llm, "temperature", None) != 0:
+            return None
+        from src.settings import get_settings
+
+        if not get_settings().llm_response_cache_enabled:
+            return None
+        return build_cache_request(self._get_model_name(), 0.0, messages, {"stop": stop, **kwargs})
+
     async def _agenerate(
         self,
         messages: list[BaseMessage],
@@ -112,7 +169,38 @@ class ResilientLLM(BaseChatModel):
         run_manager: Any = None,
         **kwargs: Any,
     ) -> ChatResult:
-        """Async generate with retry, failover, and usage logging."""
+        """Async generate with response caching, retry, hedging, failover, and usage logging."""
+        cache_request = self._cache_request(messages, stop, kwargs)
+        if cache_request is not None:
+            cached = get_response_cache().lookup(
+                cache_request, semantic=self.response_cache == "semantic"
+            )
+            if cached is not None:
+                return ChatResult(generations=[ChatGeneration(message=cached)])
+        result, served_by = await self._agenerate_uncached(
+            messages, stop=stop, run_manager=run_manager, **kwargs
+        )
+        # Fallback answers come from a different model; only cache the primary's
+        if (
+            cache_request is not None
+            and served_by == self.provider
+            and len(result.generations) == 1
+        ):
+            get_response_cache().store(cache_request, result.generations[0].message)
+        return result
+
+    async def _agenerate_uncached(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> tuple[ChatResult, str]:
+        """Retry, hedge and fail over one call, logging usage for the result.
+
+        Returns:
+            The result and the provider that produced it
+        """
         start_ms = time.perf_counter()
         _publish_llm_activity("start", self._get_model_name())
         last_error: Exception | None = None
@@ -121,27 +209,17 @@ class ResilientLLM(BaseChatModel):
                 logger.info("Circuit breaker open for %s, skipping attempt", self.provider)
                 break
             try:
-                result = await self.primary_llm._agenerate(
+                result, served_by = await self._agenerate_hedged(
                     messages, stop=stop, run_manager=run_manager, **kwargs
                 )
-                self._circuit_breaker.record_success()
-                latency_ms = int((time.perf_counter() - start_ms) * 1000)
-                if result.generations:
-                    _log_usage_async(
-                        result.generations[0].message,
-                        self.provider,
-                        self._get_model_name(),
-                        latency_ms,
-                    )
-                _publish_llm_activity("end", self._get_model_name(), latency_ms=latency_ms)
-                return result
+                self._record_completion(result, served_by, start_ms)
+                return result, served_by
             except Exception as e:
                 last_error = e
-                self._circuit_breaker.record_failure()
                 if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_DELAYS[attempt]
+                    delay = retry_delay(RETRY_DELAYS[attempt], e)
                     logger.warning(
-                        "LLM call failed (attempt %d/%d): %s. Retrying in %ds...",
+                        "LLM call failed (attempt %d/%d): %s. Retrying in %.1fs...",
                         attempt + 1,
                         MAX_RETRIES,
                         e,
@@ -158,20 +236,17 @@ class ResilientLLM(BaseChatModel):
                     raise last_error
                 raise Exception(f"Both primary ({self.provider}) and fallback providers failed")
             try:
-                result = await self.fallback_llm._agenerate(
-                    messages, stop=stop, run_manager=run_manager, **kwargs
+                result = await self._limited_agenerate(
+                    self.fallback_llm,
+                    self.fallback_provider or "fallback",
+                    messages,
+                    stop=stop,
+                    run_manager=run_manager,
+                    **kwargs,
                 )
                 fallback_cb.record_success()
-                latency_ms = int((time.perf_counter() - start_ms) * 1000)
-                if result.generations:
-                    _log_usage_async(
-                        result.generations[0].message,
-                        self.fallback_provider or "fallback",
-                        self._get_model_name(),
-                        latency_ms,
-                    )
-                _publish_llm_activity("end", self._get_model_name(), latency_ms=latency_ms)
-                return result
+                self._record_completion(result, self.fallback_provider or "fallback", start_ms)
+                return result, self.fallback_provider or "fallback"
             except Exception as e:
                 fallback_cb.record_failure()
                 logger.error("Fallback provider also failed: %s", e)
@@ -182,6 +257,115 @@ class ResilientLLM(BaseChatModel):
             raise last_error
         raise Exception(f"LLM provider {self.provider} failed after retries")
 
+    def _hedge_delay(self, tracker: LatencyTracker) -> float | None:
+        """Seconds to wait for the primary before hedging, or None to not hedge."""
+        if self.fallback_llm is None:
+            return None
+        from src.settings import get_settings
+
+        settings = get_settings()
+        if settings.llm_hedge_percentile <= 0:
+            return None
+        threshold_ms = tracker.percentile(settings.llm_hedge_percentile)
+        if threshold_ms is None:
+            return None
+        return max(threshold_ms, settings.llm_hedge_min_delay_ms) / 1000
+
+    async def _agenerate_hedged(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> tuple[ChatResult, str]:
+        """One primary attempt, raced against the fallback if it runs long.
+
+        Records the outcome on the circuit breakers and the primary's latency
+        tracker. Raises the primary's error if no call succeeded.
+
+        Returns:
+            The result and the provider that produced it
+        """
+        tracker = _get_latency_tracker(self.provider, self._get_model_name())
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(
+            self._limited_agenerate(
+                self.primary_llm,
+                self.provider,
+                messages,
+                stop=stop,
+                run_manager=run_manager,
+                **kwargs,
+            )
+        )
+        hedge: asyncio.Future[ChatResult] | None = None
+        fallback_provider = self.fallback_provider or "fallback"
+        fallback_cb = _get_circuit_breaker(fallback_provider)
+        try:
+            hedge_after = self._hedge_delay(tracker)
+            if hedge_after is not None and self.fallback_llm is not None:
+                await asyncio.wait({primary}, timeout=hedge_after)
+                if not primary.done() and fallback_cb.can_attempt():
+                    logger.info(
+                        "%s slower than %.0fms, hedging to %s",
+                        self.provider,
+                        hedge_after * 1000,
+                        fallback_provider,
+                    )
+                    _record_resilience("hedge_fired")
+                    hedge = asyncio.ensure_future(
+                        self._limited_agenerate(
+                            self.fallback_llm,
+                            fallback_provider,
+                            messages,
+                            stop=stop,
+                            run_manager=run_manager,
+                            **kwargs,
+                        )
+                    )
+                    pending: set[asyncio.Future[ChatResult]] = {primary, hedge}
+                    while pending:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        if hedge in done:
+                            if hedge.exception() is None:
+                                # The primary took at least this long
+                                tracker.record((time.perf_counter() - started) * 1000)
+                                fallback_cb.record_success()
+                                _record_resilience("hedge_won")
+                                return hedge.result(), fallback_provider
+                            fallback_cb.record_failure()
+                            logger.warning("Hedged call to %s failed", fallback_provider)
+                        if primary in done and primary.exception() is None:
+                            _record_resilience("hedge_lost")
+                            break
+                        if primary in done and hedge in pending:
+                            # Primary failed; give the hedge the chance to answer
+                            continue
+            try:
+                result = await primary
+            except Exception:
+                self._circuit_breaker.record_failure()
+                raise
+            tracker.record((time.perf_counter() - started) * 1000)
+            self._circuit_breaker.record_success()
+            return result, self.provider
+        finally:
+            if not primary.done():
+                primary.cancel()
+            if hedge is not None and not hedge.done():
+                hedge.cancel()
+
+    def _record_completion(self, result: ChatResult, provider: str, start_ms: float) -> None:
+        """Log usage, latency and the end activity event for a completed call."""
+        model_name = self._get_model_name()
+        latency_ms = int((time.perf_counter() - start_ms) * 1000)
+        if result.generations:
+            _log_usage_async(result.generations[0].message, provider, model_name, latency_ms)
+        _record_llm_latency(model_name, latency_ms)
+        _publish_llm_activity("end", model_name, latency_ms=latency_ms)
+
     async def _astream(
         self,
         messages: list[BaseMessage],
@@ -200,25 +384,27 @@ class ResilientLLM(BaseChatModel):
                 break
             try:
                 last_chunk = None
-                async for chunk in self.primary_llm._astream(
-                    messages, stop=stop, run_manager=run_manager, **kwargs
-                ):
-                    last_chunk = chunk
-                    yield chunk
+                async with self._concurrency_slot(self.primary_llm, self.provider):
+                    async for chunk in self.primary_llm._astream(
+                        messages, stop=stop, run_manager=run_manager, **kwargs
+                    ):
+                        last_chunk = chunk
+                        yield chunk
                 self._circuit_breaker.record_success()
                 latency_ms = int((time.perf_counter() - start_ms) * 1000)
                 if last_chunk is not None:
                     msg = getattr(last_chunk, "message", last_chunk)
                     _log_usage_async(msg, self.provider, model_name, latency_ms)
+                _record_llm_latency(model_name, latency_ms)
                 _publish_llm_activity("end", model_name, latency_ms=latency_ms)
                 return
             except Exception as e:
                 last_error = e
                 self._circuit_breaker.record_failure()
                 if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_DELAYS[attempt]
+                    delay = retry_delay(RETRY_DELAYS[attempt], e)
                     logger.warning(
-                        "LLM stream failed (attempt %d/%d): %s. Retrying in %ds...",
+                        "LLM stream failed (attempt %d/%d): %s. Retrying in %.1fs...",
                         attempt + 1,
                         MAX_RETRIES,
                         e,
@@ -233,11 +419,14 @@ class ResilientLLM(BaseChatModel):
             if fallback_cb.can_attempt():
                 try:
                     last_chunk = None
-                    async for chunk in self.fallback_llm._astream(
-                        messages, stop=stop, run_manager=run_manager, **kwargs
+                    async with self._concurrency_slot(
+                        self.fallback_llm, self.fallback_provider or "fallback"
                     ):
-                        last_chunk = chunk
-                        yield chunk
+                        async for chunk in self.fallback_llm._astream(
+                            messages, stop=stop, run_manager=run_manager, **kwargs
+                        ):
+                            last_chunk = chunk
+                            yield chunk
                     fallback_cb.record_success()
                     latency_ms = int((time.perf_counter() - start_ms) * 1000)
                     if last_chunk is not None:
@@ -248,6 +437,7 @@ class ResilientLLM(BaseChatModel):
                             model_name,
                             latency_ms,
                         )
+                    _record_llm_latency(model_name, latency_ms)
                     _publish_llm_activity("end", model_name, latency_ms=latency_ms)
                     return
                 except Exception as e:
@@ -0,0 +1,412 @@
+"""Response cache for deterministic LLM calls.
+
+Agents opt in per LLM instance (``get_llm(..., response_cache="exact")``);
+only calls whose primary model runs at temperature 0 are cached.
+
+Lookups are by the exact request: a SHA-256 of the model, temperature,
+normalized messages (whitespace collapsed, tool calls included) and call
+parameters such as ``stop`` and bound tools. With ``"semantic"`` lookup a
+miss also matches cached requests that share everything but the final
+user message, when that message is similar enough
+(``LLM_RESPONSE_CACHE_SEMANTIC_THRESHOLD``, off by default): "turn off
+the kitchen lights" and "turn off the kitchen lights please" share an
+answer. The two messages must use the same content words (filler such
+as "please" or "the" aside), and then score at least the threshold on
+the cosine of word unigram and bigram counts. Both are computed locally
+so a lookup never costs a model call. Word counts alone cannot tell
+"create an automation" from "analyze an automation", hence the content
+word check.
+
+Entries expire after ``LLM_RESPONSE_CACHE_TTL_SECONDS`` and the least
+recently used are evicted beyond ``LLM_RESPONSE_CACHE_MAX_ENTRIES``.
+New entries are written behind to Postgres and loaded back at startup,
+so the cache survives restarts.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import pairwise
+from typing import Any
+
+from langchain_core.messages import BaseMessage, HumanMessage, message_to_dict, messages_from_dict
+
+logger = logging.getLogger(__name__)
+
+# Seconds new entries wait before being written, so bursts share one INSERT
+_FLUSH_DELAY_SECONDS = 1.0
+_WORD_RE = re.compile(r"\w+")
+# Words a semantic match may add or drop without changing the request
+_FILLER_WORDS = frozenset(
+    ["a", "an", "the", "please", "can", "could", "would", "you", "me", "i", "just", "kindly"]
+)
+
+
+def _record_metric(event: str) -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_llm_response_cache(event)
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _normalize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        return _normalize_text(content)
+    if isinstance(content, list):
+        return [_normalize_content(part) for part in content]
+    if isinstance(content, dict):
+        return {k: _normalize_content(v) for k, v in content.items()}
+    return content
+
+
+def _normalize_message(message: BaseMessage) -> dict[str, Any]:
+    normalized: dict[str, Any] = {
+        "type": message.type,
+        "content": _normalize_content(message.content),
+    }
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        normalized["tool_calls"] = [
+            {"name": call["name"], "args": call["args"]} for call in tool_calls
+        ]
+    tool_call_id = getattr(message, "tool_call_id", None)
+    if tool_call_id:
+        normalized["tool_call_id"] = tool_call_id
+    return normalized
+
+
+def _digest(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _term_vector(text: str) -> Counter[str]:
+    words = _WORD_RE.findall(text.lower())
+    terms = Counter(words)
+    terms.update(f"{a} {b}" for a, b in pairwise(words))
+    return terms
+
+
+def _content_words(text: str) -> frozenset[str]:
+    return frozenset(_WORD_RE.findall(text.lower())) - _FILLER_WORDS
+
+
+def _cosine(a: Counter[str], b: Counter[str]) -> float:
+    if not a or not b:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(count * b[term] for term, count in a.items() if term in b)
+    norm = math.sqrt(sum(v * v for v in a.values())) * math.sqrt(sum(v * v for v in b.values()))
+    return dot / norm
+
+
+@dataclass(frozen=True)
+class CacheRequest:
+    """Cache identity of one LLM request."""
+
+    key: str
+    model: str
+    context_key: str | None = None
+    query_text: str | None = None
+
+
+def build_cache_request(
+    model: str,
+    temperature: float,
+    messages: list[BaseMessage],
+    params: dict[str, Any] | None = None,
+) -> CacheRequest:
+    """Build the cache key(s) for a request.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        messages: Request messages
+        params: Call parameters that change the answer (stop, tools, ...)
+
+    Returns:
+        The request's exact key, plus the semantic lookup scope when the
+        request ends with a user message
+    """
+    base = {
+        "model": model,
+        "temperature": temperature,
+        "params": {k: v for k, v in (params or {}).items() if v is not None},
+    }
+    normalized = [_normalize_message(m) for m in messages]
+    key = _digest({**base, "messages": normalized})
+    if not messages or not isinstance(messages[-1], HumanMessage):
+        return CacheRequest(key=key, model=model)
+    query = messages[-1].content
+    return CacheRequest(
+        key=key,
+        model=model,
+        context_key=_digest({**base, "messages": normalized[:-1]}),
+        query_text=query if isinstance(query, str) else json.dumps(query, default=str),
+    )
+
+
+@dataclass
+class _CacheEntry:
+    message: BaseMessage
+    model: str
+    context_key: str | None
+    query_text: str | None
+    created_at: float
+    expires_at: float
+    terms: Counter[str] | None = None
+    content_words: frozenset[str] | None = None
+
+
+class ResponseCache:
+    """In-memory TTL/LRU response cache with Postgres write-behind."""
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        ttl_seconds: float = 3600,
+        semantic_threshold: float = 0.0,
+        persist: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before evicting the least recently used
+            ttl_seconds: How long an entry stays valid
+            semantic_threshold: Minimum similarity for semantic hits (0 disables)
+            persist: Write new entries to Postgres
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.semantic_threshold = semantic_threshold
+        self.persist = persist
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._by_context: dict[str, set[str]] = {}
+        self._pending: list[dict[str, Any]] = []
+        self._flush_task: asyncio.Task[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, request: CacheRequest, *, semantic: bool = False) -> BaseMessage | None:
+        """Find a cached response.
+
+        Args:
+            request: The request to answer
+            semantic: Also match near-identical final user messages
+
+        Returns:
+            A copy of the cached response message, or None on a miss
+        """
+        now = time.time()
+        entry = self._get_live(request.key, now)
+        if entry is not None:
+            _record_metric("hit")
+            return entry.message.model_copy(deep=True)
+        if semantic and self.semantic_threshold > 0 and request.context_key:
+            match = self._similar(request, now)
+            if match is not None:
+                _record_metric("semantic_hit")
+                return match.message.model_copy(deep=True)
+        _record_metric("miss")
+        return None
+
+    def _get_live(self, key: str, now: float) -> _CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _similar(self, request: CacheRequest, now: float) -> _CacheEntry | None:
+        assert request.context_key is not None
+        query_words = _content_words(request.query_text or "")
+        query_terms = _term_vector(request.query_text or "")
+        best_key: str | None = None
+        best_score = self.semantic_threshold
+        for key in list(self._by_context.get(request.context_key, ())):
+            entry = self._get_live(key, now)
+            if entry is None or entry.model != request.model:
+                continue
+            if entry.content_words is None or entry.terms is None:
+                entry.content_words = _content_words(entry.query_text or "")
+                entry.terms = _term_vector(entry.query_text or "")
+            if entry.content_words != query_words:
+                continue
+            score = _cosine(query_terms, entry.terms)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return self._entries[best_key] if best_key is not None else None
+
+    def store(self, request: CacheRequest, message: BaseMessage) -> None:
+        """Cache a response and queue it for persistence."""
+        now = time.time()
+        self._insert(
+            request.key,
+            _CacheEntry(
+                message=message.model_copy(deep=True),
+                model=request.model,
+                context_key=request.context_key,
+                query_text=request.query_text,
+                created_at=now,
+                expires_at=now + self.ttl_seconds,
+            ),
+        )
+        _record_metric("store")
+        if self.persist:
+            self._pending.append(
+                {
+                    "key": request.key,
+                    "model": request.model,
+                    "context_key": request.context_key,
+                    "query_text": request.query_text,
+                    "response": message_to_dict(message),
+                    "created_at": datetime.fromtimestamp(now, UTC),
+                    "expires_at": datetime.fromtimestamp(now + self.ttl_seconds, UTC),
+                }
+            )
+            self._schedule_flush()
+
+    def _insert(self, key: str, entry: _CacheEntry) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        if entry.context_key:
+            self._by_context.setdefault(entry.context_key, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            _record_metric("evict")
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        if entry.context_key and entry.context_key in self._by_context:
+            keys = self._by_context[entry.context_key]
+            keys.discard(key)
+            if not keys:
+                del self._by_context[entry.context_key]
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (persisted rows are kept)."""
+        self._entries.clear()
+        self._by_context.clear()
+
+    def _schedule_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: entries are written by the next flush/close
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> int:
+        await asyncio.sleep(_FLUSH_DELAY_SECONDS)
+        return await self.flush()
+
+    async def flush(self) -> int:
+        """Write pending entries to Postgres.
+
+        Returns:
+            Number of entries written
+        """
+        if not self._pending:
+            return 0
+        rows, self._pending = self._pending, []
+        try:
+            from src.dal.llm_response_cache import LLMResponseCacheRepository
+            from src.storage import get_session
+
+            async with get_session() as session:
+                written = await LLMResponseCacheRepository(session).upsert_many(rows)
+        except asyncio.CancelledError:
+            self._pending[:0] = rows
+            raise
+        except Exception as e:
+            _record_metric("persist_failed")
+            logger.debug("Failed to persist %d LLM cache entries: %s", len(rows), e)
+            return 0
+        _record_metric("persisted")
+        return written
+
+    async def load(self) -> int:
+        """Load unexpired entries from Postgres and prune expired rows.
+
+        Returns:
+            Number of entries loaded
+        """
+        from src.dal.llm_response_cache import LLMResponseCacheRepository
+        from src.storage import get_session
+
+        now = datetime.now(UTC)
+        async with get_session() as session:
+            repo = LLMResponseCacheRepository(session)
+            await repo.delete_expired(now)
+            rows = await repo.list_unexpired(now, limit=self.max_entries)
+        # Oldest first, so the most recent end up most recently used
+        for row in reversed(rows):
+            try:
+                message = messages_from_dict([row.response])[0]
+            except (KeyError, ValueError, TypeError):
+                continue
+            self._insert(
+                row.key,
+                _CacheEntry(
+                    message=message,
+                    model=row.model,
+                    context_key=row.context_key,
+                    query_text=row.query_text,
+                    created_at=row.created_at.timestamp(),
+                    expires_at=row.expires_at.timestamp(),
+                ),
+            )
+        return len(rows)
+
+    async def close(self) -> None:
+        """Cancel the pending flush and write what is still queued."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide LLM response cache."""
+    global _response_cache
+    if _response_cache is None:
+        from src.settings import get_settings
+
+        settings = get_settings()
+        _response_cache = ResponseCache(
+            max_entries=settings.llm_response_cache_max_entries,
+            ttl_seconds=settings.llm_response_cache_ttl_seconds,
+            semantic_threshold=settings.llm_response_cache_semantic_threshold,
+            persist=settings.llm_response_cache_persist,
+        )
+    return _response_cache
+
+
+async def close_response_cache() -> None:
+    """Write queued cache entries (application shutdown)."""
+    global _response_cache
+    if _response_cache is not None:
+        await _response_cache.close()
+        _response_cache = None
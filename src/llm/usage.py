@@ -1,11 +1,18 @@
-"""LLM usage logging and activity publishing."""
+"""LLM usage logging and activity publishing.
+
+Usage records are buffered by a process-wide ``UsageWriter`` and written
+in multi-row batches, instead of one task, session and commit per LLM
+call. The buffer is bounded (new records are dropped when it is full)
+and flushed when it reaches the batch size, on an interval, and on
+application shutdown.
+"""
 
 import asyncio
+import contextlib
 import logging
+from collections import deque
 from typing import Any
 
-from sqlalchemy.exc import SQLAlchemyError
-
 logger = logging.getLogger(__name__)
 
 
@@ -32,12 +39,19 @@ def _publish_llm_activity(event: str, model: str, **extra: Any) -> None:
         )  # Non-critical: never block on activity broadcast
 
 
+def _record_llm_latency(model: str, latency_ms: float) -> None:
+    """Add a completed call's latency to the per-model latency histogram."""
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_latency("llm", model, latency_ms)
+
+
 def _log_usage_async(result: Any, provider: str, model: str, latency_ms: int) -> None:
-    """Log LLM token usage asynchronously (fire-and-forget).
+    """Log LLM token usage asynchronously (buffered).
 
-    Extracts token counts from the LLM response and writes a usage record
-    to the database via the LLMUsageRepository. Non-blocking: errors are
-    logged but do not propagate.
+    Extracts token counts from the LLM response and hands a usage record
+    to the shared UsageWriter, which writes it in the next batch.
+    Non-blocking: errors are logged but do not propagate.
     """
     try:
         # Extract token usage from LangChain response metadata
@@ -79,34 +93,202 @@ def _log_usage_async(result: Any, provider: str, model: str, latency_ms: int) ->
 
         ctx = get_llm_call_context()
 
-        # Fire-and-forget: write to DB
-        # Intentionally not storing task reference - this is fire-and-forget logging
-        asyncio.ensure_future(  # noqa: RUF006
-            _write_usage_record(
-                provider=provider,
-                model=model,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=total_tokens,
-                cost_usd=cost_usd,
-                latency_ms=latency_ms,
-                conversation_id=ctx.conversation_id if ctx else None,
-                agent_role=ctx.agent_role if ctx else None,
-                request_type=ctx.request_type if ctx else "chat",
-            )
+        get_usage_writer().add(
+            {
+                "provider": provider,
+                "model": model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": total_tokens,
+                "cost_usd": cost_usd,
+                "latency_ms": latency_ms,
+                "conversation_id": ctx.conversation_id if ctx else None,
+                "agent_role": ctx.agent_role if ctx else None,
+                "request_type": ctx.request_type if ctx else "chat",
+            }
         )
-    except SQLAlchemyError as e:
+    except Exception as e:
         logger.debug("Failed to log LLM usage: %s", e)
 
 
-async def _write_usage_record(**kwargs: Any) -> None:
-    """Write a usage record to the database. Silently fails."""
-    try:
-        from src.dal.llm_usage import LLMUsageRepository
-        from src.storage import get_session
-
-        async with get_session() as session:
-            repo = LLMUsageRepository(session)
-            await repo.record(**kwargs)
-    except SQLAlchemyError as e:
-        logger.debug("Failed to write usage record: %s", e)
+def _record_metric(event: str, count: int = 1) -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_usage_writer(event, count)
+
+
+class UsageWriter:
+    """Bounded in-process buffer that batches LLM usage inserts.
+
+    ``add`` never blocks or awaits: it appends to the buffer and makes
+    sure a flush loop is running on the current event loop. The loop
+    writes a batch as soon as ``batch_size`` records are pending, or
+    every ``flush_interval`` seconds otherwise. Failed batches are put
+    back at the front of the buffer (within ``max_pending``) and retried
+    on the next flush.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 50,
+        flush_interval: float = 2.0,
+        max_pending: int = 5000,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            batch_size: Records written per INSERT
+            flush_interval: Maximum seconds a record waits in the buffer
+            max_pending: Buffered records before new ones are dropped
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: deque[dict[str, Any]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopping = False
+        self._flush_lock: asyncio.Lock | None = None
+        self.written = 0
+        self.dropped = 0
+        self.failed_batches = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered records."""
+        return len(self._pending)
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Buffer one usage record (keyword arguments of ``LLMUsageRepository.record``).
+
+        Drops the record when the buffer is full.
+        """
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            _record_metric("dropped")
+            return
+        self._pending.append(record)
+        _record_metric("queued")
+        self._ensure_running()
+        if len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _ensure_running(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: records are written by the next flush/close
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._stopping = False
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while not self._stopping:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write all buffered records in batches.
+
+        Returns:
+            Number of records written
+        """
+        if self._flush_lock is None or self._loop is not asyncio.get_running_loop():
+            self._flush_lock = asyncio.Lock()
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                batch = [
+                    self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))
+                ]
+                try:
+                    ok = await self._write(batch)
+                except asyncio.CancelledError:
+                    self._requeue(batch)
+                    raise
+                if not ok:
+                    self._requeue(batch)
+                    break
+                written += len(batch)
+        return written
+
+    async def _write(self, batch: list[dict[str, Any]]) -> bool:
+        try:
+            from src.dal.llm_usage import LLMUsageRepository
+            from src.storage import get_session
+
+            async with get_session() as session:
+                await LLMUsageRepository(session).record_many(batch)
+        except Exception as e:
+            self.failed_batches += 1
+            _record_metric("failed_batches")
+            logger.debug("Failed to write %d usage records: %s", len(batch), e)
+            return False
+        self.written += len(batch)
+        _record_metric("written", len(batch))
+        return True
+
+    def _requeue(self, batch: list[dict[str, Any]]) -> None:
+        room = max(self.max_pending - len(self._pending), 0)
+        keep = batch[:room]
+        self._pending.extendleft(reversed(keep))
+        if len(batch) > room:
+            self.dropped += len(batch) - room
+            _record_metric("dropped", len(batch) - room)
+
+    def stats(self) -> dict[str, int]:
+        """Writer counters for diagnostics."""
+        return {
+            "pending": self.pending,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed_batches": self.failed_batches,
+        }
+
+    async def close(self) -> None:
+        """Stop the flush loop and write what is still buffered.
+
+        The loop is asked to stop rather than cancelled, so a batch being
+        written when shutdown starts is not lost.
+        """
+        if self._task is not None and self._loop is asyncio.get_running_loop():
+            self._stopping = True
+            if self._wakeup is not None:
+                self._wakeup.set()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        await self.flush()
+
+
+_usage_writer: UsageWriter | None = None
+
+
+def get_usage_writer() -> UsageWriter:
+    """Get the process-wide usage writer."""
+    global _usage_writer
+    if _usage_writer is None:
+        from src.settings import get_settings
+
+        settings = get_settings()
+        _usage_writer = UsageWriter(
+            batch_size=settings.llm_usage_batch_size,
+            flush_interval=settings.llm_usage_flush_interval_seconds,
+            max_pending=settings.llm_usage_max_pending,
+        )
+    return _usage_writer
+
+
+async def close_usage_writer() -> None:
+    """Flush buffered usage records (application shutdown)."""
+    global _usage_writer
+    if _usage_writer is not None:
+        await _usage_writer.close()
+        _usage_writer = None
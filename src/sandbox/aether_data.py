@@ -0,0 +1,281 @@
+"""Columnar data handoff between analysts and the sandbox.
+
+Analysts write collected data once as a *bundle* directory: a
+``data.json`` manifest plus one ``.npy`` file per column of every large,
+uniform list of records (e.g. energy ``data_points``). The bundle is
+mounted read-only at ``/workspace/data`` and the same module, mounted at
+``/workspace/aether_data.py``, loads it inside the container with the
+columns memory-mapped, so multi-MB datasets are rebuilt from binary
+arrays instead of being parsed from a Python literal.
+
+The module depends only on the standard library and NumPy so it runs
+unchanged in the sandbox image.
+
+Constitution: Isolation - data is passed through a read-only mount.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+MANIFEST_NAME = "data.json"
+DEFAULT_DATA_DIR = "/workspace/data"
+DATA_DIR_ENV = "AETHER_DATA_DIR"
+
+# Lists shorter than this stay inline in the manifest
+MIN_COLUMNAR_RECORDS = 32
+
+_COLUMNS_KEY = "__columns__"
+
+
+def _column(values: list[Any]) -> tuple[np.ndarray, np.ndarray | None] | None:
+    """Convert one field's values to an array plus an optional null mask.
+
+    Returns None when the values have no lossless columnar form.
+    """
+    present = [v for v in values if v is not None]
+    mask = None if len(present) == len(values) else np.array([v is None for v in values])
+    if not present:
+        return None
+    if all(type(v) is bool for v in present):
+        fill: Any = False
+        dtype: Any = np.bool_
+    elif all(type(v) is int for v in present):
+        fill, dtype = 0, np.int64
+    elif all(type(v) in (int, float) for v in present):
+        fill, dtype = np.nan, np.float64
+    elif all(type(v) is str for v in present):
+        fill, dtype = "", str
+    else:
+        return None
+    if mask is not None:
+        values = [fill if v is None else v for v in values]
+    try:
+        return np.array(values, dtype=dtype), mask
+    except OverflowError:
+        return None
+
+
+def _columnize(records: list[Any]) -> dict[str, tuple[np.ndarray, np.ndarray | None]] | None:
+    """Split a list of same-shaped flat dicts into per-field columns."""
+    if len(records) < MIN_COLUMNAR_RECORDS or not isinstance(records[0], dict):
+        return None
+    fields = list(records[0])
+    if not fields or not all(isinstance(f, str) for f in fields):
+        return None
+    if not all(isinstance(r, dict) and list(r) == fields for r in records):
+        return None
+    columns = {}
+    for field in fields:
+        column = _column([r[field] for r in records])
+        if column is None:
+            return None
+        columns[field] = column
+    return columns
+
+
+def write_bundle(data: Any, directory: Path) -> Path:
+    """Write ``data`` as a columnar bundle.
+
+    Args:
+        data: JSON-compatible data collected by an analyst
+        directory: Bundle directory (created if missing)
+
+    Returns:
+        The bundle directory
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    names = (f"c{i}" for i in itertools.count())
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {str(k): encode(v) for k, v in value.items()}
+        if isinstance(value, list | tuple):
+            columns = _columnize(list(value))
+            if columns is None:
+                return [encode(v) for v in value]
+            name = next(names)
+            nullable = []
+            for i, (array, mask) in enumerate(columns.values()):
+                np.save(directory / f"{name}_{i}.npy", array, allow_pickle=False)
+                if mask is not None:
+                    np.save(directory / f"{name}_{i}.mask.npy", mask, allow_pickle=False)
+                    nullable.append(i)
+            return {
+                _COLUMNS_KEY: name,
+                "fields": list(columns),
+                "nullable": nullable,
+                "length": len(value),
+            }
+        return value
+
+    manifest = encode(data)
+    (directory / MANIFEST_NAME).write_text(json.dumps(manifest, default=str))
+    return directory
+
+
+class Records(list[dict[str, Any]]):
+    """List of records backed by (memory-mapped) columns.
+
+    A real ``list`` of plain dicts, so scripts can ``json.dumps`` it,
+    concatenate and slice it like the original data. The row dicts are
+    only built the first time the list itself is used; ``columns``
+    exposes the arrays directly and ``to_frame()`` builds a pandas
+    DataFrame from them, so scripts that stay columnar never pay for the
+    rows. ``columns`` reflect the data as loaded, not later edits to the
+    list.
+    """
+
+    def __init__(
+        self,
+        columns: dict[str, np.ndarray],
+        masks: dict[str, np.ndarray],
+    ) -> None:
+        super().__init__()
+        self.columns = columns
+        self.masks = masks
+        self._materialized = False
+
+    def _materialize(self) -> None:
+        if not self._materialized:
+            self._materialized = True
+            super().extend(self._rows())
+
+    def __radd__(self, other: Any) -> Any:
+        if not isinstance(other, list):
+            return NotImplemented
+        self._materialize()
+        return list.__add__(other, self)
+
+    def _rows(self) -> Iterator[dict[str, Any]]:
+        fields = list(self.columns)
+        values = []
+        for field in fields:
+            column = self.columns[field].tolist()
+            if field in self.masks:
+                column = [
+                    None if null else v
+                    for v, null in zip(column, self.masks[field].tolist(), strict=True)
+                ]
+            values.append(column)
+        return (dict(zip(fields, row, strict=True)) for row in zip(*values, strict=True))
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Copy the records into a plain ``list``."""
+        return list(self)
+
+    def to_frame(self) -> Any:
+        """Build a pandas DataFrame straight from the columns."""
+        import pandas as pd
+
+        data = {}
+        for field, column in self.columns.items():
+            if field in self.masks:
+                series = pd.Series(column, dtype=object if column.dtype.kind in "bU" else None)
+                data[field] = series.mask(self.masks[field])
+            else:
+                data[field] = column
+        return pd.DataFrame(data)
+
+
+def _materializing(name: str) -> Any:
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self: Records, *args: Any, **kwargs: Any) -> Any:
+        self._materialize()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# Every list operation builds the rows first. C code handed a list
+# subclass (json.dumps, list(), pandas) reaches it via __iter__ or __len__.
+for _name in (
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__ge__",
+    "__getitem__",
+    "__gt__",
+    "__iadd__",
+    "__imul__",
+    "__iter__",
+    "__le__",
+    "__len__",
+    "__lt__",
+    "__mul__",
+    "__ne__",
+    "__repr__",
+    "__reversed__",
+    "__rmul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "copy",
+    "count",
+    "extend",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(Records, _name, _materializing(_name))
+del _name
+
+
+def load(path: str | Path | None = None, *, mmap: bool = True) -> Any:
+    """Load a bundle written by ``write_bundle``.
+
+    Args:
+        path: Bundle directory (default: ``$AETHER_DATA_DIR`` or
+            ``/workspace/data``)
+        mmap: Memory-map the column files instead of reading them
+
+    Returns:
+        The original data, with columnar lists returned as ``Records``
+    """
+    root = Path(path or os.environ.get(DATA_DIR_ENV, DEFAULT_DATA_DIR))
+    mmap_mode: Literal["r"] | None = "r" if mmap else None
+    manifest = json.loads((root / MANIFEST_NAME).read_text())
+
+    def decode(value: Any) -> Any:
+        if isinstance(value, list):
+            return [decode(v) for v in value]
+        if not isinstance(value, dict):
+            return value
+        if _COLUMNS_KEY not in value:
+            return {k: decode(v) for k, v in value.items()}
+        name = value[_COLUMNS_KEY]
+        columns = {}
+        masks = {}
+        for i, field in enumerate(value["fields"]):
+            columns[field] = np.load(root / f"{name}_{i}.npy", mmap_mode=mmap_mode)
+            if i in value["nullable"]:
+                masks[field] = np.load(root / f"{name}_{i}.mask.npy", mmap_mode=mmap_mode)
+        return Records(columns, masks)
+
+    return decode(manifest)
+
+
+__all__ = [
+    "DATA_DIR_ENV",
+    "DEFAULT_DATA_DIR",
+    "MANIFEST_NAME",
+    "Records",
+    "load",
+    "write_bundle",
+]
@@ -0,0 +1,413 @@
+"""Warm sandbox worker pool.
+
+Starting a container per script dominates DS-team latency when a
+request runs several scripts. The pool keeps pre-started workers
+(``src/sandbox/worker.py`` inside a container, or a local subprocess
+stand-in) keyed by everything that shapes the sandbox: image, runtime
+(gVisor or plain) and policy arguments. A run reuses an idle worker
+with the same key (hit) or starts one (miss); workers are recycled
+after ``max_runs`` scripts or any run that left processes behind, and
+the pool tops each recently used key back up to ``size`` idle workers
+in the background.
+
+Every worker owns an *exchange* directory: ``data/`` (mounted
+read-only at ``/workspace/data``) and ``output/`` (mounted at
+``/workspace/output``), emptied between runs.
+
+Constitution: Isolation - workers run with the same policy as cold
+containers and each script runs in a fresh forked process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import shutil
+import sys
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT_PATH = Path(__file__).resolve().parent / "worker.py"
+
+# Responses carry full stdout/stderr on a single line
+_STREAM_LIMIT = 64 * 1024 * 1024
+# Extra time granted to the worker beyond the script timeout
+_RESPONSE_GRACE_SECONDS = 10.0
+_READY_TIMEOUT_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class WorkerSpec:
+    """How to start one pooled worker.
+
+    Attributes:
+        key: Pool key; only runs with an identical key share workers
+        command: Argv that starts ``worker.py`` speaking the line protocol
+        exchange_dir: Host directory with ``data/`` and ``output/``
+        env: Environment for the worker process (None inherits)
+        stop_command: Optional argv that force-stops the worker (e.g.
+            ``podman rm -f``) when killing the client process is not enough
+    """
+
+    key: str
+    command: list[str]
+    exchange_dir: Path
+    env: dict[str, str] | None = None
+    stop_command: list[str] | None = None
+
+
+SpecFactory = Callable[[], Awaitable[WorkerSpec]]
+
+
+def local_worker_spec(key: str, exchange_dir: Path) -> WorkerSpec:
+    """Spec for an unsandboxed local worker (tests and development).
+
+    Args:
+        key: Pool key
+        exchange_dir: Exchange directory for the worker
+
+    Returns:
+        WorkerSpec running ``worker.py`` with the current interpreter
+    """
+    scratch_dir = exchange_dir / "tmp"
+    scratch_dir.mkdir(parents=True, exist_ok=True)
+    env = {
+        **os.environ,
+        "AETHER_DATA_DIR": str(exchange_dir / "data"),
+        "OUTDIR": str(exchange_dir / "output"),
+        "PYTHONPATH": str(WORKER_SCRIPT_PATH.parent),
+        "TMPDIR": str(scratch_dir),
+    }
+    return WorkerSpec(
+        key=key,
+        command=[
+            sys.executable,
+            "-u",
+            str(WORKER_SCRIPT_PATH),
+            "--scratch-dir",
+            str(scratch_dir),
+        ],
+        exchange_dir=exchange_dir,
+        env=env,
+    )
+
+
+class WorkerError(Exception):
+    """A pooled worker failed to start or answer."""
+
+
+@dataclass
+class SandboxWorker:
+    """One running worker process."""
+
+    spec: WorkerSpec
+    process: asyncio.subprocess.Process
+    runs: int = 0
+    # A run left processes behind; the worker is recycled on release
+    tainted: bool = False
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def key(self) -> str:
+        return self.spec.key
+
+    @property
+    def data_dir(self) -> Path:
+        return self.spec.exchange_dir / "data"
+
+    @property
+    def output_dir(self) -> Path:
+        return self.spec.exchange_dir / "output"
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    @classmethod
+    async def start(cls, spec: WorkerSpec) -> SandboxWorker:
+        """Start the worker process and wait until it reports ready.
+
+        Raises:
+            WorkerError: If the process exits or never becomes ready
+        """
+        for name in ("data", "output"):
+            (spec.exchange_dir / name).mkdir(parents=True, exist_ok=True)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *spec.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=spec.env,
+                limit=_STREAM_LIMIT,
+            )
+        except OSError as e:
+            shutil.rmtree(spec.exchange_dir, ignore_errors=True)
+            raise WorkerError(f"Failed to start sandbox worker: {e}") from e
+
+        worker = cls(spec=spec, process=process)
+        try:
+            line = await asyncio.wait_for(
+                process.stdout.readline(),  # type: ignore[union-attr]
+                timeout=_READY_TIMEOUT_SECONDS,
+            )
+            if not json.loads(line or b"{}").get("ready"):
+                raise WorkerError("Sandbox worker exited before becoming ready")
+        except (TimeoutError, ValueError, WorkerError) as e:
+            await worker.close()
+            if isinstance(e, WorkerError):
+                raise
+            raise WorkerError(f"Sandbox worker did not become ready: {e!s}") from e
+        return worker
+
+    async def execute(
+        self,
+        script: str,
+        timeout: float,
+        env: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Run one script and return the worker's response.
+
+        Raises:
+            WorkerError: If the worker dies or stops answering; the worker
+                is closed and must not be reused
+        """
+        request = {"script": script, "timeout": timeout, "env": env or {}}
+        async with self._lock:
+            try:
+                self.process.stdin.write(json.dumps(request).encode() + b"\n")  # type: ignore[union-attr]
+                await self.process.stdin.drain()  # type: ignore[union-attr]
+                line = await asyncio.wait_for(
+                    self.process.stdout.readline(),  # type: ignore[union-attr]
+                    timeout=timeout + _RESPONSE_GRACE_SECONDS,
+                )
+                if not line:
+                    raise WorkerError("Sandbox worker exited")
+                response: dict[str, Any] = json.loads(line)
+            except (OSError, TimeoutError, ValueError) as e:
+                await self.close()
+                raise WorkerError(f"Sandbox worker failed: {e!s}") from e
+            self.runs += 1
+            if response.get("stray_processes"):
+                self.tainted = True
+            return response
+
+    def reset_exchange(self) -> None:
+        """Empty the data and output directories for the next run."""
+        for directory in (self.data_dir, self.output_dir):
+            for entry in directory.iterdir():
+                if entry.is_dir() and not entry.is_symlink():
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entry.unlink(missing_ok=True)
+
+    async def close(self) -> None:
+        """Stop the worker and remove its exchange directory."""
+        if self.process.returncode is None:
+            with contextlib.suppress(OSError):
+                self.process.stdin.close()  # type: ignore[union-attr]
+            with contextlib.suppress(ProcessLookupError):
+                self.process.kill()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+        if self.spec.stop_command:
+            with contextlib.suppress(OSError, TimeoutError):
+                stop = await asyncio.create_subprocess_exec(
+                    *self.spec.stop_command,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                await asyncio.wait_for(stop.wait(), timeout=10)
+        shutil.rmtree(self.spec.exchange_dir, ignore_errors=True)
+
+
+def _record(event: str) -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_sandbox_pool(event)
+
+
+class SandboxPool:
+    """Policy-keyed pool of warm sandbox workers.
+
+    Usage:
+        pool = SandboxPool(size=2, max_runs=20)
+        worker = await pool.acquire(key, spec_factory)
+        try:
+            response = await worker.execute(script, timeout=30)
+        finally:
+            await pool.release(worker)
+    """
+
+    def __init__(self, size: int = 2, max_runs: int = 20) -> None:
+        """Initialize the pool.
+
+        Args:
+            size: Idle workers kept warm per key (and upper bound on all
+                idle workers across keys)
+            max_runs: Scripts a worker runs before it is recycled
+        """
+        self.size = size
+        self.max_runs = max_runs
+        self._idle: dict[str, list[SandboxWorker]] = {}
+        self._factories: dict[str, SpecFactory] = {}
+        self._starting: dict[str, int] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+
+    def _idle_count(self) -> int:
+        return sum(len(workers) for workers in self._idle.values())
+
+    async def acquire(self, key: str, factory: SpecFactory) -> SandboxWorker:
+        """Take an idle worker for ``key`` or start a new one.
+
+        Args:
+            key: Sandbox configuration key
+            factory: Builds a WorkerSpec for ``key`` (used for misses and
+                background refills)
+
+        Raises:
+            WorkerError: If a new worker cannot be started
+        """
+        self._factories[key] = factory
+        idle = self._idle.get(key, [])
+        while idle:
+            worker = idle.pop()
+            if worker.alive:
+                self.hits += 1
+                _record("hit")
+                self._refill(key)
+                return worker
+            await worker.close()
+
+        self.misses += 1
+        _record("miss")
+        worker = await SandboxWorker.start(await factory())
+        _record("start")
+        self._refill(key)
+        return worker
+
+    async def release(self, worker: SandboxWorker) -> None:
+        """Return a worker after a run, recycling it when spent or tainted."""
+        spent = worker.runs >= self.max_runs or worker.tainted
+        if self._closed or not worker.alive or spent:
+            if spent:
+                self.recycled += 1
+                _record("recycle")
+            await worker.close()
+            self._refill(worker.key)
+            return
+        worker.reset_exchange()
+        await self._park(worker)
+
+    async def _park(self, worker: SandboxWorker) -> None:
+        idle = self._idle.setdefault(worker.key, [])
+        if len(idle) >= self.size:
+            await worker.close()
+            return
+        # Evict idle workers of other keys (policy mismatch) to stay in budget
+        while self._idle_count() >= self.size:
+            other = next((k for k, ws in self._idle.items() if ws and k != worker.key), None)
+            if other is None:
+                break
+            await self._idle[other].pop(0).close()
+        idle.append(worker)
+
+    def _refill(self, key: str) -> None:
+        """Start workers in the background until ``key`` has ``size`` idle."""
+        if self._closed or key not in self._factories:
+            return
+        missing = self.size - len(self._idle.get(key, [])) - self._starting.get(key, 0)
+        for _ in range(max(missing, 0)):
+            self._starting[key] = self._starting.get(key, 0) + 1
+            task = asyncio.create_task(self._prestart(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _prestart(self, key: str) -> None:
+        try:
+            worker = await SandboxWorker.start(await self._factories[key]())
+            _record("start")
+        except Exception as e:
+            logger.warning("Sandbox pool prestart failed for %s: %s", key, e)
+            return
+        finally:
+            self._starting[key] -= 1
+        if self._closed:
+            await worker.close()
+            return
+        await self._park(worker)
+
+    def stats(self) -> dict[str, Any]:
+        """Pool counters for diagnostics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "recycled": self.recycled,
+            "idle": {key: len(workers) for key, workers in self._idle.items() if workers},
+        }
+
+    async def close(self) -> None:
+        """Stop all idle workers and pending prestarts."""
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for workers in self._idle.values():
+            for worker in workers:
+                await worker.close()
+        self._idle.clear()
+
+
+# Singleton, created lazily on the running event loop
+_pool: SandboxPool | None = None
+
+
+def get_sandbox_pool() -> SandboxPool | None:
+    """Get the shared pool, or None when pooling is disabled.
+
+    Pooling is disabled with ``SANDBOX_POOL_SIZE=0``.
+    """
+    global _pool
+    if _pool is None:
+        from src.settings import get_settings
+
+        settings = get_settings()
+        if settings.sandbox_pool_size <= 0:
+            return None
+        _pool = SandboxPool(
+            size=settings.sandbox_pool_size,
+            max_runs=settings.sandbox_pool_max_runs,
+        )
+    return _pool
+
+
+async def close_sandbox_pool() -> None:
+    """Stop the shared pool's workers (application shutdown)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+__all__ = [
+    "WORKER_SCRIPT_PATH",
+    "SandboxPool",
+    "SandboxWorker",
+    "WorkerError",
+    "WorkerSpec",
+    "close_sandbox_pool",
+    "get_sandbox_pool",
+    "local_worker_spec",
+]
@@ -7,9 +7,13 @@ Constitution: Isolation - All analysis scripts run in sandbox.
 """
 
 import asyncio
+import hashlib
 import logging
+import os
+import shutil
 import subprocess  # nosec B404 - sandbox uses subprocess for container execution (Constitution: Isolation)
 import tempfile
+import time
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
@@ -18,6 +22,13 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from src.sandbox.policies import SandboxPolicy, get_default_policy
+from src.sandbox.pool import (
+    WORKER_SCRIPT_PATH,
+    SandboxPool,
+    WorkerError,
+    WorkerSpec,
+    get_sandbox_pool,
+)
 from src.settings import get_settings
 from src.tracing.mlflow_spans import get_active_span, trace_with_uri
 
@@ -27,6 +38,29 @@ logger = logging.getLogger(__name__)
 _STDOUT_ATTR_MAX = 4096  # 4KB
 _STDERR_ATTR_MAX = 2048  # 2KB
 
+# Loader for columnar data bundles, mounted next to the script so any
+# image with NumPy can ``import aether_data``
+_DATA_HELPER_PATH = Path(__file__).resolve().parent / "aether_data.py"
+
+# Host tmpfs used for data bundles when available
+_TMPFS_ROOT = Path("/dev/shm")  # nosec B108
+
+
+def create_data_dir(prefix: str = "aether-data-") -> Path:
+    """Create a private directory for a sandbox data bundle.
+
+    Uses the host tmpfs (``/dev/shm``) when available so bundles never
+    touch disk; falls back to the default temp directory.
+
+    Args:
+        prefix: Directory name prefix
+
+    Returns:
+        Path to the new, empty directory (caller removes it)
+    """
+    root = _TMPFS_ROOT if _TMPFS_ROOT.is_dir() and os.access(_TMPFS_ROOT, os.W_OK) else None
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=root))
+
 
 class SandboxResult(BaseModel):
     """Result of a sandboxed script execution."""
@@ -108,21 +142,29 @@ class SandboxRunner:
     # Fallback image if custom image not available
     FALLBACK_IMAGE = "python:3.11-slim"
 
+    # How long a positive image-exists probe is trusted
+    _IMAGE_CACHE_TTL = 300  # seconds
+
     def __init__(
         self,
         image: str | None = None,
         podman_path: str = "podman",
+        pool: SandboxPool | None = None,
     ) -> None:
         """Initialize the sandbox runner.
 
         Args:
             image: Container image to use (default: python:3.11-slim)
             podman_path: Path to podman executable
+            pool: Optional warm worker pool; runs without a single-file
+                data mount are served by pooled workers when set
         """
         self.image = image or self.DEFAULT_IMAGE
         self.podman_path = podman_path
+        self.pool = pool
         self._gvisor_available: bool | None = None  # Cached check result
         self._build_attempted: bool = False  # Only attempt auto-build once per process
+        self._image_checked_at: float | None = None  # Last positive image probe
 
     @trace_with_uri(name="sandbox.execute", span_type="TOOL")
     async def run(
@@ -158,7 +200,7 @@ class SandboxRunner:
                     "Sandbox MUST be enabled in production (SANDBOX_ENABLED=true). "
                     "Unsandboxed script execution is only permitted in development."
                 )
-            return await self._run_unsandboxed(script, policy)
+            return await self._run_unsandboxed(script, policy, data_path=data_path)
 
         started_at = datetime.now(UTC)
         start_time = asyncio.get_event_loop().time()
@@ -169,6 +211,18 @@ class SandboxRunner:
             policy_enabled=policy.artifacts_enabled,
         )
 
+        # Warm path: bundle directories (or no data) can use a pooled worker
+        if self.pool is not None and (data_path is None or data_path.is_dir()):
+            pooled = await self._run_pooled(
+                script,
+                policy,
+                data_path=data_path,
+                environment=environment,
+                artifacts_active=artifacts_active,
+            )
+            if pooled is not None:
+                return pooled
+
         # Always create an output dir so LLM-generated scripts that write to
         # /workspace/output don't crash on the read-only root filesystem.
         # Artifacts are only collected when both gates are True.
@@ -319,6 +373,28 @@ class SandboxRunner:
 
         return self._gvisor_available
 
+    async def _effective_policy(self, policy: SandboxPolicy) -> SandboxPolicy:
+        """Downgrade a gVisor policy when runsc is unavailable.
+
+        Args:
+            policy: Requested security policy
+
+        Returns:
+            The policy, or a copy with gVisor and seccomp disabled
+        """
+        if policy.use_gvisor and not await self._is_gvisor_available():
+            # Also disable seccomp as it may not be available on all platforms (e.g., macOS)
+            logger.warning(
+                "gVisor (runsc) not available - running with standard container isolation"
+            )
+            return policy.model_copy(
+                update={
+                    "use_gvisor": False,
+                    "seccomp_profile": None,  # Disable seccomp on non-gVisor systems
+                }
+            )
+        return policy
+
     async def _build_command(
         self,
         script_path: Path,
@@ -341,21 +417,7 @@ class SandboxRunner:
         """
         cmd = [self.podman_path, "run", "--rm"]
 
-        # Check if gVisor is available when policy requires it
-        if policy.use_gvisor and not await self._is_gvisor_available():
-            # Create a copy of the policy with gVisor disabled
-            # Also disable seccomp as it may not be available on all platforms (e.g., macOS)
-            import logging
-
-            logging.getLogger(__name__).warning(
-                "gVisor (runsc) not available - running with standard container isolation"
-            )
-            policy = policy.model_copy(
-                update={
-                    "use_gvisor": False,
-                    "seccomp_profile": None,  # Disable seccomp on non-gVisor systems
-                }
-            )
+        policy = await self._effective_policy(policy)
 
         # Add policy args
         cmd.extend(policy.to_podman_args())
@@ -368,9 +430,20 @@ class SandboxRunner:
             ]
         )
 
-        # Mount data if provided — at /workspace/data.json to match the
-        # DS Team system prompt which tells the LLM to read from there.
-        if data_path and data_path.exists():
+        # Mount data if provided. A bundle directory (see aether_data) goes
+        # to /workspace/data with its loader beside the script; a single
+        # file goes to /workspace/data.json to match the DS Team system
+        # prompt which tells the LLM to read from there.
+        if data_path and data_path.is_dir():
+            cmd.extend(
+                [
+                    "--volume",
+                    f"{data_path}:/workspace/data:ro",
+                    "--volume",
+                    f"{_DATA_HELPER_PATH}:/workspace/aether_data.py:ro",
+                ]
+            )
+        elif data_path and data_path.exists():
             cmd.extend(
                 [
                     "--volume",
@@ -478,8 +551,17 @@ class SandboxRunner:
         Returns:
             Available container image name
         """
+        # Trust a recent positive probe instead of spawning podman per run
+        now = time.monotonic()
+        if (
+            self._image_checked_at is not None
+            and now - self._image_checked_at < self._IMAGE_CACHE_TTL
+        ):
+            return self.image
+
         # Check if preferred image already exists
         if await self._image_exists(self.image):
+            self._image_checked_at = now
             return self.image
 
         # Attempt auto-build (once per process lifetime)
@@ -492,6 +574,7 @@ class SandboxRunner:
             )
             if await self._auto_build_image():
                 logger.info("Sandbox image '%s' built successfully.", self.image)
+                self._image_checked_at = time.monotonic()
                 return self.image
             logger.warning("Auto-build of sandbox image failed.")
 
@@ -506,10 +589,160 @@ class SandboxRunner:
         )
         return self.FALLBACK_IMAGE
 
+    # -----------------------------------------------------------------
+    # Warm worker pool
+    # -----------------------------------------------------------------
+
+    @staticmethod
+    def _pool_key(image: str, policy: SandboxPolicy) -> str:
+        """Key identifying workers that can serve ``policy`` on ``image``."""
+        runtime = "gvisor" if policy.use_gvisor else "plain"
+        fingerprint = hashlib.sha256(
+            "\0".join([image, *policy.to_podman_args()]).encode()
+        ).hexdigest()[:16]
+        return f"{policy.name}:{runtime}:{fingerprint}"
+
+    async def _worker_spec(self, key: str, image: str, policy: SandboxPolicy) -> WorkerSpec:
+        """Build the command for a long-lived container running worker.py.
+
+        Mounts mirror ``_build_command``: the exchange ``data/`` is
+        read-only at /workspace/data and ``output/`` is the only writable
+        mount.
+
+        Args:
+            key: Pool key the worker will serve
+            image: Container image
+            policy: Effective security policy
+
+        Returns:
+            WorkerSpec for the pool
+        """
+        exchange_dir = create_data_dir(prefix="aether-pool-")
+        name = f"aether-pool-{uuid.uuid4().hex[:12]}"
+        cmd = [self.podman_path, "run", "--rm", "-i", "--name", name]
+        cmd.extend(policy.to_podman_args())
+        cmd.extend(
+            [
+                "--volume",
+                f"{exchange_dir / 'data'}:/workspace/data:ro",
+                "--volume",
+                f"{exchange_dir / 'output'}:/workspace/output:rw",
+                "--volume",
+                f"{_DATA_HELPER_PATH}:/workspace/aether_data.py:ro",
+                "--volume",
+                f"{WORKER_SCRIPT_PATH}:/workspace/worker.py:ro",
+                "--env",
+                "OUTDIR=/workspace/output",
+                "--env",
+                "PYTHONWARNINGS=ignore::DeprecationWarning",
+                "--env",
+                "MPLCONFIGDIR=/tmp/matplotlib",
+                image,
+                "python",
+                "-u",
+                "/workspace/worker.py",
+                "--scratch-dir",
+                "/tmp",  # nosec B108 - the container's private tmpfs
+            ]
+        )
+        return WorkerSpec(
+            key=key,
+            command=cmd,
+            exchange_dir=exchange_dir,
+            stop_command=[self.podman_path, "rm", "-f", name],
+        )
+
+    async def _run_pooled(
+        self,
+        script: str,
+        policy: SandboxPolicy,
+        *,
+        data_path: Path | None,
+        environment: dict[str, str] | None,
+        artifacts_active: bool,
+    ) -> SandboxResult | None:
+        """Run a script on a warm pooled worker.
+
+        Args:
+            script: Python script content to execute
+            policy: Requested security policy
+            data_path: Optional data bundle directory
+            environment: Optional environment variables
+            artifacts_active: Whether to collect artifacts
+
+        Returns:
+            SandboxResult, or None when no worker could be started (the
+            caller falls back to a cold container)
+        """
+        if self.pool is None:
+            return None
+        started_at = datetime.now(UTC)
+        start_time = asyncio.get_event_loop().time()
+
+        policy = await self._effective_policy(policy)
+        image = await self._get_available_image()
+        key = self._pool_key(image, policy)
+        try:
+            worker = await self.pool.acquire(key, lambda: self._worker_spec(key, image, policy))
+        except WorkerError as e:
+            logger.warning("Sandbox pool unavailable, using a cold container: %s", e)
+            return None
+
+        env = {k: v for k, v in (environment or {}).items() if k.replace("_", "").isalnum()}
+        output_dir: Path | None = None
+        try:
+            if data_path is not None:
+                shutil.copytree(
+                    data_path, worker.data_dir, dirs_exist_ok=True, copy_function=_link_or_copy
+                )
+            response = await worker.execute(script, timeout=policy.timeout_seconds, env=env)
+            if artifacts_active:
+                output_dir = _take_outputs(worker.output_dir)
+        except WorkerError as e:
+            r = SandboxResult(
+                success=False,
+                exit_code=-1,
+                stderr=f"Sandbox error: {e!s}",
+                duration_seconds=asyncio.get_event_loop().time() - start_time,
+                policy_name=policy.name,
+                started_at=started_at,
+                completed_at=datetime.now(UTC),
+            )
+            _set_sandbox_span_attributes(r)
+            return r
+        finally:
+            await self.pool.release(worker)
+
+        artifacts_list: list[Any] = []
+        artifacts_rejected = 0
+        if output_dir is not None:
+            from src.sandbox.artifact_validator import validate_artifacts
+
+            artifacts_list, artifacts_rejected = validate_artifacts(output_dir)
+
+        exit_code = int(response.get("exit_code", -1))
+        timed_out = bool(response.get("timed_out"))
+        result = SandboxResult(
+            success=exit_code == 0 and not timed_out,
+            exit_code=exit_code,
+            stdout=response.get("stdout", ""),
+            stderr=response.get("stderr", ""),
+            duration_seconds=asyncio.get_event_loop().time() - start_time,
+            timed_out=timed_out,
+            policy_name=policy.name,
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+            artifacts=artifacts_list,
+            artifacts_rejected=artifacts_rejected,
+        )
+        _set_sandbox_span_attributes(result)
+        return result
+
     async def _run_unsandboxed(
         self,
         script: str,
         policy: SandboxPolicy,
+        data_path: Path | None = None,
     ) -> SandboxResult:
         """Run script without sandboxing (for development/testing).
 
@@ -519,6 +752,8 @@ class SandboxRunner:
         Args:
             script: Python script to run
             policy: Policy (used for timeout only)
+            data_path: Optional data bundle directory, exposed to the
+                script via ``AETHER_DATA_DIR``
 
         Returns:
             SandboxResult
@@ -536,12 +771,22 @@ class SandboxRunner:
             f.write(script)
             script_path = Path(f.name)
 
+        env = None
+        if data_path and data_path.is_dir():
+            from src.sandbox.aether_data import DATA_DIR_ENV
+
+            pythonpath = os.pathsep.join(
+                p for p in (str(_DATA_HELPER_PATH.parent), os.environ.get("PYTHONPATH")) if p
+            )
+            env = {**os.environ, DATA_DIR_ENV: str(data_path), "PYTHONPATH": pythonpath}
+
         try:
             process = await asyncio.create_subprocess_exec(
                 sys.executable,
                 str(script_path),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                env=env,
             )
 
             try:
@@ -658,6 +903,42 @@ class SandboxRunner:
         return result
 
 
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link a bundle file into a worker exchange dir, copying across devices."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _take_outputs(output_dir: Path) -> Path:
+    """Move a worker's output files into a fresh artifacts directory.
+
+    The worker's output mount is reused, so artifacts are moved out
+    before the next run empties it.
+    """
+    target = Path(tempfile.mkdtemp(prefix="aether-artifacts-"))
+    for entry in output_dir.iterdir():
+        shutil.move(str(entry), target / entry.name)
+    return target
+
+
+# Shared runner so analysts reuse cached runtime probes and the warm pool
+_shared_runner: SandboxRunner | None = None
+
+
+def get_sandbox_runner() -> SandboxRunner:
+    """Get the process-wide SandboxRunner.
+
+    Returns:
+        SandboxRunner attached to the shared warm pool (if enabled)
+    """
+    global _shared_runner
+    if _shared_runner is None:
+        _shared_runner = SandboxRunner(pool=get_sandbox_pool())
+    return _shared_runner
+
+
 # Convenience function
 async def run_script(
     script: str,
@@ -705,6 +986,8 @@ def resolve_artifacts_enabled(
 __all__ = [
     "SandboxResult",
     "SandboxRunner",
+    "create_data_dir",
+    "get_sandbox_runner",
     "resolve_artifacts_enabled",
     "run_script",
 ]
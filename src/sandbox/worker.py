@@ -0,0 +1,285 @@
+"""Long-lived sandbox worker that runs scripts sent over stdin.
+
+Started once per pooled sandbox (inside the container, or as a local
+subprocess stand-in) and kept warm between scripts. The protocol is one
+JSON object per line:
+
+- the worker prints ``{"ready": true}`` once its imports are loaded;
+- each request ``{"script", "timeout", "env"}`` gets one response
+  ``{"exit_code", "stdout", "stderr", "timed_out", "duration_seconds"}``.
+
+Every script runs in a forked child, so interpreter state never leaks
+between runs while the data-science imports preloaded here are shared
+copy-on-write. The worker marks itself non-dumpable, so a script (same
+uid) cannot ptrace it or write its memory to tamper with later runs.
+The child gets /dev/null as stdin, none of the protocol
+pipes, and its own session; after it exits (or times out) the whole
+session is killed, along with any orphan the worker inherited as child
+subreaper, and the ``--scratch-dir`` (``/tmp`` in the container) is
+emptied. Responses report ``stray_processes`` so the pool can recycle
+the worker. Depends only on the standard library so it runs in any
+image.
+
+Constitution: Isolation - scripts still execute inside the sandbox.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from typing import Any
+
+# Imported before the first script so each run starts warm
+PRELOAD_MODULES = ("numpy", "pandas", "scipy", "matplotlib", "matplotlib.pyplot")
+
+SCRIPT_PATH = "/workspace/script.py"
+_POLL_INTERVAL = 0.005
+# prctl options: reparent orphaned descendants to this process, and
+# forbid same-uid ptrace and /proc/<pid>/mem access (inherited on fork)
+_PR_SET_CHILD_SUBREAPER = 36
+_PR_SET_DUMPABLE = 4
+# Kill/recheck passes when clearing processes a script left behind
+_CLEANUP_ROUNDS = 20
+
+
+def _preload() -> None:
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    for name in PRELOAD_MODULES:
+        with contextlib.suppress(Exception):
+            importlib.import_module(name)
+
+
+def _prctl(option: int, value: int) -> None:
+    with contextlib.suppress(OSError, AttributeError):
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.prctl(option, value, 0, 0, 0)
+
+
+def _set_subreaper() -> None:
+    """Adopt orphaned descendants so stray processes can be found and killed."""
+    _prctl(_PR_SET_CHILD_SUBREAPER, 1)
+
+
+def _set_undumpable() -> None:
+    """Keep forked scripts from ptracing the worker or writing its memory."""
+    _prctl(_PR_SET_DUMPABLE, 0)
+
+
+def _live_children() -> list[int]:
+    """PIDs of this process's children that have not exited (Linux /proc)."""
+    me = os.getpid()
+    children = []
+    try:
+        entries = list(Path("/proc").iterdir())
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        try:
+            # "pid (comm) state ppid ..." where comm may contain spaces
+            fields = (entry / "stat").read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        if fields[0] != "Z" and int(fields[1]) == me:
+            children.append(int(entry.name))
+    return children
+
+
+def _reap() -> None:
+    with contextlib.suppress(ChildProcessError):
+        while os.waitpid(-1, os.WNOHANG)[0]:
+            pass
+
+
+def _kill_leftovers(pgid: int) -> int:
+    """Kill everything a run left behind.
+
+    Args:
+        pgid: Session/process group of the run's child
+
+    Returns:
+        Number of processes that were still running after the child
+    """
+    strays = _live_children()
+    with contextlib.suppress(OSError):
+        os.killpg(pgid, signal.SIGKILL)
+    leftover = strays
+    for _ in range(_CLEANUP_ROUNDS):
+        for pid in leftover:
+            with contextlib.suppress(OSError):
+                os.kill(pid, signal.SIGKILL)
+        _reap()
+        leftover = _live_children()
+        if not leftover:
+            break
+        time.sleep(_POLL_INTERVAL)
+    return len(strays)
+
+
+def _wipe(directory: str) -> None:
+    """Remove everything inside ``directory``."""
+    try:
+        entries = list(Path(directory).iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            with contextlib.suppress(OSError):
+                entry.unlink()
+
+
+def _exec_child(
+    script: str,
+    env: dict[str, str],
+    out_fd: int,
+    err_fd: int,
+    close_fds: tuple[int, ...] = (),
+) -> None:
+    """Run the script in the forked child and exit with its status."""
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    for fd in close_fds:
+        with contextlib.suppress(OSError):
+            os.close(fd)
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    sys.stdin = open(0, closefd=False)  # noqa: SIM115
+    sys.stdout = open(1, "w", closefd=False)  # noqa: SIM115
+    sys.stderr = open(2, "w", closefd=False)  # noqa: SIM115
+    os.environ.update(env)
+    sys.argv = [SCRIPT_PATH]
+
+    status = 0
+    try:
+        code = compile(script, SCRIPT_PATH, "exec")
+        exec(code, {"__name__": "__main__", "__file__": SCRIPT_PATH})  # nosec B102
+    except SystemExit as exc:
+        if exc.code is None:
+            status = 0
+        elif isinstance(exc.code, int):
+            status = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            status = 1
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    finally:
+        with contextlib.suppress(Exception):
+            sys.stdout.flush()
+            sys.stderr.flush()
+    os._exit(status & 0xFF)
+
+
+def _read(fd: int) -> str:
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while chunk := os.read(fd, 1 << 16):
+        chunks.append(chunk)
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
+
+def run_script(
+    request: dict[str, Any],
+    *,
+    close_fds: tuple[int, ...] = (),
+    scratch_dir: str | None = None,
+) -> dict[str, Any]:
+    """Execute one request in a forked child and collect its output.
+
+    Args:
+        request: ``{"script", "timeout", "env"}`` protocol request
+        close_fds: Worker descriptors the child must not inherit
+        scratch_dir: Directory emptied after the run
+
+    Returns:
+        Protocol response
+    """
+    timeout = float(request.get("timeout") or 30)
+    env = {str(k): str(v) for k, v in (request.get("env") or {}).items()}
+    start = time.monotonic()
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        pid = os.fork()
+        if pid == 0:
+            _exec_child(request["script"], env, out.fileno(), err.fileno(), close_fds)
+
+        timed_out = False
+        deadline = start + timeout
+        while True:
+            waited, status = os.waitpid(pid, os.WNOHANG)
+            if waited:
+                break
+            if time.monotonic() >= deadline:
+                with contextlib.suppress(OSError):
+                    os.killpg(pid, signal.SIGKILL)
+                _, status = os.waitpid(pid, 0)
+                timed_out = True
+                break
+            time.sleep(_POLL_INTERVAL)
+        strays = _kill_leftovers(pid)
+        if scratch_dir:
+            _wipe(scratch_dir)
+
+        exit_code = 128 + os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+        return {
+            "exit_code": exit_code,
+            "stdout": "" if timed_out else _read(out.fileno()),
+            "stderr": "Execution timed out" if timed_out else _read(err.fileno()),
+            "timed_out": timed_out,
+            "duration_seconds": time.monotonic() - start,
+            "stray_processes": strays,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scratch-dir", help="Directory emptied after every run")
+    args = parser.parse_args()
+
+    _preload()
+    _set_subreaper()
+    _set_undumpable()
+    protocol = os.fdopen(os.dup(1), "w", buffering=1)
+    # Keep stray prints from the worker itself off the protocol stream
+    os.dup2(2, 1)
+    protocol.write(json.dumps({"ready": True}) + "\n")
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            response = run_script(
+                json.loads(line),
+                close_fds=(protocol.fileno(),),
+                scratch_dir=args.scratch_dir,
+            )
+        except Exception as exc:
+            response = {
+                "exit_code": -1,
+                "stdout": "",
+                "stderr": f"Worker error: {exc!s}",
+                "timed_out": False,
+                "duration_seconds": 0.0,
+                "stray_processes": 0,
+            }
+        protocol.write(json.dumps(response) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -114,6 +114,9 @@ class SchedulerService:
         # Schedule nightly data retention cleanup
         self._schedule_data_cleanup(settings)
 
+        # Schedule periodic LLM usage rollups
+        self._schedule_usage_rollup(settings)
+
         logger.info("Scheduler started")
 
     async def stop(self) -> None:
@@ -173,6 +176,23 @@ class SchedulerService:
         )
         logger.info("Nightly data retention cleanup scheduled at 03:30")
 
+    def _schedule_usage_rollup(self, settings: object) -> None:
+        """Register a periodic job folding raw LLM usage into hourly rollups."""
+        if self._scheduler is None or IntervalTrigger is None:
+            return
+
+        interval = getattr(settings, "llm_usage_rollup_interval_minutes", 15)
+
+        self._scheduler.add_job(
+            _execute_usage_rollup,
+            trigger=IntervalTrigger(minutes=interval),
+            id="usage:rollup",
+            replace_existing=True,
+            name="usage:hourly_rollup",
+            misfire_grace_time=300,
+        )
+        logger.info("LLM usage rollup scheduled every %d minutes", interval)
+
     def _schedule_discovery_sync(self, settings: object) -> None:
         """Register a periodic delta sync job if enabled.
 
@@ -304,9 +324,12 @@ async def _execute_scheduled_analysis(schedule_id: str) -> None:
     from src.dal.insight_schedules import InsightScheduleRepository
     from src.graph.workflows import run_analysis_workflow
     from src.jobs import emit_job_agent, emit_job_complete, emit_job_failed, emit_job_start
+    from src.llm.concurrency import Priority, set_llm_priority
     from src.storage import get_session
 
     logger.info("Executing scheduled analysis: %s", schedule_id)
+    # Queue behind interactive chat when a provider is at its concurrency limit
+    set_llm_priority(Priority.BACKGROUND)
 
     async with get_session() as session:
         repo = InsightScheduleRepository(session)
@@ -531,6 +554,20 @@ async def _reconcile_proposal_statuses() -> None:
         logger.warning("Proposal status reconciliation failed", exc_info=True)
 
 
+async def _execute_usage_rollup() -> None:
+    """Fold completed hours of raw LLM usage into ``llm_usage_rollups``."""
+    from src.dal.llm_usage import LLMUsageRepository
+    from src.storage import get_session
+
+    try:
+        async with get_session() as session:
+            rows = await LLMUsageRepository(session).roll_up()
+        if rows:
+            logger.info("LLM usage rollup updated %d hourly buckets", rows)
+    except SQLAlchemyError as e:
+        logger.exception("LLM usage rollup failed: %s", e)
+
+
 async def _execute_data_cleanup() -> None:
     """Delete old records from unbounded tables based on retention settings.
 
@@ -551,12 +588,27 @@ async def _execute_data_cleanup() -> None:
         async with get_session() as session:
             total_deleted = 0
 
-            # LLM usage (high-volume)
-            llm_cutoff = datetime.now(UTC) - timedelta(days=settings.llm_usage_retention_days)
+            # LLM usage (high-volume). Raw rows already folded into rollups
+            # only need to outlive the raw retention window.
+            from src.dal.llm_usage import LLMUsageRepository
             from src.storage.entities.llm_usage import LLMUsage
+            from src.storage.entities.llm_usage_rollup import LLMUsageRollup
+
+            llm_cutoff = datetime.now(UTC) - timedelta(days=settings.llm_usage_retention_days)
+            raw_cutoff = llm_cutoff
+            watermark = await LLMUsageRepository(session).get_rollup_watermark()
+            if watermark is not None:
+                raw_retained = datetime.now(UTC) - timedelta(
+                    days=settings.llm_usage_raw_retention_days
+                )
+                raw_cutoff = max(llm_cutoff, min(raw_retained, watermark))
 
-            result = await session.execute(delete(LLMUsage).where(LLMUsage.created_at < llm_cutoff))
+            result = await session.execute(delete(LLMUsage).where(LLMUsage.created_at < raw_cutoff))
             llm_count = result.rowcount or 0
+            result = await session.execute(
+                delete(LLMUsageRollup).where(LLMUsageRollup.bucket_start < llm_cutoff)
+            )
+            llm_count += result.rowcount or 0
             total_deleted += llm_count
 
             # Analysis reports
@@ -3,6 +3,8 @@
 Provides an in-memory cache over HA's entity, service, and area
 registries. Used by the semantic validator to check entity existence,
 service validity, and area/device existence without repeated API calls.
+Entity lookups are answered from the client's live state mirror when it
+is usable, bypassing the TTL.
 
 Feature 27: YAML Semantic Validation.
 """
@@ -12,6 +14,8 @@ from __future__ import annotations
 import time
 from typing import Any
 
+from src.ha.state_mirror import StateMirror
+
 _DEFAULT_TTL = 600  # 10 minutes
 
 
@@ -47,6 +51,13 @@ class HARegistryCache:
     # Entity methods
     # ------------------------------------------------------------------
 
+    def _mirror(self) -> StateMirror | None:
+        """The client's state mirror, if it can answer entity lookups."""
+        mirror = getattr(self._ha, "state_mirror", None)
+        if isinstance(mirror, StateMirror) and mirror.is_usable():
+            return mirror
+        return None
+
     async def _ensure_entities(self) -> None:
         """Fetch entities if cache is empty or expired."""
         now = time.monotonic()
@@ -59,12 +70,16 @@ class HARegistryCache:
 
     async def entity_exists(self, entity_id: str) -> bool:
         """Check if an entity ID exists in the HA registry."""
+        if (mirror := self._mirror()) is not None:
+            return mirror.get_state(entity_id) is not None
         await self._ensure_entities()
         assert self._entity_ids is not None  # nosec B101 — guaranteed by _ensure_entities
         return entity_id in self._entity_ids
 
     async def get_entity_ids(self, *, domain: str | None = None) -> set[str]:
         """Get all known entity IDs, optionally filtered by domain."""
+        if (mirror := self._mirror()) is not None:
+            return set(mirror.entity_ids(domain=domain))
         await self._ensure_entities()
         assert self._entity_ids is not None  # nosec B101 — guaranteed by _ensure_entities
         if domain is None:
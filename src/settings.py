@@ -114,6 +114,112 @@ class Settings(BaseSettings):
         default=None,
         description="Fallback model name (e.g., 'llama3') when primary is unavailable",
     )
+    llm_hedge_percentile: float = Field(
+        default=95.0,
+        ge=0.0,
+        lt=100.0,
+        description=(
+            "Race the fallback provider once a primary call runs longer than this "
+            "percentile of its recent latency (0 disables hedging)"
+        ),
+    )
+    llm_hedge_min_delay_ms: float = Field(
+        default=1000.0,
+        ge=0.0,
+        le=120000.0,
+        description="Never hedge a primary call earlier than this",
+    )
+
+    # Adaptive per-provider/model LLM concurrency limits
+    llm_concurrency_enabled: bool = Field(
+        default=True,
+        description="Bound concurrent calls per provider/model with an adaptive limit",
+    )
+    llm_concurrency_initial_limit: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Concurrent calls allowed per provider/model before the limit adapts",
+    )
+    llm_concurrency_max_limit: int = Field(
+        default=32,
+        ge=1,
+        le=1024,
+        description="Upper bound the adaptive concurrency limit can grow to",
+    )
+
+    # Response cache for deterministic (temperature 0) LLM calls of opted-in agents
+    llm_response_cache_enabled: bool = Field(
+        default=True,
+        description="Serve repeated deterministic LLM calls from the response cache",
+    )
+    llm_response_cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=1,
+        le=604800,
+        description="How long a cached LLM response stays valid",
+    )
+    llm_response_cache_max_entries: int = Field(
+        default=2000,
+        ge=10,
+        le=100000,
+        description="Cached responses kept in memory (least recently used are evicted)",
+    )
+    llm_response_cache_semantic_threshold: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Minimum similarity for a near-identical final user message with the same "
+            "content words to reuse a cached response, for callers using semantic "
+            "lookup (0 disables)"
+        ),
+    )
+    llm_response_cache_persist: bool = Field(
+        default=True,
+        description="Write cached responses to Postgres and load them at startup",
+    )
+
+    # Local fast-path intent routing ahead of the Orchestrator's LLM classifier
+    intent_router_enabled: bool = Field(
+        default=True,
+        description="Route confidently matched messages without the LLM classifier",
+    )
+    intent_router_confidence_threshold: float = Field(
+        default=0.8,
+        ge=0.5,
+        le=1.0,
+        description="Minimum local routing confidence to skip the LLM classifier",
+    )
+    intent_router_shadow_rate: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Fraction of fast-path routes also classified by the LLM to measure "
+            "fast-path accuracy (the LLM's answer is used for those)"
+        ),
+    )
+
+    # LLM usage recording (buffered, multi-row writes)
+    llm_usage_batch_size: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Usage records written per INSERT; a full batch flushes immediately",
+    )
+    llm_usage_flush_interval_seconds: float = Field(
+        default=2.0,
+        ge=0.1,
+        le=60.0,
+        description="Maximum time a usage record waits in the buffer before being written",
+    )
+    llm_usage_max_pending: int = Field(
+        default=5000,
+        ge=10,
+        le=100000,
+        description="Usage records buffered before new ones are dropped (backpressure)",
+    )
 
     # Google Gemini (separate SDK, not OpenAI-compatible)
     google_api_key: SecretStr = Field(
@@ -130,6 +236,30 @@ class Settings(BaseSettings):
         default="aether",
         description="MLflow experiment name",
     )
+    mlflow_telemetry_flush_interval_seconds: float = Field(
+        default=2.0,
+        ge=0.1,
+        le=60.0,
+        description="Maximum time a metric or param waits in the buffer before export",
+    )
+    mlflow_telemetry_max_pending: int = Field(
+        default=10000,
+        ge=100,
+        le=1000000,
+        description="Metrics/params buffered before new ones are dropped (backpressure)",
+    )
+    mlflow_trace_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of root trace_with_uri spans recorded (head sampling)",
+    )
+    mlflow_trace_slow_ms: float = Field(
+        default=1000.0,
+        ge=0.0,
+        description="Unsampled calls slower than this are still recorded (tail sampling; "
+        "0 = only failed calls)",
+    )
 
     # API
     api_host: str = Field(default="127.0.0.1")
@@ -146,6 +276,25 @@ class Settings(BaseSettings):
         description="API key for authentication (empty = auth disabled)",
     )
 
+    # Activity/job event bus (SSE fan-out and replay)
+    event_bus_backend: Literal["memory", "postgres"] = Field(
+        default="memory",
+        description="'memory' (single process) or 'postgres' (LISTEN/NOTIFY, shared by "
+        "all API workers and A2A services on the same database)",
+    )
+    event_bus_replay_size: int = Field(
+        default=500,
+        ge=0,
+        le=100_000,
+        description="Events kept per topic for Last-Event-ID replay on reconnect",
+    )
+    event_bus_subscriber_backlog: int = Field(
+        default=200,
+        ge=1,
+        le=100_000,
+        description="Undelivered events kept per SSE client before its oldest are dropped",
+    )
+
     # Authentication (JWT + Passkey)
     auth_username: str = Field(
         default="admin",
@@ -291,7 +440,20 @@ class Settings(BaseSettings):
         default=30,
         ge=7,
         le=365,
-        description="Days to keep LLM usage records (high-volume table)",
+        description="Days to keep LLM usage history (hourly rollups, and raw records "
+        "that have not been rolled up)",
+    )
+    llm_usage_raw_retention_days: int = Field(
+        default=7,
+        ge=1,
+        le=365,
+        description="Days to keep raw LLM usage records once they are rolled up",
+    )
+    llm_usage_rollup_interval_minutes: int = Field(
+        default=15,
+        ge=1,
+        le=1440,
+        description="Interval in minutes between LLM usage rollup runs",
     )
 
     # Discovery sync (periodic + webhook-triggered)
@@ -305,6 +467,88 @@ class Settings(BaseSettings):
         le=1440,
         description="Interval in minutes between periodic delta syncs (5 min - 24 h)",
     )
+    discovery_sync_config_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Automation/script configs fetched from HA concurrently during a registry sync",
+    )
+
+    # Entity search (in-process n-gram/BM25 index over discovered entities)
+    entity_search_index_enabled: bool = Field(
+        default=True,
+        description="Rank entity searches with an in-process index instead of Postgres trigrams",
+    )
+    entity_search_index_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        le=86400,
+        description="Seconds the entity search index is reused before it is rebuilt "
+        "(syncs rebuild it immediately)",
+    )
+
+    # Local HA history store (append-only cache for /api/history)
+    ha_history_store_enabled: bool = Field(
+        default=True,
+        description="Serve repeated HA history windows from an in-process store, "
+        "fetching only the missing tail from HA",
+    )
+    ha_history_store_retention_hours: int = Field(
+        default=720,
+        ge=24,
+        le=8760,
+        description="Hours of per-entity history kept in the local store",
+    )
+    ha_state_mirror_enabled: bool = Field(
+        default=True,
+        description="Serve entity reads from an in-memory mirror of HA states kept "
+        "current by the event stream",
+    )
+    ha_state_mirror_max_staleness_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        le=3600,
+        description="Seconds of missed changes tolerated before entity reads fall back to REST",
+    )
+    ha_request_cache_ttl_seconds: float = Field(
+        default=1.0,
+        ge=0,
+        le=60,
+        description="Seconds identical GETs of read-mostly HA endpoints (states, registries, "
+        "services) share one response (0 disables)",
+    )
+    ha_request_cache_max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Total size of cached HA response bodies per zone",
+    )
+    ha_event_stream_compressed: bool = Field(
+        default=True,
+        description="Subscribe to state changes with HA's compressed subscribe_entities "
+        "protocol (falls back to subscribe_events on HA versions without it)",
+    )
+    ha_event_include: str = Field(
+        default="",
+        description="Comma-separated entity_id globs whose state changes are written to the "
+        "DB (a bare domain such as 'light' matches the whole domain; empty = all)",
+    )
+    ha_event_exclude: str = Field(
+        default="",
+        description="Comma-separated entity_id globs whose state changes are never written "
+        "to the DB (takes precedence over includes)",
+    )
+    ha_event_attributes: str = Field(
+        default="",
+        description="Comma-separated attributes whose changes trigger a DB write "
+        "(empty = any attribute; state changes always do)",
+    )
+    ha_logbook_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        le=3600,
+        description="Seconds a parsed logbook snapshot is shared between behavioral "
+        "analysis runs of the same zone (0 disables)",
+    )
 
     # Tool execution timeouts
     tool_timeout_seconds: int = Field(
@@ -319,6 +563,13 @@ class Settings(BaseSettings):
         le=600,
         description="Timeout for long-running analysis tools (DS team, diagnostics)",
     )
+    tool_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Maximum read-only tool calls executed concurrently per LLM turn "
+        "in the streaming dispatcher (1 = sequential)",
+    )
 
     # Sandbox (Constitution: Isolation)
     sandbox_enabled: bool = Field(
@@ -337,6 +588,18 @@ class Settings(BaseSettings):
         "When False, no writable mount is created regardless of per-request settings. "
         "Constitution: default-deny for artifact egress.",
     )
+    sandbox_pool_size: int = Field(
+        default=2,
+        ge=0,
+        le=8,
+        description="Warm sandbox workers kept per policy (0 = start a container per script)",
+    )
+    sandbox_pool_max_runs: int = Field(
+        default=20,
+        ge=1,
+        le=1000,
+        description="Scripts a warm sandbox worker runs before it is recycled",
+    )
 
     # Per-depth analysis timeouts (Feature 33: DS Deep Analysis)
     sandbox_timeout_quick: int = Field(
@@ -8,12 +8,23 @@ graph state snapshots, enabling:
 - State persistence across restarts
 - State recovery after failures
 - Historical state inspection for debugging
+
+Checkpoints are delta-encoded: each ``aput`` stores only the channels
+whose version changed (per ``new_versions``) in ``checkpoint_blobs``,
+keyed by ``(thread_id, checkpoint_ns, channel, version)``. A checkpoint
+row carries just its ``channel_versions`` map, which references the
+blobs for unchanged channels, so each channel version is written once
+however many checkpoints share it. Rows written before delta encoding
+keep their inline ``channel_values`` and are still readable.
 """
 
+import importlib
 from collections.abc import Sequence
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+import orjson
 from langgraph.checkpoint.base import (
     BaseCheckpointSaver,
     ChannelVersions,
@@ -21,14 +32,68 @@ from langgraph.checkpoint.base import (
     CheckpointMetadata,
     CheckpointTuple,
 )
-from pydantic import BaseModel
-from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, delete, select
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    and_,
+    delete,
+    exists,
+    select,
+    tuple_,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.storage.models import Base, TimestampMixin, UUIDMixin
 
+# ``checkpoint_data`` marker for rows whose channel values live in blobs
+DELTA_FORMAT = "delta"
+# Blob type for channels that have a version but no value
+_EMPTY_BLOB = "empty"
+# Key tagging an encoded pydantic model with its import path
+_MODEL_KEY = "__pydantic__"
+
+
+@lru_cache(maxsize=256)
+def _resolve_model(path: str) -> type[BaseModel] | None:
+    """Import a pydantic model class from a ``module:QualName`` path."""
+    module_name, _, qualname = path.partition(":")
+    try:
+        obj: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError):
+        return None
+    return obj if isinstance(obj, type) and issubclass(obj, BaseModel) else None
+
+
+def _revive_models(value: Any) -> Any:
+    """Rebuild pydantic models tagged by ``_serialize_value``.
+
+    Untagged structures pass through unchanged; a model whose class can
+    no longer be imported or validated falls back to its dict form.
+    """
+    if isinstance(value, list):
+        return [_revive_models(item) for item in value]
+    if isinstance(value, dict):
+        if _MODEL_KEY in value:
+            model = _resolve_model(value[_MODEL_KEY])
+            data = value.get("data")
+            if model is None:
+                return data
+            try:
+                return model.model_validate(data)
+            except ValidationError:
+                return data
+        return {key: _revive_models(item) for key, item in value.items()}
+    return value
+
 
 class CheckpointRecord(Base, UUIDMixin, TimestampMixin):
     """SQLAlchemy model for storing LangGraph checkpoints.
@@ -149,11 +214,45 @@ class PendingWrite(Base, UUIDMixin):
     )
 
 
+class CheckpointBlob(Base, UUIDMixin):
+    """One serialized channel value at a specific channel version.
+
+    Shared by every checkpoint whose ``channel_versions`` references the
+    same ``(channel, version)`` in the thread.
+    """
+
+    __tablename__ = "checkpoint_blobs"
+
+    thread_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    checkpoint_ns: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    channel: Mapped[str] = mapped_column(String(255), nullable=False)
+    version: Mapped[str] = mapped_column(String(255), nullable=False)
+    value_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    value_data: Mapped[str] = mapped_column(Text, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_checkpoint_blobs_thread_channel_version",
+            "thread_id",
+            "checkpoint_ns",
+            "channel",
+            "version",
+            unique=True,
+        ),
+    )
+
+
 class CheckpointConfig(BaseModel):
-    """Configuration for the PostgreSQL checkpointer."""
+    """Configuration for the PostgreSQL checkpointer.
+
+    ``cleanup_interval`` amortizes retention: old checkpoints, writes and
+    unreferenced blobs are pruned once every that many steps per thread
+    instead of on every put.
+    """
 
     max_checkpoints_per_thread: int = 100
     cleanup_on_complete: bool = False
+    cleanup_interval: int = 10
 
 
 class PostgresCheckpointer(BaseCheckpointSaver):
@@ -182,6 +281,9 @@ class PostgresCheckpointer(BaseCheckpointSaver):
         super().__init__()
         self.session = session
         self.config = config or CheckpointConfig()
+        # Legacy (inline) checkpoints loaded by this instance; the next put
+        # on top of one writes every channel so no blob reference dangles.
+        self._legacy_parents: set[tuple[str, str, str]] = set()
 
     async def aget_tuple(self, config: dict[str, Any]) -> CheckpointTuple | None:  # type: ignore[override]
         """Get checkpoint tuple for a thread.
@@ -213,6 +315,10 @@ class PostgresCheckpointer(BaseCheckpointSaver):
         if not record:
             return None
 
+        blobs = await self._load_blobs(thread_id, checkpoint_ns, [record])
+        if not self._is_delta(record):
+            self._legacy_parents.add((thread_id, checkpoint_ns, record.checkpoint_id))
+
         # Get pending writes
         writes_query = (
             select(PendingWrite)
@@ -230,38 +336,11 @@ class PostgresCheckpointer(BaseCheckpointSaver):
             for w in writes_result.scalars()
         ]
 
-        return CheckpointTuple(
-            config={
-                "configurable": {
-                    "thread_id": thread_id,
-                    "checkpoint_ns": checkpoint_ns,
-                    "checkpoint_id": record.checkpoint_id,
-                }
-            },
-            checkpoint=Checkpoint(
-                v=1,
-                id=record.checkpoint_id,
-                ts=record.checkpoint_at.isoformat(),
-                channel_values=record.channel_values,
-                channel_versions=record.channel_versions,
-                versions_seen=record.metadata_data.get("versions_seen", {}),  # type: ignore[typeddict-unknown-key]
-                pending_sends=record.metadata_data.get("pending_sends", []),  # type: ignore[typeddict-unknown-key]
-            ),
-            metadata=CheckpointMetadata(
-                source=record.metadata_data.get("source", "update"),
-                step=record.step,
-                writes=record.metadata_data.get("writes"),  # type: ignore[typeddict-unknown-key]
-                parents=record.metadata_data.get("parents", {}),  # type: ignore[typeddict-unknown-key]
-            ),
-            parent_config={
-                "configurable": {
-                    "thread_id": thread_id,
-                    "checkpoint_ns": checkpoint_ns,
-                    "checkpoint_id": record.parent_checkpoint_id,
-                }
-            }
-            if record.parent_checkpoint_id
-            else None,
+        return self._to_tuple(
+            record,
+            thread_id,
+            checkpoint_ns,
+            self._channel_values(record, blobs),
             pending_writes=pending_writes,
         )
 
@@ -275,6 +354,8 @@ class PostgresCheckpointer(BaseCheckpointSaver):
     ) -> list[CheckpointTuple]:
         """List checkpoints for a thread.
 
+        Blobs for every listed checkpoint are fetched in a single query.
+
         Args:
             config: Configuration with thread_id
             filter: Optional metadata filters
@@ -308,45 +389,16 @@ class PostgresCheckpointer(BaseCheckpointSaver):
         result = await self.session.execute(query)
         records = result.scalars().all()
 
-        tuples = []
-        for record in records:
-            tuples.append(
-                CheckpointTuple(
-                    config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": record.checkpoint_id,
-                        }
-                    },
-                    checkpoint=Checkpoint(
-                        v=1,
-                        id=record.checkpoint_id,
-                        ts=record.checkpoint_at.isoformat(),
-                        channel_values=record.channel_values,
-                        channel_versions=record.channel_versions,
-                        versions_seen=record.metadata_data.get("versions_seen", {}),  # type: ignore[typeddict-unknown-key]
-                        pending_sends=record.metadata_data.get("pending_sends", []),  # type: ignore[typeddict-unknown-key]
-                    ),
-                    metadata=CheckpointMetadata(
-                        source=record.metadata_data.get("source", "update"),
-                        step=record.step,
-                        writes=record.metadata_data.get("writes"),  # type: ignore[typeddict-unknown-key]
-                        parents=record.metadata_data.get("parents", {}),  # type: ignore[typeddict-unknown-key]
-                    ),
-                    parent_config={
-                        "configurable": {
-                            "thread_id": thread_id,
-                            "checkpoint_ns": checkpoint_ns,
-                            "checkpoint_id": record.parent_checkpoint_id,
-                        }
-                    }
-                    if record.parent_checkpoint_id
-                    else None,
-                )
+        blobs = await self._load_blobs(thread_id, checkpoint_ns, records)
+        return [
+            self._to_tuple(
+                record,
+                thread_id,
+                checkpoint_ns,
+                self._channel_values(record, blobs),
             )
-
-        return tuples
+            for record in records
+        ]
 
     async def aput(  # type: ignore[override]
         self,
@@ -357,6 +409,9 @@ class PostgresCheckpointer(BaseCheckpointSaver):
     ) -> dict[str, Any]:
         """Save a checkpoint.
 
+        Only channels listed in ``new_versions`` are serialized; unchanged
+        channels are referenced through ``channel_versions``.
+
         Args:
             config: Configuration with thread_id
             checkpoint: Checkpoint data to save
@@ -379,16 +434,27 @@ class PostgresCheckpointer(BaseCheckpointSaver):
             "pending_sends": checkpoint.pending_sends,
         }
 
+        channel_versions = dict(checkpoint.channel_versions)
+        parent_key = (thread_id, checkpoint_ns, parent_checkpoint_id)
+        if parent_checkpoint_id and parent_key in self._legacy_parents:
+            # Unchanged channels of a legacy parent have no blobs yet
+            self._legacy_parents.discard(parent_key)
+            changed = channel_versions
+        else:
+            changed = dict(new_versions)
+
+        await self._put_blobs(thread_id, checkpoint_ns, checkpoint.channel_values, changed)
+
         # Upsert checkpoint
         stmt = insert(CheckpointRecord).values(
             thread_id=thread_id,
             checkpoint_ns=checkpoint_ns,
             checkpoint_id=checkpoint.id,
             parent_checkpoint_id=parent_checkpoint_id,
-            checkpoint_data=checkpoint.channel_values,
+            checkpoint_data={"format": DELTA_FORMAT},
             metadata_data=meta_dict,
-            channel_versions=dict(checkpoint.channel_versions),
-            channel_values=checkpoint.channel_values,
+            channel_versions=channel_versions,
+            channel_values={},
             step=metadata.step,
             checkpoint_at=datetime.fromisoformat(checkpoint.ts),
         )
@@ -407,8 +473,10 @@ class PostgresCheckpointer(BaseCheckpointSaver):
 
         await self.session.execute(stmt)
 
-        # Cleanup old checkpoints if needed
-        await self._cleanup_old_checkpoints(thread_id, checkpoint_ns)
+        # Amortized cleanup: prune once every ``cleanup_interval`` steps
+        interval = max(self.config.cleanup_interval, 1)
+        if metadata.step >= 0 and metadata.step % interval == 0:
+            await self._cleanup_old_checkpoints(thread_id, checkpoint_ns)
 
         return {
             "configurable": {
@@ -426,6 +494,8 @@ class PostgresCheckpointer(BaseCheckpointSaver):
     ) -> None:
         """Save pending writes for a checkpoint.
 
+        All writes are stored with a single multi-row upsert.
+
         Args:
             config: Configuration with thread_id and checkpoint_id
             writes: List of (channel, value) tuples
@@ -435,98 +505,286 @@ class PostgresCheckpointer(BaseCheckpointSaver):
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
         checkpoint_id = config["configurable"]["checkpoint_id"]
 
+        if not writes:
+            return
+
+        rows = []
         for idx, (channel, value) in enumerate(writes):
             value_type, value_data = self._serialize_value(value)
-
-            stmt = insert(PendingWrite).values(
-                thread_id=thread_id,
-                checkpoint_ns=checkpoint_ns,
-                checkpoint_id=checkpoint_id,
-                task_id=task_id,
-                idx=idx,
-                channel=channel,
-                value_type=value_type,
-                value_data=value_data,
+            rows.append(
+                {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                    "task_id": task_id,
+                    "idx": idx,
+                    "channel": channel,
+                    "value_type": value_type,
+                    "value_data": value_data,
+                }
             )
 
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[
-                    "thread_id",
-                    "checkpoint_ns",
-                    "checkpoint_id",
-                    "task_id",
-                    "idx",
-                ],
-                set_={
-                    "channel": stmt.excluded.channel,
-                    "value_type": stmt.excluded.value_type,
-                    "value_data": stmt.excluded.value_data,
-                },
-            )
+        # One multi-row upsert per call instead of one round trip per write
+        stmt = insert(PendingWrite).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                "thread_id",
+                "checkpoint_ns",
+                "checkpoint_id",
+                "task_id",
+                "idx",
+            ],
+            set_={
+                "channel": stmt.excluded.channel,
+                "value_type": stmt.excluded.value_type,
+                "value_data": stmt.excluded.value_data,
+            },
+        )
 
-            await self.session.execute(stmt)
+        await self.session.execute(stmt)
 
-    async def _cleanup_old_checkpoints(
+    async def _put_blobs(
         self,
         thread_id: str,
         checkpoint_ns: str,
+        channel_values: dict[str, Any],
+        versions: dict[str, Any],
     ) -> None:
-        """Remove old checkpoints exceeding the limit.
+        """Store one blob per changed channel in a single insert.
+
+        Blobs are keyed by channel version, so re-putting a version that
+        is already stored is a no-op.
 
         Args:
-            thread_id: Thread to clean up
-            checkpoint_ns: Namespace to clean up
+            thread_id: Thread the blobs belong to
+            checkpoint_ns: Checkpoint namespace
+            channel_values: Current channel values
+            versions: Channel -> version for the channels to store
         """
-        # Get checkpoint IDs to keep
-        keep_query = (
-            select(CheckpointRecord.checkpoint_id)
-            .where(
-                CheckpointRecord.thread_id == thread_id,
-                CheckpointRecord.checkpoint_ns == checkpoint_ns,
+        if not versions:
+            return
+
+        rows = []
+        for channel, version in versions.items():
+            if channel in channel_values:
+                value_type, value_data = self._serialize_value(channel_values[channel])
+            else:
+                value_type, value_data = _EMPTY_BLOB, ""
+            rows.append(
+                {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "channel": channel,
+                    "version": str(version),
+                    "value_type": value_type,
+                    "value_data": value_data,
+                }
             )
-            .order_by(CheckpointRecord.step.desc())
-            .limit(self.config.max_checkpoints_per_thread)
+
+        stmt = insert(CheckpointBlob).values(rows)
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=["thread_id", "checkpoint_ns", "channel", "version"],
         )
+        await self.session.execute(stmt)
 
-        keep_result = await self.session.execute(keep_query)
-        keep_ids = {row[0] for row in keep_result.fetchall()}
+    async def _load_blobs(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        records: Sequence[CheckpointRecord],
+    ) -> dict[tuple[str, str], Any]:
+        """Fetch the blobs referenced by delta-encoded checkpoints.
 
-        if not keep_ids:
-            return
+        Args:
+            thread_id: Thread the checkpoints belong to
+            checkpoint_ns: Checkpoint namespace
+            records: Checkpoint rows to resolve
+
+        Returns:
+            Mapping of (channel, version) to deserialized value; empty
+            channels are omitted
+        """
+        refs = {
+            (channel, str(version))
+            for record in records
+            if self._is_delta(record)
+            for channel, version in record.channel_versions.items()
+        }
+        if not refs:
+            return {}
+
+        query = select(CheckpointBlob).where(
+            CheckpointBlob.thread_id == thread_id,
+            CheckpointBlob.checkpoint_ns == checkpoint_ns,
+            tuple_(CheckpointBlob.channel, CheckpointBlob.version).in_(sorted(refs)),
+        )
+        result = await self.session.execute(query)
+        return {
+            (blob.channel, blob.version): self._deserialize_value(blob.value_type, blob.value_data)
+            for blob in result.scalars()
+            if blob.value_type != _EMPTY_BLOB
+        }
+
+    @staticmethod
+    def _is_delta(record: CheckpointRecord) -> bool:
+        """Whether a checkpoint row stores its values as blob references."""
+        data = record.checkpoint_data
+        return isinstance(data, dict) and data.get("format") == DELTA_FORMAT
+
+    def _channel_values(
+        self,
+        record: CheckpointRecord,
+        blobs: dict[tuple[str, str], Any],
+    ) -> dict[str, Any]:
+        """Reassemble a checkpoint's channel values.
+
+        Args:
+            record: Checkpoint row
+            blobs: Values loaded by ``_load_blobs``
+
+        Returns:
+            Channel -> value mapping
+        """
+        if not self._is_delta(record):
+            return record.channel_values
+        values = {}
+        for channel, version in record.channel_versions.items():
+            key = (channel, str(version))
+            if key in blobs:
+                values[channel] = blobs[key]
+        return values
+
+    @staticmethod
+    def _to_tuple(
+        record: CheckpointRecord,
+        thread_id: str,
+        checkpoint_ns: str,
+        channel_values: dict[str, Any],
+        pending_writes: list[tuple[str, str, Any]] | None = None,
+    ) -> CheckpointTuple:
+        """Build a CheckpointTuple from a row and its channel values."""
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": record.checkpoint_id,
+                }
+            },
+            checkpoint=Checkpoint(
+                v=1,
+                id=record.checkpoint_id,
+                ts=record.checkpoint_at.isoformat(),
+                channel_values=channel_values,
+                channel_versions=record.channel_versions,
+                versions_seen=record.metadata_data.get("versions_seen", {}),  # type: ignore[typeddict-unknown-key]
+                pending_sends=record.metadata_data.get("pending_sends", []),  # type: ignore[typeddict-unknown-key]
+            ),
+            metadata=CheckpointMetadata(
+                source=record.metadata_data.get("source", "update"),
+                step=record.step,
+                writes=record.metadata_data.get("writes"),  # type: ignore[typeddict-unknown-key]
+                parents=record.metadata_data.get("parents", {}),  # type: ignore[typeddict-unknown-key]
+            ),
+            parent_config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": record.parent_checkpoint_id,
+                }
+            }
+            if record.parent_checkpoint_id
+            else None,
+            pending_writes=pending_writes,
+        )
 
-        # Delete old checkpoints
-        delete_query = delete(CheckpointRecord).where(
+    async def _cleanup_old_checkpoints(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+    ) -> None:
+        """Remove old checkpoints exceeding the limit.
+
+        Issues three set-based DELETEs with no round trip to fetch the
+        retained IDs: checkpoints below the retention cutoff step, writes
+        of checkpoints that no longer exist, and blobs no remaining
+        checkpoint references.
+
+        Args:
+            thread_id: Thread to clean up
+            checkpoint_ns: Namespace to clean up
+        """
+        in_thread = and_(
             CheckpointRecord.thread_id == thread_id,
             CheckpointRecord.checkpoint_ns == checkpoint_ns,
-            CheckpointRecord.checkpoint_id.notin_(keep_ids),
         )
-        await self.session.execute(delete_query)
+
+        # Step of the oldest checkpoint to keep
+        cutoff_step = (
+            select(CheckpointRecord.step)
+            .where(in_thread)
+            .order_by(CheckpointRecord.step.desc())
+            .offset(max(self.config.max_checkpoints_per_thread, 1) - 1)
+            .limit(1)
+            .scalar_subquery()
+        )
+        await self.session.execute(
+            delete(CheckpointRecord).where(in_thread, CheckpointRecord.step < cutoff_step)
+        )
 
         # Delete orphaned writes
-        delete_writes = delete(PendingWrite).where(
-            PendingWrite.thread_id == thread_id,
-            PendingWrite.checkpoint_ns == checkpoint_ns,
-            PendingWrite.checkpoint_id.notin_(keep_ids),
+        await self.session.execute(
+            delete(PendingWrite).where(
+                PendingWrite.thread_id == thread_id,
+                PendingWrite.checkpoint_ns == checkpoint_ns,
+                ~exists().where(
+                    in_thread,
+                    CheckpointRecord.checkpoint_id == PendingWrite.checkpoint_id,
+                ),
+            )
+        )
+
+        # Delete blobs no longer referenced by any checkpoint
+        await self.session.execute(
+            delete(CheckpointBlob).where(
+                CheckpointBlob.thread_id == thread_id,
+                CheckpointBlob.checkpoint_ns == checkpoint_ns,
+                ~exists().where(
+                    in_thread,
+                    CheckpointRecord.channel_versions[CheckpointBlob.channel].as_string()
+                    == CheckpointBlob.version,
+                ),
+            )
         )
-        await self.session.execute(delete_writes)
 
     def _serialize_value(self, value: Any) -> tuple[str, str]:
         """Serialize a channel value for storage.
 
+        Values are encoded with orjson. Pydantic models anywhere in the
+        value are tagged with their import path so they round-trip as
+        models; the type is ``pydantic`` when any tag was emitted.
+
         Args:
             value: Value to serialize
 
         Returns:
             Tuple of (type_name, serialized_data)
         """
-        import json
+        has_models = False
+
+        def encode_model(obj: Any) -> Any:
+            nonlocal has_models
+            if isinstance(obj, BaseModel):
+                has_models = True
+                cls = type(obj)
+                return {
+                    _MODEL_KEY: f"{cls.__module__}:{cls.__qualname__}",
+                    "data": obj.model_dump(mode="json"),
+                }
+            raise TypeError(f"Type is not serializable: {type(obj).__name__}")
 
-        if isinstance(value, BaseModel):
-            return ("pydantic", value.model_dump_json())
-        elif isinstance(value, dict | list):
-            return ("json", json.dumps(value))
-        else:
-            return ("json", json.dumps(value))
+        data = orjson.dumps(value, default=encode_model, option=orjson.OPT_NON_STR_KEYS)
+        return ("pydantic" if has_models else "json", data.decode())
 
     def _deserialize_value(self, value_type: str, value_data: str) -> Any:
         """Deserialize a stored channel value.
@@ -536,18 +794,14 @@ class PostgresCheckpointer(BaseCheckpointSaver):
             value_data: Serialized data
 
         Returns:
-            Deserialized value
+            Deserialized value; tagged pydantic models are rebuilt, while
+            untagged values (including rows written before tagging) stay
+            in their JSON form
         """
-        import json
-
-        if value_type == "json":
-            return json.loads(value_data)
-        elif value_type == "pydantic":
-            # Note: For Pydantic, we return the dict form
-            # The graph node should reconstruct if needed
-            return json.loads(value_data)
-        else:
-            return json.loads(value_data)
+        value = orjson.loads(value_data)
+        if value_type == "pydantic":
+            return _revive_models(value)
+        return value
 
     # Sync methods (required by base class but we use async)
     def get_tuple(self, config: dict[str, Any]) -> CheckpointTuple | None:  # type: ignore[override]
@@ -587,6 +841,7 @@ class PostgresCheckpointer(BaseCheckpointSaver):
 
 # Exports
 __all__ = [
+    "CheckpointBlob",
     "CheckpointConfig",
     "CheckpointRecord",
     "PendingWrite",
@@ -39,7 +39,9 @@ _EXPORTS = {
     "InsightType": "src.storage.entities.insight",
     "InsightSchedule": "src.storage.entities.insight_schedule",
     "TriggerType": "src.storage.entities.insight_schedule",
+    "LLMResponseCacheEntry": "src.storage.entities.llm_response_cache",
     "LLMUsage": "src.storage.entities.llm_usage",
+    "LLMUsageRollup": "src.storage.entities.llm_usage_rollup",
     "Message": "src.storage.entities.message",
     "ModelRating": "src.storage.entities.model_rating",
     "JobStatus": "src.storage.entities.optimization_job",
@@ -127,7 +129,9 @@ if TYPE_CHECKING:
         InsightType,
     )
     from src.storage.entities.insight_schedule import InsightSchedule, TriggerType
+    from src.storage.entities.llm_response_cache import LLMResponseCacheEntry
     from src.storage.entities.llm_usage import LLMUsage
+    from src.storage.entities.llm_usage_rollup import LLMUsageRollup
     from src.storage.entities.message import Message
     from src.storage.entities.model_rating import ModelRating
     from src.storage.entities.optimization_job import JobStatus, OptimizationJob
@@ -161,7 +165,9 @@ __all__ = [
     "InsightStatus",
     "InsightType",
     "JobStatus",
+    "LLMResponseCacheEntry",
     "LLMUsage",
+    "LLMUsageRollup",
     "Message",
     "ModelRating",
     "OptimizationJob",
@@ -0,0 +1,50 @@
+"""LLM response cache entity model.
+
+Persisted entries of the deterministic LLM response cache
+(``src.llm.response_cache``), so cached answers survive restarts.
+Entries are loaded into memory at startup; the hot path never reads
+this table.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.storage.models import Base
+
+
+class LLMResponseCacheEntry(Base):
+    """One cached LLM response, keyed by the hash of its request."""
+
+    __tablename__ = "llm_response_cache"
+    __table_args__ = (Index("ix_llm_response_cache_expires_at", "expires_at"),)
+
+    key: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        doc="SHA-256 of model, temperature, normalized messages and call parameters",
+    )
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    context_key: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        doc="Hash of the request without its final user message (semantic lookup scope)",
+    )
+    query_text: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        doc="Final user message, for rebuilding the similarity index",
+    )
+    response: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+        doc="Serialized response message (langchain message_to_dict)",
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<LLMResponseCacheEntry(key={self.key[:12]}, model={self.model!r})>"
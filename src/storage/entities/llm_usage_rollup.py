@@ -0,0 +1,84 @@
+"""LLM usage hourly rollup entity model.
+
+Pre-aggregated ``llm_usage`` totals per hour, provider, model, agent role
+and conversation, so usage reporting reads a bounded number of rows
+regardless of call volume. Maintained by the scheduler's rollup job.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.storage.models import Base, UUIDMixin
+
+
+class LLMUsageRollup(Base, UUIDMixin):
+    """Hourly aggregate of LLM usage for one provider/model/agent/conversation.
+
+    Missing agent roles and conversations are stored as ``""`` so the
+    grouping columns can carry a plain unique index.
+    """
+
+    __tablename__ = "llm_usage_rollups"
+    __table_args__ = (
+        Index(
+            "ix_llm_usage_rollups_bucket_group",
+            "bucket_start",
+            "provider",
+            "model",
+            "agent_role",
+            "conversation_id",
+            unique=True,
+        ),
+        Index("ix_llm_usage_rollups_conversation_id", "conversation_id"),
+    )
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="Start of the hour this row aggregates",
+    )
+    provider: Mapped[str] = mapped_column(String(50), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    agent_role: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        default="",
+        doc="Agent role, or '' when the call had none",
+    )
+    conversation_id: Mapped[str] = mapped_column(
+        String(36),
+        nullable=False,
+        default="",
+        doc="Conversation UUID, or '' for non-conversational calls",
+    )
+
+    calls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    input_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    output_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    cost_usd: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+        doc="Summed cost in USD (calls with unknown pricing count as 0)",
+    )
+    latency_ms_sum: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        doc="Summed latency of calls that reported one",
+    )
+    latency_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Number of calls that reported a latency",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LLMUsageRollup(bucket={self.bucket_start:%Y-%m-%d %H:00}, "
+            f"model={self.model!r}, calls={self.calls})>"
+        )
@@ -28,10 +28,9 @@ async def review_config(
         target: Entity ID or 'all_automations'/'all_scripts'/'all_scenes'
         focus: Focus area: energy, behavioral, efficiency, security
     """
-    from src.graph.workflows import build_review_graph
+    from src.graph.workflows.cache import get_compiled_graph
 
-    graph = build_review_graph()
-    compiled = graph.compile()
+    compiled = get_compiled_graph("review")
 
     initial_state: dict[str, Any] = {
         "targets": [target],
@@ -39,7 +38,7 @@ async def review_config(
     }
 
     try:
-        result = await compiled.ainvoke(initial_state)  # type: ignore[arg-type]
+        result = await compiled.ainvoke(initial_state)
     except Exception:
         logger.exception("Review workflow failed for target=%s", target)
         return f"Error: Review workflow failed for '{target}'. Check logs for details."
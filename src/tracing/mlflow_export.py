@@ -0,0 +1,261 @@
+"""Batched, off-loop export of MLflow metrics and params.
+
+``mlflow.log_metric`` is a blocking round-trip to the tracking server,
+which is too slow for hot paths such as every HA request. ``log_metric``
+and friends instead hand records to a ``TelemetryExporter``: a bounded
+in-memory buffer drained by a daemon thread, which sends them with
+``MlflowClient.log_batch`` (one call per run per flush, plus one for
+params).
+
+The run id and timestamp are captured when a record is submitted, so
+records still land on the run that was active at the call site. When the
+buffer is full, new records are dropped and counted rather than blocking
+the caller. A param can only be set once per run, so params go in their
+own batches (a rejected param never costs metrics) and keys already sent
+for a run are skipped.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from typing import Any, NamedTuple
+
+_logger = logging.getLogger(__name__)
+
+# MlflowClient.log_batch request limits
+_MAX_BATCH_METRICS = 1000
+_MAX_BATCH_PARAMS = 100
+_MAX_PARAM_LENGTH = 6000
+# Runs whose already-sent param keys are remembered
+_MAX_TRACKED_RUNS = 1000
+
+
+class _Record(NamedTuple):
+    run_id: str
+    key: str
+    value: Any
+    timestamp_ms: int
+    step: int | None
+    is_param: bool
+
+
+def _record_metric(event: str, count: int = 1) -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_telemetry(event, count)
+
+
+class TelemetryExporter:
+    """Bounded buffer of metrics/params exported by a background thread."""
+
+    def __init__(self, max_pending: int = 10000, flush_interval: float = 2.0) -> None:
+        """Initialize the exporter.
+
+        Args:
+            max_pending: Records buffered before new ones are dropped
+            flush_interval: Maximum seconds a record waits before export
+        """
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self._pending: deque[_Record] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self._client: Any = None
+        self._sent_params: OrderedDict[str, set[str]] = OrderedDict()
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def submit_metrics(self, run_id: str, metrics: dict[str, float], step: int | None) -> None:
+        """Queue metric values for ``run_id``."""
+        now = int(time.time() * 1000)
+        records = []
+        for key, value in metrics.items():
+            try:
+                records.append(_Record(run_id, key, float(value), now, step, False))
+            except (TypeError, ValueError):
+                _logger.debug("Skipping non-numeric metric %s=%r", key, value)
+        self._submit(records)
+
+    def submit_params(self, run_id: str, params: dict[str, object]) -> None:
+        """Queue params for ``run_id``."""
+        now = int(time.time() * 1000)
+        self._submit(
+            [
+                _Record(run_id, key, str(value)[:_MAX_PARAM_LENGTH], now, None, True)
+                for key, value in params.items()
+            ]
+        )
+
+    def _submit(self, records: list[_Record]) -> None:
+        if not records:
+            return
+        with self._lock:
+            room = max(self.max_pending - len(self._pending), 0)
+            accepted = records[:room]
+            self._pending.extend(accepted)
+            dropped = len(records) - len(accepted)
+            self.dropped += dropped
+            backlog = len(self._pending)
+        if accepted:
+            _record_metric("queued", len(accepted))
+        if dropped:
+            _record_metric("dropped", dropped)
+        self._ensure_running()
+        if backlog >= _MAX_BATCH_METRICS:
+            self._wake.set()
+
+    @property
+    def pending(self) -> int:
+        """Records waiting for export."""
+        return len(self._pending)
+
+    def _ensure_running(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._stopped or (self._thread is not None and self._thread.is_alive()):
+                    return
+                self._thread = threading.Thread(
+                    target=self._run, name="mlflow-telemetry", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """Export everything buffered now (blocking; call off the event loop).
+
+        Returns:
+            Number of records exported
+        """
+        with self._flush_lock:
+            with self._lock:
+                records = list(self._pending)
+                self._pending.clear()
+            if not records:
+                return 0
+
+            by_run: dict[str, list[_Record]] = defaultdict(list)
+            for record in records:
+                by_run[record.run_id].append(record)
+
+            exported = 0
+            for run_id, run_records in by_run.items():
+                exported += self._export_run(run_id, run_records)
+            return exported
+
+    def _export_run(self, run_id: str, records: list[_Record]) -> int:
+        from mlflow.entities import Metric, Param
+
+        metrics = [
+            Metric(r.key, r.value, r.timestamp_ms, r.step or 0) for r in records if not r.is_param
+        ]
+        # A param can only be set once per run; keep the first value
+        sent = self._sent_params.get(run_id, set())
+        params: dict[str, Param] = {}
+        for r in records:
+            if r.is_param and r.key not in sent and r.key not in params:
+                params[r.key] = Param(r.key, r.value)  # type: ignore[no-untyped-call]
+        param_list = list(params.values())
+
+        exported = 0
+        for start in range(0, len(metrics), _MAX_BATCH_METRICS):
+            metric_chunk = metrics[start : start + _MAX_BATCH_METRICS]
+            exported += self._log_batch(run_id, metrics=metric_chunk, params=[])
+        for start in range(0, len(param_list), _MAX_BATCH_PARAMS):
+            param_chunk = param_list[start : start + _MAX_BATCH_PARAMS]
+            sent_count = self._log_batch(run_id, metrics=[], params=param_chunk)
+            if sent_count:
+                exported += sent_count
+                self._remember_params(run_id, [p.key for p in param_chunk])
+        if exported:
+            self.exported += exported
+            _record_metric("exported", exported)
+        return exported
+
+    def _log_batch(self, run_id: str, *, metrics: list[Any], params: list[Any]) -> int:
+        count = len(metrics) + len(params)
+        try:
+            self._get_client().log_batch(run_id, metrics=metrics, params=params)
+        except Exception as e:
+            self.failed += count
+            _record_metric("failed", count)
+            _logger.debug("Failed to export %d MLflow records for run %s: %s", count, run_id, e)
+            return 0
+        return count
+
+    def _remember_params(self, run_id: str, keys: list[str]) -> None:
+        self._sent_params.setdefault(run_id, set()).update(keys)
+        self._sent_params.move_to_end(run_id)
+        while len(self._sent_params) > _MAX_TRACKED_RUNS:
+            self._sent_params.popitem(last=False)
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            from mlflow import MlflowClient
+
+            self._client = MlflowClient()
+        return self._client
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the export thread and export what is still buffered."""
+        self._stopped = True
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    def stats(self) -> dict[str, int]:
+        """Exporter counters for diagnostics."""
+        return {
+            "pending": self.pending,
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+_exporter: TelemetryExporter | None = None
+_exporter_lock = threading.Lock()
+
+
+def get_telemetry_exporter() -> TelemetryExporter:
+    """Get the process-wide telemetry exporter."""
+    global _exporter
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                from src.settings import get_settings
+
+                settings = get_settings()
+                _exporter = TelemetryExporter(
+                    max_pending=settings.mlflow_telemetry_max_pending,
+                    flush_interval=settings.mlflow_telemetry_flush_interval_seconds,
+                )
+                atexit.register(_exporter.close)
+    return _exporter
+
+
+def close_telemetry_exporter() -> None:
+    """Export buffered telemetry and stop the exporter (application shutdown)."""
+    global _exporter
+    with _exporter_lock:
+        exporter, _exporter = _exporter, None
+    if exporter is not None:
+        atexit.unregister(exporter.close)
+        exporter.close()
+
+
+__all__ = ["TelemetryExporter", "close_telemetry_exporter", "get_telemetry_exporter"]
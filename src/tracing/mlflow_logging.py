@@ -1,62 +1,53 @@
-"""MLflow logging: log_param, log_params, log_metric, log_metrics, log_dict."""
+"""MLflow logging: log_param, log_params, log_metric, log_metrics, log_dict.
+
+Params and metrics are queued for batched export by a background thread
+(see ``mlflow_export``), so logging never blocks the caller on the
+tracking server. ``log_dict`` uploads an artifact and stays synchronous.
+"""
 
 import logging
 
+from src.tracing.mlflow_export import get_telemetry_exporter
 from src.tracing.mlflow_init import _safe_import_mlflow
 
 _logger = logging.getLogger(__name__)
 
 
-def log_param(key: str, value: object) -> None:
-    """Log a parameter to the active run."""
+def _active_run_id() -> str | None:
+    """The caller's active run id, or None when there is no run."""
     mlflow = _safe_import_mlflow()
     if mlflow is None:
-        return
-
+        return None
     try:
-        if mlflow.active_run():
-            mlflow.log_param(key, value)
+        run = mlflow.active_run()
     except (AttributeError, RuntimeError, ImportError) as e:
-        _logger.debug("Failed to log param %s: %s", key, e)
+        _logger.debug("Failed to resolve active MLflow run: %s", e)
+        return None
+    return run.info.run_id if run else None
 
 
-def log_params(params: dict[str, object]) -> None:
-    """Log multiple parameters to the active run."""
-    mlflow = _safe_import_mlflow()
-    if mlflow is None:
-        return
+def log_param(key: str, value: object) -> None:
+    """Log a parameter to the active run (queued)."""
+    log_params({key: value})
 
-    try:
-        if mlflow.active_run():
-            mlflow.log_params(params)
-    except (AttributeError, RuntimeError, ImportError) as e:
-        _logger.debug("Failed to log params: %s", e)
 
+def log_params(params: dict[str, object]) -> None:
+    """Log multiple parameters to the active run (queued)."""
+    run_id = _active_run_id()
+    if run_id:
+        get_telemetry_exporter().submit_params(run_id, params)
 
-def log_metric(key: str, value: float, step: int | None = None) -> None:
-    """Log a metric to the active run."""
-    mlflow = _safe_import_mlflow()
-    if mlflow is None:
-        return
 
-    try:
-        if mlflow.active_run():
-            mlflow.log_metric(key, value, step=step)
-    except (AttributeError, RuntimeError, ImportError) as e:
-        _logger.debug("Failed to log metric %s: %s", key, e)
+def log_metric(key: str, value: float, step: int | None = None) -> None:
+    """Log a metric to the active run (queued)."""
+    log_metrics({key: value}, step=step)
 
 
 def log_metrics(metrics: dict[str, float], step: int | None = None) -> None:
-    """Log multiple metrics to the active run."""
-    mlflow = _safe_import_mlflow()
-    if mlflow is None:
-        return
-
-    try:
-        if mlflow.active_run():
-            mlflow.log_metrics(metrics, step=step)
-    except (AttributeError, RuntimeError, ImportError) as e:
-        _logger.debug("Failed to log metrics: %s", e)
+    """Log multiple metrics to the active run (queued)."""
+    run_id = _active_run_id()
+    if run_id:
+        get_telemetry_exporter().submit_metrics(run_id, metrics, step)
 
 
 def log_dict(data: dict[str, object], filename: str) -> None:
@@ -2,6 +2,8 @@
 
 import functools
 import logging
+import random
+import time
 from collections.abc import Callable
 from typing import Any, ParamSpec, TypeVar
 
@@ -51,6 +53,67 @@ def add_span_event(
         _logger.debug("Failed to add span event: %s", e)
 
 
+def _sample_root_span(mlflow: Any) -> bool:
+    """Head sampling: whether a ``trace_with_uri`` call records a span.
+
+    Calls inside an active span always do, so sampled traces stay
+    complete; root calls are kept at ``MLFLOW_TRACE_SAMPLE_RATE``.
+    """
+    from src.settings import get_settings
+
+    rate = get_settings().mlflow_trace_sample_rate
+    if rate >= 1.0:
+        return True
+    try:
+        if mlflow.get_current_active_span() is not None:
+            return True
+    except (AttributeError, RuntimeError):
+        return True
+    return random.random() < rate
+
+
+def _keep_unsampled(duration_ms: float, failed: bool) -> bool:
+    """Tail sampling: whether an unsampled call is recorded after all."""
+    from src.settings import get_settings
+
+    slow_ms = get_settings().mlflow_trace_slow_ms
+    return failed or (slow_ms > 0 and duration_ms >= slow_ms)
+
+
+def _record_span_after(
+    mlflow: Any,
+    name: str,
+    span_type: str,
+    attributes: dict[str, Any] | None,
+    start_ns: int,
+    error: BaseException | None,
+) -> None:
+    """Record a span for an unsampled call that turned out slow or failed."""
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_telemetry("spans_tail_kept")
+    try:
+        span = mlflow.start_span_no_context(
+            name,
+            span_type=span_type,
+            attributes={**(attributes or {}), "aether.sampling": "tail"},
+            start_time_ns=start_ns,
+        )
+        if error is not None:
+            from mlflow.entities import SpanEvent
+
+            span.add_event(SpanEvent.from_exception(error))  # type: ignore[arg-type]
+        span.end(status="ERROR" if error is not None else "OK", end_time_ns=time.time_ns())
+    except (AttributeError, RuntimeError, ImportError, TypeError) as e:
+        _logger.debug("Failed to record tail-sampled span %s: %s", name, e)
+
+
+def _sampled_out() -> None:
+    from src.api.metrics import get_metrics_collector
+
+    get_metrics_collector().record_telemetry("spans_sampled_out")
+
+
 def _is_async(func: Callable[..., Any]) -> bool:
     """Check if a function is async."""
     import asyncio
@@ -138,6 +201,10 @@ def trace_with_uri(
     timing, errors, and custom attributes. If MLflow is unavailable,
     the function runs without tracing.
 
+    Root calls are head-sampled at ``MLFLOW_TRACE_SAMPLE_RATE``; an
+    unsampled call that fails or exceeds ``MLFLOW_TRACE_SLOW_MS`` is
+    recorded afterwards with its real start and end times.
+
     Args:
         name: Span name (defaults to function name)
         span_type: Type of span (CHAIN, TOOL, LLM, RETRIEVER, etc.)
@@ -183,6 +250,18 @@ def trace_with_uri(
             if mlflow is None:
                 return await func(*args, **kwargs)  # type: ignore[misc, no-any-return]
 
+            if not _sample_root_span(mlflow):
+                _sampled_out()
+                start_ns = time.time_ns()
+                try:
+                    result = await func(*args, **kwargs)  # type: ignore[misc]
+                except Exception as e:
+                    _record_span_after(mlflow, span_name, span_type, attributes, start_ns, e)
+                    raise
+                if _keep_unsampled((time.time_ns() - start_ns) / 1e6, failed=False):
+                    _record_span_after(mlflow, span_name, span_type, attributes, start_ns, None)
+                return result  # type: ignore[no-any-return]
+
             try:
                 traced = _get_traced(mlflow)
                 result = await traced(*args, **kwargs)
@@ -202,11 +281,23 @@ def trace_with_uri(
             if mlflow is None:
                 return func(*args, **kwargs)
 
+            if not _sample_root_span(mlflow):
+                _sampled_out()
+                start_ns = time.time_ns()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    _record_span_after(mlflow, span_name, span_type, attributes, start_ns, e)
+                    raise
+                if _keep_unsampled((time.time_ns() - start_ns) / 1e6, failed=False):
+                    _record_span_after(mlflow, span_name, span_type, attributes, start_ns, None)
+                return result
+
             try:
                 traced = _get_traced(mlflow)
                 result = traced(*args, **kwargs)
                 _tag_trace_session(mlflow)
-                return result  # type: ignore[no-any-return]
+                return result
             except (AttributeError, RuntimeError, ImportError) as e:
                 _disable_traces("span creation failed; backend rejected traces")
                 _logger.debug("Span creation failed, running without trace: %s", e)
@@ -292,3 +292,242 @@ class TestToolDispatcher:
         assert order == ["a", "b"]
         tool_starts = [e for e in events if e["type"] == "tool_start"]
         assert len(tool_starts) == 2
+
+
+class TestConcurrentDispatch:
+    """Tests for concurrent read-only tool execution."""
+
+    @staticmethod
+    def _tool(name, fn):
+        tool = MagicMock()
+        tool.name = name
+        tool.ainvoke = fn
+        return tool
+
+    @pytest.mark.asyncio
+    async def test_read_only_tools_run_concurrently(self):
+        """Independent read-only tools should overlap rather than run back to back."""
+        from src.agents.streaming.dispatcher import dispatch_tool_calls
+
+        running = 0
+        peak = 0
+
+        async def slow(args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return f"done {args['n']}"
+
+        tool_calls = [
+            ParsedToolCall(
+                name="get_entity_state", args={"n": i}, id=f"call-{i}", is_mutating=False
+            )
+            for i in range(4)
+        ]
+
+        events = [
+            dict(e)
+            async for e in dispatch_tool_calls(
+                tool_calls=tool_calls,
+                tool_lookup={"get_entity_state": self._tool("get_entity_state", slow)},
+                conversation_id="conv-1",
+                max_concurrency=4,
+            )
+        ]
+
+        assert peak == 4
+        results = events[-1]["tool_results"]
+        assert results == {f"call-{i}": f"done {i}" for i in range(4)}
+
+    @pytest.mark.asyncio
+    async def test_semaphore_bounds_concurrency(self):
+        """No more than max_concurrency tools should run at once."""
+        from src.agents.streaming.dispatcher import dispatch_tool_calls
+
+        running = 0
+        peak = 0
+
+        async def slow(args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return "ok"
+
+        tool_calls = [
+            ParsedToolCall(name="t", args={}, id=f"call-{i}", is_mutating=False) for i in range(5)
+        ]
+
+        async for _ in dispatch_tool_calls(
+            tool_calls=tool_calls,
+            tool_lookup={"t": self._tool("t", slow)},
+            conversation_id="conv-1",
+            max_concurrency=2,
+        ):
+            pass
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_event_order_is_deterministic(self):
+        """tool_start/tool_end follow call order even if later tools finish first."""
+        from src.agents.streaming.dispatcher import dispatch_tool_calls
+
+        async def slow(args):
+            await asyncio.sleep(0.05)
+            return "slow"
+
+        async def fast(args):
+            return "fast"
+
+        tool_calls = [
+            ParsedToolCall(name="slow", args={}, id="call-1", is_mutating=False),
+            ParsedToolCall(name="execute_service", args={}, id="call-2", is_mutating=True),
+            ParsedToolCall(name="fast", args={}, id="call-3", is_mutating=False),
+        ]
+
+        events = [
+            dict(e)
+            async for e in dispatch_tool_calls(
+                tool_calls=tool_calls,
+                tool_lookup={"slow": self._tool("slow", slow), "fast": self._tool("fast", fast)},
+                conversation_id="conv-1",
+                max_concurrency=4,
+            )
+        ]
+
+        sequence = [
+            (e["type"], e["tool"])
+            for e in events
+            if e["type"] in ("tool_start", "tool_end", "approval_required")
+        ]
+        assert sequence == [
+            ("tool_start", "slow"),
+            ("approval_required", "execute_service"),
+            ("tool_start", "fast"),
+            ("tool_end", "slow"),
+            ("tool_end", "fast"),
+        ]
+        assert events[-1]["tool_results"]["call-2"] == "Requires user approval"
+
+    @pytest.mark.asyncio
+    async def test_progress_multiplexed_within_tool_bounds(self):
+        """Each tool's progress appears after its tool_start and before its tool_end."""
+        from src.agents.streaming.dispatcher import dispatch_tool_calls
+
+        def make(agent):
+            async def fn(args):
+                emit_progress("agent_start", agent, "Started")
+                await asyncio.sleep(0.02)
+                emit_progress("agent_end", agent, "Done")
+                return agent
+
+            return fn
+
+        tool_calls = [
+            ParsedToolCall(name="a", args={}, id="call-a", is_mutating=False),
+            ParsedToolCall(name="b", args={}, id="call-b", is_mutating=False),
+        ]
+
+        events = [
+            dict(e)
+            async for e in dispatch_tool_calls(
+                tool_calls=tool_calls,
+                tool_lookup={"a": self._tool("a", make("a")), "b": self._tool("b", make("b"))},
+                conversation_id="conv-1",
+                max_concurrency=2,
+            )
+        ]
+
+        for name in ("a", "b"):
+            start = next(
+                i for i, e in enumerate(events) if e["type"] == "tool_start" and e["tool"] == name
+            )
+            end = next(
+                i for i, e in enumerate(events) if e["type"] == "tool_end" and e["tool"] == name
+            )
+            progress = [
+                i
+                for i, e in enumerate(events)
+                if e["type"].startswith("agent_") and e["agent"] == name
+            ]
+            assert len(progress) == 2
+            assert all(start < i < end for i in progress)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_timeout_and_error(self):
+        """Timeouts and errors in one tool do not affect the others."""
+        from src.agents.streaming.dispatcher import dispatch_tool_calls
+
+        async def hang(args):
+            await asyncio.Event().wait()
+
+        async def fail(args):
+            raise ValueError("boom")
+
+        async def ok(args):
+            return "fine"
+
+        tool_calls = [
+            ParsedToolCall(name="hang", args={}, id="call-1", is_mutating=False),
+            ParsedToolCall(name="fail", args={}, id="call-2", is_mutating=False),
+            ParsedToolCall(name="ok", args={}, id="call-3", is_mutating=False),
+        ]
+
+        with patch("src.agents.streaming.dispatcher.get_settings") as mock_settings:
+            settings = MagicMock()
+            settings.tool_timeout_seconds = 0.1
+            settings.analysis_tool_timeout_seconds = 0.2
+            mock_settings.return_value = settings
+
+            events = [
+                dict(e)
+                async for e in dispatch_tool_calls(
+                    tool_calls=tool_calls,
+                    tool_lookup={
+                        "hang": self._tool("hang", hang),
+                        "fail": self._tool("fail", fail),
+                        "ok": self._tool("ok", ok),
+                    },
+                    conversation_id="conv-1",
+                    max_concurrency=3,
+                )
+            ]
+
+        results = events[-1]["tool_results"]
+        assert "timed out" in results["call-1"]
+        assert results["call-2"] == "Error: boom"
+        assert results["call-3"] == "fine"
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_one_is_sequential(self):
+        """max_concurrency=1 keeps strictly sequential execution."""
+        from src.agents.streaming.dispatcher import dispatch_tool_calls
+
+        running = 0
+        peak = 0
+
+        async def slow(args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "ok"
+
+        tool_calls = [
+            ParsedToolCall(name="t", args={}, id=f"call-{i}", is_mutating=False) for i in range(3)
+        ]
+
+        async for _ in dispatch_tool_calls(
+            tool_calls=tool_calls,
+            tool_lookup={"t": self._tool("t", slow)},
+            conversation_id="conv-1",
+            max_concurrency=1,
+        ):
+            pass
+
+        assert peak == 1
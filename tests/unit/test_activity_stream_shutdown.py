@@ -136,3 +136,19 @@ class TestActivityStreamShutdown:
             items.append(item)  # pragma: no cover
 
         assert items == []
+
+    @pytest.mark.asyncio
+    async def test_subscribe_replays_after_last_event_id(self):
+        """A reconnecting client gets the events it missed, tagged with SSE ids."""
+        from src.api.event_bus import get_event_bus
+        from src.api.routes.activity_stream import ACTIVITY_TOPIC, _subscribe
+
+        first = get_event_bus().publish(ACTIVITY_TOPIC, '{"msg": "seen"}')
+        missed = get_event_bus().publish(ACTIVITY_TOPIC, '{"msg": "missed"}')
+
+        gen = _subscribe(last_event_id=first)
+        item = await gen.__anext__()
+        signal_shutdown()
+        await gen.aclose()
+
+        assert item == f'id: {missed}\ndata: {{"msg": "missed"}}\n\n'
@@ -134,30 +134,11 @@ class TestBaseAgentLogging:
             agent.log_param("test_key", "test_value")
             mock_log_param.assert_called_once_with(f"{agent.name}.test_key", "test_value")
 
-    def test_log_metric_with_active_run(self):
+    def test_log_metric(self):
         agent = ConcreteAgent(role=AgentRole.ARCHITECT)
-        mock_mlflow = MagicMock()
-        mock_mlflow.active_run.return_value = MagicMock()  # has active run
-        with patch.dict("sys.modules", {"mlflow": mock_mlflow}):
-            agent.log_metric("accuracy", 0.95)
-            mock_mlflow.log_metric.assert_called_once()
-
-    def test_log_metric_no_active_run(self):
-        agent = ConcreteAgent(role=AgentRole.ARCHITECT)
-        mock_mlflow = MagicMock()
-        mock_mlflow.active_run.return_value = None
-        with patch.dict("sys.modules", {"mlflow": mock_mlflow}):
-            agent.log_metric("accuracy", 0.95)
-            mock_mlflow.log_metric.assert_not_called()
-
-    def test_log_metric_mlflow_error(self):
-        """Should not raise when mlflow fails."""
-        agent = ConcreteAgent(role=AgentRole.ARCHITECT)
-        mock_mlflow = MagicMock()
-        mock_mlflow.active_run.side_effect = RuntimeError("MLflow server unavailable")
-        with patch.dict("sys.modules", {"mlflow": mock_mlflow}):
-            # Should not raise (RuntimeError is caught)
-            agent.log_metric("accuracy", 0.95)
+        with patch("src.agents.base.log_metric") as mock_log_metric:
+            agent.log_metric("accuracy", 0.95, step=2)
+            mock_log_metric.assert_called_once_with(f"{agent.name}.accuracy", 0.95, step=2)
 
 
 class TestBaseAgentConversation:
@@ -249,6 +249,7 @@ class TestUpdateAgentStatus:
         with (
             patch("src.api.routes.agents.core.get_session", side_effect=_get_session_factory),
             patch("src.api.routes.agents.core.AgentRepository") as MockAgentRepo,
+            patch("src.agents.config_cache.invalidate_agent_config") as mock_invalidate,
         ):
             MockAgentRepo.return_value.update_status = AsyncMock(return_value=sample_agent)
 
@@ -261,6 +262,7 @@ class TestUpdateAgentStatus:
             data = response.json()
             assert data["status"] == "disabled"
             mock_session.commit.assert_called_once()
+            mock_invalidate.assert_called_once_with("architect")
 
     async def test_update_status_invalid(self, agents_client, mock_session):
         """Should return 400 for invalid status."""
@@ -83,7 +83,7 @@ def mock_entity_repo(mock_entity):
     repo.list_all = AsyncMock(return_value=[mock_entity])
     repo.count = AsyncMock(return_value=1)
     repo.get_by_entity_id = AsyncMock(return_value=mock_entity)
-    repo.search = AsyncMock(return_value=[mock_entity])
+    repo.search_scored = AsyncMock(return_value=[(mock_entity, 0.92)])
     repo.get_domain_counts = AsyncMock(return_value={"light": 5, "switch": 3})
     return repo
 
@@ -204,7 +204,10 @@ class TestQueryEntities:
             assert "entities" in data
             assert data["query"] == "lights in living room"
             assert "interpreted_as" in data
-            mock_entity_repo.search.assert_called_once_with("lights in living room", limit=10)
+            assert data["scores"] == {"light.living_room": 0.92}
+            mock_entity_repo.search_scored.assert_called_once_with(
+                "lights in living room", limit=10
+            )
 
     async def test_query_entities_default_limit(self, entities_client, mock_entity_repo):
         """Should use default limit when not provided."""
@@ -216,7 +219,7 @@ class TestQueryEntities:
 
             assert response.status_code == 200
             # Default limit should be used
-            mock_entity_repo.search.assert_called_once()
+            mock_entity_repo.search_scored.assert_called_once()
 
 
 @pytest.mark.asyncio
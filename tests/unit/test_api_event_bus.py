@@ -0,0 +1,147 @@
+"""Unit tests for the activity event bus."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.api.event_bus import EventBus, PostgresEventBus, get_event_bus
+
+
+class TestEventBus:
+    """In-memory fan-out, replay and backlog bounds."""
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_topic_subscribers(self):
+        bus = EventBus()
+        sub = bus.subscribe("activity")
+        other = bus.subscribe("other")
+
+        event_id = bus.publish("activity", '{"a": 1}')
+
+        assert await sub.get() == (event_id, '{"a": 1}')
+        assert other._queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_replay_after_last_event_id(self):
+        bus = EventBus()
+        ids = [bus.publish("activity", json.dumps({"n": n})) for n in range(3)]
+
+        sub = bus.subscribe("activity", last_event_id=ids[0])
+
+        assert [(await sub.get())[0] for _ in range(2)] == ids[1:]
+
+    def test_evicted_id_replays_newer_events(self):
+        bus = EventBus(replay_size=2)
+        with patch("src.api.event_bus.time.time", side_effect=[1.0, 2.0, 3.0]):
+            ids = [bus.publish("activity", "{}") for _ in range(3)]
+
+        assert [i for i, _ in bus.replay("activity", ids[0])] == ids[1:]
+
+    def test_unknown_id_replays_only_newer_events(self):
+        bus = EventBus()
+        with patch("src.api.event_bus.time.time", side_effect=[1.0, 2.0, 3.0]):
+            ids = [bus.publish("activity", "{}") for _ in range(3)]
+
+        # An id minted by a previous process between the 2nd and 3rd events
+        assert [i for i, _ in bus.replay("activity", "7d0-abcdef-9")] == ids[2:]
+        assert bus.replay("activity", f"{10_000:x}-abcdef-0") == []
+
+    def test_unparseable_id_replays_nothing(self):
+        bus = EventBus()
+        bus.publish("activity", "{}")
+
+        assert bus.replay("activity", "expired") == []
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest(self):
+        bus = EventBus(subscriber_backlog=2)
+        sub = bus.subscribe("activity")
+        ids = [bus.publish("activity", "{}") for _ in range(3)]
+
+        assert sub.dropped == 1
+        assert bus.stats()["dropped"] == 1
+        assert (await sub.get())[0] == ids[1]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        bus = EventBus()
+        sub = bus.subscribe("activity")
+        bus.unsubscribe(sub)
+        bus.publish("activity", "{}")
+
+        assert sub._queue.empty()
+        assert bus.stats()["subscribers"] == 0
+
+
+class TestPostgresEventBus:
+    """LISTEN/NOTIFY backend without a live database."""
+
+    @pytest.mark.asyncio
+    async def test_delivers_locally_until_connected(self):
+        bus = PostgresEventBus("postgresql://localhost/aether")
+        with patch.object(bus, "_run", return_value=asyncio.sleep(0)):
+            sub = bus.subscribe("activity")
+            event_id = bus.publish("activity", "{}")
+
+        assert await sub.get() == (event_id, "{}")
+        assert not bus._outbox
+
+    @pytest.mark.asyncio
+    async def test_queues_for_notify_when_connected(self):
+        bus = PostgresEventBus("postgresql://localhost/aether")
+        with patch.object(bus, "_run", return_value=asyncio.sleep(0)):
+            sub = bus.subscribe("activity")
+            bus._connected = True
+            event_id = bus.publish("activity", "{}")
+
+        # Delivered only once the notification comes back
+        assert sub._queue.empty()
+        assert [item[1] for item in bus._outbox] == [event_id]
+
+        bus._on_notify(None, 1, "aether_events", json.dumps({"t": "activity", "i": "x", "d": "{}"}))
+        assert await sub.get() == ("x", "{}")
+
+    @pytest.mark.asyncio
+    async def test_oversized_payload_stays_local(self):
+        bus = PostgresEventBus("postgresql://localhost/aether")
+        with patch.object(bus, "_run", return_value=asyncio.sleep(0)):
+            sub = bus.subscribe("activity")
+            bus._connected = True
+            bus.publish("activity", json.dumps({"blob": "x" * 10_000}))
+
+        assert not bus._outbox
+        assert sub._queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_outbox_locally(self):
+        bus = PostgresEventBus("postgresql://localhost/aether")
+        with patch.object(bus, "_run", return_value=asyncio.sleep(3600)):
+            sub = bus.subscribe("activity")
+        bus._outbox.append(("activity", "1", "{}"))
+
+        await bus.close()
+
+        assert await sub.get() == ("1", "{}")
+
+
+class TestGetEventBus:
+    """Backend selection from settings."""
+
+    def test_postgres_backend_strips_driver(self, monkeypatch):
+        import src.api.event_bus as mod
+
+        monkeypatch.setattr(mod, "_event_bus", None)
+        with patch("src.settings.get_settings") as get_settings:
+            settings = get_settings.return_value
+            settings.event_bus_backend = "postgres"
+            settings.database_url = "postgresql+asyncpg://u:p@db:5432/aether"
+            settings.event_bus_replay_size = 10
+            settings.event_bus_subscriber_backlog = 5
+            bus = get_event_bus()
+
+        assert isinstance(bus, PostgresEventBus)
+        assert bus._dsn == "postgresql://u:p@db:5432/aether"
+        assert bus.replay_size == 10
+        monkeypatch.setattr(mod, "_event_bus", None)
@@ -1,6 +1,14 @@
 """Unit tests for src/api/metrics.py (MetricsCollector)."""
 
-from src.api.metrics import MetricsCollector, get_metrics_collector
+import pytest
+
+from src.api.metrics import (
+    LatencyHistogram,
+    MetricsCollector,
+    _PrometheusLatencyCollector,
+    _PrometheusLLMConcurrencyCollector,
+    get_metrics_collector,
+)
 
 
 class TestMetricsCollector:
@@ -55,12 +63,34 @@ class TestMetricsCollector:
         assert metrics["agents"]["invocations"]["architect"] == 2
         assert metrics["agents"]["invocations"]["data_scientist"] == 1
 
+    def test_sandbox_pool_events(self):
+        mc = MetricsCollector()
+        mc.record_sandbox_pool("hit")
+        mc.record_sandbox_pool("hit")
+        mc.record_sandbox_pool("miss")
+        assert mc.get_metrics()["sandbox_pool"] == {"hit": 2, "miss": 1}
+        mc.reset()
+        assert mc.get_metrics()["sandbox_pool"] == {}
+
+    def test_usage_writer_events(self):
+        mc = MetricsCollector()
+        mc.record_usage_writer("queued")
+        mc.record_usage_writer("written", 10)
+        assert mc.get_metrics()["usage_writer"] == {"queued": 1, "written": 10}
+
+    def test_event_bus_events(self):
+        mc = MetricsCollector()
+        mc.record_event_bus("published")
+        mc.record_event_bus("dropped", 3)
+        assert mc.get_metrics()["event_bus"] == {"published": 1, "dropped": 3}
+
     def test_latency_percentiles(self):
         mc = MetricsCollector()
         for i in range(100):
             mc.record_request("GET", "/api/v1/test", 200, float(i))
         metrics = mc.get_metrics()
-        assert metrics["latency"]["p50_ms"] == 50.0
+        assert metrics["latency"]["p50_ms"] == pytest.approx(50.0, rel=0.03)
+        assert metrics["latency"]["p99_ms"] == pytest.approx(99.0, rel=0.03)
         assert metrics["latency"]["min_ms"] == 0.0
         assert metrics["latency"]["max_ms"] == 99.0
 
@@ -69,6 +99,38 @@ class TestMetricsCollector:
         metrics = mc.get_metrics()
         assert metrics["latency"]["p50_ms"] == 0.0
 
+    def test_route_latency_keyed_by_template(self):
+        mc = MetricsCollector()
+        mc.record_request(
+            "GET", "/api/v1/entities/light.a", 200, 5.0, route="/api/v1/entities/{id}"
+        )
+        mc.record_request(
+            "GET", "/api/v1/entities/light.b", 200, 7.0, route="/api/v1/entities/{id}"
+        )
+        mc.record_request("GET", "/unmatched", 404, 1.0)
+        by_route = mc.get_metrics()["latency_by"]["route"]
+        assert list(by_route) == ["GET /api/v1/entities/{id}"]
+        assert by_route["GET /api/v1/entities/{id}"]["count"] == 2
+
+    def test_record_latency_by_kind(self):
+        mc = MetricsCollector()
+        mc.record_latency("agent", "architect", 120.0)
+        mc.record_latency("tool", "get_entity_state", 30.0)
+        mc.record_latency("llm", "gpt-4o", 900.0)
+        latency_by = mc.get_metrics()["latency_by"]
+        assert latency_by["agent"]["architect"]["count"] == 1
+        assert latency_by["tool"]["get_entity_state"]["max_ms"] == 30.0
+        assert latency_by["llm"]["gpt-4o"]["p50_ms"] == pytest.approx(900.0, rel=0.03)
+
+    def test_key_overflow_goes_to_other(self, monkeypatch):
+        monkeypatch.setattr("src.api.metrics._MAX_KEYS_PER_KIND", 2)
+        mc = MetricsCollector()
+        for name in ("a", "b", "c", "d"):
+            mc.record_latency("tool", name, 1.0)
+        tools = mc.get_metrics()["latency_by"]["tool"]
+        assert set(tools) == {"a", "b", "other"}
+        assert tools["other"]["count"] == 2
+
     def test_reset(self):
         mc = MetricsCollector()
         mc.record_request("GET", "/", 200, 10.0)
@@ -87,6 +149,78 @@ class TestMetricsCollector:
         assert metrics["uptime_seconds"] >= 0
 
 
+class TestLatencyHistogram:
+    def test_empty(self):
+        h = LatencyHistogram()
+        assert h.count == 0
+        assert h.percentile(0.5) == 0.0
+
+    def test_percentiles_within_bucket_error(self):
+        h = LatencyHistogram()
+        for i in range(1, 10001):
+            h.record(i / 10)
+        for q, expected in ((0.5, 500.0), (0.95, 950.0), (0.99, 990.0)):
+            assert h.percentile(q) == pytest.approx(expected, rel=0.03)
+        assert h.percentile(0.0) == pytest.approx(0.1, rel=0.03)
+        assert h.percentile(1.0) == pytest.approx(1000.0, rel=0.03)
+
+    def test_merge(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        for _ in range(50):
+            a.record(10.0)
+            b.record(1000.0)
+        a.merge(b)
+        summary = a.summary()
+        assert summary["count"] == 100
+        assert summary["min_ms"] == 10.0
+        assert summary["max_ms"] == 1000.0
+        assert summary["p99_ms"] == pytest.approx(1000.0, rel=0.03)
+
+    def test_cumulative_counts(self):
+        h = LatencyHistogram()
+        for value in (1.0, 4.0, 40.0, 400.0):
+            h.record(value)
+        assert h.cumulative_counts((5.0, 50.0, 500.0)) == [2, 3, 4]
+
+
+class TestPrometheusLatencyCollector:
+    def test_collect_exports_histograms(self, monkeypatch):
+        mc = MetricsCollector()
+        mc.record_latency("tool", "get_entity_state", 20.0)
+        mc.record_latency("tool", "get_entity_state", 2000.0)
+        monkeypatch.setattr("src.api.metrics._metrics_collector", mc)
+
+        families = {f.name: f for f in _PrometheusLatencyCollector().collect()}
+
+        samples = {
+            (s.name, s.labels.get("le")): s.value
+            for s in families["aether_tool_latency_seconds"].samples
+        }
+        assert samples[("aether_tool_latency_seconds_count", None)] == 2
+        assert samples[("aether_tool_latency_seconds_bucket", "0.025")] == 1
+        assert samples[("aether_tool_latency_seconds_bucket", "+Inf")] == 2
+        assert samples[("aether_tool_latency_seconds_sum", None)] == pytest.approx(2.02)
+        assert families["aether_llm_latency_seconds"].samples == []
+
+
+class TestPrometheusLLMConcurrencyCollector:
+    def test_collect_exports_gauges(self, monkeypatch):
+        mc = MetricsCollector()
+        mc.record_llm_concurrency("openai:gpt-4o", limit=6.5, in_flight=6, queued=3)
+        monkeypatch.setattr("src.api.metrics._metrics_collector", mc)
+
+        families = {f.name: f for f in _PrometheusLLMConcurrencyCollector().collect()}
+
+        def value(name: str) -> float:
+            (sample,) = families[name].samples
+            assert sample.labels == {"model": "openai:gpt-4o"}
+            return sample.value
+
+        assert value("aether_llm_concurrency_limit") == 6.5
+        assert value("aether_llm_in_flight") == 6
+        assert value("aether_llm_queue_depth") == 3
+
+
 class TestGetMetricsCollector:
     def test_singleton(self):
         c1 = get_metrics_collector()
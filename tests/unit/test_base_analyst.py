@@ -16,6 +16,7 @@ from src.graph.state import (
     SpecialistFinding,
     TeamAnalysis,
 )
+from src.sandbox.aether_data import load
 
 # ---------------------------------------------------------------------------
 # Concrete subclass for testing (BaseAnalyst is abstract)
@@ -115,13 +116,24 @@ class TestBaseAnalystExecuteScript:
         analyst = StubAnalyst(ha_client=MagicMock())
         analyst._sandbox = mock_sandbox
 
-        data = {"sensor_readings": [1, 2, 3]}
+        data = {"sensor_readings": [1, 2, 3], "note": "'''' quotes"}
+        loaded = {}
+
+        async def capture(script, policy=None, data_path=None):
+            loaded.update(load(data_path))
+            return mock_result
+
+        mock_sandbox.run = AsyncMock(side_effect=capture)
         await analyst.execute_script("print(data)", data)
 
         call_args = mock_sandbox.run.call_args
-        # The script content should include the data injection
-        script_content = call_args.args[0] if call_args.args else call_args.kwargs.get("script", "")
-        assert "sensor_readings" in script_content or data == call_args.kwargs.get("data")
+        # Data is mounted as a bundle and loaded by a preamble, not inlined
+        script_content = call_args.args[0]
+        assert "sensor_readings" not in script_content
+        assert script_content.startswith("import aether_data\ndata = aether_data.load()")
+        assert script_content.endswith("print(data)")
+        assert loaded == data
+        assert not call_args.kwargs["data_path"].exists()
 
 
 class TestBaseAnalystCrossConsultation:
@@ -100,6 +100,27 @@ class TestUpsertMany:
         assert stats["created"] == 1
         assert stats["updated"] == 1
 
+    @pytest.mark.asyncio
+    async def test_upsert_many_skip_unchanged(self, repo, mock_session):
+        """Rows whose fields already match are left untouched."""
+        same = _make_area(ha_area_id="kitchen", name="Kitchen")
+        same.last_synced_at = None
+        changed = _make_area(ha_area_id="bedroom", name="Old Bedroom")
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [same, changed]
+        mock_session.execute.return_value = mock_result
+
+        data_list = [
+            {"ha_area_id": "kitchen", "name": "Kitchen"},
+            {"ha_area_id": "bedroom", "name": "Bedroom"},
+        ]
+
+        _results, stats = await repo.upsert_many(data_list, skip_unchanged=True)
+
+        assert stats == {"created": 0, "updated": 1, "unchanged": 1}
+        assert same.last_synced_at is None
+        assert changed.name == "Bedroom"
+
     @pytest.mark.asyncio
     async def test_upsert_many_empty_list(self, repo, mock_session):
         """Empty list returns empty results without DB calls."""
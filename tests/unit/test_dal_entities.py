@@ -10,6 +10,7 @@ from uuid import uuid4
 import pytest
 
 from src.dal.entities import EntityRepository
+from src.dal.entity_search import EntitySearchIndex
 
 
 @pytest.fixture
@@ -249,32 +250,107 @@ class TestEntityRepositoryDelete:
 class TestEntityRepositorySearch:
     """Tests for search method."""
 
-    @pytest.mark.asyncio
-    async def test_search_by_name(self, entity_repo, mock_session):
-        """Test searching entities by name."""
-        mock_entities = [
-            MagicMock(name="Living Room Light"),
-            MagicMock(name="Living Room Switch"),
-        ]
+    @pytest.fixture
+    def index(self):
+        return EntitySearchIndex(
+            [
+                ("light.living_room_lamp", "Living Room Lamp", "Living Room", None),
+                ("switch.living_room_fan", "Living Room Fan", "Living Room", None),
+                ("sensor.kitchen_temperature", "Kitchen Temperature", "Kitchen", "Aqara TH"),
+            ]
+        )
 
+    @pytest.mark.asyncio
+    async def test_search_ranks_from_index(self, entity_repo, mock_session, index):
+        """Test entities come back in index order with their scores."""
+        lamp = MagicMock(entity_id="light.living_room_lamp")
+        fan = MagicMock(entity_id="switch.living_room_fan")
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_entities
+        # Database order is irrelevant; relevance order wins
+        mock_result.scalars.return_value.all.return_value = [fan, lamp]
         mock_session.execute.return_value = mock_result
 
-        result = await entity_repo.search("living")
+        with patch("src.dal.entities.get_search_index", AsyncMock(return_value=index)):
+            hits = await entity_repo.search_scored("livng room lamp")
+
+        assert [e for e, _ in hits] == [lamp, fan]
+        assert hits[0][1] > hits[1][1]
+
+    @pytest.mark.asyncio
+    async def test_search_empty_results(self, entity_repo, mock_session, index):
+        """Test search with no matching results skips the entity fetch."""
+        with patch("src.dal.entities.get_search_index", AsyncMock(return_value=index)):
+            result = await entity_repo.search("zzqx")
 
-        assert len(result) == 2
+        assert result == []
+        mock_session.execute.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_search_empty_results(self, entity_repo, mock_session):
-        """Test search with no matching results."""
+    async def test_search_falls_back_to_trigram_query(self, entity_repo, mock_session):
+        """Test the Postgres trigram path when the index is disabled."""
+        entity = MagicMock(entity_id="light.living_room")
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+        mock_result.all.return_value = [(entity, 0.61234)]
         mock_session.execute.return_value = mock_result
 
-        result = await entity_repo.search("nonexistent")
+        settings = MagicMock(entity_search_index_enabled=False)
+        with patch("src.dal.entities.get_settings", return_value=settings):
+            result = await entity_repo.search_scored("living")
+
+        assert result == [(entity, 0.6123)]
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "word_similarity" in sql
+
+
+class TestEntitySearchIndex:
+    """Tests for the in-process n-gram/BM25 index."""
+
+    @pytest.fixture
+    def index(self):
+        return EntitySearchIndex(
+            [
+                ("light.living_room_lamp", "Living Room Lamp", "Living Room", None),
+                ("light.bedroom_lamp", "Bedroom Lamp", "Bedroom", None),
+                ("sensor.kitchen_temperature", "Kitchen Temperature", "Kitchen", "Aqara TH"),
+                ("binary_sensor.hall_motion", "Hall Motion", None, "Hue Motion Sensor"),
+            ]
+        )
+
+    def test_exact_id_ranks_first(self, index):
+        hits = index.search("light.bedroom_lamp")
+        assert hits[0][0] == "light.bedroom_lamp"
+        assert 0 < hits[0][1] <= 1
+
+    def test_tolerates_typos(self, index):
+        assert index.search("kitchn temprature")[0][0] == "sensor.kitchen_temperature"
+
+    def test_matches_area_and_device_names(self, index):
+        assert index.search("bedroom")[0][0] == "light.bedroom_lamp"
+        assert index.search("hue")[0][0] == "binary_sensor.hall_motion"
+
+    def test_limit_and_threshold(self, index):
+        assert len(index.search("lamp", limit=1)) == 1
+        assert index.search("xyzzy") == []
+        assert index.search("") == []
+
+    @pytest.mark.parametrize("query", ["at", "droo", "oom_la", "Lamp", "sensor.", "MOTION"])
+    def test_substring_matches_kept(self, index, query):
+        """Everything the old ILIKE search matched is still returned."""
+        rows = [
+            ("light.living_room_lamp", "Living Room Lamp"),
+            ("light.bedroom_lamp", "Bedroom Lamp"),
+            ("sensor.kitchen_temperature", "Kitchen Temperature"),
+            ("binary_sensor.hall_motion", "Hall Motion"),
+        ]
+        ilike = {eid for eid, name in rows if query.lower() in f"{eid} {name}".lower()}
+
+        hits = {eid for eid, _ in index.search(query)}
 
-        assert result == []
+        assert ilike
+        assert ilike <= hits
+
+    def test_empty_index(self):
+        assert EntitySearchIndex([]).search("lamp") == []
 
 
 class TestEntityRepositoryGetDomainCounts:
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.dal.llm_usage import LLMUsageRepository
 
@@ -51,6 +52,90 @@ class TestLLMUsageRepositoryRecord:
         mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_record_many_single_insert(self, llm_usage_repo, mock_session):
+        """Test that a batch is written with one INSERT and one commit."""
+        records = [
+            {
+                "provider": "openai",
+                "model": "gpt-4o",
+                "input_tokens": i,
+                "output_tokens": 1,
+                "total_tokens": i + 1,
+            }
+            for i in range(5)
+        ]
+
+        count = await llm_usage_repo.record_many(records)
+
+        assert count == 5
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+        params = mock_session.execute.call_args[0][0].compile().params
+        assert params["model_m4"] == "gpt-4o"
+        assert params["request_type_m0"] == "chat"
+
+    @pytest.mark.asyncio
+    async def test_record_many_empty(self, llm_usage_repo, mock_session):
+        """Test that an empty batch does not touch the database."""
+        assert await llm_usage_repo.record_many([]) == 0
+        mock_session.execute.assert_not_called()
+
+
+class TestLLMUsageRepositoryRollups:
+    """Tests for hourly rollups and rollup-aware reads."""
+
+    @pytest.mark.asyncio
+    async def test_roll_up_upserts_completed_hours(self, llm_usage_repo, mock_session):
+        """Test raw rows since the watermark are folded with one INSERT ... SELECT."""
+        watermark_result = MagicMock()
+        watermark_result.scalar.return_value = datetime(2026, 1, 1, 10, tzinfo=UTC)
+        insert_result = MagicMock(rowcount=4)
+        mock_session.execute.side_effect = [MagicMock(), watermark_result, insert_result]
+
+        rows = await llm_usage_repo.roll_up()
+
+        assert rows == 4
+        mock_session.commit.assert_called_once()
+        sql = str(mock_session.execute.call_args_list[0][0][0])
+        assert "pg_advisory_xact_lock" in sql
+        stmt = mock_session.execute.call_args_list[2][0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO llm_usage_rollups")
+        assert "ON CONFLICT" in sql
+        assert "calls = (llm_usage_rollups.calls + excluded.calls)" in sql
+        # Bounded below by the watermark (newest bucket + 1h)
+        assert stmt.compile().params["created_at_2"] == datetime(2026, 1, 1, 11, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_roll_up_noop_when_current(self, llm_usage_repo, mock_session):
+        """Test nothing is inserted when the watermark already covers settled hours."""
+        watermark_result = MagicMock()
+        watermark_result.scalar.return_value = datetime.now(UTC)
+        mock_session.execute.side_effect = [MagicMock(), watermark_result]
+
+        assert await llm_usage_repo.roll_up() == 0
+        assert mock_session.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rollup_watermark_empty(self, llm_usage_repo, mock_session):
+        """Test the watermark is None before anything is rolled up."""
+        result = MagicMock()
+        result.scalar.return_value = None
+        mock_session.execute.return_value = result
+
+        assert await llm_usage_repo.get_rollup_watermark() is None
+
+    def test_usage_reads_rollups_plus_raw_tail(self):
+        """Test reads union rollups with raw rows past the watermark."""
+        usage = LLMUsageRepository._usage(since=datetime(2026, 1, 1, tzinfo=UTC))
+
+        sql = str(usage.element.compile(dialect=postgresql.dialect()))
+
+        assert "FROM llm_usage_rollups" in sql
+        assert "UNION ALL" in sql
+        assert "llm_usage.created_at >= (SELECT max(llm_usage_rollups.bucket_start)" in sql
+
 
 class TestLLMUsageRepositoryGetSummary:
     """Tests for LLMUsageRepository.get_summary method."""
@@ -5,9 +5,11 @@ error handling and status transitions, and the registry sync helper.
 All external dependencies (HA client, repositories, DB session) are mocked.
 """
 
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from src.dal.sync import DiscoverySyncService, run_discovery, run_registry_sync
@@ -314,7 +316,42 @@ class TestAutomationRegistrySync:
 
         await service._sync_automation_entities(entities)
 
-        service.automation_repo.delete.assert_called_once_with("old_deleted")
+        service.automation_repo.delete_by_ha_ids.assert_called_once_with({"old_deleted"})
+
+    @pytest.mark.asyncio
+    async def test_fetches_configs_concurrently_and_skips_unchanged(self):
+        """Config fetches overlap up to the limit; rows are written with skip_unchanged."""
+        service, _, ha = _make_service()
+        in_flight = 0
+        peak = 0
+
+        async def fetch(automation_id: str) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if automation_id == "broken":
+                raise httpx.ConnectError("refused")
+            return {"id": automation_id}
+
+        ha.get_automation_config = AsyncMock(side_effect=fetch)
+        entities = [
+            _make_entity(f"automation.a{i}", "automation", attributes={"id": f"a{i}"})
+            for i in range(6)
+        ] + [_make_entity("automation.broken", "automation", attributes={"id": "broken"})]
+
+        settings = MagicMock(discovery_sync_config_concurrency=3)
+        with patch("src.dal.sync.get_settings", return_value=settings):
+            stats = await service._sync_automation_entities(entities)
+
+        assert peak == 3
+        assert stats["automations_synced"] == 7
+        (rows,) = service.automation_repo.upsert_many.call_args[0]
+        assert service.automation_repo.upsert_many.call_args.kwargs == {"skip_unchanged": True}
+        configs = {r["ha_automation_id"]: r["config"] for r in rows}
+        assert configs["a0"] == {"id": "a0"}
+        assert configs["broken"] is None
 
 
 class TestConvenienceFunctions:
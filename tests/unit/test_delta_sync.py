@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -52,26 +52,25 @@ class TestDeltaSync:
             last_updated=_ts(minutes_ago=60),
         )
 
-        # Mock DB record: synced more recently than HA updated
-        db_entity = MagicMock()
-        db_entity.last_synced_at = _ts(minutes_ago=30)
-
         ha_client = AsyncMock()
         ha_client.list_entities = AsyncMock(return_value=[])
 
         session = AsyncMock()
         service = DiscoverySyncService(session, ha_client)
         service.entity_repo = AsyncMock()
-        service.entity_repo.get_by_entity_id = AsyncMock(return_value=db_entity)
-        service.entity_repo.upsert = AsyncMock()
-        service.entity_repo.get_all_entity_ids = AsyncMock(return_value={"light.living_room"})
+        # DB record synced more recently than HA updated
+        service.entity_repo.get_sync_timestamps = AsyncMock(
+            return_value={"light.living_room": _ts(minutes_ago=30)}
+        )
+        service.entity_repo.upsert_many = AsyncMock(return_value=([], {"created": 0, "updated": 0}))
+        service.entity_repo.delete_by_ha_ids = AsyncMock(return_value=0)
 
         stats = await service._sync_entities_delta([entity], {}, {})
 
         # Should be skipped, not upserted
         assert stats["skipped"] == 1
         assert stats["updated"] == 0
-        service.entity_repo.upsert.assert_not_called()
+        service.entity_repo.upsert_many.assert_called_once_with([])
 
     async def test_syncs_changed_entity(self):
         """Entity with last_updated newer than last_synced_at should be synced."""
@@ -85,22 +84,22 @@ class TestDeltaSync:
             last_updated=_ts(minutes_ago=5),
         )
 
-        db_entity = MagicMock()
-        db_entity.last_synced_at = _ts(minutes_ago=30)
-
         ha_client = AsyncMock()
         session = AsyncMock()
         service = DiscoverySyncService(session, ha_client)
         service.entity_repo = AsyncMock()
-        service.entity_repo.get_by_entity_id = AsyncMock(return_value=db_entity)
-        service.entity_repo.upsert = AsyncMock(return_value=(MagicMock(), False))
-        service.entity_repo.get_all_entity_ids = AsyncMock(return_value={"light.living_room"})
+        service.entity_repo.get_sync_timestamps = AsyncMock(
+            return_value={"light.living_room": _ts(minutes_ago=30)}
+        )
+        service.entity_repo.upsert_many = AsyncMock(return_value=([], {"created": 0, "updated": 1}))
+        service.entity_repo.delete_by_ha_ids = AsyncMock(return_value=0)
 
         stats = await service._sync_entities_delta([entity], {}, {})
 
         assert stats["updated"] == 1
         assert stats["skipped"] == 0
-        service.entity_repo.upsert.assert_called_once()
+        data_list = service.entity_repo.upsert_many.call_args[0][0]
+        assert [d["entity_id"] for d in data_list] == ["light.living_room"]
 
     async def test_syncs_new_entity(self):
         """Entity not in DB should always be synced."""
@@ -117,14 +116,35 @@ class TestDeltaSync:
         session = AsyncMock()
         service = DiscoverySyncService(session, ha_client)
         service.entity_repo = AsyncMock()
-        service.entity_repo.get_by_entity_id = AsyncMock(return_value=None)
-        service.entity_repo.upsert = AsyncMock(return_value=(MagicMock(), True))
-        service.entity_repo.get_all_entity_ids = AsyncMock(return_value=set())
+        service.entity_repo.get_sync_timestamps = AsyncMock(return_value={})
+        service.entity_repo.upsert_many = AsyncMock(return_value=([], {"created": 1, "updated": 0}))
+        service.entity_repo.delete_by_ha_ids = AsyncMock(return_value=0)
 
         stats = await service._sync_entities_delta([entity], {}, {})
 
         assert stats["added"] == 1
-        service.entity_repo.upsert.assert_called_once()
+        service.entity_repo.upsert_many.assert_called_once()
+
+    async def test_removes_missing_entities_in_one_delete(self):
+        """Entities gone from HA should be deleted with a single batch call."""
+        from src.dal.sync import DiscoverySyncService
+
+        ha_client = AsyncMock()
+        session = AsyncMock()
+        service = DiscoverySyncService(session, ha_client)
+        service.entity_repo = AsyncMock()
+        service.entity_repo.get_sync_timestamps = AsyncMock(
+            return_value={"light.gone": _ts(30), "light.also_gone": None}
+        )
+        service.entity_repo.upsert_many = AsyncMock(return_value=([], {"created": 0, "updated": 0}))
+        service.entity_repo.delete_by_ha_ids = AsyncMock(return_value=2)
+
+        stats = await service._sync_entities_delta([], {}, {})
+
+        assert stats["removed"] == 2
+        service.entity_repo.delete_by_ha_ids.assert_called_once_with(
+            {"light.gone", "light.also_gone"}
+        )
 
     async def test_run_delta_sync_returns_stats(self):
         """run_delta_sync should return combined stats."""
@@ -1,5 +1,6 @@
 """Unit tests for src/ha/base.py (BaseHAClient, config, URL handling)."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -8,6 +9,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from src.exceptions import HAClientError
 from src.ha.base import BaseHAClient, HAClientConfig, _try_get_db_config
+from src.ha.request_cache import RequestCache
 
 
 class TestHAClientConfig:
@@ -425,3 +427,183 @@ class TestRequestHttpxErrorPaths:
         with patch("src.tracing.log_metric", MagicMock()):
             result = await client._request("GET", "/api/missing")
         assert result is None
+
+
+def _ok(body: bytes) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.content = body
+    return response
+
+
+class TestRequestCoalescingAndCache:
+    """Tests for single-flight GETs and the micro-TTL request cache."""
+
+    @staticmethod
+    def _client(request: AsyncMock, cache: RequestCache | None = None) -> BaseHAClient:
+        client = BaseHAClient(config=HAClientConfig(ha_url="http://ha.local:8123", ha_token="tok"))
+        mock_http = AsyncMock(spec=httpx.AsyncClient)
+        mock_http.request = request
+        client._http_client = mock_http
+        client.request_cache = cache
+        return client
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self) -> None:
+        release = asyncio.Event()
+
+        async def slow(*args, **kwargs):
+            await release.wait()
+            return _ok(b'[{"entity_id": "light.a"}]')
+
+        request = AsyncMock(side_effect=slow)
+        client = self._client(request)
+
+        with patch("src.tracing.log_metric", MagicMock()):
+            calls = [asyncio.create_task(client._request("GET", "/api/states")) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*calls)
+
+        assert request.await_count == 1
+        assert results[0] == results[2] == [{"entity_id": "light.a"}]
+        # Every caller gets its own decoded copy
+        assert results[0] is not results[1]
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_coalesced_failure_reaches_every_caller(self) -> None:
+        release = asyncio.Event()
+
+        async def failing(*args, **kwargs):
+            await release.wait()
+            raise httpx.ConnectError("refused")
+
+        client = self._client(AsyncMock(side_effect=failing))
+
+        with patch("src.tracing.log_metric", MagicMock()):
+            calls = [asyncio.create_task(client._request("GET", "/api/states")) for _ in range(2)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(r, HAClientError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self) -> None:
+        hang, release = asyncio.Event(), asyncio.Event()
+        gates = iter([hang, release])
+
+        async def send(*args, **kwargs):
+            await next(gates).wait()
+            return _ok(b'{"a": 1}')
+
+        request = AsyncMock(side_effect=send)
+        client = self._client(request)
+
+        with patch("src.tracing.log_metric", MagicMock()):
+            leader = asyncio.create_task(client._request("GET", "/api/states"))
+            await asyncio.sleep(0)
+            followers = [
+                asyncio.create_task(client._request("GET", "/api/states")) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            leader.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert results == [{"a": 1}, {"a": 1}]
+        # One follower took over the request; the other joined it
+        assert request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_started_before_write_is_not_cached(self) -> None:
+        release = asyncio.Event()
+        bodies = iter([b'{"v": "old"}', b"{}", b'{"v": "new"}'])
+
+        async def send(method, *args, **kwargs):
+            body = next(bodies)
+            if body == b'{"v": "old"}':
+                await release.wait()
+            return _ok(body)
+
+        request = AsyncMock(side_effect=send)
+        cache = RequestCache({"/api/states": 60}, max_bytes=1024)
+        client = self._client(request, cache)
+
+        with patch("src.tracing.log_metric", MagicMock()):
+            stale = asyncio.create_task(client._request("GET", "/api/states"))
+            await asyncio.sleep(0)
+            await client._request("POST", "/api/services/light/turn_on", json={})
+            release.set()
+            assert await stale == {"v": "old"}
+            fresh = await client._request("GET", "/api/states")
+
+        assert fresh == {"v": "new"}
+        assert request.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_path_served_within_ttl(self) -> None:
+        request = AsyncMock(return_value=_ok(b'{"a": 1}'))
+        cache = RequestCache({"/api/services": 60}, max_bytes=1024)
+        client = self._client(request, cache)
+
+        with patch("src.tracing.log_metric", MagicMock()):
+            first = await client._request("GET", "/api/services")
+            first["a"] = 2
+            second = await client._request("GET", "/api/services")
+            await client._request("GET", "/api/states")
+            await client._request("GET", "/api/states")
+
+        assert second == {"a": 1}
+        # /api/services once, /api/states (not opted in) twice
+        assert request.await_count == 3
+        assert cache.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_write_clears_cache(self) -> None:
+        request = AsyncMock(return_value=_ok(b"[]"))
+        cache = RequestCache({"/api/states": 60}, max_bytes=1024)
+        client = self._client(request, cache)
+
+        with patch("src.tracing.log_metric", MagicMock()):
+            await client._request("GET", "/api/states")
+            await client._request("POST", "/api/services/light/turn_on", json={})
+            await client._request("GET", "/api/states")
+
+        assert request.await_count == 3
+
+
+class TestRequestCache:
+    def test_byte_budget_evicts_least_recently_used(self) -> None:
+        cache = RequestCache({"/a": 60, "/b": 60, "/c": 60}, max_bytes=10)
+        cache.put("/a", "/a", b"aaaa")
+        cache.put("/b", "/b", b"bbbb")
+        assert cache.get("/a") == b"aaaa"
+        cache.put("/c", "/c", b"cccc")
+
+        assert cache.get("/b") is None
+        assert cache.get("/a") == b"aaaa"
+        assert cache.stats["evictions"] == 1
+        assert cache.stats["bytes"] == 8
+
+    def test_put_skipped_after_clear(self) -> None:
+        cache = RequestCache({"/a": 60}, max_bytes=100)
+        generation = cache.generation
+        cache.clear()
+        cache.put("/a", "/a", b"x", generation=generation)
+        assert cache.get("/a") is None
+
+    def test_oversized_body_not_cached(self) -> None:
+        cache = RequestCache({"/a": 60}, max_bytes=3)
+        cache.put("/a", "/a", b"toolarge")
+        assert cache.get("/a") is None
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        cache = RequestCache({"/a": 60}, max_bytes=100)
+        cache.put("/a", "/a", b"x")
+        with patch("src.ha.request_cache.time.monotonic", return_value=1e12):
+            assert cache.get("/a") is None
+        assert cache.stats == {"entries": 0, "bytes": 0, "hits": 0, "misses": 1, "evictions": 0}
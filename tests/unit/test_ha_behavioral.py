@@ -4,7 +4,7 @@ Tests behavioral analysis patterns, automation gaps, correlations, etc.
 All tests mock HA client responses.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -375,6 +375,46 @@ class TestFindCorrelations:
 
             assert len(results) == 0
 
+    async def test_find_correlations_reports_lift_and_pmi(self, behavioral_client, mock_ha_client):
+        """Test that results carry lift/PMI and can be ranked by lift."""
+        base_time = datetime(2026, 2, 9, 12, 0, 0, tzinfo=UTC)
+
+        def entry(entity_id, when):
+            return ParsedLogbookEntry(
+                entity_id=entity_id,
+                domain=entity_id.split(".", maxsplit=1)[0],
+                state="on",
+                when=when.isoformat(),
+            )
+
+        entries = []
+        for day in range(5):
+            t = base_time + timedelta(days=day)
+            entries += [
+                entry("light.kitchen", t),
+                entry("switch.kitchen", t + timedelta(seconds=5)),
+            ]
+            # sensor.noise fires constantly, co-occurring with everything by chance
+            entries += [entry("sensor.noise", t + timedelta(minutes=m)) for m in range(-4, 5)]
+        entries.sort(key=lambda e: e.when)
+
+        mock_logbook = MagicMock()
+        mock_logbook.get_entries = AsyncMock(return_value=entries)
+
+        with patch.object(behavioral_client, "_logbook", mock_logbook):
+            by_count = await behavioral_client.find_correlations(hours=168)
+            by_lift = await behavioral_client.find_correlations(hours=168, rank_by="lift")
+
+        assert by_count[0].co_occurrence_count >= by_count[-1].co_occurrence_count
+        assert (by_lift[0].entity_a, by_lift[0].entity_b) == ("light.kitchen", "switch.kitchen")
+        assert by_lift[0].lift > 1.0
+        assert by_lift[0].pmi > 0.0
+
+    async def test_find_correlations_rejects_unknown_rank(self, behavioral_client):
+        """Test that an unknown rank_by raises ValueError."""
+        with pytest.raises(ValueError, match="rank_by"):
+            await behavioral_client.find_correlations(rank_by="bogus")
+
 
 @pytest.mark.asyncio
 class TestDetectAutomationGaps:
@@ -609,3 +649,30 @@ class TestGetDeviceHealthReport:
             assert priority.get(health_entries[0].status, 99) <= priority.get(
                 health_entries[1].status, 99
             )
+
+
+@pytest.mark.asyncio
+class TestSharedLogbookSnapshot:
+    """Tests that one analysis run fetches the logbook once."""
+
+    async def test_methods_share_one_fetch(self, behavioral_client, mock_ha_client):
+        """Test that all analysis methods reuse a single logbook download."""
+        mock_ha_client.get_logbook = AsyncMock(
+            return_value=[
+                {
+                    "entity_id": "light.kitchen",
+                    "domain": "light",
+                    "state": "on",
+                    "when": datetime.now(UTC).isoformat(),
+                    "context_user_id": "user-123",
+                }
+            ]
+        )
+
+        await behavioral_client.get_button_usage(hours=168)
+        await behavioral_client.get_automation_effectiveness(hours=168)
+        await behavioral_client.find_correlations(hours=168)
+        await behavioral_client.detect_automation_gaps(hours=168)
+        await behavioral_client.get_device_health_report(hours=48)
+
+        mock_ha_client.get_logbook.assert_called_once()
@@ -0,0 +1,115 @@
+"""Unit tests for the sweep-line co-occurrence engine."""
+
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from src.ha.correlation import count_co_occurrences, top_k
+
+
+def _nested_scan(entity_ids, times_us, window_seconds):
+    """Reference O(n^2) implementation matching the original algorithm."""
+    pairs = defaultdict(list)
+    for i in range(len(times_us)):
+        for j in range(i + 1, len(times_us)):
+            delta = (times_us[j] - times_us[i]) / 1_000_000
+            if delta > window_seconds:
+                break
+            if entity_ids[i] != entity_ids[j]:
+                pairs[tuple(sorted([entity_ids[i], entity_ids[j]]))].append(delta)
+    return pairs
+
+
+class TestCountCoOccurrences:
+    """Tests for count_co_occurrences."""
+
+    @pytest.mark.parametrize("dense_limit", [1 << 18, 0], ids=["dense", "sparse"])
+    def test_matches_nested_scan(self, dense_limit, monkeypatch):
+        """Test counts and deltas match a brute-force scan on both accumulator paths."""
+        monkeypatch.setattr("src.ha.correlation._DENSE_LIMIT", dense_limit)
+        rng = np.random.default_rng(42)
+        times = np.sort(rng.integers(0, 3_600 * 1_000_000, 500)).astype(np.int64)
+        ids = [f"light.e{i}" for i in rng.integers(0, 12, 500)]
+
+        matrix = count_co_occurrences(ids, times, 60)
+        expected = _nested_scan(ids, times, 60)
+
+        got = {
+            (str(matrix.entities[r]), str(matrix.entities[c])): (int(n), float(s))
+            for r, c, n, s in zip(
+                matrix.rows, matrix.cols, matrix.counts, matrix.delta_sums, strict=True
+            )
+        }
+        assert set(got) == set(expected)
+        for pair, deltas in expected.items():
+            assert got[pair][0] == len(deltas)
+            assert got[pair][1] == pytest.approx(sum(deltas))
+
+    def test_window_boundary_inclusive(self):
+        """Test that events exactly one window apart co-occur."""
+        matrix = count_co_occurrences(["a", "b"], np.array([0, 300_000_000]), 300)
+
+        assert matrix.counts.tolist() == [1]
+
+    def test_same_entity_not_counted(self):
+        """Test that repeated changes of one entity are ignored."""
+        matrix = count_co_occurrences(["a", "a", "a"], np.array([0, 1, 2]), 300)
+
+        assert matrix.counts.size == 0
+
+    def test_empty_input(self):
+        """Test that no events produce an empty matrix."""
+        matrix = count_co_occurrences([], np.empty(0, dtype=np.int64), 300)
+
+        assert matrix.counts.size == 0
+
+    def test_lift_higher_for_coupled_pair(self):
+        """Test that a tightly coupled pair outscores an incidental one."""
+        hour = 3_600 * 1_000_000
+        ids: list[str] = []
+        times: list[int] = []
+        for day in range(7):
+            base = day * 24 * hour
+            # kitchen light and switch always change together
+            ids += ["light.kitchen", "switch.kitchen"]
+            times += [base, base + 5_000_000]
+            # a chatty sensor fires every few minutes
+            for minute in range(0, 24 * 60, 3):
+                ids.append("sensor.power")
+                times.append(base + hour + minute * 60_000_000)
+
+        matrix = count_co_occurrences(ids, np.array(times, dtype=np.int64), 300)
+        lift = dict(
+            zip(
+                (
+                    (str(matrix.entities[r]), str(matrix.entities[c]))
+                    for r, c in zip(matrix.rows, matrix.cols, strict=True)
+                ),
+                matrix.lift(),
+                strict=True,
+            )
+        )
+
+        assert lift[("light.kitchen", "switch.kitchen")] > 10
+        assert lift[("light.kitchen", "switch.kitchen")] > lift.get(
+            ("light.kitchen", "sensor.power"), 0.0
+        )
+
+
+class TestTopK:
+    """Tests for top_k selection."""
+
+    def test_returns_best_first(self):
+        """Test that the k largest scores are returned in order."""
+        scores = np.array([1.0, 5.0, 3.0, 4.0, 2.0])
+
+        assert top_k(scores, 3).tolist() == [1, 3, 2]
+
+    def test_k_larger_than_input(self):
+        """Test that all indices are returned when k exceeds the size."""
+        assert top_k(np.array([2.0, 1.0]), 10).tolist() == [0, 1]
+
+    def test_zero_k(self):
+        """Test that k=0 returns nothing."""
+        assert top_k(np.array([1.0]), 0).size == 0
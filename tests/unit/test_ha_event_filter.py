@@ -0,0 +1,66 @@
+"""Tests for the event stream ingestion filter.
+
+Feature 35: Real-Time HA Event Stream.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from src.ha.event_filter import EventFilter
+
+
+class TestAccepts:
+    """Tests for include/exclude globs."""
+
+    def test_empty_filter_accepts_everything(self) -> None:
+        event_filter = EventFilter()
+        assert event_filter.is_passthrough
+        assert event_filter.accepts("sensor.anything")
+
+    def test_bare_domain_matches_domain(self) -> None:
+        event_filter = EventFilter(include=["light"])
+        assert event_filter.accepts("light.kitchen")
+        assert not event_filter.accepts("lightning.sensor")
+
+    def test_exclude_wins(self) -> None:
+        event_filter = EventFilter(include=["sensor.*"], exclude=["sensor.*_rssi"])
+        assert event_filter.accepts("sensor.temp")
+        assert not event_filter.accepts("sensor.plug_rssi")
+
+    def test_from_settings(self) -> None:
+        settings = MagicMock(
+            ha_event_include="light, switch.a",
+            ha_event_exclude="",
+            ha_event_attributes="brightness",
+        )
+        event_filter = EventFilter.from_settings(settings)
+        assert event_filter.include == ("light.*", "switch.a")
+        assert event_filter.attributes == {"brightness", "friendly_name"}
+
+
+class TestSignature:
+    """Tests for change signatures."""
+
+    def test_ignores_timestamps(self) -> None:
+        event_filter = EventFilter()
+        a = {"state": "on", "attributes": {"x": 1}, "last_updated": "t1"}
+        b = {"state": "on", "attributes": {"x": 1}, "last_updated": "t2"}
+        assert event_filter.signature(a) == event_filter.signature(b)
+
+    def test_allowlist_keeps_friendly_name(self) -> None:
+        event_filter = EventFilter(attributes=["brightness"])
+        state = {"state": "on", "attributes": {"brightness": 1, "rssi": 2, "friendly_name": "A"}}
+        assert event_filter.signature(state) == ("on", {"brightness": 1, "friendly_name": "A"})
+
+
+class TestLiteralEntityIds:
+    """Tests for server-side subscription narrowing."""
+
+    def test_exact_ids(self) -> None:
+        event_filter = EventFilter(include=["light.b", "light.a", "light.c"], exclude=["light.c"])
+        assert event_filter.literal_entity_ids() == ["light.a", "light.b"]
+
+    def test_globs_need_everything(self) -> None:
+        assert EventFilter(include=["light"]).literal_entity_ids() is None
+        assert EventFilter().literal_entity_ids() is None
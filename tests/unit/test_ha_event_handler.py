@@ -17,6 +17,7 @@ import pytest
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+from src.ha.event_filter import EventFilter
 from src.ha.event_handler import EventHandler
 
 
@@ -109,6 +110,94 @@ class TestDrainQueue:
         assert len(handler._pending) == 0
 
 
+class TestIngestionFilter:
+    """Tests for filtering, diffing and overflow counters."""
+
+    @pytest.mark.asyncio
+    async def test_excluded_entities_not_queued(self) -> None:
+        """Entities outside the filter are counted but never queued."""
+        handler = EventHandler(event_filter=EventFilter(include=["light"], exclude=["light.x"]))
+        await handler.handle_event(_state_event("light.kitchen", "on"))
+        await handler.handle_event(_state_event("light.x", "on"))
+        await handler.handle_event(_state_event("sensor.noise", "1"))
+
+        assert handler._queue.qsize() == 1
+        assert handler.stats["events_received"] == 3
+        assert handler.stats["events_filtered"] == 2
+
+    @pytest.mark.asyncio
+    async def test_state_mirror_sees_filtered_events(self) -> None:
+        """The mirror is updated even for entities the filter excludes."""
+        mirror = MagicMock()
+        handler = EventHandler(state_mirror=mirror, event_filter=EventFilter(include=["light"]))
+        event = _state_event("sensor.noise", "1")
+        await handler.handle_event(event)
+
+        mirror.apply_event.assert_called_once_with(event)
+        assert handler._queue.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_noop_updates_skipped(self) -> None:
+        """A state equal to the last accepted one (e.g. only last_updated moved) is dropped."""
+        handler = EventHandler()
+        first = _state_event("sensor.t", "21")
+        repeat = _state_event("sensor.t", "21")
+        repeat["data"]["new_state"]["last_updated"] = "2026-01-01T00:00:05+00:00"  # type: ignore[index]
+        await handler.handle_event(first)
+        await handler.handle_event(repeat)
+
+        assert handler._queue.qsize() == 1
+        assert handler.stats["events_unchanged"] == 1
+
+    @pytest.mark.asyncio
+    async def test_attribute_allowlist(self) -> None:
+        """Changes to attributes outside the allowlist do not count as changes."""
+        handler = EventHandler(event_filter=EventFilter(attributes=["brightness"]))
+        await handler.handle_event(_state_event("light.a", "on", brightness=10, rssi=-40))
+        await handler.handle_event(_state_event("light.a", "on", brightness=10, rssi=-41))
+        await handler.handle_event(_state_event("light.a", "on", brightness=20, rssi=-41))
+
+        assert handler._queue.qsize() == 2
+        assert handler.stats["events_unchanged"] == 1
+
+    @pytest.mark.asyncio
+    async def test_return_to_earlier_state_is_kept(self) -> None:
+        """off -> on -> off must keep the final off even though it matches the first."""
+        handler = EventHandler()
+        for state in ("off", "on", "off"):
+            await handler.handle_event(_state_event("light.a", state))
+
+        handler._drain_queue()
+        assert handler._pending["light.a"]["state"] == "off"
+        assert handler.stats["events_coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_overflow_counts_dropped(self) -> None:
+        """Dropped events are counted and do not suppress an identical retry."""
+        handler = EventHandler(queue_size=1)
+        await handler.handle_event(_state_event("a", "1"))
+        await handler.handle_event(_state_event("b", "2"))
+        await handler.handle_event(_state_event("a", "1"))
+
+        assert handler.stats["events_dropped"] == 2
+        assert handler.stats["events_unchanged"] == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_shrinks_with_depth(self) -> None:
+        """A fuller queue flushes sooner, down to the minimum interval."""
+        handler = EventHandler(batch_interval=2.0, queue_size=4, min_batch_interval=0.25)
+        assert handler._next_interval() == 2.0
+
+        for i in range(2):
+            await handler.handle_event(_state_event(f"sensor.t{i}", "1"))
+        assert handler._next_interval() == 1.0
+        assert handler._wake.is_set()
+
+        for i in range(2, 4):
+            await handler.handle_event(_state_event(f"sensor.t{i}", "1"))
+        assert handler._next_interval() == 0.25
+
+
 class TestFlushToDb:
     """Tests for _flush_to_db() batch upsert logic."""
 
@@ -366,3 +366,145 @@ class TestHAEventStreamLifecycle:
 
         assert len(received) == 1
         assert received[0]["event_type"] == "state_changed"
+
+
+class TestHAEventStreamSharedSession:
+    """Subscription over a shared HAWebSocketSession."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_events_from_shared_session(self) -> None:
+        """Events from the session queue reach the handler; close triggers reconnect."""
+        received: list[dict[str, Any]] = []
+
+        async def handler(event: dict[str, Any]) -> None:
+            received.append(event)
+
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        queue.put_nowait({"event_type": "state_changed", "data": {"entity_id": "light.a"}})
+        queue.put_nowait(None)
+        session = AsyncMock()
+        session.subscribe = AsyncMock(return_value=queue)
+        connected: list[bool] = []
+
+        stream = HAEventStream(
+            WS_URL,
+            TOKEN,
+            handler=handler,
+            on_connected=lambda: connected.append(True),
+            on_disconnected=lambda: connected.append(False),
+            session=session,
+        )
+
+        with pytest.raises(ConnectionError):
+            stream._running = True
+            await stream._connect_and_subscribe()
+
+        session.subscribe.assert_awaited_once_with("subscribe_events", event_type="state_changed")
+        assert received[0]["data"]["entity_id"] == "light.a"
+        assert connected == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_ends_subscriptions(self) -> None:
+        """A failing handler unsubscribes and stops the forwarders before a retry."""
+        handler = AsyncMock(side_effect=ValueError("boom"))
+        queues: list[asyncio.Queue[dict[str, Any] | None]] = []
+
+        async def subscribe(*args: Any, **kwargs: Any) -> asyncio.Queue[dict[str, Any] | None]:
+            queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+            queues.append(queue)
+            return queue
+
+        session = AsyncMock()
+        session.subscribe = AsyncMock(side_effect=subscribe)
+        stream = HAEventStream(
+            WS_URL,
+            TOKEN,
+            handler=handler,
+            session=session,
+            event_types=("state_changed", "call_service"),
+        )
+
+        stream._running = True
+        task = asyncio.create_task(stream._connect_and_subscribe())
+        await asyncio.sleep(0)
+        queues[0].put_nowait({"event_type": "state_changed"})
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(task, timeout=1)
+        await asyncio.sleep(0)
+
+        assert [c.args[0] for c in session.unsubscribe.await_args_list] == queues
+        assert not stream._forwarders
+
+    @pytest.mark.asyncio
+    async def test_full_merged_queue_drops_oldest(self) -> None:
+        """Forwarding into a full merged queue drops the oldest events and counts them."""
+        stream = HAEventStream(WS_URL, TOKEN, handler=AsyncMock(), session=AsyncMock())
+        source: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        for n in range(3):
+            source.put_nowait({"n": n})
+        source.put_nowait(None)
+        target: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=2)
+
+        await asyncio.wait_for(stream._forward(source, target), timeout=1)
+
+        assert stream.events_dropped == 2
+        assert [target.get_nowait(), target.get_nowait()] == [{"n": 2}, None]
+
+    @pytest.mark.asyncio
+    async def test_compressed_subscription_expands_diffs(self) -> None:
+        """subscribe_entities adds and diffs arrive as full state_changed events."""
+        received: list[dict[str, Any]] = []
+
+        async def handler(event: dict[str, Any]) -> None:
+            received.append(event)
+
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        queue.put_nowait(
+            {"a": {"light.a": {"s": "off", "a": {"friendly_name": "A", "brightness": 10}, "lc": 0}}}
+        )
+        queue.put_nowait(
+            {"c": {"light.a": {"+": {"s": "on", "lc": 60}, "-": {"a": ["brightness"]}}}}
+        )
+        queue.put_nowait({"r": ["light.a"]})
+        queue.put_nowait(None)
+        session = AsyncMock()
+        session.subscribe = AsyncMock(return_value=queue)
+
+        stream = HAEventStream(
+            WS_URL,
+            TOKEN,
+            handler=handler,
+            session=session,
+            compressed=True,
+            entity_ids=["light.a"],
+        )
+
+        with pytest.raises(ConnectionError):
+            stream._running = True
+            await stream._connect_and_subscribe()
+
+        session.subscribe.assert_awaited_once_with("subscribe_entities", entity_ids=["light.a"])
+        added, changed, removed = (e["data"] for e in received)
+        assert added["new_state"]["last_changed"] == "1970-01-01T00:00:00+00:00"
+        assert changed["old_state"] is added["new_state"]
+        assert changed["new_state"]["state"] == "on"
+        assert changed["new_state"]["attributes"] == {"friendly_name": "A"}
+        assert changed["new_state"]["last_updated"] == "1970-01-01T00:01:00+00:00"
+        assert removed["new_state"] is None
+
+    @pytest.mark.asyncio
+    async def test_rejected_compressed_subscription_falls_back(self) -> None:
+        """HA without subscribe_entities gets subscribe_events on the next connect."""
+        from src.exceptions import HAClientError
+
+        session = AsyncMock()
+        session.subscribe = AsyncMock(side_effect=HAClientError("Unknown command", tool="ws"))
+        stream = HAEventStream(WS_URL, TOKEN, handler=AsyncMock(), session=session, compressed=True)
+
+        with pytest.raises(HAClientError):
+            await stream._connect_and_subscribe()
+
+        assert stream._state_subscription() == {
+            "type": "subscribe_events",
+            "event_type": "state_changed",
+        }
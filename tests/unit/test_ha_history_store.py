@@ -0,0 +1,229 @@
+"""Unit tests for the local HA history store.
+
+Covers coverage planning (full/tail/hit), ingestion de-duplication,
+live event appends while the stream is connected, window queries,
+retention limits, and the EntityMixin read path through the store.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.ha.entities import EntityMixin
+from src.ha.event_handler import EventHandler
+from src.ha.history_store import HistoryStore, parse_timestamp
+
+_T0 = datetime.now(UTC).timestamp() - 86_400
+
+
+def T(offset: float) -> float:
+    """Timestamp ``offset`` seconds after a fixed point one day ago."""
+    return _T0 + offset
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, UTC).isoformat()
+
+
+def _rows(*samples: tuple[float, str]) -> list[dict[str, str]]:
+    return [{"state": state, "last_changed": _iso(ts)} for ts, state in samples]
+
+
+class TestParseTimestamp:
+    def test_parses_z_suffix(self):
+        assert (
+            parse_timestamp("2024-01-01T00:00:00Z") == datetime(2024, 1, 1, tzinfo=UTC).timestamp()
+        )
+
+    def test_naive_is_utc(self):
+        assert parse_timestamp("2024-01-01T00:00:00") == parse_timestamp(
+            "2024-01-01T00:00:00+00:00"
+        )
+
+    def test_invalid_returns_none(self):
+        assert parse_timestamp("not-a-date") is None
+        assert parse_timestamp(None) is None
+
+
+class TestPlanFetch:
+    def test_unknown_entity_needs_full_fetch(self):
+        store = HistoryStore()
+        assert store.plan_fetch("sensor.p", T(100.0), T(200.0)) == T(100.0)
+        assert store.stats["full_fetches"] == 1
+
+    def test_covered_window_is_a_hit(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1")), T(100.0), T(200.0))
+        assert store.plan_fetch("sensor.p", T(120.0), T(180.0)) is None
+        assert store.stats["hits"] == 1
+
+    def test_newer_window_fetches_only_tail(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1")), T(100.0), T(200.0))
+        assert store.plan_fetch("sensor.p", T(150.0), T(300.0)) == T(200.0)
+        assert store.stats["tail_fetches"] == 1
+
+    def test_older_window_needs_full_fetch(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1")), T(100.0), T(200.0))
+        assert store.plan_fetch("sensor.p", T(50.0), T(200.0)) == T(50.0)
+
+    def test_live_series_is_current(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1")), T(100.0), T(200.0))
+        store.mark_live(since=T(150.0))
+        assert store.plan_fetch("sensor.p", T(100.0), T(10_000.0)) is None
+
+    def test_disconnect_closes_coverage(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1")), T(100.0), T(200.0))
+        store.mark_live(since=T(150.0))
+        store.mark_stale(at=T(500.0))
+        assert store.plan_fetch("sensor.p", T(100.0), T(900.0)) == T(500.0)
+
+
+class TestIngestAndQuery:
+    def test_tail_ingest_appends_without_duplicates(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1"), (T(150.0), "2")), T(100.0), T(200.0))
+        # HA repeats the state in effect at the tail start
+        store.ingest("sensor.p", _rows((T(200.0), "2"), (T(250.0), "3")), T(200.0), T(300.0))
+
+        rows = store.query("sensor.p", T(100.0), T(300.0))
+        assert [r["state"] for r in rows] == ["1", "2", "3"]
+
+    def test_query_includes_state_at_window_start(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1"), (T(150.0), "2")), T(100.0), T(200.0))
+
+        rows = store.query("sensor.p", T(120.0), T(200.0))
+        assert [r["state"] for r in rows] == ["1", "2"]
+        assert rows[0]["last_changed"] == _iso(T(120.0))
+
+    def test_query_unknown_entity(self):
+        assert HistoryStore().query("sensor.none", T(0.0), T(1.0)) == []
+
+    def test_skips_malformed_rows(self):
+        store = HistoryStore()
+        store.ingest(
+            "sensor.p",
+            [
+                {"state": "1", "last_changed": "garbage"},
+                {"state": None, "last_changed": _iso(T(1))},
+            ],
+            T(0.0),
+            T(10.0),
+        )
+        assert store.query("sensor.p", T(0.0), T(10.0)) == []
+
+    def test_max_samples_trims_oldest(self):
+        store = HistoryStore(max_samples_per_entity=3)
+        store.ingest(
+            "sensor.p", _rows(*[(T(float(t)), str(t)) for t in range(1, 6)]), T(0.0), T(10.0)
+        )
+
+        assert store.stats["samples"] == 3
+        # Coverage moves forward with the trimmed data
+        assert store.plan_fetch("sensor.p", T(0.0), T(10.0)) == T(0.0)
+
+    def test_invalidate(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(1.0), "1")), T(0.0), T(10.0))
+        store.invalidate("sensor.p")
+        assert store.stats["entities"] == 0
+
+
+class TestLiveRecording:
+    def test_records_changes_for_current_series(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1")), T(100.0), T(200.0))
+        store.mark_live(since=T(150.0))
+        store.record("sensor.p", "5", _iso(T(300.0)))
+
+        assert [r["state"] for r in store.query("sensor.p", T(100.0), T(400.0))] == ["1", "5"]
+        assert store.stats["live_appends"] == 1
+
+    def test_ignores_untracked_and_gapped_series(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1")), T(100.0), T(200.0))
+        store.mark_live(since=T(250.0))  # gap between 200 and 250
+        store.record("sensor.p", "5", _iso(T(300.0)))
+        store.record("sensor.other", "1", _iso(T(300.0)))
+
+        assert store.stats["live_appends"] == 0
+        assert store.stats["entities"] == 1
+
+    @pytest.mark.asyncio
+    async def test_event_handler_feeds_store(self):
+        store = HistoryStore()
+        store.ingest("sensor.p", _rows((T(110.0), "1")), T(100.0), T(200.0))
+        store.mark_live(since=T(150.0))
+        handler = EventHandler(history_store=store)
+
+        await handler.handle_event(
+            {
+                "data": {
+                    "entity_id": "sensor.p",
+                    "new_state": {"state": "7", "last_changed": _iso(T(300.0))},
+                }
+            }
+        )
+        handler._drain_queue()
+
+        assert store.query("sensor.p", T(250.0), T(400.0))[-1]["state"] == "7"
+
+
+class _StoreClient(EntityMixin):
+    def __init__(self, store: HistoryStore) -> None:
+        self._request = AsyncMock()
+        self.history_store = store
+
+
+class TestEntityMixinStorePath:
+    @pytest.mark.asyncio
+    async def test_repeated_window_served_from_store(self):
+        client = _StoreClient(HistoryStore())
+        now = datetime.now(UTC)
+        client._request.return_value = [
+            [
+                {
+                    "entity_id": "sensor.p",
+                    "state": "1",
+                    "last_changed": (now - timedelta(hours=2)).isoformat(),
+                }
+            ]
+        ]
+
+        first = await client.get_history("sensor.p", hours=24)
+        client._request.reset_mock()
+        client._request.return_value = []
+        second = await client.get_history("sensor.p", hours=12)
+
+        assert first["count"] == 1
+        assert second["states"][0]["state"] == "1"
+        # Only the tail since the first read is requested
+        client._request.assert_called_once()
+        path = client._request.call_args[0][1]
+        fetched_from = datetime.fromisoformat(path.rsplit("/", 1)[1])
+        assert now - fetched_from < timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_batch_fetches_only_missing_entities(self):
+        store = HistoryStore()
+        client = _StoreClient(store)
+        now = datetime.now(UTC)
+        store.ingest("sensor.a", [], (now - timedelta(hours=48)).timestamp(), now.timestamp())
+        store.mark_live(since=(now - timedelta(hours=1)).timestamp())
+        client._request.return_value = [
+            [{"entity_id": "sensor.b", "state": "3", "last_changed": now.isoformat()}]
+        ]
+
+        result = await client.get_history_batch(["sensor.a", "sensor.b"], hours=24)
+
+        params = client._request.call_args[1]["params"]
+        assert params["filter_entity_id"] == "sensor.b"
+        assert result["sensor.a"]["count"] == 0
+        assert result["sensor.b"]["count"] == 1
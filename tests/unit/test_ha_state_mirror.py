@@ -0,0 +1,247 @@
+"""Unit tests for the in-memory HA state mirror.
+
+Covers bootstrap and index maintenance, live state/registry events,
+the staleness bound, and the EntityMixin / HARegistryCache read paths
+through the mirror (with REST fallback when it is too stale).
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.ha.entities import EntityMixin
+from src.ha.event_handler import EventHandler
+from src.ha.state_mirror import StateMirror
+from src.schema.ha.registry_cache import HARegistryCache
+
+
+def _state(entity_id: str, state: str = "on", **attributes: str) -> dict:
+    return {"entity_id": entity_id, "state": state, "attributes": attributes}
+
+
+_STATES = [
+    _state("light.kitchen", friendly_name="Kitchen"),
+    _state("light.hall", "off"),
+    _state("sensor.temp", "21", area_id="office"),
+]
+_REGISTRY = {
+    "light.kitchen": {"entity_id": "light.kitchen", "area_id": "kitchen", "device_id": "d1"},
+    "light.hall": {"entity_id": "light.hall", "area_id": "hall", "device_id": "d1"},
+}
+
+
+def _live_mirror() -> StateMirror:
+    mirror = StateMirror()
+    mirror.mark_live(since=time.time() - 1)
+    mirror.bootstrap(_STATES, _REGISTRY, fetched_at=time.time())
+    return mirror
+
+
+class TestIndexes:
+    def test_bootstrap_indexes_domain_area_device(self):
+        mirror = _live_mirror()
+
+        assert mirror.entity_ids(domain="light") == ["light.kitchen", "light.hall"]
+        assert mirror.entity_ids(area_id="kitchen") == ["light.kitchen"]
+        # Area falls back to the state attribute when the registry has none
+        assert mirror.entity_ids(area_id="office") == ["sensor.temp"]
+        assert mirror.entity_ids(device_id="d1", area_id="hall") == ["light.hall"]
+
+    def test_state_changed_adds_updates_and_removes(self):
+        mirror = _live_mirror()
+
+        mirror.apply_event(
+            {
+                "event_type": "state_changed",
+                "data": {"entity_id": "switch.fan", "new_state": _state("switch.fan")},
+            }
+        )
+        mirror.apply_event(
+            {
+                "event_type": "state_changed",
+                "data": {"entity_id": "light.hall", "new_state": _state("light.hall", "on")},
+            }
+        )
+        mirror.apply_event(
+            {"event_type": "state_changed", "data": {"entity_id": "sensor.temp", "new_state": None}}
+        )
+
+        assert mirror.entity_ids(domain="switch") == ["switch.fan"]
+        assert mirror.get_state("light.hall")["state"] == "on"
+        assert mirror.get_state("sensor.temp") is None
+        assert mirror.entity_ids(area_id="office") == []
+
+    def test_registry_remove_and_update(self):
+        mirror = _live_mirror()
+
+        mirror.apply_event(
+            {
+                "event_type": "entity_registry_updated",
+                "data": {"action": "remove", "entity_id": "light.kitchen"},
+            }
+        )
+        assert "light.kitchen" not in mirror.registry
+        assert mirror.entity_ids(area_id="kitchen") == []
+        assert not mirror.registry_dirty
+
+        mirror.apply_event(
+            {
+                "event_type": "entity_registry_updated",
+                "data": {"action": "update", "entity_id": "light.hall", "changes": {}},
+            }
+        )
+        assert mirror.registry_dirty
+
+    def test_older_state_not_applied(self):
+        mirror = _live_mirror()
+        newer = {**_state("light.hall", "on"), "last_updated": "2026-01-01T00:00:02+00:00"}
+        older = {**_state("light.hall", "off"), "last_updated": "2026-01-01T00:00:01+00:00"}
+
+        mirror.apply_state_changed({"entity_id": "light.hall", "new_state": newer})
+        mirror.apply_state_changed({"entity_id": "light.hall", "new_state": older})
+
+        assert mirror.get_state("light.hall")["state"] == "on"
+
+    def test_events_before_bootstrap_are_ignored(self):
+        mirror = StateMirror()
+        mirror.apply_state_changed({"entity_id": "light.x", "new_state": _state("light.x")})
+        assert mirror.states() == []
+
+
+class TestStaleness:
+    def test_exact_while_live(self):
+        mirror = _live_mirror()
+        assert mirror.staleness() == 0.0
+        assert mirror.is_usable()
+        assert not mirror.needs_bootstrap()
+
+    def test_bootstrap_before_connect_needs_rebootstrap(self):
+        mirror = StateMirror()
+        mirror.bootstrap(_STATES, _REGISTRY, fetched_at=time.time() - 1)
+        mirror.mark_live()
+        assert mirror.needs_bootstrap()
+
+    def test_disconnected_mirror_ages_out(self):
+        mirror = StateMirror(max_staleness_seconds=30)
+        mirror.mark_live(since=time.time() - 120)
+        mirror.bootstrap(_STATES, _REGISTRY, fetched_at=time.time() - 100)
+        mirror.mark_stale(at=time.time() - 60)
+
+        assert mirror.staleness() >= 60
+        assert not mirror.is_usable()
+
+    def test_unbootstrapped_is_unusable(self):
+        assert not StateMirror().is_usable()
+
+
+class _MirrorClient(EntityMixin):
+    def __init__(self, mirror: StateMirror) -> None:
+        self._request = AsyncMock()
+        self.state_mirror = mirror
+
+
+class TestEntityMixinMirrorPath:
+    @pytest.mark.asyncio
+    async def test_reads_served_from_live_mirror(self):
+        client = _MirrorClient(_live_mirror())
+
+        lights = await client.list_entities(domain="light")
+        entity = await client.get_entity("sensor.temp")
+
+        assert [e["entity_id"] for e in lights] == ["light.kitchen", "light.hall"]
+        assert lights[0]["area_id"] == "kitchen"
+        assert entity["state"] == "21"
+        client._request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_live_mirror_bootstraps_once(self):
+        mirror = StateMirror()
+        mirror.mark_live()
+        client = _MirrorClient(mirror)
+        client._request.side_effect = lambda method, path: (
+            list(_STATES) if path == "/api/states" else list(_REGISTRY.values())
+        )
+
+        await client.list_entities()
+        await client.list_entities(domain="sensor")
+
+        assert client._request.await_count == 2
+        assert mirror.stats["bootstraps"] == 1
+
+    @pytest.mark.parametrize("bootstrapped", [False, True])
+    @pytest.mark.asyncio
+    async def test_events_during_bootstrap_fetch_kept(self, bootstrapped):
+        mirror = StateMirror()
+        if bootstrapped:
+            mirror.bootstrap(_STATES, _REGISTRY, fetched_at=time.time() - 1)
+        mirror.mark_live()
+        client = _MirrorClient(mirror)
+
+        async def request(method, path):
+            if path != "/api/states":
+                return list(_REGISTRY.values())
+            # Fired after fetched_at, but the snapshot predates it
+            mirror.apply_event(
+                {
+                    "event_type": "state_changed",
+                    "data": {"entity_id": "light.hall", "new_state": _state("light.hall", "on")},
+                }
+            )
+            return list(_STATES)
+
+        client._request.side_effect = request
+
+        entity = await client.get_entity("light.hall")
+
+        assert entity["state"] == "on"
+        assert mirror.staleness() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_stale_mirror_falls_back_to_rest(self):
+        mirror = StateMirror(max_staleness_seconds=5)
+        mirror.bootstrap(_STATES, _REGISTRY, fetched_at=time.time() - 60)
+        client = _MirrorClient(mirror)
+        client._request.return_value = _state("sensor.temp", "23")
+
+        entity = await client.get_entity("sensor.temp")
+
+        assert entity["state"] == "23"
+        client._request.assert_awaited_once_with("GET", "/api/states/sensor.temp")
+
+
+class TestConsumers:
+    @pytest.mark.asyncio
+    async def test_registry_cache_uses_usable_mirror(self):
+        client = _MirrorClient(_live_mirror())
+        client.list_entities = AsyncMock()
+        cache = HARegistryCache(client)
+
+        assert await cache.entity_exists("light.hall")
+        assert await cache.get_entity_ids(domain="light") == {"light.kitchen", "light.hall"}
+        client.list_entities.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_event_handler_applies_events_immediately(self):
+        mirror = _live_mirror()
+        handler = EventHandler(state_mirror=mirror)
+
+        await handler.handle_event(
+            {
+                "event_type": "state_changed",
+                "data": {"entity_id": "light.kitchen", "new_state": _state("light.kitchen", "off")},
+            }
+        )
+        await handler.handle_event(
+            {
+                "event_type": "entity_registry_updated",
+                "data": {"action": "create", "entity_id": "light.new"},
+            }
+        )
+
+        assert mirror.get_state("light.kitchen")["state"] == "off"
+        assert mirror.registry_dirty
+        # Only state changes are queued for the debounced DB flush
+        assert handler.stats["events_received"] == 1
@@ -233,6 +233,183 @@ class TestWsCommand:
         # Connection should have been closed via context manager
 
 
+# ---------------------------------------------------------------------------
+# Tests: HAWebSocketSession
+# ---------------------------------------------------------------------------
+
+
+class _FakeHA:
+    """In-memory HA WebSocket server: answers each command by id.
+
+    Replies are released in the order given by ``reply_order`` (once that
+    many commands are pending) to exercise out-of-order multiplexing.
+    """
+
+    def __init__(self, reply_order: list[int] | None = None) -> None:
+        self.connections = 0
+        self.sent: list[dict[str, Any]] = []
+        self._reply_order = reply_order
+        self._inbox: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._held: list[dict[str, Any]] = []
+
+    def connect(self, url: str) -> _async_ctx:
+        self.connections += 1
+        self._inbox = asyncio.Queue()
+        for msg in (
+            {"type": "auth_required", "ha_version": "2025.1.0"},
+            {"type": "auth_ok", "ha_version": "2025.1.0"},
+        ):
+            self._inbox.put_nowait(msg)
+        ws = AsyncMock()
+        ws.send = AsyncMock(side_effect=self._on_send)
+        ws.recv = self._recv
+        return _async_ctx(ws)
+
+    async def _on_send(self, raw: str) -> None:
+        msg = json.loads(raw)
+        self.sent.append(msg)
+        if msg["type"] == "auth":
+            return
+        reply = {"id": msg["id"], "type": "result", "success": True, "result": msg["type"]}
+        if self._reply_order is None:
+            self._inbox.put_nowait(reply)
+            return
+        self._held.append(reply)
+        if len(self._held) == len(self._reply_order):
+            for i in self._reply_order:
+                self._inbox.put_nowait(self._held[i])
+            self._held.clear()
+
+    def push(self, msg: dict[str, Any] | None) -> None:
+        """Send a message to the client (None drops the connection)."""
+        self._inbox.put_nowait(msg)
+
+    async def _recv(self) -> str:
+        msg = await self._inbox.get()
+        if msg is None:
+            raise ConnectionError("connection closed")
+        return json.dumps(msg)
+
+
+class TestHAWebSocketSession:
+    """Test the shared, multiplexed WebSocket session."""
+
+    @pytest.mark.asyncio
+    async def test_commands_share_one_connection(self) -> None:
+        """Sequential ws_command calls reuse one authenticated socket."""
+        from src.ha.websocket import close_ws_sessions, ws_command
+
+        server = _FakeHA()
+        with patch("src.ha.websocket.ws_connect", side_effect=server.connect):
+            first = await ws_command(WS_URL, TOKEN, "input_boolean/create", name="a")
+            second = await ws_command(WS_URL, TOKEN, "input_number/create", name="b")
+            await close_ws_sessions()
+
+        assert (first, second) == ("input_boolean/create", "input_number/create")
+        assert server.connections == 1
+        commands = [m for m in server.sent if m["type"] != "auth"]
+        assert [m["id"] for m in commands] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands_are_multiplexed(self) -> None:
+        """Pipelined commands get their own results even when answered out of order."""
+        from src.ha.websocket import close_ws_sessions, get_ws_session
+
+        server = _FakeHA(reply_order=[2, 0, 1])
+        with patch("src.ha.websocket.ws_connect", side_effect=server.connect):
+            session = get_ws_session(WS_URL, TOKEN)
+            results = await asyncio.gather(
+                session.command("a/list"),
+                session.command("b/list"),
+                session.command("c/list"),
+            )
+            await close_ws_sessions()
+
+        assert results == ["a/list", "b/list", "c/list"]
+        assert server.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_drop(self) -> None:
+        """A dropped socket is re-opened and re-authenticated on the next command."""
+        from src.ha.websocket import close_ws_sessions, get_ws_session
+
+        server = _FakeHA()
+        with patch("src.ha.websocket.ws_connect", side_effect=server.connect):
+            session = get_ws_session(WS_URL, TOKEN)
+            await session.command("a/list")
+            server.push(None)
+            await asyncio.sleep(0.01)
+            assert not session.connected
+
+            assert await session.command("b/list") == "b/list"
+            await close_ws_sessions()
+
+        assert server.connections == 2
+        assert sum(1 for m in server.sent if m["type"] == "auth") == 2
+
+    @pytest.mark.asyncio
+    async def test_subscription_receives_events(self) -> None:
+        """Events are routed to the subscription queue; None marks a disconnect."""
+        from src.ha.websocket import close_ws_sessions, get_ws_session
+
+        server = _FakeHA()
+        with patch("src.ha.websocket.ws_connect", side_effect=server.connect):
+            session = get_ws_session(WS_URL, TOKEN)
+            queue = await session.subscribe("subscribe_events", event_type="state_changed")
+            sub_id = server.sent[-1]["id"]
+            server.push({"id": sub_id, "type": "event", "event": {"event_type": "x"}})
+            event = await asyncio.wait_for(queue.get(), timeout=1)
+            server.push(None)
+            closed = await asyncio.wait_for(queue.get(), timeout=1)
+            await close_ws_sessions()
+
+        assert event == {"event_type": "x"}
+        assert closed is None
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_events(self) -> None:
+        """unsubscribe tells HA to stop and drops the queue from routing."""
+        from src.ha.websocket import close_ws_sessions, get_ws_session
+
+        server = _FakeHA()
+        with patch("src.ha.websocket.ws_connect", side_effect=server.connect):
+            session = get_ws_session(WS_URL, TOKEN)
+            queue = await session.subscribe("subscribe_events", event_type="state_changed")
+            sub_id = server.sent[-1]["id"]
+            await session.unsubscribe(queue)
+            server.push({"id": sub_id, "type": "event", "event": {"event_type": "x"}})
+            await session.command("a/list")
+            await session.unsubscribe(queue)  # already ended: no-op
+            await close_ws_sessions()
+
+        unsubscribes = [m for m in server.sent if m["type"] == "unsubscribe_events"]
+        assert [m["subscription"] for m in unsubscribes] == [sub_id]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_full_subscription_queue_drops_oldest(self) -> None:
+        """A slow consumer loses the oldest events, never the disconnect marker."""
+        from src.ha.websocket import close_ws_sessions, get_ws_session
+
+        server = _FakeHA()
+        with (
+            patch("src.ha.websocket.ws_connect", side_effect=server.connect),
+            patch("src.ha.websocket.SUBSCRIPTION_QUEUE_SIZE", 2),
+        ):
+            session = get_ws_session(WS_URL, TOKEN)
+            queue = await session.subscribe("subscribe_events", event_type="state_changed")
+            sub_id = server.sent[-1]["id"]
+            for n in range(3):
+                server.push({"id": sub_id, "type": "event", "event": {"n": n}})
+            await session.command("a/list")
+            server.push(None)
+            await asyncio.sleep(0.01)
+            await close_ws_sessions()
+
+        assert session.events_dropped == 1
+        assert [queue.get_nowait(), queue.get_nowait()] == [{"n": 2}, None]
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -0,0 +1,199 @@
+"""Unit tests for the local fast-path intent router."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.agents import config_cache
+from src.agents.intent_router import (
+    PATTERN_CONFIDENCE,
+    IntentRouter,
+    get_intent_router,
+    record_routing_decision,
+    reset_intent_router,
+)
+
+AGENTS = [
+    {
+        "name": "architect",
+        "domain": "home",
+        "description": "Automation design and user interaction.",
+        "intent_patterns": ["home_automation", "device_control", "lights", "scenes"],
+        "capabilities": ["control_devices", "create_automations", "query_entities"],
+    },
+    {
+        "name": "knowledge",
+        "domain": "knowledge",
+        "description": "General knowledge and questions.",
+        "intent_patterns": ["general_question", "explain", "trivia", "how_to"],
+        "capabilities": ["answer_questions", "explain_concepts"],
+    },
+    {
+        "name": "dashboard_designer",
+        "domain": "dashboard",
+        "description": "Lovelace dashboard design, YAML generation, and deployment.",
+        "intent_patterns": ["dashboard_design", "lovelace", "ui_layout", "cards"],
+        "capabilities": ["design_dashboards", "generate_yaml", "deploy_dashboards"],
+    },
+    {
+        "name": "food",
+        "domain": "food",
+        "description": "Cooking, recipes, meal planning, and kitchen appliance control.",
+        "intent_patterns": ["hungry", "recipe", "order_food", "preheat"],
+        "capabilities": ["search_recipes", "order_food"],
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    reset_intent_router()
+    config_cache.clear_config_cache()
+    yield
+    reset_intent_router()
+    config_cache.clear_config_cache()
+
+
+@pytest.fixture
+def router_settings():
+    settings = MagicMock(intent_router_enabled=True, intent_router_confidence_threshold=0.8)
+    with patch("src.settings.get_settings", return_value=settings):
+        yield settings
+
+
+class TestPatternMatching:
+    def test_unique_pattern_routes(self):
+        match = IntentRouter(AGENTS).route("Turn off the kitchen lights")
+        assert match is not None
+        assert match.agent == "architect"
+        assert match.method == "pattern"
+        assert "lights" in match.reasoning
+
+    def test_underscore_pattern_matches_words(self):
+        match = IntentRouter(AGENTS).route("can you order food for tonight")
+        assert match is not None
+        assert match.agent == "food"
+
+    def test_plural_and_singular(self):
+        assert IntentRouter(AGENTS).route("add two cards").agent == "dashboard_designer"
+        assert IntentRouter(AGENTS).route("find a recipe").agent == "food"
+
+    def test_word_boundaries(self):
+        match = IntentRouter(AGENTS).route("what is a lightsaber")
+        assert match is None or match.method != "pattern"
+
+    def test_patterns_of_two_agents_defer(self):
+        assert IntentRouter(AGENTS).route("explain the lights") is None
+
+    def test_threshold(self):
+        router = IntentRouter(AGENTS, threshold=PATTERN_CONFIDENCE + 0.01)
+        assert router.route("Turn off the kitchen lights") is None
+
+
+class TestClassifier:
+    def test_routes_on_profile_terms(self):
+        match = IntentRouter(AGENTS).route("design a new dashboard")
+        assert match is not None
+        assert match.agent == "dashboard_designer"
+        assert match.method == "classifier"
+        assert match.confidence >= 0.8
+
+    def test_no_overlap_defers(self):
+        assert IntentRouter(AGENTS).route("what is the capital of France") is None
+
+    def test_threshold(self):
+        message = "design a new dashboard"
+        confidence = IntentRouter(AGENTS).route(message).confidence
+        assert IntentRouter(AGENTS, threshold=min(confidence + 0.01, 1.0)).route(message) is None
+
+    def test_learns_from_history(self):
+        message = "what should we eat tonight"
+        assert IntentRouter(AGENTS).route(message) is None
+
+        history = [("what should we eat for dinner", "food"), ("what to eat tonight", "food")]
+        match = IntentRouter(AGENTS, history=history).route(message)
+        assert match is not None
+        assert match.agent == "food"
+
+    def test_history_for_unknown_agents_ignored(self):
+        router = IntentRouter(AGENTS, history=[("what should we eat", "removed_agent")])
+        assert "removed_agent" not in router.scores("what should we eat")
+
+
+@pytest.mark.usefixtures("router_settings")
+class TestGetIntentRouter:
+    def test_reused_while_agents_unchanged(self):
+        router = get_intent_router(AGENTS)
+        assert get_intent_router([dict(a) for a in AGENTS]) is router
+
+    def test_rebuilt_when_agents_change(self):
+        router = get_intent_router(AGENTS)
+        changed = [*AGENTS[:-1], {**AGENTS[-1], "intent_patterns": ["pizza"]}]
+        assert get_intent_router(changed) is not router
+
+    def test_rebuilt_with_new_decisions(self):
+        router = get_intent_router(AGENTS)
+        record_routing_decision("what should we eat for dinner", "food")
+        assert get_intent_router(AGENTS) is not router
+
+    def test_disabled(self, router_settings):
+        router_settings.intent_router_enabled = False
+        assert get_intent_router(AGENTS) is None
+
+    def test_no_agents(self):
+        assert get_intent_router([]) is None
+
+
+def _agent_row(name: str, routable: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        domain="home",
+        description="desc",
+        intent_patterns=["lights"],
+        capabilities=None,
+        is_routable=routable,
+    )
+
+
+class TestRoutingAgentsCache:
+    @pytest.fixture
+    def repo(self):
+        repo = MagicMock()
+        repo.list_all = AsyncMock(return_value=[_agent_row("architect"), _agent_row("x", False)])
+
+        @asynccontextmanager
+        async def session():
+            yield MagicMock()
+
+        with (
+            patch("src.storage.get_session", session),
+            patch("src.dal.agents.AgentRepository", return_value=repo),
+        ):
+            yield repo
+
+    @pytest.mark.asyncio
+    async def test_cached_between_calls(self, repo):
+        agents = await config_cache.get_routing_agents()
+        assert [a["name"] for a in agents] == ["architect"]
+        assert agents[0]["capabilities"] == []
+
+        await config_cache.get_routing_agents()
+        assert repo.list_all.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidated_on_agent_change(self, repo):
+        await config_cache.get_routing_agents()
+        config_cache.invalidate_agent_config("architect")
+        await config_cache.get_routing_agents()
+        assert repo.list_all.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_db_error_serves_stale(self, repo):
+        await config_cache.get_routing_agents()
+        repo.list_all.side_effect = SQLAlchemyError("down")
+        with patch.object(config_cache, "_routing_agents_fetched_at", 0.0):
+            agents = await config_cache.get_routing_agents()
+        assert [a["name"] for a in agents] == ["architect"]
@@ -0,0 +1,206 @@
+"""Unit tests for the adaptive LLM concurrency limiter."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api.metrics import get_metrics_collector
+from src.llm import (
+    AdaptiveConcurrencyLimiter,
+    Priority,
+    _concurrency_limiters,
+    _get_concurrency_limiter,
+    llm_priority,
+)
+from src.llm.concurrency import get_llm_priority, is_overload_error
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    _concurrency_limiters.clear()
+    get_metrics_collector().reset()
+    yield
+    _concurrency_limiters.clear()
+
+
+class TestPriority:
+    def test_default_is_normal(self):
+        assert get_llm_priority() is Priority.NORMAL
+
+    def test_context_manager_restores(self):
+        with llm_priority(Priority.BACKGROUND):
+            assert get_llm_priority() is Priority.BACKGROUND
+        assert get_llm_priority() is Priority.NORMAL
+
+
+class TestIsOverloadError:
+    def test_status_code(self):
+        assert is_overload_error(_RateLimitError())
+
+    def test_response_status(self):
+        error = Exception("unavailable")
+        error.response = MagicMock(status_code=503)  # type: ignore[attr-defined]
+        assert is_overload_error(error)
+
+    def test_other_errors(self):
+        assert not is_overload_error(ValueError("bad request"))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    @pytest.mark.asyncio
+    async def test_bounds_in_flight(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=2)
+        peak = 0
+
+        async def call() -> None:
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert limiter.in_flight == 0
+        assert limiter.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=1)
+        order: list[str] = []
+        await limiter.acquire()
+
+        async def call(name: str, priority: Priority) -> None:
+            async with limiter.slot(priority):
+                order.append(name)
+
+        tasks = [
+            asyncio.create_task(call("scheduled", Priority.BACKGROUND)),
+            asyncio.create_task(call("default", Priority.NORMAL)),
+            asyncio.create_task(call("chat", Priority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        assert limiter.queued == 3
+        limiter.release()
+        await asyncio.gather(*tasks)
+        assert order == ["chat", "default", "scheduled"]
+
+    @pytest.mark.asyncio
+    async def test_priority_from_context(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=1)
+        order: list[str] = []
+        await limiter.acquire()
+
+        async def call(name: str) -> None:
+            async with limiter.slot():
+                order.append(name)
+
+        with llm_priority(Priority.BACKGROUND):
+            background = asyncio.create_task(call("scheduled"))
+        with llm_priority(Priority.INTERACTIVE):
+            chat = asyncio.create_task(call("chat"))
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(background, chat)
+        assert order == ["chat", "scheduled"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_block(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.queued == 0
+
+        limiter.release()
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_overload_cuts_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=10)
+        with pytest.raises(_RateLimitError):
+            async with limiter.slot():
+                raise _RateLimitError()
+        assert limiter.limit == pytest.approx(7.0)
+        assert limiter.in_flight == 0
+        assert get_metrics_collector().get_metrics()["llm_resilience"] == {
+            "concurrency_overload": 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_other_errors_leave_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=10)
+        with pytest.raises(ValueError):
+            async with limiter.slot():
+                raise ValueError("bad request")
+        assert limiter.limit == 10.0
+
+    def test_never_below_min_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=2, min_limit=1)
+        for _ in range(10):
+            limiter.in_flight += 1
+            limiter.release(overloaded=True)
+        assert limiter.limit == 1.0
+
+    def test_grows_while_utilized(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=4, max_limit=5)
+        for _ in range(100):
+            limiter.in_flight = 4
+            limiter.release(100.0)
+        assert limiter.limit == 5.0
+
+    def test_idle_limit_does_not_grow(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=4)
+        for _ in range(100):
+            limiter.in_flight = 1
+            limiter.release(100.0)
+        assert limiter.limit == 4.0
+
+    def test_latency_rise_cuts_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_limit=10)
+        for _ in range(20):
+            limiter.in_flight = 1
+            limiter.release(100.0)
+        for _ in range(3):
+            limiter.in_flight = 1
+            limiter.release(2000.0)
+        assert limiter.limit < 10.0
+
+    @pytest.mark.asyncio
+    async def test_publishes_state(self):
+        limiter = AdaptiveConcurrencyLimiter("openai:gpt-4o", initial_limit=3)
+        await limiter.acquire()
+        state = get_metrics_collector().get_metrics()["llm_concurrency"]["openai:gpt-4o"]
+        assert state == {"limit": 3.0, "in_flight": 1, "queued": 0}
+
+
+class TestGetConcurrencyLimiter:
+    def test_shared_per_provider_model(self):
+        limiter = _get_concurrency_limiter("openai", "gpt-4o")
+        assert limiter is _get_concurrency_limiter("openai", "gpt-4o")
+        assert limiter is not _get_concurrency_limiter("openai", "gpt-4o-mini")
+
+    def test_uses_settings(self):
+        settings = MagicMock(
+            llm_concurrency_enabled=True,
+            llm_concurrency_initial_limit=3,
+            llm_concurrency_max_limit=6,
+        )
+        with patch("src.settings.get_settings", return_value=settings):
+            limiter = _get_concurrency_limiter("openai", "gpt-4o")
+        assert limiter is not None
+        assert limiter.limit == 3.0
+        assert limiter.max_limit == 6
+
+    def test_disabled(self):
+        settings = MagicMock(llm_concurrency_enabled=False)
+        with patch("src.settings.get_settings", return_value=settings):
+            assert _get_concurrency_limiter("openai", "gpt-4o") is None
@@ -3,6 +3,7 @@
 Tests retry logic, circuit breaker, and provider failover.
 """
 
+import asyncio
 from collections.abc import AsyncIterator
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -13,7 +14,19 @@ from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
 from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
 from pydantic import Field
 
-from src.llm import CircuitBreaker, ResilientLLM, _circuit_breakers, _get_circuit_breaker
+from src.llm import (
+    MAX_RETRIES,
+    CircuitBreaker,
+    LatencyTracker,
+    ResilientLLM,
+    _circuit_breakers,
+    _concurrency_limiters,
+    _get_circuit_breaker,
+    _get_concurrency_limiter,
+    _get_latency_tracker,
+    _latency_trackers,
+    retry_delay,
+)
 
 
 def _chat_result(content: str) -> ChatResult:
@@ -58,12 +71,45 @@ class StubChatModel(BaseChatModel):
             yield chunk
 
 
+class SlowChatModel(BaseChatModel):
+    """BaseChatModel that answers (or raises) after a delay."""
+
+    delay: float = 0.0
+    response: Any = None
+    cancelled: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow"
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        raise NotImplementedError("Use async tests")
+
+    async def _agenerate(
+        self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if isinstance(self.response, BaseException):
+            raise self.response
+        return self.response
+
+
 @pytest.fixture(autouse=True)
 def reset_circuit_breakers():
     """Reset global circuit breakers between tests to prevent state leakage."""
     _circuit_breakers.clear()
+    _latency_trackers.clear()
+    _concurrency_limiters.clear()
     yield
     _circuit_breakers.clear()
+    _latency_trackers.clear()
+    _concurrency_limiters.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -127,6 +173,60 @@ class TestCircuitBreaker:
         assert not cb.circuit_open
         assert cb.failure_count == 0
 
+    def test_half_open_allows_one_probe(self):
+        """After cooldown only one probe is let through until it reports back."""
+        current_time = 1000.0
+        cb = CircuitBreaker(
+            failure_threshold=2, cooldown_seconds=60, time_func=lambda: current_time
+        )
+        cb.record_failure()
+        cb.record_failure()
+
+        current_time = 1061.0
+        assert cb.can_attempt()
+        assert cb.half_open
+        assert not cb.can_attempt()
+
+        cb.record_success()
+        assert not cb.half_open
+        assert cb.can_attempt()
+        assert cb.can_attempt()
+
+    def test_failed_probe_reopens(self):
+        """A failed probe reopens the circuit for another cooldown."""
+        current_time = 1000.0
+        cb = CircuitBreaker(
+            failure_threshold=2, cooldown_seconds=60, time_func=lambda: current_time
+        )
+        cb.record_failure()
+        cb.record_failure()
+
+        current_time = 1061.0
+        assert cb.can_attempt()
+        cb.record_failure()
+        assert cb.circuit_open
+        assert not cb.can_attempt()
+
+        current_time = 1122.0
+        assert cb.can_attempt()
+
+    def test_abandoned_probe_times_out(self):
+        """A probe that never reports back stops blocking after the probe timeout."""
+        current_time = 1000.0
+        cb = CircuitBreaker(
+            failure_threshold=1,
+            cooldown_seconds=10,
+            probe_timeout_seconds=5,
+            time_func=lambda: current_time,
+        )
+        cb.record_failure()
+        current_time = 1010.0
+        assert cb.can_attempt()
+        current_time = 1014.0
+        assert not cb.can_attempt()
+        current_time = 1015.0
+        assert cb.can_attempt()
+
     def test_global_circuit_breakers(self):
         """Test circuit breakers are shared per provider."""
         cb1 = _get_circuit_breaker("openai")
@@ -137,6 +237,290 @@ class TestCircuitBreaker:
         assert cb1 is not cb3  # Different provider = different breaker
 
 
+class TestRetryDelay:
+    """Tests for jittered backoff and Retry-After."""
+
+    def test_jitter_bounds(self):
+        delays = [retry_delay(4) for _ in range(200)]
+        assert all(2 <= d <= 4 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_seconds_header(self):
+        error = Exception("rate limited")
+        error.response = MagicMock(headers={"retry-after": "7"})  # type: ignore[attr-defined]
+        assert retry_delay(1, error) == 7
+
+    def test_retry_after_ms_header(self):
+        error = Exception("rate limited")
+        error.response = MagicMock(  # type: ignore[attr-defined]
+            headers={"retry-after-ms": "250", "retry-after": "1"}
+        )
+        assert retry_delay(1, error) == 0.25
+
+    def test_retry_after_http_date(self):
+        from email.utils import formatdate
+
+        error = Exception("unavailable")
+        error.response = MagicMock(  # type: ignore[attr-defined]
+            headers={"retry-after": formatdate(usegmt=True)}
+        )
+        assert 0 <= retry_delay(4, error) <= 1
+
+    def test_retry_after_capped(self):
+        error = Exception("rate limited")
+        error.retry_after = 3600  # type: ignore[attr-defined]
+        assert retry_delay(1, error) == 30.0
+
+    def test_unparseable_retry_after_uses_backoff(self):
+        error = Exception("rate limited")
+        error.response = MagicMock(headers={"retry-after": "soon"})  # type: ignore[attr-defined]
+        assert 0.5 <= retry_delay(1, error) <= 1
+
+
+class TestLatencyTracker:
+    """Tests for the rolling latency window."""
+
+    def test_needs_min_samples(self):
+        tracker = LatencyTracker(min_samples=5)
+        for value in range(4):
+            tracker.record(value)
+        assert tracker.percentile(95) is None
+        tracker.record(4)
+        assert tracker.percentile(95) == 4
+
+    def test_window_rolls(self):
+        tracker = LatencyTracker(window=10, min_samples=1)
+        for value in range(100):
+            tracker.record(value)
+        # The current and previous generations: 80-99
+        assert tracker.count == 20
+        assert tracker.percentile(0) == pytest.approx(80, rel=0.05)
+        assert tracker.percentile(50) == pytest.approx(90, rel=0.05)
+        assert tracker.percentile(100) == pytest.approx(99, rel=0.05)
+
+    def test_shared_per_provider_model(self):
+        assert _get_latency_tracker("openai", "gpt-4o") is _get_latency_tracker("openai", "gpt-4o")
+        assert _get_latency_tracker("openai", "gpt-4o") is not _get_latency_tracker(
+            "openai", "gpt-4o-mini"
+        )
+
+
+@pytest.fixture
+def hedge_settings():
+    """Hedge at p95 with no minimum delay."""
+    settings = MagicMock(
+        llm_hedge_percentile=95.0, llm_hedge_min_delay_ms=0.0, llm_concurrency_enabled=False
+    )
+    with patch("src.settings.get_settings", return_value=settings):
+        yield settings
+
+
+def _warm_tracker(provider: str, model: str, latency_ms: float = 10.0) -> LatencyTracker:
+    tracker = _get_latency_tracker(provider, model)
+    for _ in range(tracker.min_samples):
+        tracker.record(latency_ms)
+    return tracker
+
+
+def _resilience_events() -> dict[str, int]:
+    from src.api.metrics import get_metrics_collector
+
+    return get_metrics_collector().get_metrics()["llm_resilience"]
+
+
+@pytest.mark.usefixtures("hedge_settings")
+class TestHedgedRequests:
+    """Tests for racing a slow primary against the fallback."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_metrics(self):
+        from src.api.metrics import get_metrics_collector
+
+        get_metrics_collector().reset()
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged_to_fallback(self):
+        primary = SlowChatModel(delay=5, response=_chat_result("primary"))
+        fallback = SlowChatModel(delay=0, response=_chat_result("fallback"))
+        resilient = ResilientLLM(
+            primary_llm=primary,
+            provider="primary",
+            fallback_llm=fallback,
+            fallback_provider="fallback",
+        )
+        tracker = _warm_tracker("primary", resilient._get_model_name())
+
+        result = await resilient.ainvoke("test input")
+
+        assert result.content == "fallback"
+        assert primary.cancelled
+        assert _resilience_events() == {"hedge_fired": 1, "hedge_won": 1}
+        assert tracker.count == tracker.min_samples + 1
+        # A hedge that wins is not a primary failure
+        assert _get_circuit_breaker("primary").failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_primary_wins_race(self):
+        primary = SlowChatModel(delay=0.05, response=_chat_result("primary"))
+        fallback = SlowChatModel(delay=5, response=_chat_result("fallback"))
+        resilient = ResilientLLM(
+            primary_llm=primary,
+            provider="primary",
+            fallback_llm=fallback,
+            fallback_provider="fallback",
+        )
+        _warm_tracker("primary", resilient._get_model_name())
+
+        result = await resilient.ainvoke("test input")
+
+        assert result.content == "primary"
+        assert fallback.cancelled
+        assert _resilience_events() == {"hedge_fired": 1, "hedge_lost": 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_waits_for_primary(self):
+        primary = SlowChatModel(delay=0.05, response=_chat_result("primary"))
+        fallback = SlowChatModel(delay=0, response=Exception("fallback down"))
+        resilient = ResilientLLM(
+            primary_llm=primary,
+            provider="primary",
+            fallback_llm=fallback,
+            fallback_provider="fallback",
+        )
+        _warm_tracker("primary", resilient._get_model_name())
+
+        result = await resilient.ainvoke("test input")
+
+        assert result.content == "primary"
+        assert _get_circuit_breaker("fallback").failure_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_not_recorded(self):
+        primary = SlowChatModel(delay=5, response=_chat_result("primary"))
+        fallback = SlowChatModel(delay=5, response=_chat_result("fallback"))
+        resilient = ResilientLLM(
+            primary_llm=primary,
+            provider="primary",
+            fallback_llm=fallback,
+            fallback_provider="fallback",
+        )
+        tracker = _warm_tracker("primary", resilient._get_model_name())
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(resilient.ainvoke("test input"), timeout=0.1)
+
+        assert primary.cancelled
+        assert tracker.count == tracker.min_samples
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_history(self):
+        primary = SlowChatModel(delay=0.05, response=_chat_result("primary"))
+        fallback = SlowChatModel(delay=0, response=_chat_result("fallback"))
+        resilient = ResilientLLM(
+            primary_llm=primary,
+            provider="primary",
+            fallback_llm=fallback,
+            fallback_provider="fallback",
+        )
+
+        result = await resilient.ainvoke("test input")
+
+        assert result.content == "primary"
+        assert _resilience_events() == {}
+        assert _get_latency_tracker("primary", resilient._get_model_name()).count == 1
+
+    @pytest.mark.asyncio
+    async def test_hedging_disabled(self, hedge_settings):
+        hedge_settings.llm_hedge_percentile = 0
+        primary = SlowChatModel(delay=0.05, response=_chat_result("primary"))
+        fallback = SlowChatModel(delay=0, response=_chat_result("fallback"))
+        resilient = ResilientLLM(
+            primary_llm=primary,
+            provider="primary",
+            fallback_llm=fallback,
+            fallback_provider="fallback",
+        )
+        _warm_tracker("primary", resilient._get_model_name())
+
+        result = await resilient.ainvoke("test input")
+
+        assert result.content == "primary"
+        assert _resilience_events() == {}
+
+
+class TestResponseCaching:
+    """Tests for serving opted-in temperature-0 calls from the response cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        from src.llm.response_cache import ResponseCache
+
+        cache = ResponseCache()
+        with patch("src.llm.resilient.get_response_cache", return_value=cache):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_repeat_served_from_cache(self, cache):
+        primary = StubChatModel(temperature=0.0, agenerate_sequence=[_chat_result("kitchen")])
+        resilient = ResilientLLM(primary_llm=primary, provider="test", response_cache="exact")
+
+        first = await resilient.ainvoke("turn off the kitchen lights")
+        second = await resilient.ainvoke("turn off  the kitchen lights")
+
+        assert first.content == second.content == "kitchen"
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_semantic_lookup(self, cache):
+        cache.semantic_threshold = 0.9
+        primary = StubChatModel(temperature=0.0, agenerate_sequence=[_chat_result("kitchen")])
+        resilient = ResilientLLM(primary_llm=primary, provider="test", response_cache="semantic")
+
+        await resilient.ainvoke("turn off the kitchen lights")
+        result = await resilient.ainvoke("turn off the kitchen lights please")
+
+        assert result.content == "kitchen"
+
+    @pytest.mark.asyncio
+    async def test_not_opted_in(self, cache):
+        primary = StubChatModel(
+            temperature=0.0, agenerate_sequence=[_chat_result("a"), _chat_result("b")]
+        )
+        resilient = ResilientLLM(primary_llm=primary, provider="test")
+
+        assert (await resilient.ainvoke("hi")).content == "a"
+        assert (await resilient.ainvoke("hi")).content == "b"
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_nonzero_temperature_not_cached(self, cache):
+        primary = StubChatModel(
+            temperature=0.7, agenerate_sequence=[_chat_result("a"), _chat_result("b")]
+        )
+        resilient = ResilientLLM(primary_llm=primary, provider="test", response_cache="exact")
+
+        assert (await resilient.ainvoke("hi")).content == "a"
+        assert (await resilient.ainvoke("hi")).content == "b"
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_fallback_answer_not_cached(self, cache):
+        primary = StubChatModel(
+            temperature=0.0, agenerate_sequence=[Exception("down")] * MAX_RETRIES
+        )
+        fallback = StubChatModel(agenerate_sequence=[_chat_result("fallback")])
+        resilient = ResilientLLM(
+            primary_llm=primary,
+            provider="test",
+            fallback_llm=fallback,
+            fallback_provider="fallback",
+            response_cache="exact",
+        )
+
+        assert (await resilient.ainvoke("hi")).content == "fallback"
+        assert len(cache) == 0
+
+
 class TestResilientLLM:
     """Tests for ResilientLLM wrapper."""
 
@@ -219,6 +603,37 @@ class TestResilientLLM:
         assert primary.agenerate_sequence == []
         assert fallback.agenerate_sequence == []
 
+    @pytest.mark.asyncio
+    async def test_call_holds_concurrency_slot(self):
+        """Calls run inside the provider/model's concurrency limiter."""
+        primary = SlowChatModel(delay=0.05, response=_chat_result("ok"))
+        resilient = ResilientLLM(primary_llm=primary, provider="test")
+        task = asyncio.create_task(resilient.ainvoke("test input"))
+        await asyncio.sleep(0.01)
+        limiter = _get_concurrency_limiter("test", resilient._get_model_name())
+        assert limiter is not None
+        assert limiter.in_flight == 1
+        await task
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_astream_releases_slot_when_abandoned(self):
+        """A stream that is closed early gives its concurrency slot back."""
+
+        async def _fake_stream():
+            yield ChatGenerationChunk(message=AIMessageChunk(content="a"))
+            yield ChatGenerationChunk(message=AIMessageChunk(content="b"))
+
+        primary = StubChatModel(astream_sequence=[_fake_stream()])
+        resilient = ResilientLLM(primary_llm=primary, provider="test")
+        stream = resilient._astream([])
+        await stream.__anext__()
+        limiter = _get_concurrency_limiter("test", resilient._get_model_name())
+        assert limiter is not None
+        assert limiter.in_flight == 1
+        await stream.aclose()
+        assert limiter.in_flight == 0
+
     def test_delegates_other_attributes(self):
         """Test other attributes are delegated to primary LLM."""
         primary = StubChatModel(agenerate_sequence=[])
@@ -341,3 +756,29 @@ class TestGetLLMWithResilience:
                 assert isinstance(llm, ResilientLLM)
                 assert llm.primary_llm is primary_llm
                 assert llm.fallback_llm is None
+
+    def test_response_cache_mode_is_separate_instance(self):
+        """Test get_llm caches opted-in and plain instances separately."""
+        import src.llm.factory as factory_mod
+
+        factory_mod._llm_cache.clear()
+        settings = MagicMock()
+        settings.llm_provider = "openrouter"
+        settings.llm_model = "test"
+        settings.llm_temperature = 0.0
+        settings.llm_fallback_provider = None
+        settings.llm_fallback_model = None
+
+        with patch("src.llm.factory.get_settings", return_value=settings):
+            with patch("src.llm.factory._create_llm_instance") as mock_create:
+                from src.llm import get_llm
+
+                mock_create.side_effect = lambda **kw: StubChatModel(agenerate_sequence=[])
+
+                cached = get_llm(response_cache="semantic")
+                plain = get_llm()
+
+                assert cached.response_cache == "semantic"
+                assert plain.response_cache is None
+                assert get_llm(response_cache="semantic") is cached
+        factory_mod._llm_cache.clear()
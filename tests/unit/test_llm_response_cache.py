@@ -0,0 +1,222 @@
+"""Unit tests for the deterministic LLM response cache."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, message_to_dict
+
+from src.api.metrics import get_metrics_collector
+from src.llm.response_cache import ResponseCache, build_cache_request
+
+
+def _request(text: str, system: str = "Classify the intent.", **params):
+    return build_cache_request(
+        "gpt-4o-mini", 0.0, [SystemMessage(content=system), HumanMessage(content=text)], params
+    )
+
+
+def _cache_events() -> dict[str, float]:
+    return get_metrics_collector().get_metrics()["llm_response_cache"]
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    get_metrics_collector().reset()
+
+
+class TestBuildCacheRequest:
+    def test_whitespace_normalized(self):
+        assert _request("turn off  the\nlights").key == _request("turn off the lights").key
+
+    def test_params_change_key(self):
+        assert _request("hi").key != _request("hi", stop=["\n"]).key
+        assert _request("hi").key == _request("hi", stop=None).key
+
+    def test_model_and_temperature_change_key(self):
+        messages = [HumanMessage(content="hi")]
+        key = build_cache_request("a", 0.0, messages).key
+        assert key != build_cache_request("b", 0.0, messages).key
+        assert key != build_cache_request("a", 0.5, messages).key
+
+    def test_tool_calls_change_key(self):
+        call = AIMessage(content="", tool_calls=[{"name": "get_state", "args": {}, "id": "1"}])
+        plain = build_cache_request("m", 0.0, [HumanMessage(content="hi"), AIMessage(content="")])
+        with_call = build_cache_request("m", 0.0, [HumanMessage(content="hi"), call])
+        assert plain.key != with_call.key
+
+    def test_context_key_ignores_final_user_message(self):
+        a, b = _request("turn on the lights"), _request("what is the weather")
+        assert a.key != b.key
+        assert a.context_key == b.context_key
+        assert a.context_key != _request("hi", system="Other prompt").context_key
+        assert a.query_text == "turn on the lights"
+
+    def test_no_context_key_without_final_user_message(self):
+        request = build_cache_request("m", 0.0, [HumanMessage(content="hi"), AIMessage(content="")])
+        assert request.context_key is None
+
+
+class TestResponseCache:
+    def test_exact_hit_returns_copy(self):
+        cache = ResponseCache()
+        cache.store(_request("hi"), AIMessage(content="hello"))
+
+        hit = cache.lookup(_request("hi"))
+        assert hit is not None
+        assert hit.content == "hello"
+        hit.content = "changed"
+        assert cache.lookup(_request("hi")).content == "hello"
+
+    def test_miss(self):
+        cache = ResponseCache()
+        assert cache.lookup(_request("hi")) is None
+        assert _cache_events() == {"miss": 1, "hit_rate": 0.0}
+
+    def test_semantic_hit(self):
+        cache = ResponseCache(semantic_threshold=0.9)
+        cache.store(_request("turn off the kitchen lights"), AIMessage(content="home"))
+
+        request = _request("turn off the kitchen lights please")
+        assert cache.lookup(request) is None
+        assert cache.lookup(request, semantic=True).content == "home"
+        assert _cache_events()["semantic_hit"] == 1
+
+    def test_semantic_below_threshold(self):
+        cache = ResponseCache(semantic_threshold=0.9)
+        cache.store(_request("turn off the kitchen lights"), AIMessage(content="home"))
+        assert cache.lookup(_request("turn on the kitchen lights"), semantic=True) is None
+
+    def test_semantic_requires_same_content_words(self):
+        cache = ResponseCache(semantic_threshold=0.9)
+        cache.store(
+            _request("turn on the lights for me and create an automation for the porch"),
+            AIMessage(content="architect"),
+        )
+        request = _request("turn on the lights for me and analyze an automation for the porch")
+        assert cache.lookup(request, semantic=True) is None
+
+    def test_semantic_off_by_default(self):
+        cache = ResponseCache()
+        cache.store(_request("turn off the kitchen lights"), AIMessage(content="home"))
+        assert cache.lookup(_request("turn off the kitchen lights please"), semantic=True) is None
+
+    def test_semantic_scoped_to_context(self):
+        cache = ResponseCache(semantic_threshold=0.5)
+        cache.store(_request("turn off the kitchen lights"), AIMessage(content="home"))
+        other = _request("turn off the kitchen lights", system="Other prompt")
+        assert cache.lookup(other, semantic=True) is None
+
+    def test_semantic_disabled(self):
+        cache = ResponseCache(semantic_threshold=0)
+        cache.store(_request("turn off the kitchen lights"), AIMessage(content="home"))
+        assert cache.lookup(_request("turn off the kitchen lights please"), semantic=True) is None
+
+    def test_ttl_expiry(self):
+        cache = ResponseCache(ttl_seconds=10)
+        with patch("src.llm.response_cache.time.time", return_value=1000.0):
+            cache.store(_request("hi"), AIMessage(content="hello"))
+        with patch("src.llm.response_cache.time.time", return_value=1011.0):
+            assert cache.lookup(_request("hi")) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.store(_request("a"), AIMessage(content="a"))
+        cache.store(_request("b"), AIMessage(content="b"))
+        cache.lookup(_request("a"))
+        cache.store(_request("c"), AIMessage(content="c"))
+
+        assert cache.lookup(_request("b")) is None
+        assert cache.lookup(_request("a")) is not None
+        assert _cache_events()["evict"] == 1
+
+    def test_hit_rate(self):
+        cache = ResponseCache()
+        cache.store(_request("hi"), AIMessage(content="hello"))
+        cache.lookup(_request("hi"))
+        cache.lookup(_request("hi"))
+        cache.lookup(_request("other"))
+        assert _cache_events()["hit_rate"] == pytest.approx(0.6667)
+
+
+def _patch_repo(repo: MagicMock):
+    @asynccontextmanager
+    async def session():
+        yield MagicMock()
+
+    return (
+        patch("src.storage.get_session", session),
+        patch("src.dal.llm_response_cache.LLMResponseCacheRepository", return_value=repo),
+    )
+
+
+class TestPersistence:
+    @pytest.mark.asyncio
+    async def test_close_writes_pending(self):
+        repo = MagicMock(upsert_many=AsyncMock(return_value=1))
+        cache = ResponseCache(persist=True)
+        cache.store(_request("hi"), AIMessage(content="hello"))
+
+        session_patch, repo_patch = _patch_repo(repo)
+        with session_patch, repo_patch:
+            await cache.close()
+
+        (rows,) = repo.upsert_many.await_args.args
+        assert rows[0]["key"] == _request("hi").key
+        assert rows[0]["query_text"] == "hi"
+        assert rows[0]["response"]["data"]["content"] == "hello"
+        assert _cache_events()["persisted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_not_persisted_when_disabled(self):
+        repo = MagicMock(upsert_many=AsyncMock())
+        cache = ResponseCache(persist=False)
+        cache.store(_request("hi"), AIMessage(content="hello"))
+
+        session_patch, repo_patch = _patch_repo(repo)
+        with session_patch, repo_patch:
+            await cache.close()
+
+        repo.upsert_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_write_failure_counted(self):
+        repo = MagicMock(upsert_many=AsyncMock(side_effect=RuntimeError("db down")))
+        cache = ResponseCache(persist=True)
+        cache.store(_request("hi"), AIMessage(content="hello"))
+
+        session_patch, repo_patch = _patch_repo(repo)
+        with session_patch, repo_patch:
+            assert await cache.flush() == 0
+
+        assert _cache_events()["persist_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_load(self):
+        request = _request("turn off the kitchen lights")
+        now = datetime.now(UTC)
+        row = SimpleNamespace(
+            key=request.key,
+            model=request.model,
+            context_key=request.context_key,
+            query_text=request.query_text,
+            response=message_to_dict(AIMessage(content="home")),
+            created_at=now,
+            expires_at=now + timedelta(hours=1),
+        )
+        repo = MagicMock(
+            delete_expired=AsyncMock(return_value=0),
+            list_unexpired=AsyncMock(return_value=[row]),
+        )
+        cache = ResponseCache(semantic_threshold=0.9)
+
+        session_patch, repo_patch = _patch_repo(repo)
+        with session_patch, repo_patch:
+            assert await cache.load() == 1
+
+        assert cache.lookup(request).content == "home"
+        similar = _request("turn off the kitchen lights please")
+        assert cache.lookup(similar, semantic=True).content == "home"
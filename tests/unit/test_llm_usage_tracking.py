@@ -4,9 +4,40 @@ Tests that token usage is extracted from LLM responses and
 logged via the usage tracking context variable system.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.exc import OperationalError
+
+from src.llm.usage import UsageWriter, _log_usage_async
 from src.llm_pricing import calculate_cost
 
 
+def _record(i: int = 0) -> dict:
+    return {
+        "provider": "openai",
+        "model": "gpt-4o",
+        "input_tokens": 10 + i,
+        "output_tokens": 5,
+        "total_tokens": 15 + i,
+    }
+
+
+def _patch_storage(record_many: AsyncMock):
+    """Patch the session and repository used by the writer."""
+
+    @asynccontextmanager
+    async def fake_session():
+        yield MagicMock()
+
+    repo = MagicMock(record_many=record_many)
+    return (
+        patch("src.storage.get_session", fake_session),
+        patch("src.dal.llm_usage.LLMUsageRepository", return_value=repo),
+    )
+
+
 class TestUsageContextVar:
     """Test the LLM usage context variable for passing metadata."""
 
@@ -70,3 +101,130 @@ class TestCostCalculationIntegration:
         mini_cost = calculate_cost("gpt-4o-mini", input_tokens=1000, output_tokens=500)
         assert full_cost is not None and mini_cost is not None
         assert mini_cost < full_cost * 0.15  # Mini is at least 85% cheaper
+
+
+class TestUsageWriter:
+    """Test the buffered, batched usage writer."""
+
+    async def test_full_batch_flushes_in_one_insert(self):
+        record_many = AsyncMock(side_effect=lambda rows: len(rows))
+        writer = UsageWriter(batch_size=3, flush_interval=60)
+        session_patch, repo_patch = _patch_storage(record_many)
+
+        with session_patch, repo_patch:
+            for i in range(3):
+                writer.add(_record(i))
+            await asyncio.sleep(0.05)
+
+            assert record_many.await_count == 1
+            assert len(record_many.await_args[0][0]) == 3
+            assert writer.pending == 0
+            await writer.close()
+
+    async def test_interval_flushes_partial_batch(self):
+        record_many = AsyncMock(side_effect=lambda rows: len(rows))
+        writer = UsageWriter(batch_size=50, flush_interval=0.05)
+        session_patch, repo_patch = _patch_storage(record_many)
+
+        with session_patch, repo_patch:
+            writer.add(_record())
+            await asyncio.sleep(0.2)
+            await writer.close()
+
+        assert writer.written == 1
+
+    async def test_close_flushes_pending(self):
+        record_many = AsyncMock(side_effect=lambda rows: len(rows))
+        writer = UsageWriter(batch_size=10, flush_interval=60)
+        session_patch, repo_patch = _patch_storage(record_many)
+
+        with session_patch, repo_patch:
+            for i in range(25):
+                writer.add(_record(i))
+            await writer.close()
+
+        assert writer.written == 25
+        assert [len(c[0][0]) for c in record_many.await_args_list] == [10, 10, 5]
+
+    async def test_full_buffer_drops_new_records(self):
+        writer = UsageWriter(batch_size=100, flush_interval=60, max_pending=2)
+
+        with patch.object(writer, "_ensure_running"):
+            for i in range(5):
+                writer.add(_record(i))
+
+        assert writer.pending == 2
+        assert writer.dropped == 3
+
+    async def test_failed_batch_is_retried(self):
+        record_many = AsyncMock(side_effect=[OperationalError("insert", {}, Exception("down")), 2])
+        writer = UsageWriter(batch_size=10, flush_interval=60)
+        session_patch, repo_patch = _patch_storage(record_many)
+
+        with session_patch, repo_patch, patch.object(writer, "_ensure_running"):
+            writer.add(_record(0))
+            writer.add(_record(1))
+            assert await writer.flush() == 0
+            assert writer.pending == 2
+            assert await writer.flush() == 2
+
+        assert writer.failed_batches == 1
+        assert writer.pending == 0
+
+    async def test_close_waits_for_batch_being_written(self):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_insert(rows):
+            started.set()
+            await release.wait()
+            return len(rows)
+
+        record_many = AsyncMock(side_effect=slow_insert)
+        writer = UsageWriter(batch_size=1, flush_interval=60)
+        session_patch, repo_patch = _patch_storage(record_many)
+
+        with session_patch, repo_patch:
+            writer.add(_record())
+            await started.wait()
+            closing = asyncio.create_task(writer.close())
+            await asyncio.sleep(0.01)
+            release.set()
+            await closing
+
+        assert writer.written == 1
+        assert record_many.await_count == 1
+
+    async def test_cancel_mid_write_requeues_batch(self):
+        started = asyncio.Event()
+
+        async def hanging_insert(rows):
+            started.set()
+            await asyncio.Event().wait()
+
+        writer = UsageWriter(batch_size=1, flush_interval=60)
+        session_patch, repo_patch = _patch_storage(AsyncMock(side_effect=hanging_insert))
+
+        with session_patch, repo_patch:
+            writer.add(_record())
+            await started.wait()
+            task = writer._task
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert writer.pending == 1
+        assert writer.written == 0
+
+    async def test_log_usage_buffers_record(self):
+        writer = UsageWriter()
+        result = MagicMock(usage_metadata={"input_tokens": 100, "output_tokens": 20})
+
+        with (
+            patch("src.llm.usage.get_usage_writer", return_value=writer),
+            patch.object(writer, "_ensure_running"),
+        ):
+            _log_usage_async(result, "openai", "gpt-4o", latency_ms=42)
+
+        assert writer.pending == 1
+        record = writer._pending[0]
+        assert record["total_tokens"] == 120
+        assert record["latency_ms"] == 42
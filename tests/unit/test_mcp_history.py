@@ -15,6 +15,7 @@ from src.ha.history import (
     EnergyDataPoint,
     EnergyHistory,
     EnergyHistoryClient,
+    EnergySeries,
     EnergyStats,
     discover_energy_sensors,
     get_energy_history,
@@ -215,6 +216,72 @@ class TestEnergyHistoryClientStats:
         assert stats.hourly_averages[14] == 1.5
 
 
+class TestEnergySeries:
+    """Tests for the columnar EnergySeries representation."""
+
+    def test_from_states_sorts_and_skips_invalid(self):
+        """Test that samples are sorted and non-numeric states dropped."""
+        states = [
+            {"state": "2.0", "last_changed": "2024-01-01T12:00:00+00:00"},
+            {"state": "unavailable", "last_changed": "2024-01-01T12:30:00+00:00"},
+            {"state": "1.0", "last_changed": "2024-01-01T11:00:00Z"},
+            {"state": "abc", "last_changed": "2024-01-01T13:00:00+00:00"},
+        ]
+
+        series = EnergySeries.from_states(states, "kWh")
+
+        assert len(series) == 2
+        assert series.values.tolist() == [1.0, 2.0]
+        assert series.datetime_at(0) == datetime(2024, 1, 1, 11, tzinfo=UTC)
+
+    def test_from_states_non_utc_offset(self):
+        """Test that non-UTC offsets are normalized to UTC."""
+        states = [{"state": "1.0", "last_changed": "2024-01-01T14:00:00+02:00"}]
+
+        series = EnergySeries.from_states(states, "kWh")
+
+        assert series.datetime_at(0) == datetime(2024, 1, 1, 12, tzinfo=UTC)
+
+    def test_resample(self):
+        """Test downsampling to bucket means."""
+        start = datetime(2024, 1, 1, 12, tzinfo=UTC)
+        series = EnergySeries.from_datapoints(
+            [
+                EnergyDataPoint(timestamp=start, value=1.0),
+                EnergyDataPoint(timestamp=start + timedelta(minutes=30), value=3.0),
+                EnergyDataPoint(timestamp=start + timedelta(hours=1), value=5.0),
+            ]
+        )
+
+        hourly = series.resample(3600)
+
+        assert hourly.values.tolist() == [2.0, 5.0]
+        assert hourly.datetime_at(1) == start + timedelta(hours=1)
+
+    def test_power_sensor_integrated_to_kwh(self, energy_client):
+        """Test trapezoidal integration of a W sensor into kWh."""
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        datapoints = [
+            EnergyDataPoint(timestamp=start, value=1000.0, unit="W"),
+            EnergyDataPoint(timestamp=start + timedelta(hours=1), value=1000.0, unit="W"),
+            EnergyDataPoint(timestamp=start + timedelta(hours=2), value=3000.0, unit="W"),
+        ]
+
+        stats = energy_client._calculate_stats(datapoints)
+
+        assert stats.energy_kwh == pytest.approx(3.0)
+        assert stats.to_dict()["energy_kwh"] == pytest.approx(3.0)
+
+    def test_energy_sensor_not_integrated(self, energy_client):
+        """Test that kWh sensors leave energy_kwh unset."""
+        now = datetime.now(UTC)
+        stats = energy_client._calculate_stats(
+            [EnergyDataPoint(timestamp=now, value=1.0, unit="kWh")]
+        )
+
+        assert stats.energy_kwh is None
+
+
 class TestEnergyHistoryClientGetHistory:
     """Tests for get_energy_history method."""
 
@@ -319,6 +386,34 @@ class TestEnergyHistoryClientAggregation:
         assert "entities" in result
         assert result["hours"] == 24
 
+    @pytest.mark.asyncio
+    async def test_get_aggregated_energy_by_entity_in_kwh(
+        self, energy_client, mock_ha_client, sample_history_states, sample_entity_info
+    ):
+        """Power sensors report integrated kWh per entity, matching the total."""
+        power_info = {
+            "entity_id": "sensor.solar_power",
+            "attributes": {"device_class": "power", "unit_of_measurement": "W"},
+        }
+        mock_ha_client.get_entity = AsyncMock(side_effect=[sample_entity_info, power_info])
+        mock_ha_client.get_history_batch = AsyncMock(
+            return_value={
+                eid: {"entity_id": eid, "states": sample_history_states, "count": 4}
+                for eid in ("sensor.grid_power", "sensor.solar_power")
+            }
+        )
+
+        result = await energy_client.get_aggregated_energy(
+            ["sensor.grid_power", "sensor.solar_power"],
+            hours=24,
+        )
+
+        by_entity = result["by_entity"]
+        power_stats = result["entities"][1]["stats"]
+        assert by_entity["sensor.solar_power"] == power_stats["energy_kwh"]
+        assert by_entity["sensor.solar_power"] != power_stats["total"]
+        assert sum(by_entity.values()) == pytest.approx(result["total_kwh"])
+
     @pytest.mark.asyncio
     async def test_get_aggregated_energy_uses_batch(
         self, energy_client, mock_ha_client, sample_history_states, sample_entity_info
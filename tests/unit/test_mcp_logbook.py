@@ -16,6 +16,8 @@ from src.ha.logbook import (
     ACTION_TYPE_BUTTON,
     ACTION_TYPE_STATE_CHANGE,
     LogbookHistoryClient,
+    LogbookSnapshot,
+    LogbookSnapshotCache,
     LogbookStats,
     classify_action,
 )
@@ -206,3 +208,96 @@ class TestLogbookHistoryClient:
         grouped = logbook_client.aggregate_by_action_type(entries)
         assert isinstance(grouped, dict)
         assert ACTION_TYPE_AUTOMATION in grouped
+
+
+# === Snapshot Tests ===
+
+
+class TestLogbookSnapshot:
+    @pytest.mark.asyncio
+    async def test_single_fetch_per_client(
+        self, logbook_client, mock_ha_client, sample_logbook_entries
+    ):
+        mock_ha_client.get_logbook.return_value = sample_logbook_entries
+
+        await logbook_client.get_entries(hours=24)
+        await logbook_client.get_manual_actions(hours=24)
+        await logbook_client.get_stats(hours=24)
+        await logbook_client.get_entries_by_domain("light", hours=24)
+
+        mock_ha_client.get_logbook.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_narrower_window_sliced_from_wider(
+        self, logbook_client, mock_ha_client, sample_logbook_entries
+    ):
+        mock_ha_client.get_logbook.return_value = sample_logbook_entries
+
+        await logbook_client.get_entries(hours=24)
+        recent = await logbook_client.get_entries(hours=1)
+
+        mock_ha_client.get_logbook.assert_called_once()
+        assert [e.entity_id for e in recent] == ["switch.garden_lights"]
+
+    @pytest.mark.asyncio
+    async def test_entries_not_shared_with_snapshot(
+        self, logbook_client, mock_ha_client, sample_logbook_entries
+    ):
+        mock_ha_client.get_logbook.return_value = sample_logbook_entries
+
+        entries = await logbook_client.get_entries(hours=24)
+        entries.clear()
+
+        assert len(await logbook_client.get_entries(hours=24)) == len(sample_logbook_entries)
+
+    @pytest.mark.asyncio
+    async def test_entity_filter_bypasses_snapshot(
+        self, logbook_client, mock_ha_client, sample_logbook_entries
+    ):
+        mock_ha_client.get_logbook.return_value = sample_logbook_entries[:1]
+
+        await logbook_client.get_entries(hours=24, entity_id="automation.morning_lights")
+
+        mock_ha_client.get_logbook.assert_called_once_with(
+            hours=24, entity_id="automation.morning_lights"
+        )
+
+    @pytest.mark.asyncio
+    async def test_zone_cache_shared_across_clients(self, mock_ha_client, sample_logbook_entries):
+        mock_ha_client.get_logbook.return_value = sample_logbook_entries
+        mock_ha_client.logbook_cache = LogbookSnapshotCache(ttl_seconds=60)
+
+        await LogbookHistoryClient(mock_ha_client).get_stats(hours=24)
+        stats = await LogbookHistoryClient(mock_ha_client).get_stats(hours=24)
+
+        mock_ha_client.get_logbook.assert_called_once()
+        assert stats.total_entries == 3
+        assert mock_ha_client.logbook_cache.hits == 1
+
+    def test_cache_expires(self, sample_logbook_entries):
+        cache = LogbookSnapshotCache(ttl_seconds=0)
+        snapshot = LogbookSnapshot.from_entries(parse_logbook_list(sample_logbook_entries), 24)
+
+        cache.put(snapshot)
+
+        assert cache.get(24) is None
+
+    def test_indexes_and_stats(self, sample_logbook_entries):
+        snapshot = LogbookSnapshot.from_entries(parse_logbook_list(sample_logbook_entries), 24)
+
+        assert [e.entity_id for e in snapshot.for_entity("light.living_room")] == [
+            "light.living_room"
+        ]
+        assert len(snapshot.for_domain("automation")) == 1
+        assert sum(len(idx) for idx in snapshot.by_hour.values()) == 3
+        assert snapshot.stats.by_domain == {"automation": 1, "light": 1, "switch": 1}
+        assert snapshot.stats.manual_actions == 2
+        assert snapshot.stats.automation_triggers == 1
+
+    def test_entries_without_timestamp(self):
+        entries = [ParsedLogbookEntry(entity_id="light.a", domain="light", when=None)]
+
+        snapshot = LogbookSnapshot.from_entries(entries, 24)
+
+        assert snapshot.stats.total_entries == 1
+        assert snapshot.stats.by_hour == {}
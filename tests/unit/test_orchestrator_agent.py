@@ -19,6 +19,33 @@ from langchain_core.messages import HumanMessage
 from src.graph.state import AgentRole, ConversationState
 
 
+@pytest.fixture()
+def available_agents():
+    return [
+        {
+            "name": "architect",
+            "domain": "home",
+            "description": "Home automation design and control",
+            "intent_patterns": ["home_automation", "device_control", "lights"],
+            "capabilities": ["control_devices", "create_automations"],
+        },
+        {
+            "name": "knowledge",
+            "domain": "knowledge",
+            "description": "General knowledge and questions",
+            "intent_patterns": ["general_question", "explain", "trivia"],
+            "capabilities": ["answer_questions"],
+        },
+        {
+            "name": "data_scientist",
+            "domain": "analytics",
+            "description": "Energy and usage analysis",
+            "intent_patterns": ["energy_analysis", "usage_patterns"],
+            "capabilities": ["analyze_data", "generate_reports"],
+        },
+    ]
+
+
 class TestOrchestratorInit:
     """OrchestratorAgent basic instantiation."""
 
@@ -40,6 +67,16 @@ class TestOrchestratorInit:
         agent = OrchestratorAgent(model_name="gpt-4o-mini")
         assert agent.model_name == "gpt-4o-mini"
 
+    def test_classification_llm_uses_exact_cache(self):
+        from src.agents.orchestrator import OrchestratorAgent
+
+        agent = OrchestratorAgent(model_name="gpt-4o-mini")
+        with patch("src.agents.orchestrator.get_llm") as get_llm:
+            assert agent._get_classification_llm() is agent._get_classification_llm()
+        get_llm.assert_called_once_with(
+            model="gpt-4o-mini", temperature=0.0, response_cache="exact"
+        )
+
 
 class TestIntentClassification:
     """OrchestratorAgent.classify_intent() routes to the right agent."""
@@ -50,32 +87,6 @@ class TestIntentClassification:
 
         return OrchestratorAgent(model_name="test-model")
 
-    @pytest.fixture()
-    def available_agents(self):
-        return [
-            {
-                "name": "architect",
-                "domain": "home",
-                "description": "Home automation design and control",
-                "intent_patterns": ["home_automation", "device_control", "lights"],
-                "capabilities": ["control_devices", "create_automations"],
-            },
-            {
-                "name": "knowledge",
-                "domain": "knowledge",
-                "description": "General knowledge and questions",
-                "intent_patterns": ["general_question", "explain", "trivia"],
-                "capabilities": ["answer_questions"],
-            },
-            {
-                "name": "data_scientist",
-                "domain": "analytics",
-                "description": "Energy and usage analysis",
-                "intent_patterns": ["energy_analysis", "usage_patterns"],
-                "capabilities": ["analyze_data", "generate_reports"],
-            },
-        ]
-
     @pytest.mark.asyncio()
     async def test_classifies_home_intent(self, agent, available_agents):
         mock_response = MagicMock()
@@ -150,6 +161,125 @@ class TestIntentClassification:
         assert result["confidence"] < 0.5
 
 
+class TestRoute:
+    """OrchestratorAgent.route() answers locally when confident."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        from src.agents.intent_router import reset_intent_router
+        from src.api.metrics import get_metrics_collector
+
+        reset_intent_router()
+        get_metrics_collector().reset()
+        yield
+        reset_intent_router()
+
+    @pytest.fixture()
+    def settings(self):
+        settings = MagicMock(
+            intent_router_enabled=True,
+            intent_router_confidence_threshold=0.8,
+            intent_router_shadow_rate=0.0,
+        )
+        with patch("src.settings.get_settings", return_value=settings):
+            yield settings
+
+    @pytest.fixture()
+    def agent(self):
+        from src.agents.orchestrator import OrchestratorAgent
+
+        return OrchestratorAgent(model_name="test-model")
+
+    @staticmethod
+    def _routing_metrics() -> dict:
+        from src.api.metrics import get_metrics_collector
+
+        return get_metrics_collector().get_metrics()["intent_router"]
+
+    @pytest.mark.asyncio()
+    async def test_fast_path_skips_llm(self, agent, available_agents, settings):
+        with patch.object(agent, "classify_intent", new_callable=AsyncMock) as classify:
+            result = await agent.route("turn off the kitchen lights", available_agents)
+
+        classify.assert_not_awaited()
+        assert result["agent"] == "architect"
+        assert result["needs_clarification"] is False
+        assert self._routing_metrics()["fast_path"] == 1
+
+    @pytest.mark.asyncio()
+    async def test_unmatched_message_uses_llm(self, agent, available_agents, settings):
+        classification = {
+            "agent": "knowledge",
+            "confidence": 0.9,
+            "reasoning": "General knowledge question",
+            "needs_clarification": False,
+        }
+        with patch.object(
+            agent, "classify_intent", new_callable=AsyncMock, return_value=classification
+        ):
+            result = await agent.route("what is the capital of France?", available_agents)
+
+        assert result == classification
+        assert self._routing_metrics()["llm"] == 1
+
+    @pytest.mark.asyncio()
+    async def test_shadow_check_uses_llm_answer(self, agent, available_agents, settings):
+        settings.intent_router_shadow_rate = 1.0
+        classification = {
+            "agent": "knowledge",
+            "confidence": 0.9,
+            "reasoning": "Question about lights",
+            "needs_clarification": False,
+        }
+        with patch.object(
+            agent, "classify_intent", new_callable=AsyncMock, return_value=classification
+        ):
+            result = await agent.route("turn off the kitchen lights", available_agents)
+
+        assert result["agent"] == "knowledge"
+        metrics = self._routing_metrics()
+        assert metrics["shadowed"] == 1
+        assert metrics["shadow_disagree"] == 1
+        assert metrics["accuracy"] == 0.0
+        assert metrics["hit_rate"] == 1.0
+
+    @pytest.mark.asyncio()
+    async def test_confident_llm_decisions_train_router(self, agent, available_agents, settings):
+        from src.agents.intent_router import _routing_history
+
+        confident = {
+            "agent": "data_scientist",
+            "confidence": 0.9,
+            "reasoning": "",
+            "needs_clarification": False,
+        }
+        unsure = {**confident, "confidence": 0.3, "needs_clarification": True}
+        with patch.object(
+            agent, "classify_intent", new_callable=AsyncMock, side_effect=[confident, unsure]
+        ):
+            await agent.route("why did my power bill spike", available_agents)
+            await agent.route("set a timer", available_agents)
+
+        assert list(_routing_history) == [("why did my power bill spike", "data_scientist")]
+
+    @pytest.mark.asyncio()
+    async def test_disabled(self, agent, available_agents, settings):
+        settings.intent_router_enabled = False
+        classification = {
+            "agent": "architect",
+            "confidence": 0.95,
+            "reasoning": "",
+            "needs_clarification": False,
+        }
+        with patch.object(
+            agent, "classify_intent", new_callable=AsyncMock, return_value=classification
+        ) as classify:
+            await agent.route("turn off the kitchen lights", available_agents)
+
+        classify.assert_awaited_once()
+        assert self._routing_metrics() == {"hit_rate": 0.0, "accuracy": None}
+
+
 class TestOrchestratorInvoke:
     """OrchestratorAgent.invoke() updates state with routing decision."""
 
@@ -29,7 +29,6 @@ class TestReviewConfigTool:
     @pytest.mark.asyncio
     async def test_single_target_invocation(self):
         """Tool triggers review workflow for a single target."""
-        mock_graph = MagicMock()
         mock_compiled = MagicMock()
         mock_compiled.ainvoke = AsyncMock(
             return_value={
@@ -43,9 +42,8 @@ class TestReviewConfigTool:
                 ],
             }
         )
-        mock_graph.compile.return_value = mock_compiled
 
-        with patch("src.graph.workflows.build_review_graph", return_value=mock_graph):
+        with patch("src.graph.workflows.cache.get_compiled_graph", return_value=mock_compiled):
             result = await review_config.ainvoke({"target": "automation.kitchen_lights"})
 
         assert (
@@ -58,12 +56,10 @@ class TestReviewConfigTool:
     @pytest.mark.asyncio
     async def test_batch_target_invocation(self):
         """Tool handles 'all_automations' batch target."""
-        mock_graph = MagicMock()
         mock_compiled = MagicMock()
         mock_compiled.ainvoke = AsyncMock(return_value={"suggestions": []})
-        mock_graph.compile.return_value = mock_compiled
 
-        with patch("src.graph.workflows.build_review_graph", return_value=mock_graph):
+        with patch("src.graph.workflows.cache.get_compiled_graph", return_value=mock_compiled):
             result = await review_config.ainvoke({"target": "all_automations"})
 
         assert isinstance(result, str)
@@ -71,12 +67,10 @@ class TestReviewConfigTool:
     @pytest.mark.asyncio
     async def test_with_focus_parameter(self):
         """Tool passes focus parameter to workflow."""
-        mock_graph = MagicMock()
         mock_compiled = MagicMock()
         mock_compiled.ainvoke = AsyncMock(return_value={"suggestions": []})
-        mock_graph.compile.return_value = mock_compiled
 
-        with patch("src.graph.workflows.build_review_graph", return_value=mock_graph):
+        with patch("src.graph.workflows.cache.get_compiled_graph", return_value=mock_compiled):
             await review_config.ainvoke({"target": "automation.kitchen_lights", "focus": "energy"})
 
         call_args = mock_compiled.ainvoke.call_args[0][0]
@@ -85,12 +79,10 @@ class TestReviewConfigTool:
     @pytest.mark.asyncio
     async def test_error_handling(self):
         """Tool returns error message on workflow failure."""
-        mock_graph = MagicMock()
         mock_compiled = MagicMock()
         mock_compiled.ainvoke = AsyncMock(return_value={"error": "Failed to fetch configs"})
-        mock_graph.compile.return_value = mock_compiled
 
-        with patch("src.graph.workflows.build_review_graph", return_value=mock_graph):
+        with patch("src.graph.workflows.cache.get_compiled_graph", return_value=mock_compiled):
             result = await review_config.ainvoke({"target": "automation.nonexistent"})
 
         assert "error" in result.lower() or "failed" in result.lower()
@@ -0,0 +1,184 @@
+"""Unit tests for the columnar sandbox data handoff (src/sandbox/aether_data.py)."""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.sandbox.aether_data import Records, load, write_bundle
+from src.sandbox.policies import SandboxPolicy
+from src.sandbox.runner import SandboxRunner
+
+
+def _energy_data(n: int = 100) -> dict:
+    return {
+        "entities": [
+            {
+                "entity_id": "sensor.grid_power",
+                "data_points": [
+                    {"timestamp": f"2026-01-01T00:{i % 60:02d}:00+00:00", "value": i * 0.5}
+                    for i in range(n)
+                ],
+                "stats": {"total": 12.5, "hourly_averages": {"0": 1.0}},
+            }
+        ],
+        "total_kwh": 12.5,
+    }
+
+
+class TestWriteBundle:
+    def test_round_trip(self, tmp_path: Path):
+        data = _energy_data()
+        write_bundle(data, tmp_path)
+
+        loaded = load(tmp_path)
+
+        points = loaded["entities"][0]["data_points"]
+        assert isinstance(points, Records)
+        assert points == data["entities"][0]["data_points"]
+        assert loaded["entities"][0]["stats"] == data["entities"][0]["stats"]
+        assert loaded["total_kwh"] == 12.5
+
+    def test_columns_are_memory_mapped(self, tmp_path: Path):
+        write_bundle(_energy_data(), tmp_path)
+
+        points = load(tmp_path)["entities"][0]["data_points"]
+
+        assert isinstance(points.columns["value"], np.memmap)
+        assert points.columns["value"].dtype == np.float64
+
+    def test_record_access(self, tmp_path: Path):
+        write_bundle(_energy_data(), tmp_path)
+        points = load(tmp_path)["entities"][0]["data_points"]
+
+        assert len(points) == 100
+        assert points[1] == {"timestamp": "2026-01-01T00:01:00+00:00", "value": 0.5}
+        assert points[-1]["value"] == 49.5
+        assert [p["value"] for p in points[2:4]] == [1.0, 1.5]
+        with pytest.raises(IndexError):
+            points[100]
+
+    def test_records_are_plain_lists(self, tmp_path: Path):
+        data = _energy_data()
+        write_bundle(data, tmp_path)
+        points = load(tmp_path)["entities"][0]["data_points"]
+
+        assert isinstance(points, list)
+        assert json.loads(json.dumps(points)) == data["entities"][0]["data_points"]
+        assert len(points + points[:2]) == 102
+        assert type(points[:2]) is list
+
+    def test_load_does_not_build_rows(self, tmp_path: Path):
+        n = 100_000
+        data = _energy_data(n)
+        write_bundle(data, tmp_path)
+        encoded = json.dumps(data)
+
+        start = time.perf_counter()
+        points = load(tmp_path)["entities"][0]["data_points"]
+        load_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        json.loads(encoded)
+        parse_seconds = time.perf_counter() - start
+
+        assert list.__len__(points) == 0
+        assert load_seconds < parse_seconds / 5
+        assert len(points) == n
+        assert points.to_frame()["value"].iloc[-1] == (n - 1) * 0.5
+
+    def test_rows_built_on_first_use(self, tmp_path: Path):
+        data = _energy_data()
+        write_bundle(data, tmp_path)
+        expected = data["entities"][0]["data_points"]
+
+        for use in (
+            list,
+            lambda p: json.loads(json.dumps(p)),
+            lambda p: [*p],
+            lambda p: [] + p,  # noqa: RUF005 - list + Records
+            lambda p: sorted(p, key=lambda r: r["value"]),
+        ):
+            points = load(tmp_path)["entities"][0]["data_points"]
+            assert use(points) == expected
+
+    def test_nulls_round_trip(self, tmp_path: Path):
+        records = [{"value": None if i % 3 == 0 else i, "ok": i % 2 == 0} for i in range(40)]
+        write_bundle({"rows": records}, tmp_path)
+
+        rows = load(tmp_path)["rows"]
+
+        assert rows == records
+        assert rows[0]["value"] is None
+        assert rows.to_frame()["value"].isna().sum() == 14
+
+    def test_small_and_irregular_lists_stay_inline(self, tmp_path: Path):
+        data = {
+            "short": [{"a": 1}] * 3,
+            "mixed": [{"a": 1 if i % 2 else "x"} for i in range(40)],
+            "ragged": [{"a": 1}, {"b": 2}] * 20,
+        }
+        write_bundle(data, tmp_path)
+
+        loaded = load(tmp_path)
+
+        assert loaded == data
+        assert not list(tmp_path.glob("*.npy"))
+
+    def test_triple_quotes_are_safe(self, tmp_path: Path):
+        data = {"note": "'''\"\"\" breaks literals"}
+        write_bundle(data, tmp_path)
+
+        assert load(tmp_path) == data
+
+    def test_to_frame(self, tmp_path: Path):
+        write_bundle(_energy_data(), tmp_path)
+        points = load(tmp_path)["entities"][0]["data_points"]
+
+        frame = points.to_frame()
+
+        assert list(frame.columns) == ["timestamp", "value"]
+        assert frame["value"].sum() == pytest.approx(sum(i * 0.5 for i in range(100)))
+
+
+class TestRunnerDataMount:
+    async def test_bundle_dir_mounts_data_and_loader(self, tmp_path: Path):
+        runner = SandboxRunner()
+        policy = SandboxPolicy(name="test", level="standard")
+
+        with (
+            patch("src.sandbox.runner.get_settings", return_value=MagicMock()),
+            patch.object(
+                runner, "_is_gvisor_available", new_callable=AsyncMock, return_value=False
+            ),
+            patch.object(
+                runner, "_get_available_image", new_callable=AsyncMock, return_value="img"
+            ),
+        ):
+            cmd = await runner._build_command(
+                script_path=Path("/tmp/script.py"),
+                policy=policy,
+                data_path=tmp_path,
+                environment=None,
+            )
+
+        assert f"{tmp_path}:/workspace/data:ro" in cmd
+        assert any(arg.endswith("aether_data.py:/workspace/aether_data.py:ro") for arg in cmd)
+        assert not any("/workspace/data.json" in arg for arg in cmd)
+
+    async def test_unsandboxed_script_loads_bundle(self, tmp_path: Path):
+        write_bundle(_energy_data(), tmp_path)
+        script = (
+            "import aether_data\n"
+            "data = aether_data.load()\n"
+            "print(sum(p['value'] for p in data['entities'][0]['data_points']))\n"
+        )
+
+        result = await SandboxRunner()._run_unsandboxed(
+            script, SandboxPolicy(name="test", level="standard"), data_path=tmp_path
+        )
+
+        assert result.success, result.stderr
+        assert float(result.stdout) == pytest.approx(2475.0)
@@ -0,0 +1,231 @@
+"""Unit tests for the warm sandbox worker pool (src/sandbox/pool.py).
+
+Workers run ``worker.py`` as local subprocesses via ``local_worker_spec``,
+so the protocol, forking and recycling are exercised without Podman.
+Each worker preloads numpy/pandas on start, so these tests are slow.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.api.metrics import get_metrics_collector
+from src.sandbox.aether_data import write_bundle
+from src.sandbox.policies import SandboxPolicy
+from src.sandbox.pool import SandboxPool, WorkerError, WorkerSpec, local_worker_spec
+from src.sandbox.runner import SandboxRunner
+
+pytestmark = [pytest.mark.slow, pytest.mark.timeout(60)]
+
+
+@pytest.fixture
+def factory(tmp_path: Path):
+    workers = tmp_path / "workers"
+    workers.mkdir()
+
+    def for_key(key: str):
+        async def make() -> WorkerSpec:
+            return local_worker_spec(key, Path(tempfile.mkdtemp(prefix=f"{key}-", dir=workers)))
+
+        return make
+
+    return for_key
+
+
+@pytest.fixture
+async def pool():
+    p = SandboxPool(size=1, max_runs=3)
+    yield p
+    await p.close()
+
+
+class TestSandboxPool:
+    async def test_executes_script(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("k", factory("k"))
+        try:
+            response = await worker.execute("print('hello')", timeout=10)
+        finally:
+            await pool.release(worker)
+
+        assert response["exit_code"] == 0
+        assert response["stdout"] == "hello\n"
+        assert not response["timed_out"]
+
+    async def test_reuses_released_worker(self, pool: SandboxPool, factory):
+        first = await pool.acquire("k", factory("k"))
+        await first.execute("x = 1", timeout=10)
+        await pool.release(first)
+
+        second = await pool.acquire("k", factory("k"))
+        await pool.release(second)
+
+        assert second is first
+        assert pool.stats()["hits"] == 1
+        assert pool.stats()["misses"] == 1
+
+    async def test_state_does_not_leak_between_runs(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("k", factory("k"))
+        try:
+            await worker.execute("import builtins; builtins.leak = 1", timeout=10)
+            response = await worker.execute(
+                "import builtins; print(hasattr(builtins, 'leak'))", timeout=10
+            )
+        finally:
+            await pool.release(worker)
+
+        assert response["stdout"] == "False\n"
+
+    async def test_recycles_after_max_runs(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("k", factory("k"))
+        for _ in range(3):
+            await worker.execute("pass", timeout=10)
+        await pool.release(worker)
+
+        assert not worker.alive
+        assert pool.stats()["recycled"] == 1
+
+    async def test_key_mismatch_is_a_miss(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("standard", factory("standard"))
+        await pool.release(worker)
+
+        other = await pool.acquire("restricted", factory("restricted"))
+        await pool.release(other)
+
+        assert other is not worker
+        assert pool.stats()["misses"] == 2
+
+    async def test_timeout_kills_script_not_worker(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("k", factory("k"))
+        try:
+            response = await worker.execute("import time; time.sleep(30)", timeout=0.5)
+            after = await worker.execute("print('ok')", timeout=10)
+        finally:
+            await pool.release(worker)
+
+        assert response["timed_out"]
+        assert response["stderr"] == "Execution timed out"
+        assert after["stdout"] == "ok\n"
+
+    async def test_script_cannot_read_protocol_stdin(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("k", factory("k"))
+        try:
+            response = await worker.execute(
+                "import os, sys\nprint(repr(sys.stdin.read()), repr(os.read(0, 100)))\n",
+                timeout=10,
+            )
+        finally:
+            await pool.release(worker)
+
+        assert response["stdout"] == "'' b''\n"
+
+    async def test_script_cannot_write_protocol_stdout(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("k", factory("k"))
+        forge = "import os\nfor fd in range(3, 64):\n    try: os.write(fd, b'{\"exit_code\": 99}\\n')\n    except OSError: pass\n"
+        try:
+            await worker.execute(forge, timeout=10)
+            after = await worker.execute("print('ok')", timeout=10)
+        finally:
+            await pool.release(worker)
+
+        assert after["exit_code"] == 0
+        assert after["stdout"] == "ok\n"
+
+    async def test_worker_not_dumpable_by_scripts(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("k", factory("k"))
+        try:
+            # PR_GET_DUMPABLE: the flag is inherited from the worker on fork
+            response = await worker.execute(
+                "import ctypes; print(ctypes.CDLL(None).prctl(3, 0, 0, 0, 0))", timeout=10
+            )
+        finally:
+            await pool.release(worker)
+
+        assert response["stdout"] == "0\n"
+
+    async def test_background_processes_killed_and_worker_recycled(
+        self, pool: SandboxPool, tmp_path: Path, factory
+    ):
+        marker = tmp_path / "marker"
+        child = f"import time; time.sleep(1); open({str(marker)!r}, 'w').close()"
+        script = (
+            "import subprocess, sys\n"
+            f"subprocess.Popen([sys.executable, '-c', {child!r}], start_new_session=True)\n"
+        )
+        worker = await pool.acquire("k", factory("k"))
+        response = await worker.execute(script, timeout=10)
+        await pool.release(worker)
+        await asyncio.sleep(1.5)
+
+        assert response["stray_processes"] == 1
+        assert not worker.alive
+        assert pool.stats()["recycled"] == 1
+        assert not marker.exists()
+
+    async def test_scratch_dir_wiped_between_runs(self, pool: SandboxPool, factory):
+        worker = await pool.acquire("k", factory("k"))
+        try:
+            await worker.execute(
+                "import os, tempfile\n"
+                "open(os.path.join(tempfile.gettempdir(), 'secret'), 'w').write('x')\n",
+                timeout=10,
+            )
+            response = await worker.execute(
+                "import os, tempfile; print(os.listdir(tempfile.gettempdir()))", timeout=10
+            )
+        finally:
+            await pool.release(worker)
+
+        assert response["stdout"] == "[]\n"
+
+    async def test_failed_start_raises(self, pool: SandboxPool, tmp_path: Path):
+        async def broken() -> WorkerSpec:
+            return WorkerSpec(key="k", command=["/nonexistent/python"], exchange_dir=tmp_path)
+
+        with pytest.raises(WorkerError):
+            await pool.acquire("k", broken)
+
+    async def test_records_metrics(self, pool: SandboxPool, factory):
+        collector = get_metrics_collector()
+        collector.reset()
+
+        worker = await pool.acquire("k", factory("k"))
+        await pool.release(worker)
+        worker = await pool.acquire("k", factory("k"))
+        await pool.release(worker)
+
+        events = collector.get_metrics()["sandbox_pool"]
+        assert events["miss"] == 1
+        assert events["hit"] == 1
+
+
+class TestRunnerPooledPath:
+    async def test_run_uses_pool_with_data_bundle(self, pool: SandboxPool, tmp_path: Path, factory):
+        bundle = write_bundle({"rows": [{"v": i} for i in range(40)]}, tmp_path / "bundle")
+        runner = SandboxRunner(pool=pool)
+        settings = MagicMock(sandbox_enabled=True, sandbox_artifacts_enabled=False)
+
+        async def spec(key: str, image: str, policy: SandboxPolicy) -> WorkerSpec:
+            return await factory(key)()
+
+        with (
+            patch("src.sandbox.runner.get_settings", return_value=settings),
+            patch.object(
+                runner, "_is_gvisor_available", new_callable=AsyncMock, return_value=False
+            ),
+            patch.object(
+                runner, "_get_available_image", new_callable=AsyncMock, return_value="img"
+            ),
+            patch.object(runner, "_worker_spec", side_effect=spec),
+        ):
+            result = await runner.run(
+                "import aether_data\nprint(len(aether_data.load()['rows']))",
+                SandboxPolicy(name="test", level="standard"),
+                data_path=bundle,
+            )
+
+        assert result.success, result.stderr
+        assert result.stdout.strip() == "40"
+        assert pool.stats()["misses"] == 1
@@ -23,6 +23,7 @@ class TestSchedulerDiscoverySync:
         mock_settings.aether_role = "all"
         mock_settings.discovery_sync_enabled = True
         mock_settings.discovery_sync_interval_minutes = 15
+        mock_settings.llm_usage_rollup_interval_minutes = 15
 
         with patch("src.scheduler.service.get_settings", return_value=mock_settings):
             from src.scheduler.service import SchedulerService
@@ -58,6 +59,7 @@ class TestSchedulerDiscoverySync:
         mock_settings.aether_role = "all"
         mock_settings.discovery_sync_enabled = False
         mock_settings.discovery_sync_interval_minutes = 30
+        mock_settings.llm_usage_rollup_interval_minutes = 15
 
         with patch("src.scheduler.service.get_settings", return_value=mock_settings):
             from src.scheduler.service import SchedulerService
@@ -27,6 +27,7 @@ def mock_settings():
     s.aether_role = "all"
     s.discovery_sync_enabled = False
     s.trace_eval_enabled = False
+    s.llm_usage_rollup_interval_minutes = 15
     return s
 
 
@@ -224,6 +225,25 @@ class TestScheduleDiscoverySync:
         svc._scheduler.add_job.assert_called_once()
 
 
+class TestScheduleUsageRollup:
+    """Tests for _schedule_usage_rollup."""
+
+    def test_no_scheduler(self, mock_settings):
+        with patch("src.scheduler.service.get_settings", return_value=mock_settings):
+            svc = SchedulerService()
+        svc._scheduler = None
+        svc._schedule_usage_rollup(mock_settings)  # Should not raise
+
+    def test_scheduled_at_interval(self, mock_settings):
+        mock_settings.llm_usage_rollup_interval_minutes = 10
+        with patch("src.scheduler.service.get_settings", return_value=mock_settings):
+            svc = SchedulerService()
+        svc._scheduler = MagicMock()
+        svc._schedule_usage_rollup(mock_settings)
+        svc._scheduler.add_job.assert_called_once()
+        assert svc._scheduler.add_job.call_args.kwargs["id"] == "usage:rollup"
+
+
 class TestScheduleTraceEvaluation:
     """Tests for _schedule_trace_evaluation."""
 
@@ -10,6 +10,8 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.storage.checkpoints import (
+    DELTA_FORMAT,
+    CheckpointBlob,
     CheckpointConfig,
     CheckpointRecord,
     PendingWrite,
@@ -44,6 +46,7 @@ class TestCheckpointConfig:
         cfg = CheckpointConfig()
         assert cfg.max_checkpoints_per_thread == 100
         assert cfg.cleanup_on_complete is False
+        assert cfg.cleanup_interval == 10
 
     def test_custom_config(self):
         cfg = CheckpointConfig(max_checkpoints_per_thread=50, cleanup_on_complete=True)
@@ -58,6 +61,9 @@ class TestCheckpointRecordModel:
     def test_pending_write_tablename(self):
         assert PendingWrite.__tablename__ == "checkpoint_writes"
 
+    def test_blob_tablename(self):
+        assert CheckpointBlob.__tablename__ == "checkpoint_blobs"
+
 
 class TestPostgresCheckpointerInit:
     def test_init_default_config(self, mock_session):
@@ -230,7 +236,16 @@ class TestAputWrites:
     async def test_put_writes(self, checkpointer, mock_session, sample_config):
         writes = [("messages", ["hello"]), ("status", "active")]
         await checkpointer.aput_writes(sample_config, writes, "task-1")
-        assert mock_session.execute.call_count == 2  # one per write
+        assert mock_session.execute.call_count == 1  # single multi-row upsert
+
+        params = mock_session.execute.call_args.args[0].compile().params
+        assert params["channel_m0"] == "messages"
+        assert params["channel_m1"] == "status"
+        assert params["idx_m1"] == 1
+
+    async def test_put_no_writes(self, checkpointer, mock_session, sample_config):
+        await checkpointer.aput_writes(sample_config, [], "task-1")
+        mock_session.execute.assert_not_called()
 
 
 class TestSerializeDeserialize:
@@ -261,6 +276,34 @@ class TestSerializeDeserialize:
         result = checkpointer._deserialize_value("unknown", '"hello"')
         assert result == "hello"
 
+    def test_pydantic_round_trip(self, checkpointer):
+        config = CheckpointConfig(max_checkpoints_per_thread=7)
+        vtype, vdata = checkpointer._serialize_value(config)
+        assert vtype == "pydantic"
+        assert checkpointer._deserialize_value(vtype, vdata) == config
+
+    def test_nested_models_round_trip(self, checkpointer):
+        from langchain_core.messages import AIMessage, HumanMessage
+
+        value = {"messages": [HumanMessage(content="hi"), AIMessage(content="hello")], "n": 2}
+        vtype, vdata = checkpointer._serialize_value(value)
+        restored = checkpointer._deserialize_value(vtype, vdata)
+
+        assert isinstance(restored["messages"][0], HumanMessage)
+        assert isinstance(restored["messages"][1], AIMessage)
+        assert restored["messages"][1].content == "hello"
+        assert restored["n"] == 2
+
+    def test_unresolvable_model_falls_back_to_dict(self, checkpointer):
+        data = json.dumps({"__pydantic__": "missing.module:Gone", "data": {"a": 1}})
+        assert checkpointer._deserialize_value("pydantic", data) == {"a": 1}
+
+    def test_serialize_datetime(self, checkpointer):
+        ts = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        vtype, vdata = checkpointer._serialize_value({"at": ts})
+        assert vtype == "json"
+        assert json.loads(vdata) == {"at": "2026-01-02T03:04:05+00:00"}
+
 
 class TestSyncMethodsNotImplemented:
     def test_get_tuple_raises(self, checkpointer, sample_config):
@@ -281,18 +324,164 @@ class TestSyncMethodsNotImplemented:
 
 
 class TestCleanupOldCheckpoints:
-    async def test_cleanup_removes_old(self, checkpointer, mock_session):
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = [("cp-1",), ("cp-2",)]
-        mock_session.execute.return_value = mock_result
-
+    async def test_cleanup_is_set_based(self, checkpointer, mock_session):
         await checkpointer._cleanup_old_checkpoints("thread-1", "")
-        assert mock_session.execute.call_count == 3  # select + delete + delete writes
+        # checkpoints + orphaned writes + unreferenced blobs, no SELECT round trip
+        assert mock_session.execute.call_count == 3
+        tables = [call.args[0].table.name for call in mock_session.execute.call_args_list]
+        assert tables == ["checkpoints", "checkpoint_writes", "checkpoint_blobs"]
+
+
+def _delta_record(checkpoint_id, channel_versions, step=1):
+    record = MagicMock()
+    record.checkpoint_id = checkpoint_id
+    record.parent_checkpoint_id = None
+    record.checkpoint_data = {"format": DELTA_FORMAT}
+    record.metadata_data = {"source": "loop", "versions_seen": {}, "pending_sends": []}
+    record.channel_versions = channel_versions
+    record.channel_values = {}
+    record.step = step
+    record.checkpoint_at = datetime.now(UTC)
+    return record
+
+
+def _blob(channel, version, value):
+    blob = MagicMock()
+    blob.channel = channel
+    blob.version = version
+    blob.value_type = "json"
+    blob.value_data = json.dumps(value)
+    return blob
+
+
+def _checkpoint(channel_values, channel_versions):
+    checkpoint = MagicMock()
+    checkpoint.id = "cp-2"
+    checkpoint.ts = datetime.now(UTC).isoformat()
+    checkpoint.channel_values = channel_values
+    checkpoint.channel_versions = channel_versions
+    checkpoint.versions_seen = {}
+    checkpoint.pending_sends = []
+    return checkpoint
+
+
+def _metadata(step):
+    metadata = MagicMock()
+    metadata.source = "loop"
+    metadata.step = step
+    metadata.writes = None
+    metadata.parents = {}
+    return metadata
+
+
+class TestDeltaCheckpoints:
+    async def test_put_stores_only_changed_channels(
+        self, checkpointer, mock_session, sample_config
+    ):
+        checkpoint = _checkpoint(
+            {"messages": ["a", "b"], "analysis": {"big": "payload"}},
+            {"messages": 3, "analysis": 1},
+        )
+
+        await checkpointer.aput(sample_config, checkpoint, _metadata(3), {"messages": 3})
+
+        blob_stmt, record_stmt = (c.args[0] for c in mock_session.execute.call_args_list)
+        assert blob_stmt.table.name == "checkpoint_blobs"
+        blob_params = blob_stmt.compile().params
+        assert "analysis" not in blob_params.values()
+        assert '["a","b"]' in blob_params.values()
+
+        record_params = record_stmt.compile().params
+        assert record_params["checkpoint_data"] == {"format": DELTA_FORMAT}
+        assert record_params["channel_values"] == {}
+        assert record_params["channel_versions"] == {"messages": 3, "analysis": 1}
+
+    async def test_put_without_changes_skips_blob_insert(
+        self, checkpointer, mock_session, sample_config
+    ):
+        checkpoint = _checkpoint({"messages": ["a"]}, {"messages": 1})
+
+        await checkpointer.aput(sample_config, checkpoint, _metadata(3), {})
+
+        assert mock_session.execute.call_count == 1
+        assert mock_session.execute.call_args.args[0].table.name == "checkpoints"
+
+    async def test_cleanup_is_amortized(self, checkpointer, mock_session, sample_config):
+        checkpoint = _checkpoint({}, {})
+
+        for step in range(1, 10):
+            await checkpointer.aput(sample_config, checkpoint, _metadata(step), {})
+        assert mock_session.execute.call_count == 9  # upserts only
+
+        await checkpointer.aput(sample_config, checkpoint, _metadata(10), {})
+        assert mock_session.execute.call_count == 13  # upsert + 3 cleanup deletes
+
+    async def test_get_tuple_resolves_blob_references(
+        self, checkpointer, mock_session, sample_config
+    ):
+        record = _delta_record("cp-1", {"messages": 3, "analysis": 1, "empty": 2})
+        record_result = MagicMock()
+        record_result.scalar_one_or_none.return_value = record
+        blob_result = MagicMock()
+        blob_result.scalars.return_value = [
+            _blob("messages", "3", ["a", "b"]),
+            _blob("analysis", "1", {"big": "payload"}),
+        ]
+        writes_result = MagicMock()
+        writes_result.scalars.return_value = []
+        mock_session.execute.side_effect = [record_result, blob_result, writes_result]
 
-    async def test_cleanup_empty_keeps(self, checkpointer, mock_session):
-        mock_result = MagicMock()
-        mock_result.fetchall.return_value = []
-        mock_session.execute.return_value = mock_result
+        result = await checkpointer.aget_tuple(sample_config)
 
-        await checkpointer._cleanup_old_checkpoints("thread-1", "")
-        assert mock_session.execute.call_count == 1  # only select
+        assert result.checkpoint["channel_values"] == {
+            "messages": ["a", "b"],
+            "analysis": {"big": "payload"},
+        }
+
+    async def test_list_loads_blobs_in_one_query(self, checkpointer, mock_session):
+        config = {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}}
+        records = [
+            _delta_record("cp-2", {"messages": 2, "analysis": 1}, step=2),
+            _delta_record("cp-1", {"messages": 1, "analysis": 1}, step=1),
+        ]
+        records_result = MagicMock()
+        records_result.scalars.return_value.all.return_value = records
+        blob_result = MagicMock()
+        blob_result.scalars.return_value = [
+            _blob("messages", "1", ["a"]),
+            _blob("messages", "2", ["a", "b"]),
+            _blob("analysis", "1", {"shared": True}),
+        ]
+        mock_session.execute.side_effect = [records_result, blob_result]
+
+        result = await checkpointer.alist(config)
+
+        assert mock_session.execute.call_count == 2
+        assert result[0].checkpoint["channel_values"]["messages"] == ["a", "b"]
+        assert result[1].checkpoint["channel_values"]["messages"] == ["a"]
+        assert result[0].checkpoint["channel_values"]["analysis"] == {"shared": True}
+
+    async def test_put_after_legacy_parent_writes_all_channels(
+        self, checkpointer, mock_session, sample_config
+    ):
+        legacy = _delta_record("cp-1", {"messages": 1, "analysis": 1})
+        legacy.checkpoint_data = {"messages": ["a"], "analysis": {"x": 1}}
+        legacy.channel_values = {"messages": ["a"], "analysis": {"x": 1}}
+        legacy_result = MagicMock()
+        legacy_result.scalar_one_or_none.return_value = legacy
+        writes_result = MagicMock()
+        writes_result.scalars.return_value = []
+        mock_session.execute.side_effect = [legacy_result, writes_result, None, None]
+
+        loaded = await checkpointer.aget_tuple(sample_config)
+        assert loaded.checkpoint["channel_values"] == legacy.channel_values
+
+        checkpoint = _checkpoint(
+            {"messages": ["a", "b"], "analysis": {"x": 1}},
+            {"messages": 2, "analysis": 1},
+        )
+        await checkpointer.aput(sample_config, checkpoint, _metadata(3), {"messages": 2})
+
+        blob_stmt = mock_session.execute.call_args_list[2].args[0]
+        assert blob_stmt.table.name == "checkpoint_blobs"
+        assert '{"x":1}' in blob_stmt.compile().params.values()
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -65,7 +65,7 @@ class TestSyncConfigEnrichment:
         ha_client.get_script_config = AsyncMock(return_value=None)
 
         mock_auto_repo = AsyncMock()
-        mock_auto_repo.upsert = AsyncMock(return_value=(MagicMock(), True))
+        mock_auto_repo.upsert_many = AsyncMock(return_value=([], {"created": 1, "updated": 0}))
         mock_auto_repo.get_all_ha_ids = AsyncMock(return_value=set())
 
         mock_script_repo = AsyncMock()
@@ -85,7 +85,7 @@ class TestSyncConfigEnrichment:
         assert stats["automations_synced"] == 1
 
         # Config should be included in the upsert data
-        upsert_data = mock_auto_repo.upsert.call_args[0][0]
+        upsert_data = mock_auto_repo.upsert_many.call_args[0][0][0]
         assert upsert_data["config"] == auto_config
 
         # HA client should have been called with the automation ID
@@ -112,7 +112,7 @@ class TestSyncConfigEnrichment:
         mock_auto_repo = AsyncMock()
         mock_auto_repo.get_all_ha_ids = AsyncMock(return_value=set())
         mock_script_repo = AsyncMock()
-        mock_script_repo.upsert = AsyncMock(return_value=(MagicMock(), True))
+        mock_script_repo.upsert_many = AsyncMock(return_value=([], {"created": 1, "updated": 0}))
         mock_script_repo.get_all_ha_ids = AsyncMock(return_value=set())
         mock_scene_repo = AsyncMock()
         mock_scene_repo.get_all_ha_ids = AsyncMock(return_value=set())
@@ -128,7 +128,7 @@ class TestSyncConfigEnrichment:
 
         assert stats["scripts_synced"] == 1
 
-        upsert_data = mock_script_repo.upsert.call_args[0][0]
+        upsert_data = mock_script_repo.upsert_many.call_args[0][0][0]
         assert upsert_data["sequence"] == script_config["sequence"]
         assert upsert_data["fields"] == script_config["fields"]
 
@@ -148,10 +148,10 @@ class TestSyncConfigEnrichment:
         ha_client.get_script_config = AsyncMock(side_effect=ha_err)
 
         mock_auto_repo = AsyncMock()
-        mock_auto_repo.upsert = AsyncMock(return_value=(MagicMock(), True))
+        mock_auto_repo.upsert_many = AsyncMock(return_value=([], {"created": 1, "updated": 0}))
         mock_auto_repo.get_all_ha_ids = AsyncMock(return_value=set())
         mock_script_repo = AsyncMock()
-        mock_script_repo.upsert = AsyncMock(return_value=(MagicMock(), True))
+        mock_script_repo.upsert_many = AsyncMock(return_value=([], {"created": 1, "updated": 0}))
         mock_script_repo.get_all_ha_ids = AsyncMock(return_value=set())
         mock_scene_repo = AsyncMock()
         mock_scene_repo.get_all_ha_ids = AsyncMock(return_value=set())
@@ -173,8 +173,8 @@ class TestSyncConfigEnrichment:
         assert stats["scripts_synced"] == 1
 
         # Upsert should have been called, config will be None
-        auto_data = mock_auto_repo.upsert.call_args[0][0]
+        auto_data = mock_auto_repo.upsert_many.call_args[0][0][0]
         assert auto_data.get("config") is None
 
-        script_data = mock_script_repo.upsert.call_args[0][0]
+        script_data = mock_script_repo.upsert_many.call_args[0][0][0]
         assert script_data.get("sequence") is None
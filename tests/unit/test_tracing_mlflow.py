@@ -61,19 +61,29 @@ class TestLogParam:
         mock_mlflow = MagicMock()
         mock_mlflow.active_run.return_value = None
 
-        with patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow):
+        exporter = MagicMock()
+        with (
+            patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow),
+            patch("src.tracing.mlflow_logging.get_telemetry_exporter", return_value=exporter),
+        ):
             log_param("key", "value")
+            exporter.submit_params.assert_not_called()
             mock_mlflow.log_param.assert_not_called()
 
     def test_log_param_success(self):
         from src.tracing.mlflow import log_param
 
         mock_mlflow = MagicMock()
-        mock_mlflow.active_run.return_value = MagicMock()
+        mock_mlflow.active_run.return_value.info.run_id = "run-1"
 
-        with patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow):
+        exporter = MagicMock()
+        with (
+            patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow),
+            patch("src.tracing.mlflow_logging.get_telemetry_exporter", return_value=exporter),
+        ):
             log_param("key", "value")
-            mock_mlflow.log_param.assert_called_once_with("key", "value")
+            exporter.submit_params.assert_called_once_with("run-1", {"key": "value"})
+            mock_mlflow.log_param.assert_not_called()
 
 
 class TestLogParams:
@@ -89,11 +99,15 @@ class TestLogParams:
         from src.tracing.mlflow import log_params
 
         mock_mlflow = MagicMock()
-        mock_mlflow.active_run.return_value = MagicMock()
+        mock_mlflow.active_run.return_value.info.run_id = "run-1"
 
-        with patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow):
+        exporter = MagicMock()
+        with (
+            patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow),
+            patch("src.tracing.mlflow_logging.get_telemetry_exporter", return_value=exporter),
+        ):
             log_params({"a": "1"})
-            mock_mlflow.log_params.assert_called_once_with({"a": "1"})
+            exporter.submit_params.assert_called_once_with("run-1", {"a": "1"})
 
 
 class TestLogMetric:
@@ -109,11 +123,31 @@ class TestLogMetric:
         from src.tracing.mlflow import log_metric
 
         mock_mlflow = MagicMock()
-        mock_mlflow.active_run.return_value = MagicMock()
+        mock_mlflow.active_run.return_value.info.run_id = "run-1"
 
-        with patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow):
+        exporter = MagicMock()
+        with (
+            patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow),
+            patch("src.tracing.mlflow_logging.get_telemetry_exporter", return_value=exporter),
+        ):
             log_metric("latency", 0.5, step=1)
-            mock_mlflow.log_metric.assert_called_once_with("latency", 0.5, step=1)
+            exporter.submit_metrics.assert_called_once_with("run-1", {"latency": 0.5}, 1)
+            mock_mlflow.log_metric.assert_not_called()
+
+    def test_log_metric_active_run_error(self):
+        """A failing active_run() lookup is swallowed."""
+        from src.tracing.mlflow import log_metric
+
+        mock_mlflow = MagicMock()
+        mock_mlflow.active_run.side_effect = RuntimeError("MLflow server unavailable")
+
+        exporter = MagicMock()
+        with (
+            patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow),
+            patch("src.tracing.mlflow_logging.get_telemetry_exporter", return_value=exporter),
+        ):
+            log_metric("latency", 0.5)
+            exporter.submit_metrics.assert_not_called()
 
 
 class TestLogMetrics:
@@ -121,11 +155,15 @@ class TestLogMetrics:
         from src.tracing.mlflow import log_metrics
 
         mock_mlflow = MagicMock()
-        mock_mlflow.active_run.return_value = MagicMock()
+        mock_mlflow.active_run.return_value.info.run_id = "run-1"
 
-        with patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow):
+        exporter = MagicMock()
+        with (
+            patch("src.tracing.mlflow_logging._safe_import_mlflow", return_value=mock_mlflow),
+            patch("src.tracing.mlflow_logging.get_telemetry_exporter", return_value=exporter),
+        ):
             log_metrics({"a": 1.0, "b": 2.0})
-            mock_mlflow.log_metrics.assert_called_once_with({"a": 1.0, "b": 2.0}, step=None)
+            exporter.submit_metrics.assert_called_once_with("run-1", {"a": 1.0, "b": 2.0}, None)
 
 
 class TestLogDict:
@@ -661,3 +699,85 @@ class TestCheckTraceBackend:
         finally:
             mod._traces_checked = orig_checked
             mod._traces_available = orig_available
+
+
+class TestTraceSampling:
+    """Head and tail sampling of trace_with_uri spans."""
+
+    @staticmethod
+    def _patches(mock_mlflow, rate: float, slow_ms: float = 1000.0):
+        settings = MagicMock(mlflow_trace_sample_rate=rate, mlflow_trace_slow_ms=slow_ms)
+        return (
+            patch("src.tracing.mlflow_spans._ensure_mlflow_initialized", return_value=True),
+            patch("src.tracing.mlflow_spans._traces_available", True),
+            patch("src.tracing.mlflow_spans._safe_import_mlflow", return_value=mock_mlflow),
+            patch("src.settings.get_settings", return_value=settings),
+        )
+
+    def test_unsampled_root_call_is_not_traced(self):
+        from src.tracing.mlflow import trace_with_uri
+
+        @trace_with_uri(name="sampled_out")
+        def my_func():
+            return 42
+
+        mock_mlflow = MagicMock()
+        mock_mlflow.get_current_active_span.return_value = None
+        p1, p2, p3, p4 = self._patches(mock_mlflow, rate=0.0)
+        with p1, p2, p3, p4:
+            assert my_func() == 42
+        mock_mlflow.trace.assert_not_called()
+        mock_mlflow.start_span_no_context.assert_not_called()
+
+    def test_child_of_active_span_is_always_traced(self):
+        from src.tracing.mlflow import trace_with_uri
+
+        @trace_with_uri(name="child")
+        def my_func():
+            return 42
+
+        mock_mlflow = MagicMock()
+        mock_mlflow.get_current_active_span.return_value = MagicMock()
+        mock_mlflow.trace.return_value = MagicMock(return_value=42)
+        p1, p2, p3, p4 = self._patches(mock_mlflow, rate=0.0)
+        with p1, p2, p3, p4:
+            assert my_func() == 42
+        mock_mlflow.trace.assert_called_once()
+
+    async def test_unsampled_failure_is_recorded_after(self):
+        from src.tracing.mlflow import trace_with_uri
+
+        @trace_with_uri(name="fails", span_type="TOOL")
+        async def my_func():
+            raise ValueError("boom")
+
+        mock_mlflow = MagicMock()
+        mock_mlflow.get_current_active_span.return_value = None
+        p1, p2, p3, p4 = self._patches(mock_mlflow, rate=0.0)
+        with p1, p2, p3, p4, suppress(ValueError):
+            await my_func()
+        mock_mlflow.trace.assert_not_called()
+        call = mock_mlflow.start_span_no_context.call_args
+        assert call.args == ("fails",)
+        assert call.kwargs["span_type"] == "TOOL"
+        assert call.kwargs["attributes"]["aether.sampling"] == "tail"
+        span = mock_mlflow.start_span_no_context.return_value
+        assert span.end.call_args.kwargs["status"] == "ERROR"
+
+    async def test_unsampled_slow_call_is_recorded_after(self):
+        import asyncio
+
+        from src.tracing.mlflow import trace_with_uri
+
+        @trace_with_uri(name="slow")
+        async def my_func():
+            await asyncio.sleep(0.01)
+            return 1
+
+        mock_mlflow = MagicMock()
+        mock_mlflow.get_current_active_span.return_value = None
+        p1, p2, p3, p4 = self._patches(mock_mlflow, rate=0.0, slow_ms=5.0)
+        with p1, p2, p3, p4:
+            assert await my_func() == 1
+        span = mock_mlflow.start_span_no_context.return_value
+        assert span.end.call_args.kwargs["status"] == "OK"
@@ -0,0 +1,152 @@
+"""Unit tests for the batched MLflow telemetry exporter."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock, patch
+
+from src.tracing.mlflow_export import (
+    TelemetryExporter,
+    close_telemetry_exporter,
+    get_telemetry_exporter,
+)
+
+
+def _exporter(**kwargs) -> tuple[TelemetryExporter, MagicMock]:
+    exporter = TelemetryExporter(**kwargs)
+    client = MagicMock()
+    exporter._client = client
+    # Keep the background thread out of tests that flush by hand
+    exporter._ensure_running = MagicMock()  # type: ignore[method-assign]
+    return exporter, client
+
+
+class TestTelemetryExporter:
+    def test_flush_batches_per_run(self):
+        exporter, client = _exporter()
+        exporter.submit_metrics("run-a", {"x": 1, "y": 2.5}, step=3)
+        exporter.submit_metrics("run-b", {"x": 4}, step=None)
+        exporter.submit_params("run-a", {"model": "gpt-4o"})
+
+        assert exporter.flush() == 4
+        calls = [(c.args[0], c.kwargs) for c in client.log_batch.call_args_list]
+        assert [(run, len(kw["metrics"]), len(kw["params"])) for run, kw in calls] == [
+            ("run-a", 2, 0),
+            ("run-a", 0, 1),
+            ("run-b", 1, 0),
+        ]
+        metrics_a = calls[0][1]["metrics"]
+        assert [(m.key, m.value, m.step) for m in metrics_a] == [("x", 1.0, 3), ("y", 2.5, 3)]
+        assert [(p.key, p.value) for p in calls[1][1]["params"]] == [("model", "gpt-4o")]
+        assert [m.step for m in calls[2][1]["metrics"]] == [0]
+        assert exporter.pending == 0
+        assert exporter.exported == 4
+
+    def test_timestamp_taken_at_submit(self):
+        exporter, client = _exporter()
+        before = int(time.time() * 1000)
+        exporter.submit_metrics("run", {"x": 1.0}, step=None)
+        exporter.flush()
+        assert client.log_batch.call_args.kwargs["metrics"][0].timestamp >= before
+
+    def test_duplicate_params_keep_first_value(self):
+        exporter, client = _exporter()
+        exporter.submit_params("run", {"error": "first"})
+        exporter.submit_params("run", {"error": "second"})
+        exporter.flush()
+        params = client.log_batch.call_args.kwargs["params"]
+        assert [(p.key, p.value) for p in params] == [("error", "first")]
+
+    def test_params_sent_once_per_run(self):
+        exporter, client = _exporter()
+        exporter.submit_params("run", {"query": "kitchen"})
+        exporter.flush()
+        client.log_batch.reset_mock()
+
+        exporter.submit_params("run", {"query": "bedroom", "model": "gpt-4o"})
+        exporter.submit_metrics("run", {"x": 1.0}, step=None)
+        assert exporter.flush() == 2
+        calls = [c.kwargs for c in client.log_batch.call_args_list]
+        assert [m.key for m in calls[0]["metrics"]] == ["x"]
+        assert [p.key for p in calls[1]["params"]] == ["model"]
+
+    def test_rejected_params_do_not_lose_metrics(self):
+        exporter, client = _exporter()
+
+        def log_batch(run_id, metrics, params):
+            if params:
+                raise RuntimeError("param already logged with a different value")
+
+        client.log_batch.side_effect = log_batch
+        exporter.submit_params("run", {"query": "kitchen"})
+        exporter.submit_metrics("run", {"x": 1.0}, step=None)
+        assert exporter.flush() == 1
+        assert exporter.failed == 1
+
+    def test_non_numeric_metric_skipped(self):
+        exporter, _client = _exporter()
+        exporter.submit_metrics("run", {"bad": "n/a", "good": 1}, step=None)
+        assert exporter.pending == 1
+
+    def test_drops_when_full(self):
+        exporter, _client = _exporter(max_pending=100)
+        exporter.submit_metrics("run", {f"m{i}": i for i in range(150)}, step=None)
+        assert exporter.pending == 100
+        assert exporter.dropped == 50
+
+    def test_chunks_to_log_batch_limits(self):
+        exporter, client = _exporter(max_pending=5000)
+        exporter.submit_metrics("run", {f"m{i}": i for i in range(2500)}, step=None)
+        exporter.submit_params("run", {f"p{i}": i for i in range(150)})
+        exporter.flush()
+        sizes = [
+            (len(c.kwargs["metrics"]), len(c.kwargs["params"]))
+            for c in client.log_batch.call_args_list
+        ]
+        assert sizes == [(1000, 0), (1000, 0), (500, 0), (0, 100), (0, 50)]
+
+    def test_failed_batch_counted(self):
+        exporter, client = _exporter()
+        client.log_batch.side_effect = RuntimeError("tracking server down")
+        exporter.submit_metrics("run", {"x": 1.0}, step=None)
+        assert exporter.flush() == 0
+        assert exporter.failed == 1
+        assert exporter.pending == 0
+
+    def test_background_thread_exports(self):
+        exporter = TelemetryExporter(flush_interval=0.05)
+        client = MagicMock()
+        exporter._client = client
+        exporter.submit_metrics("run", {"x": 1.0}, step=None)
+        deadline = time.monotonic() + 2
+        while not client.log_batch.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        exporter.close()
+        client.log_batch.assert_called_once()
+
+    def test_close_exports_remaining(self):
+        exporter, client = _exporter(flush_interval=60)
+        exporter.submit_metrics("run", {"x": 1.0}, step=None)
+        exporter.close()
+        client.log_batch.assert_called_once()
+
+    def test_stats(self):
+        exporter, _client = _exporter(max_pending=100)
+        exporter.submit_metrics("run", {f"m{i}": i for i in range(101)}, step=None)
+        assert exporter.stats() == {"pending": 100, "exported": 0, "dropped": 1, "failed": 0}
+
+
+class TestGetTelemetryExporter:
+    def test_singleton_uses_settings(self):
+        settings = MagicMock(
+            mlflow_telemetry_max_pending=123, mlflow_telemetry_flush_interval_seconds=0.5
+        )
+        close_telemetry_exporter()
+        with patch("src.settings.get_settings", return_value=settings):
+            exporter = get_telemetry_exporter()
+            assert get_telemetry_exporter() is exporter
+        assert exporter.max_pending == 123
+        assert exporter.flush_interval == 0.5
+        close_telemetry_exporter()
+        assert get_telemetry_exporter() is not exporter
+        close_telemetry_exporter()
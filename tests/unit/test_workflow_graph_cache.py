@@ -0,0 +1,140 @@
+"""Unit tests for the compiled workflow graph cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.graph import END, START, create_graph
+from src.graph.state import DiscoveryState
+from src.graph.workflows._registry import (
+    register_dynamic_workflow,
+    unregister_dynamic_workflow,
+)
+from src.graph.workflows.cache import (
+    bind_graph,
+    get_compiled_graph,
+    invalidate_compiled_graphs,
+    resolve_dependency,
+    warm_up_compiled_graphs,
+)
+from src.graph.workflows.definition import WorkflowDefinition
+from src.graph.workflows.manifest import NodeManifest
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    invalidate_compiled_graphs()
+    yield
+    invalidate_compiled_graphs()
+    unregister_dynamic_workflow("echo_client")
+
+
+async def _dummy_node(state: object) -> dict:
+    return {}
+
+
+def _build_echo_graph(ha_client: Any = None):
+    """Graph whose single node reports the HA client it resolved."""
+    graph = create_graph(DiscoveryState)
+
+    async def _echo(state: DiscoveryState, config: RunnableConfig) -> dict[str, object]:
+        client = resolve_dependency(config, "ha_client", ha_client)
+        return {"errors": [str(client)]}
+
+    graph.add_node("echo", _echo)
+    graph.add_edge(START, "echo")
+    graph.add_edge("echo", END)
+    return graph
+
+
+class TestGetCompiledGraph:
+    def test_compiles_once(self):
+        assert get_compiled_graph("discovery") is get_compiled_graph("discovery")
+
+    def test_conversation_has_hitl_interrupt(self):
+        compiled = get_compiled_graph("conversation")
+        assert compiled.interrupt_before_nodes == ["approval_gate"]
+        assert compiled.checkpointer is None
+
+    def test_unknown_workflow(self):
+        with pytest.raises(ValueError, match="Unknown workflow"):
+            get_compiled_graph("nope")
+
+    def test_reregistering_invalidates(self):
+        register_dynamic_workflow("echo_client", _build_echo_graph)
+        first = get_compiled_graph("echo_client")
+        register_dynamic_workflow("echo_client", _build_echo_graph)
+        assert get_compiled_graph("echo_client") is not first
+
+    def test_compile_and_register_invalidates(self):
+        from src.graph.workflows._registry import compile_and_register, workflow_version
+
+        manifest = NodeManifest()
+        manifest.register(name="node_a", function=_dummy_node, state_type="ConversationState")
+        defn = WorkflowDefinition(
+            name="echo_client",
+            state_type="ConversationState",
+            nodes=[{"id": "a", "function": "node_a"}],
+            edges=[
+                {"source": "__start__", "target": "a"},
+                {"source": "a", "target": "__end__"},
+            ],
+        )
+        compile_and_register(defn, manifest)
+        first = get_compiled_graph("echo_client")
+        version = workflow_version("echo_client")
+        assert version
+
+        compile_and_register(defn.model_copy(update={"description": "changed"}), manifest)
+        assert workflow_version("echo_client") != version
+        assert get_compiled_graph("echo_client") is not first
+
+
+class TestBindGraph:
+    def test_binding_leaves_shared_graph_untouched(self):
+        shared = get_compiled_graph("conversation")
+        checkpointer = MemorySaver()
+        bound = bind_graph(shared, checkpointer=checkpointer, session="db")
+        assert bound is not shared
+        assert bound.checkpointer is checkpointer
+        assert bound.config["configurable"]["session"] == "db"
+        assert shared.checkpointer is None
+        assert not (shared.config or {}).get("configurable")
+
+    def test_nothing_to_bind(self):
+        shared = get_compiled_graph("discovery")
+        assert bind_graph(shared, session=None) is shared
+
+    @pytest.mark.asyncio
+    async def test_nodes_see_bound_dependency(self):
+        register_dynamic_workflow("echo_client", _build_echo_graph)
+        shared = get_compiled_graph("echo_client")
+
+        first = await bind_graph(shared, ha_client="client-a").ainvoke(DiscoveryState())
+        second = await bind_graph(shared, ha_client="client-b").ainvoke(DiscoveryState())
+        unbound = await shared.ainvoke(DiscoveryState())
+
+        assert first["errors"] == ["client-a"]
+        assert second["errors"] == ["client-b"]
+        assert unbound["errors"] == ["None"]
+
+
+class TestResolveDependency:
+    def test_falls_back_to_default(self):
+        assert resolve_dependency(None, "session", "default") == "default"
+        assert resolve_dependency({}, "session", "default") == "default"
+        assert resolve_dependency({"configurable": {"session": None}}, "session", 1) == 1
+
+    def test_prefers_config(self):
+        assert resolve_dependency({"configurable": {"session": "s"}}, "session", "d") == "s"
+
+
+class TestWarmUp:
+    def test_compiles_and_skips_failures(self):
+        assert warm_up_compiled_graphs(["discovery", "nope", "review"]) == 2
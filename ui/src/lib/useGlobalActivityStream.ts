@@ -26,6 +26,8 @@ export function useGlobalActivityStream() {
   const retriesRef = useRef(0);
   const timerRef = useRef<ReturnType<typeof setTimeout> | undefined>(undefined);
   const esRef = useRef<EventSource | null>(null);
+  /** Last SSE event id seen, so a reconnect replays what was missed. */
+  const lastEventIdRef = useRef<string | null>(null);
   /** Track all auto-complete timeouts so we can cancel on unmount. */
   const pendingTimeouts = useRef(new Set<ReturnType<typeof setTimeout>>());
 
@@ -38,7 +40,10 @@ export function useGlobalActivityStream() {
       const apiBase =
         (import.meta as unknown as { env: Record<string, string> }).env
           .VITE_API_BASE_URL ?? "";
-      const url = `${apiBase}/api/v1/activity/stream`;
+      const resume = lastEventIdRef.current
+        ? `?last_event_id=${encodeURIComponent(lastEventIdRef.current)}`
+        : "";
+      const url = `${apiBase}/api/v1/activity/stream${resume}`;
       const es = new EventSource(url);
       esRef.current = es;
 
@@ -47,6 +52,7 @@ export function useGlobalActivityStream() {
       };
 
       es.onmessage = (ev) => {
+        if (ev.lastEventId) lastEventIdRef.current = ev.lastEventId;
         try {
           const data = JSON.parse(ev.data);
 